@@ -3,4 +3,5 @@ from .format import OutputFormats, output_format_handler, common_output_format_h
 from .file_input import FileInputs, file_inputs_handler, default_file_inputs_handler
 from .set_param import set_param_option
 from .ignore_missing import ignore_missing_option
+from .wait import wait_option
 from .tnco_secrets import tnco_client_secret_option, tnco_pwd_option
\ No newline at end of file
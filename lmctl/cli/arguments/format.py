@@ -1,9 +1,10 @@
 import click
-from lmctl.cli.format import OutputFormat, Table, JsonFormat, YamlFormat, TableFormat
+from lmctl.cli.format import OutputFormat, Table, JsonFormat, NdjsonFormat, YamlFormat, TableFormat
 
 JSON_VALUE = 'json'
 YAML_VALUE = 'yaml'
 TABLE_VALUE = 'table'
+JSONL_VALUE = 'jsonl'
 
 class OutputFormats:
 
@@ -42,10 +43,12 @@ def common_output_format_handler(table: Table):
     return output_format_handler()\
             .add_choice(TABLE_VALUE, TableFormat(table=table), is_default=True)\
             .add_choice(YAML_VALUE, YamlFormat())\
-            .add_choice(JSON_VALUE, JsonFormat())
+            .add_choice(JSON_VALUE, JsonFormat())\
+            .add_choice(JSONL_VALUE, NdjsonFormat())
 
 def default_output_format_handler():
     return output_format_handler()\
         .add_choice(YAML_VALUE, YamlFormat(), is_default=True)\
-        .add_choice(JSON_VALUE, JsonFormat())
+        .add_choice(JSON_VALUE, JsonFormat())\
+        .add_choice(JSONL_VALUE, NdjsonFormat())
 
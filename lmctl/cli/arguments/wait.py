@@ -0,0 +1,14 @@
+import click
+
+def wait_option():
+    def decorator(f):
+        f = click.option('--wait-timeout', 
+                        help='Maximum number of seconds to wait when using "--wait" (waits indefinitely if not set)',
+                        type=float,
+                        default=None
+                        )(f)
+        return click.option('--wait', 
+                        help='Wait for the Process to finish and exit with an error if it does not complete successfully',
+                        is_flag=True
+                        )(f)
+    return decorator
@@ -45,7 +45,7 @@ class TagFormattedMixin:
         })
         other_commands = []
         for cmd_name in self.list_commands(ctx):
-            cmd = self.get_command(ctx, cmd_name)
+            cmd = self._get_listed_command(ctx, cmd_name)
             if cmd is None:
                 continue
             if cmd.hidden:
@@ -65,6 +65,12 @@ class TagFormattedMixin:
         if len(other_commands) > 0:
             self._write_commands_to_formatter(formatter, 'Other', other_commands)
         
+    def _get_listed_command(self, ctx, cmd_name):
+        """
+        Get the command to list in help text, which only needs its short help and tags (so groups loading commands lazily may return a summary of it instead)
+        """
+        return self.get_command(ctx, cmd_name)
+
     def _write_commands_to_formatter(self, formatter, title, command_tpls, pre_text = None):
         if len(command_tpls):
             # Click recommended width
@@ -0,0 +1,561 @@
+# Generated by "python -m lmctl.cli.command_registry", do not edit.
+# Describes every lmctl command, so the CLI can list them (and show their help) without importing them.
+# Regenerate whenever a command, action or target is added, removed or has its help changed (a unit test checks it is up-to-date)
+COMMAND_INDEX = {'commands': {'deployment': {'module': 'lmctl.cli.commands.deployment_location',
+                             'attr': 'deployment',
+                             'short_help': 'Use "lmctl create/get/update/delete deploymentlocation"',
+                             'help': 'deprecated in v3.0: Commands for managing Deployment Locations',
+                             'hidden': False,
+                             'deprecated': False,
+                             'tags': ['Deprecated']},
+              'env': {'module': 'lmctl.cli.commands.env',
+                      'attr': 'env',
+                      'short_help': 'Use "get env"',
+                      'help': 'deprecated in v3.0: Commands for inspecting available CP4NA orchestration environments',
+                      'hidden': False,
+                      'deprecated': False,
+                      'tags': ['Deprecated']},
+              'resourcedriver': {'module': 'lmctl.cli.commands.resourcedriver',
+                                 'attr': 'resourcedriver',
+                                 'short_help': 'Use "lmctl create/get/delete resourcedriver"',
+                                 'help': 'deprecated in v3.0: Commands for managing Resource drivers (CP4NA orchestration 2.2+ only)',
+                                 'hidden': False,
+                                 'deprecated': False,
+                                 'tags': ['Deprecated']},
+              'pkg': {'module': 'lmctl.cli.commands.pkg',
+                      'attr': 'pkg',
+                      'short_help': 'Onboard a package built from a Project',
+                      'help': 'Onboard a package previously built from a Project, distributed as a ".tgz" or ".csar" file',
+                      'hidden': False,
+                      'deprecated': False,
+                      'tags': ['Projects']},
+              'project': {'module': 'lmctl.cli.commands.project',
+                          'attr': 'project',
+                          'short_help': 'Manage Assembly/Resource/NS/VNF Projects',
+                          'help': 'Commands for managing Assembly/Resource/NS/VNF Projects',
+                          'hidden': False,
+                          'deprecated': False,
+                          'tags': ['Projects']},
+              'key': {'module': 'lmctl.cli.commands.infrastructure_key',
+                      'attr': 'key',
+                      'short_help': 'Use "lmctl create/get/update/delete infrastructurekey"',
+                      'help': 'deprecated in v3.0: Commands for managing shared infrastructure keys',
+                      'hidden': False,
+                      'deprecated': False,
+                      'tags': ['Deprecated']},
+              'lifecycledriver': {'module': 'lmctl.cli.commands.lifecycledriver',
+                                  'attr': 'lifecycledriver',
+                                  'short_help': 'Use "lmctl create/get/delete resourcedriver"',
+                                  'help': 'deprecated in v3.0: Commands for managing Lifecycle drivers (CP4NA orchestration 2.1 only)',
+                                  'hidden': False,
+                                  'deprecated': False,
+                                  'tags': ['Deprecated']},
+              'vimdriver': {'module': 'lmctl.cli.commands.vimdriver',
+                            'attr': 'vimdriver',
+                            'short_help': 'Use "lmctl create/get/delete resourcedriver"',
+                            'help': 'deprecated in v3.0: Commands for managing VIM drivers (CP4NA orchestration 2.1 only)',
+                            'hidden': False,
+                            'deprecated': False,
+                            'tags': ['Deprecated']},
+              'login': {'module': 'lmctl.cli.commands.login',
+                        'attr': 'login',
+                        'short_help': 'Authenticate and save credentials',
+                        'help': 'Authenticate with an environment and save credentials in the lmctl config file for subsequent use',
+                        'hidden': False,
+                        'deprecated': False,
+                        'tags': ['Settings']},
+              'logdir': {'module': 'lmctl.cli.commands.logdir',
+                         'attr': 'logdir',
+                         'short_help': 'Print log file location',
+                         'help': 'Print log file location',
+                         'hidden': False,
+                         'deprecated': False,
+                         'tags': ['Settings']}},
+ 'actions': {'get': {'module': 'lmctl.cli.commands.actions.get_action',
+                     'class': 'Get',
+                     'short_help': None,
+                     'help': 'Display details of supported objects',
+                     'hidden': False,
+                     'deprecated': False,
+                     'tags': ['Actions'],
+                     'targets': {'assembly': {'short_help': 'Get Assembly',
+                                              'help': '                                            Get an Assembly by ID or name. Alternatively, get a list of '
+                                                      'most recent or by partial name match                                            ',
+                                              'hidden': False,
+                                              'deprecated': False,
+                                              'tags': []},
+                                 'assemblyconfig': {'short_help': 'Get Assembly Configuration',
+                                                    'help': '                                            Get Assembly Configuration by ID or all in a '
+                                                            'Behaviour Project                                            ',
+                                                    'hidden': False,
+                                                    'deprecated': False,
+                                                    'tags': []},
+                                 'behaviourproject': {'short_help': 'Get Behaviour Project',
+                                                      'help': '                                            Get all Behaviour Projects or get one by '
+                                                              'name                                            ',
+                                                      'hidden': False,
+                                                      'deprecated': False,
+                                                      'tags': []},
+                                 'config': {'short_help': None,
+                                            'help': 'Get the active LMCTL Configuration file',
+                                            'hidden': False,
+                                            'deprecated': False,
+                                            'tags': []},
+                                 'deploymentlocation': {'short_help': 'Get Deployment Location',
+                                                        'help': '                                            Get all Deployment Locations or get by name or '
+                                                                'get by partial name match                                            ',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                 'descriptor': {'short_help': 'Get Descriptor',
+                                                'help': '                                            Get a summary of all Descriptors or get the details of '
+                                                        'one by name                                            ',
+                                                'hidden': False,
+                                                'deprecated': False,
+                                                'tags': []},
+                                 'descriptortemplate': {'short_help': 'Get Descriptor Template',
+                                                        'help': '                                            Get a summary of all Descriptor Templates or get '
+                                                                'the details of one by name                                            ',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                 'env': {'short_help': None,
+                                         'help': 'Get LMCTL Environments from active config file',
+                                         'hidden': False,
+                                         'deprecated': False,
+                                         'tags': []},
+                                 'infrastructurekey': {'short_help': 'Get Infrastructure Key',
+                                                       'help': '                                            Get all Infrastructure Keys or get by '
+                                                               'name                                            ',
+                                                       'hidden': False,
+                                                       'deprecated': False,
+                                                       'tags': []},
+                                 'process': {'short_help': 'Get the status of an Assembly Process',
+                                             'help': '            Get the status of an Assembly Process.\n            ',
+                                             'hidden': False,
+                                             'deprecated': False,
+                                             'tags': []},
+                                 'resourcedriver': {'short_help': 'Get Resource Driver',
+                                                    'help': '                                            Get Resource Driver by ID or '
+                                                            'type                                            ',
+                                                    'hidden': False,
+                                                    'deprecated': False,
+                                                    'tags': []},
+                                 'resourcemanager': {'short_help': 'Get Resource Manager',
+                                                     'help': '                                            Get all Resource Managers or get by '
+                                                             'name                                            ',
+                                                     'hidden': False,
+                                                     'deprecated': False,
+                                                     'tags': []},
+                                 'scenario': {'short_help': 'Get Scenario',
+                                              'help': '                                            Get Scenario by ID or all in a Behaviour '
+                                                      'Project                                            ',
+                                              'hidden': False,
+                                              'deprecated': False,
+                                              'tags': []},
+                                 'scenarioexecution': {'short_help': 'Get Scenario Execution',
+                                                       'help': '                                            Get Scenario Execution by ID or all in a Behaviour '
+                                                               'Project or all of a particular Behaviour Scenario                                            ',
+                                                       'hidden': False,
+                                                       'deprecated': False,
+                                                       'tags': []}}},
+             'create': {'module': 'lmctl.cli.commands.actions.create_action',
+                        'class': 'Create',
+                        'short_help': None,
+                        'help': 'Create supported objects',
+                        'hidden': False,
+                        'deprecated': False,
+                        'tags': ['Actions'],
+                        'targets': {'assembly': {'short_help': 'Request an intent to create an Assembly',
+                                                 'help': '                        Request an intent to create an Assembly. The request can include the '
+                                                         'following parameters (either with --set or in a file with -f):\n'
+                                                         '                        ',
+                                                 'hidden': False,
+                                                 'deprecated': False,
+                                                 'tags': []},
+                                    'assemblyconfig': {'short_help': 'Create Assembly Configuration',
+                                                       'help': 'Create Assembly Configuration',
+                                                       'hidden': False,
+                                                       'deprecated': False,
+                                                       'tags': []},
+                                    'behaviourproject': {'short_help': 'Create Behaviour Project',
+                                                         'help': 'Create Behaviour Project',
+                                                         'hidden': False,
+                                                         'deprecated': False,
+                                                         'tags': []},
+                                    'config': {'short_help': None,
+                                               'help': 'Create starter LMCTL Configuration file',
+                                               'hidden': False,
+                                               'deprecated': False,
+                                               'tags': []},
+                                    'deploymentlocation': {'short_help': 'Create Deployment Location',
+                                                           'help': 'Create Deployment Location',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []},
+                                    'descriptor': {'short_help': 'Create Descriptor',
+                                                   'help': 'Create Descriptor',
+                                                   'hidden': False,
+                                                   'deprecated': False,
+                                                   'tags': []},
+                                    'descriptortemplate': {'short_help': 'Create Descriptor Template',
+                                                           'help': 'Create Descriptor Template',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []},
+                                    'infrastructurekey': {'short_help': 'Create Infrastructure Key',
+                                                          'help': 'Create Infrastructure Key',
+                                                          'hidden': False,
+                                                          'deprecated': False,
+                                                          'tags': []},
+                                    'intent': {'short_help': 'Request an intent of any type on an Assembly',
+                                               'help': '                        Request an intent of any type on an Assembly.                         ',
+                                               'hidden': False,
+                                               'deprecated': False,
+                                               'tags': []},
+                                    'resourcedriver': {'short_help': 'Create Resource Driver',
+                                                       'help': 'Create Resource Driver',
+                                                       'hidden': False,
+                                                       'deprecated': False,
+                                                       'tags': []},
+                                    'resourcemanager': {'short_help': 'Create Resource Manager',
+                                                        'help': 'Create Resource Manager',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                    'resourcepkg': {'short_help': 'Upload Brent Resource Package',
+                                                    'help': 'Upload Brent Resource Package                        ',
+                                                    'hidden': False,
+                                                    'deprecated': False,
+                                                    'tags': []},
+                                    'scenario': {'short_help': 'Create Scenario',
+                                                 'help': 'Create Scenario',
+                                                 'hidden': False,
+                                                 'deprecated': False,
+                                                 'tags': []}}},
+             'update': {'module': 'lmctl.cli.commands.actions.update_action',
+                        'class': 'Update',
+                        'short_help': None,
+                        'help': 'Update supported objects',
+                        'hidden': False,
+                        'deprecated': False,
+                        'tags': ['Actions'],
+                        'targets': {'assembly': {'short_help': 'Request an intent to upgrade an Assembly',
+                                                 'help': '                        Request an intent to upgrade an Assembly (Assembly must be in the Active '
+                                                         'state to proceed). The request can include the following properties:\n'
+                                                         '                        ',
+                                                 'hidden': False,
+                                                 'deprecated': False,
+                                                 'tags': []},
+                                    'assemblyconfig': {'short_help': 'Update Assembly Configuration',
+                                                       'help': 'Update Assembly Configuration',
+                                                       'hidden': False,
+                                                       'deprecated': False,
+                                                       'tags': []},
+                                    'behaviourproject': {'short_help': 'Update Behaviour Project',
+                                                         'help': 'Update Behaviour Project',
+                                                         'hidden': False,
+                                                         'deprecated': False,
+                                                         'tags': []},
+                                    'deploymentlocation': {'short_help': 'Update Deployment Location',
+                                                           'help': 'Update Deployment Location',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []},
+                                    'descriptor': {'short_help': 'Update Descriptor',
+                                                   'help': 'Update Descriptor',
+                                                   'hidden': False,
+                                                   'deprecated': False,
+                                                   'tags': []},
+                                    'descriptortemplate': {'short_help': 'Update Descriptor Template',
+                                                           'help': 'Update Descriptor Template',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []},
+                                    'infrastructurekey': {'short_help': 'Update Infrastructure Key',
+                                                          'help': 'Update Infrastructure Key',
+                                                          'hidden': False,
+                                                          'deprecated': False,
+                                                          'tags': []},
+                                    'resourcemanager': {'short_help': 'Update Resource Manager',
+                                                        'help': 'Update Resource Manager',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                    'resourcepkg': {'short_help': 'Update Brent Resource Package',
+                                                    'help': 'Update Brent Resource Package                        ',
+                                                    'hidden': False,
+                                                    'deprecated': False,
+                                                    'tags': []},
+                                    'scenario': {'short_help': 'Update Scenario',
+                                                 'help': 'Update Scenario',
+                                                 'hidden': False,
+                                                 'deprecated': False,
+                                                 'tags': []}}},
+             'delete': {'module': 'lmctl.cli.commands.actions.delete_action',
+                        'class': 'Delete',
+                        'short_help': None,
+                        'help': 'Delete supported objects',
+                        'hidden': False,
+                        'deprecated': False,
+                        'tags': ['Actions'],
+                        'targets': {'assembly': {'short_help': 'Request an intent to delete an Assembly',
+                                                 'help': '                        Request an intent to delete an Assembly.\n                        ',
+                                                 'hidden': False,
+                                                 'deprecated': False,
+                                                 'tags': []},
+                                    'assemblyconfig': {'short_help': 'Delete Assembly Configuration',
+                                                       'help': 'Delete Assembly Configuration',
+                                                       'hidden': False,
+                                                       'deprecated': False,
+                                                       'tags': []},
+                                    'behaviourproject': {'short_help': 'Delete Behaviour Project',
+                                                         'help': 'Delete Behaviour Project',
+                                                         'hidden': False,
+                                                         'deprecated': False,
+                                                         'tags': []},
+                                    'deploymentlocation': {'short_help': 'Delete Deployment Location',
+                                                           'help': 'Delete Deployment Location',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []},
+                                    'descriptor': {'short_help': 'Delete Descriptor',
+                                                   'help': 'Delete Descriptor',
+                                                   'hidden': False,
+                                                   'deprecated': False,
+                                                   'tags': []},
+                                    'descriptortemplate': {'short_help': 'Delete Descriptor Template',
+                                                           'help': 'Delete Descriptor Template',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []},
+                                    'infrastructurekey': {'short_help': 'Delete Infrastructure Key',
+                                                          'help': 'Delete Infrastructure Key',
+                                                          'hidden': False,
+                                                          'deprecated': False,
+                                                          'tags': []},
+                                    'resourcedriver': {'short_help': 'Delete Resource Driver',
+                                                       'help': '                Delete Resource Driver by ID or type                ',
+                                                       'hidden': False,
+                                                       'deprecated': False,
+                                                       'tags': []},
+                                    'resourcemanager': {'short_help': 'Delete Resource Manager',
+                                                        'help': 'Delete Resource Manager',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                    'resourcepkg': {'short_help': None, 'help': None, 'hidden': False, 'deprecated': False, 'tags': []},
+                                    'scenario': {'short_help': 'Delete Scenario', 'help': 'Delete Scenario', 'hidden': False, 'deprecated': False, 'tags': []},
+                                    'scenarioexecution': {'short_help': 'Delete Scenario Execution',
+                                                          'help': 'Delete Scenario Execution',
+                                                          'hidden': False,
+                                                          'deprecated': False,
+                                                          'tags': []}}},
+             'execute': {'module': 'lmctl.cli.commands.actions.execute_action',
+                         'class': 'Execute',
+                         'short_help': None,
+                         'help': 'Execute scenarios or another supported object',
+                         'hidden': False,
+                         'deprecated': False,
+                         'tags': ['Actions'],
+                         'targets': {'scenario': {'short_help': None,
+                                                  'help': '                    Execute a Behaviour Scenario (by ID)\n                    ',
+                                                  'hidden': False,
+                                                  'deprecated': False,
+                                                  'tags': []}}},
+             'cancel': {'module': 'lmctl.cli.commands.actions.cancel_action',
+                        'class': 'Cancel',
+                        'short_help': None,
+                        'help': 'Cancel scenario executions or another supported object',
+                        'hidden': False,
+                        'deprecated': False,
+                        'tags': ['Actions'],
+                        'targets': {'scenarioexecution': {'short_help': None,
+                                                          'help': '                Cancel Scenario Execution by ID\n                ',
+                                                          'hidden': False,
+                                                          'deprecated': False,
+                                                          'tags': []}}},
+             'changestate': {'module': 'lmctl.cli.commands.actions.change_state_action',
+                             'class': 'ChangeState',
+                             'short_help': None,
+                             'help': 'Change state of an Assembly or another supported object',
+                             'hidden': False,
+                             'deprecated': False,
+                             'tags': ['Actions'],
+                             'targets': {'assembly': {'short_help': 'Request an intent to change state of an Assembly',
+                                                      'help': '                        Request an intent to change state of an Assembly.\n'
+                                                              '                        ',
+                                                      'hidden': False,
+                                                      'deprecated': False,
+                                                      'tags': []}}},
+             'scale': {'module': 'lmctl.cli.commands.actions.scale_action',
+                       'class': 'Scale',
+                       'short_help': None,
+                       'help': 'Scale Assembly clusters and other supported objects',
+                       'hidden': False,
+                       'deprecated': False,
+                       'tags': ['Actions'],
+                       'targets': {'cluster': {'short_help': 'Request an intent to scale out/in a Cluster of an Assembly',
+                                               'help': '                        Request an intent to scale out/in a Cluster of an Assembly.\n'
+                                                       '                        ',
+                                               'hidden': False,
+                                               'deprecated': False,
+                                               'tags': []}}},
+             'heal': {'module': 'lmctl.cli.commands.actions.heal_action',
+                      'class': 'Heal',
+                      'short_help': None,
+                      'help': 'Heal Assembly components and other supported objects',
+                      'hidden': False,
+                      'deprecated': False,
+                      'tags': ['Actions'],
+                      'targets': {'assemblycomponent': {'short_help': 'Request an intent to heal an Assembly Component (e.g. Resource)',
+                                                        'help': '                        Request an intent to heal an Assembly Component\n'
+                                                                '                        ',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                  'resource': {'short_help': 'Request an intent to heal a Resource (same as assemblycomponent)',
+                                               'help': '                        Request an intent to heal a Resource\n                        ',
+                                               'hidden': False,
+                                               'deprecated': False,
+                                               'tags': []}}},
+             'adopt': {'module': 'lmctl.cli.commands.actions.adopt_action',
+                       'class': 'Adopt',
+                       'short_help': None,
+                       'help': 'Adopt Assembly or any other supported objects',
+                       'hidden': False,
+                       'deprecated': False,
+                       'tags': ['Actions'],
+                       'targets': {'assembly': {'short_help': 'Request an intent to adopt an Assembly',
+                                                'help': '                        Request an intent to adopt an Assembly. The request can include the following '
+                                                        'properties:\n'
+                                                        '                        ',
+                                                'hidden': False,
+                                                'deprecated': False,
+                                                'tags': []}}},
+             'render': {'module': 'lmctl.cli.commands.actions.render_action',
+                        'class': 'Render',
+                        'short_help': None,
+                        'help': 'Render Descriptor Templates or any other supported objects',
+                        'hidden': False,
+                        'deprecated': False,
+                        'tags': ['Actions'],
+                        'targets': {'descriptortemplate': {'short_help': 'Render a Descriptor Template and view the output',
+                                                           'help': '                        Render a Descriptor Template and view the output\n'
+                                                                   '                        ',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []}}},
+             'ping': {'module': 'lmctl.cli.commands.actions.ping_action',
+                      'class': 'Ping',
+                      'short_help': None,
+                      'help': 'Test connection to environments',
+                      'hidden': False,
+                      'deprecated': False,
+                      'tags': ['Settings', 'Actions'],
+                      'targets': {'env': {'short_help': None,
+                                          'help': '                    Test connection with Environments from active config file\n                    ',
+                                          'hidden': False,
+                                          'deprecated': False,
+                                          'tags': []}}},
+             'genfile': {'module': 'lmctl.cli.commands.actions.gen_file_action',
+                         'class': 'GenerateFile',
+                         'short_help': None,
+                         'help': 'Generate example file for supported object types',
+                         'hidden': False,
+                         'deprecated': False,
+                         'tags': ['Actions'],
+                         'targets': {'assembly': {'short_help': 'Generate file for Assembly',
+                                                  'help': 'Generate file for Assembly',
+                                                  'hidden': False,
+                                                  'deprecated': False,
+                                                  'tags': []},
+                                     'assemblyconfig': {'short_help': 'Generate file for Assembly Configuration',
+                                                        'help': 'Generate file for Assembly Configuration',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                     'behaviourproject': {'short_help': 'Generate file for Behaviour Project',
+                                                          'help': 'Generate file for Behaviour Project',
+                                                          'hidden': False,
+                                                          'deprecated': False,
+                                                          'tags': []},
+                                     'deploymentlocation': {'short_help': 'Generate file for Deployment Location',
+                                                            'help': 'Generate file for Deployment Location',
+                                                            'hidden': False,
+                                                            'deprecated': False,
+                                                            'tags': []},
+                                     'descriptor': {'short_help': 'Generate file for Descriptor',
+                                                    'help': 'Generate file for Descriptor',
+                                                    'hidden': False,
+                                                    'deprecated': False,
+                                                    'tags': []},
+                                     'descriptortemplate': {'short_help': 'Generate file for Descriptor Template',
+                                                            'help': 'Generate file for Descriptor Template',
+                                                            'hidden': False,
+                                                            'deprecated': False,
+                                                            'tags': []},
+                                     'infrastructurekey': {'short_help': 'Generate file for Infrastructure Key',
+                                                           'help': 'Generate file for Infrastructure Key',
+                                                           'hidden': False,
+                                                           'deprecated': False,
+                                                           'tags': []},
+                                     'intent': {'short_help': 'Generate file for Intent',
+                                                'help': 'Generate file for Intent',
+                                                'hidden': False,
+                                                'deprecated': False,
+                                                'tags': []},
+                                     'resourcedriver': {'short_help': 'Generate file for Resource Driver',
+                                                        'help': 'Generate file for Resource Driver',
+                                                        'hidden': False,
+                                                        'deprecated': False,
+                                                        'tags': []},
+                                     'resourcemanager': {'short_help': 'Generate file for Resource Manager',
+                                                         'help': 'Generate file for Resource Manager',
+                                                         'hidden': False,
+                                                         'deprecated': False,
+                                                         'tags': []},
+                                     'scenario': {'short_help': 'Generate file for Scenario',
+                                                  'help': 'Generate file for Scenario',
+                                                  'hidden': False,
+                                                  'deprecated': False,
+                                                  'tags': []}}},
+             'use': {'module': 'lmctl.cli.commands.actions.use_action',
+                     'class': 'Use',
+                     'short_help': None,
+                     'help': 'Change active environment',
+                     'hidden': False,
+                     'deprecated': False,
+                     'tags': ['Settings', 'Actions'],
+                     'targets': {'env': {'short_help': None,
+                                         'help': 'Change the active environment (default environment used by commands)',
+                                         'hidden': False,
+                                         'deprecated': False,
+                                         'tags': []}}}},
+ 'targets': {'deploymentlocation': {'module': 'lmctl.cli.commands.targets.deployment_location',
+                                    'class': 'DeploymentLocations',
+                                    'plural': 'deploymentlocations'},
+             'resourcedriver': {'module': 'lmctl.cli.commands.targets.resource_driver', 'class': 'ResourceDrivers', 'plural': 'resourcedrivers'},
+             'env': {'module': 'lmctl.cli.commands.targets.env', 'class': 'Environments', 'plural': 'envs'},
+             'infrastructurekey': {'module': 'lmctl.cli.commands.targets.infrastructure_keys', 'class': 'InfrastructureKeys', 'plural': 'infrastructurekeys'},
+             'assemblyconfig': {'module': 'lmctl.cli.commands.targets.behaviour_assembly_configurations',
+                                'class': 'AssemblyConfigurations',
+                                'plural': 'assemblyconfigs'},
+             'behaviourproject': {'module': 'lmctl.cli.commands.targets.behaviour_projects', 'class': 'Projects', 'plural': 'behaviourprojects'},
+             'scenario': {'module': 'lmctl.cli.commands.targets.behaviour_scenarios', 'class': 'Scenarios', 'plural': 'scenarios'},
+             'scenarioexecution': {'module': 'lmctl.cli.commands.targets.behaviour_scenario_executions',
+                                   'class': 'ScenarioExecutions',
+                                   'plural': 'scenarioexecutions'},
+             'descriptor': {'module': 'lmctl.cli.commands.targets.descriptors', 'class': 'Descriptors', 'plural': 'descriptors'},
+             'descriptortemplate': {'module': 'lmctl.cli.commands.targets.descriptor_templates',
+                                    'class': 'DescriptorTemplates',
+                                    'plural': 'descriptortemplates'},
+             'resourcemanager': {'module': 'lmctl.cli.commands.targets.resource_managers', 'class': 'ResourceManagers', 'plural': 'resourcemanagers'},
+             'resourcepkg': {'module': 'lmctl.cli.commands.targets.resource_packages', 'class': 'ResourcePackages', 'plural': 'resourcepkgs'},
+             'assembly': {'module': 'lmctl.cli.commands.targets.assemblies', 'class': 'Assemblies', 'plural': 'assemblies'},
+             'cluster': {'module': 'lmctl.cli.commands.targets.clusters', 'class': 'Cluster', 'plural': 'clusters'},
+             'assemblycomponent': {'module': 'lmctl.cli.commands.targets.assembly_components', 'class': 'AssemblyComponents', 'plural': 'assemblycomponents'},
+             'resource': {'module': 'lmctl.cli.commands.targets.resources', 'class': 'Resource', 'plural': 'resources'},
+             'intent': {'module': 'lmctl.cli.commands.targets.intents', 'class': 'Intents', 'plural': 'intents'},
+             'process': {'module': 'lmctl.cli.commands.targets.processes', 'class': 'Processes', 'plural': 'processes'},
+             'config': {'module': 'lmctl.cli.commands.targets.config', 'class': 'Configuration', 'plural': 'configs'}}}
@@ -0,0 +1,198 @@
+import importlib
+import importlib.util
+import pprint
+import click
+from typing import Dict, List, Tuple
+from .cmd_tags import TagFormattedGroup, get_tags, tag
+
+# Commands added to the root "lmctl" group, as the (module, attribute) of each click command/group.
+# Actions (get, create etc.) are added from the action_types and target_instances of lmctl.cli.commands
+ROOT_COMMANDS = [
+    ('lmctl.cli.commands.deployment_location', 'deployment'),
+    ('lmctl.cli.commands.env', 'env'),
+    ('lmctl.cli.commands.resourcedriver', 'resourcedriver'),
+    ('lmctl.cli.commands.pkg', 'pkg'),
+    ('lmctl.cli.commands.project', 'project'),
+    ('lmctl.cli.commands.infrastructure_key', 'key'),
+    ('lmctl.cli.commands.lifecycledriver', 'lifecycledriver'),
+    ('lmctl.cli.commands.vimdriver', 'vimdriver'),
+    ('lmctl.cli.commands.login', 'login'),
+    ('lmctl.cli.commands.logdir', 'logdir')
+]
+
+INDEX_MODULE = 'lmctl.cli.command_index'
+INDEX_HEADER = '''\
+# Generated by "python -m lmctl.cli.command_registry", do not edit.
+# Describes every lmctl command, so the CLI can list them (and show their help) without importing them.
+# Regenerate whenever a command, action or target is added, removed or has its help changed (a unit test checks it is up-to-date)
+'''
+
+def lazy_attributes(package: str, attributes: Dict[str, Tuple[str, str]]):
+    """
+    Build a module level `__getattr__` (PEP 562) for `package`, so each attribute is only imported (from the (module, name) it maps to)
+    when first used
+    """
+    def __getattr__(name):
+        if name not in attributes:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        module_name, attr_name = attributes[name]
+        value = getattr(importlib.import_module(module_name, package), attr_name)
+        setattr(importlib.import_module(package), name, value)
+        return value
+    return __getattr__
+
+
+def _describe(cmd: click.Command) -> Dict:
+    # Only the first paragraph of help is needed for short help
+    help = cmd.help
+    if help is not None:
+        paragraph_end = help.find('\n\n')
+        if paragraph_end != -1:
+            help = help[:paragraph_end]
+    return {
+        'short_help': cmd.short_help,
+        'help': help,
+        'hidden': cmd.hidden,
+        'deprecated': cmd.deprecated,
+        'tags': list(get_tags(cmd))
+    }
+
+def build_command_index() -> Dict:
+    """
+    Import every command, action and target to build the index saved in lmctl.cli.command_index
+    """
+    from .commands.actions import action_types
+    from .commands.targets import target_instances
+    commands = {}
+    for module_name, attr_name in ROOT_COMMANDS:
+        cmd = getattr(importlib.import_module(module_name), attr_name)
+        commands[cmd.name] = {'module': module_name, 'attr': attr_name, **_describe(cmd)}
+    targets = {}
+    for target in target_instances:
+        targets[target.name] = {'module': type(target).__module__, 'class': type(target).__name__, 'plural': getattr(target, 'plural', None)}
+    actions = {}
+    for action_type in action_types:
+        action = action_type(targets=target_instances)
+        action_targets = {}
+        for target_name in action.list_commands(None):
+            action_targets[target_name] = _describe(action.get_command(None, target_name))
+        actions[action.name] = {'module': action_type.__module__, 'class': action_type.__name__, **_describe(action), 'targets': action_targets}
+    return {'commands': commands, 'actions': actions, 'targets': targets}
+
+def write_command_index(path: str = None) -> str:
+    if path is None:
+        path = importlib.util.find_spec(INDEX_MODULE).origin
+    with open(path, 'w') as f:
+        f.write(INDEX_HEADER)
+        f.write('COMMAND_INDEX = ')
+        f.write(pprint.pformat(build_command_index(), width=160, sort_dicts=False))
+        f.write('\n')
+    return path
+
+
+def _summary_command(name: str, entry: Dict) -> click.Command:
+    """
+    Stand-in for a command, with enough of its details (from the index) to list it in help text or shell completion
+    """
+    cmd = click.Command(name, short_help=entry.get('short_help'), help=entry.get('help'), hidden=entry.get('hidden', False),
+                            deprecated=entry.get('deprecated', False))
+    for tag_name in entry.get('tags', []):
+        tag(tag_name)(cmd)
+    return cmd
+
+def visible_completions(cmd: click.Group, ctx: click.Context, incomplete: str, summaries: Dict[str, click.Command]) -> List:
+    """
+    Shell completion of a group, offering the (visible) commands in summaries without loading them
+    """
+    from click.shell_completion import CompletionItem
+    results = [CompletionItem(name, help=summary.get_short_help_str()) for name, summary in summaries.items() if name.startswith(incomplete) and not summary.hidden]
+    results.extend(click.Command.shell_complete(cmd, ctx, incomplete))
+    return results
+
+
+class CommandIndex:
+    """
+    Loads commands, actions and targets from an index generated by `build_command_index`, importing each module only when the command is invoked
+    """
+
+    def __init__(self, index: Dict):
+        self.commands = index.get('commands', {})
+        self.actions = index.get('actions', {})
+        self.targets = index.get('targets', {})
+        self._targets_by_plural = {entry['plural']: name for name, entry in self.targets.items() if entry.get('plural') is not None}
+        self._loaded_targets = {}
+        self._summaries = None
+
+    def command_names(self) -> List[str]:
+        return sorted(list(self.commands.keys()) + list(self.actions.keys()))
+
+    def summaries(self) -> Dict[str, click.Command]:
+        if self._summaries is None:
+            entries = {**self.commands, **self.actions}
+            self._summaries = {name: _summary_command(name, entries[name]) for name in self.command_names()}
+        return self._summaries
+
+    def load_command(self, name: str) -> click.Command:
+        if name in self.commands:
+            entry = self.commands[name]
+            return getattr(importlib.import_module(entry['module']), entry['attr'])
+        if name in self.actions:
+            entry = self.actions[name]
+            action_type = getattr(importlib.import_module(entry['module']), entry['class'])
+            return action_type(target_index=self)
+        return None
+
+    def action_target_names(self, action_name: str) -> List[str]:
+        return sorted(self.actions.get(action_name, {}).get('targets', {}).keys())
+
+    def action_target_summaries(self, action_name: str) -> Dict[str, click.Command]:
+        action_targets = self.actions.get(action_name, {}).get('targets', {})
+        return {name: _summary_command(name, action_targets[name]) for name in sorted(action_targets.keys())}
+
+    def load_target(self, name: str):
+        """
+        Get the Target instance by name or plural name, returns None if there is no such Target
+        """
+        name = self._targets_by_plural.get(name, name)
+        if name not in self.targets:
+            return None
+        if name not in self._loaded_targets:
+            entry = self.targets[name]
+            target_type = getattr(importlib.import_module(entry['module']), entry['class'])
+            self._loaded_targets[name] = target_type()
+        return self._loaded_targets[name]
+
+
+class LazyCommandGroup(TagFormattedGroup):
+    """
+    Group with commands from a CommandIndex, as well as any added with `add_command`. Each is only imported when invoked;
+    help text and shell completion are produced from the index alone
+    """
+
+    def __init__(self, *args, command_index: CommandIndex = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.command_index = command_index if command_index is not None else CommandIndex({})
+
+    def list_commands(self, ctx):
+        return sorted(set(self.commands.keys()).union(self.command_index.command_names()))
+
+    def get_command(self, ctx, name):
+        if name not in self.commands:
+            cmd = self.command_index.load_command(name)
+            if cmd is None:
+                return None
+            self.add_command(cmd, name=name)
+        return self.commands[name]
+
+    def _get_listed_command(self, ctx, name):
+        if name in self.commands:
+            return self.commands[name]
+        return self.command_index.summaries().get(name)
+
+    def shell_complete(self, ctx, incomplete):
+        summaries = {**self.command_index.summaries(), **self.commands}
+        return visible_completions(self, ctx, incomplete, summaries)
+
+
+if __name__ == '__main__':
+    print(f'Written command index to: {write_command_index()}')
@@ -1,12 +1,17 @@
-from .env import env as env_group
-from .pkg import pkg as pkg_group
-from .project import project as project_group
-from .deployment_location import deployment as deployment_group
-from .resourcedriver import resourcedriver as resourcedriver_group
-from .infrastructure_key import key as key_group
-from .lifecycledriver import lifecycledriver as lifecycledriver_group
-from .vimdriver import vimdriver as vimdriver_group
-from .actions import action_types
-from .targets import target_instances
-from .login import login as login_cmd
-from .logdir import logdir as logdir_cmd
\ No newline at end of file
+from lmctl.cli.command_registry import lazy_attributes
+
+# Imported on first use, so invoking one command does not import all of them (see lmctl.cli.command_registry)
+__getattr__ = lazy_attributes(__name__, {
+    'env_group': ('.env', 'env'),
+    'pkg_group': ('.pkg', 'pkg'),
+    'project_group': ('.project', 'project'),
+    'deployment_group': ('.deployment_location', 'deployment'),
+    'resourcedriver_group': ('.resourcedriver', 'resourcedriver'),
+    'key_group': ('.infrastructure_key', 'key'),
+    'lifecycledriver_group': ('.lifecycledriver', 'lifecycledriver'),
+    'vimdriver_group': ('.vimdriver', 'vimdriver'),
+    'action_types': ('.actions', 'action_types'),
+    'target_instances': ('.targets', 'target_instances'),
+    'login_cmd': ('.login', 'login'),
+    'logdir_cmd': ('.logdir', 'logdir')
+})
@@ -4,7 +4,7 @@ from lmctl.cli.cmd_tags import actions_tag
 
 class Action(click.MultiCommand):
 
-    def __init__(self, name: str = None, group_attrs: Dict = None, targets: List = None):
+    def __init__(self, name: str = None, group_attrs: Dict = None, targets: List = None, target_index: 'CommandIndex' = None):
         if name is None:
             if not hasattr(self, 'name'):
                 raise ValueError(f'Subclass of Action must set "name" class attribute: Subclass={self.__class__.__name__}')
@@ -17,6 +17,8 @@ class Action(click.MultiCommand):
         else:
             group_attrs_to_pass = {}
         self.targets = targets
+        # When set (instead of targets), each Target is only imported when one of its commands is invoked
+        self.target_index = target_index
         actions_tag(self)
         super().__init__(name=self.name, **group_attrs_to_pass)
 
@@ -28,6 +30,8 @@ class Action(click.MultiCommand):
         return False, None
 
     def list_commands(self, ctx):
+        if self.target_index is not None:
+            return self.target_index.action_target_names(self.name)
         result = []
         for t in self.targets:
             can_act, _ = self._can_act_on(t)
@@ -37,10 +41,32 @@ class Action(click.MultiCommand):
         return result
 
     def get_command(self, ctx, name):
+        if self.target_index is not None:
+            target = self.target_index.load_target(name)
+            if target is not None:
+                can_act, callable_on_target = self._can_act_on(target)
+                if can_act:
+                    return callable_on_target
+            return None
         for t in self.targets:
             if t.name == name or (hasattr(t, 'plural') and getattr(t, 'plural') == name):
                 can_act, callable_on_target = self._can_act_on(t)
                 if can_act:
                     return callable_on_target
                 break
-        return None
\ No newline at end of file
+        return None
+
+    def format_commands(self, ctx, formatter):
+        if self.target_index is None:
+            return super().format_commands(ctx, formatter)
+        summaries = [(name, cmd) for name, cmd in self.target_index.action_target_summaries(self.name).items() if not cmd.hidden]
+        if len(summaries) > 0:
+            limit = formatter.width - 6 - max(len(name) for name, _ in summaries)
+            with formatter.section('Commands'):
+                formatter.write_dl([(name, cmd.get_short_help_str(limit)) for name, cmd in summaries])
+
+    def shell_complete(self, ctx, incomplete):
+        if self.target_index is None:
+            return super().shell_complete(ctx, incomplete)
+        from lmctl.cli.command_registry import visible_completions
+        return visible_completions(self, ctx, incomplete, self.target_index.action_target_summaries(self.name))
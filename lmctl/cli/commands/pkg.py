@@ -25,16 +25,18 @@ PUSH_HEADER = 'Push'
 @click.option('--armname', default='defaultrm', help='if using ansible-rm packaging the name of ARM to upload Resources to must be provided')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
-def push(package, environment, config, armname, pwd, autocorrect):
+@click.option('--parallel', default=1, type=click.IntRange(min=1), help='number of subpackages to push at the same time. Sibling subpackages are pushed in parallel but each parent is still pushed after its own subpackages')
+@click.option('--delta', default=False, is_flag=True, help='skip content unchanged since the last push to this environment (descriptors are compared with the copy in the environment, other content with a record of the last push kept in ~/.lmctl/push-state)')
+@click.option('--behaviour-parallel', default=1, type=click.IntRange(min=1), help='number of Assembly Configurations/Scenarios of each project to create or update at the same time')
+def push(package, environment, config, armname, pwd, autocorrect, parallel, delta, behaviour_parallel):
     """Pushes an existing Assembly/Resource package to a target CP4NA orchestration (and ARM) environment"""
     logger.debug('Pushing package at: {0}'.format(package))
-    pkg, pkg_content = lifecycle_cli.get_pkg_and_open(package)
-    try:
-        env_sessions = lifecycle_cli.build_sessions_for_pkg(pkg_content.meta, environment, pwd, armname, config)
-        controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
-        controller.start(package)
-        exec_push(controller, pkg, env_sessions, allow_autocorrect=autocorrect)
-    finally:
+    pkg, pkg_meta = lifecycle_cli.get_pkg_and_read_meta(package)
+    env_sessions = lifecycle_cli.build_sessions_for_pkg(pkg_meta, environment, pwd, armname, config)
+    controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
+    controller.start(package)
+    pkg_content = exec_push(controller, pkg, env_sessions, allow_autocorrect=autocorrect, parallel=parallel, delta=delta, behaviour_parallel=behaviour_parallel)
+    if pkg_content is not None:
         cleanup_pkg(pkg_content)
     controller.finalise()
 
@@ -45,13 +47,9 @@ def push(package, environment, config, armname, pwd, autocorrect):
 @click.option('-f', '--format', 'output_format', default='yaml', help='format of output [yaml, json]')
 def inspect(package, config, output_format):
     logger.debug('Inspecting package at: {0}'.format(package))
-    pkg_content = lifecycle_cli.open_pkg(package)
-    try:
-        inspection_report = pkg_content.inspect()
-        result = format_inspection_report(output_format, inspection_report)
-        click.echo(result)
-    finally:
-        cleanup_pkg(pkg_content)
+    inspection_report = lifecycle_cli.inspect_pkg(package)
+    result = format_inspection_report(output_format, inspection_report)
+    click.echo(result)
     
 def cleanup_pkg(pkg):
     if os.path.exists(pkg.tree.root_path):
@@ -64,8 +62,11 @@ def format_inspection_report(output_format, inspection_report):
     result = formatter.convert_element(inspection_report_tpl)
     return result
 
-def exec_push(controller, pkg, env_sessions, allow_autocorrect=False):
+def exec_push(controller, pkg, env_sessions, allow_autocorrect=False, parallel=1, delta=False, behaviour_parallel=1):
     push_options = pkgs.PushOptions()
     push_options.allow_autocorrect = allow_autocorrect
+    push_options.parallel = parallel
+    push_options.delta = delta
+    push_options.behaviour_parallel = behaviour_parallel
     push_options.journal_consumer = controller.consumer
     return controller.execute(pkg.push, env_sessions, push_options)
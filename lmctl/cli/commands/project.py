@@ -3,6 +3,7 @@ import click
 import logging
 import os
 import lmctl.project.package.core as pkgs
+import lmctl.project.package.compression as compression
 import lmctl.project.source.core as project_sources
 import lmctl.project.source.creator as creator
 import lmctl.project.types as project_types
@@ -40,30 +41,53 @@ def exec_validate(controller, project, allow_autocorrect=False):
     return validation_result
 
 
-def exec_build(controller, project, allow_autocorrect=False):
+def exec_build(controller, project, allow_autocorrect=False, incremental=False, compression_level=compression.DEFAULT_COMPRESSION_LEVEL, reproducible=False):
     build_options = project_sources.BuildOptions()
     build_options.allow_autocorrect = allow_autocorrect
+    build_options.incremental = incremental
+    build_options.compression = compression.CompressionOptions(level=compression_level, reproducible=reproducible)
     build_options.journal_consumer = controller.consumer
     build_result = controller.execute(project.build, build_options)
     controller.process_validation_result(build_result.validation_result)
     return build_result
 
 
-def exec_push(controller, pkg, env_sessions):
+def exec_push(controller, pkg, env_sessions, parallel=1, delta=False, behaviour_parallel=1):
     push_options = pkgs.PushOptions()
+    push_options.parallel = parallel
+    push_options.delta = delta
+    push_options.behaviour_parallel = behaviour_parallel
     push_options.journal_consumer = controller.consumer
     return controller.execute(pkg.push, env_sessions, push_options)
 
 
-def exec_test(controller, pkg_content, env_sessions, tests):
+def exec_build_and_push(controller, project, env_sessions, allow_autocorrect=False, incremental=False, delta=False, compression_level=compression.DEFAULT_COMPRESSION_LEVEL, reproducible=False, behaviour_parallel=1):
+    build_options = project_sources.BuildOptions()
+    build_options.allow_autocorrect = allow_autocorrect
+    build_options.incremental = incremental
+    build_options.compression = compression.CompressionOptions(level=compression_level, reproducible=reproducible)
+    build_options.journal_consumer = controller.consumer
+    push_options = pkgs.PushOptions()
+    push_options.allow_autocorrect = allow_autocorrect
+    push_options.delta = delta
+    push_options.behaviour_parallel = behaviour_parallel
+    push_options.journal_consumer = controller.consumer
+    result = controller.execute(project.build_and_push, env_sessions, build_options, push_options)
+    controller.process_validation_result(result.validation_result)
+    return result
+
+
+def exec_test(controller, pkg_content, env_sessions, tests, parallel=1):
     test_options = pkgs.TestOptions(tests)
+    test_options.parallel = parallel
     test_options.journal_consumer = controller.consumer
     test_report = controller.execute(pkg_content.test, env_sessions, test_options)
     controller.process_test_report(test_report)
 
 
-def exec_pull(controller, project, env_sessions):
+def exec_pull(controller, project, env_sessions, parallel=1):
     pull_options = project_sources.PullOptions()
+    pull_options.parallel = parallel
     pull_options.journal_consumer = controller.consumer
     controller.execute(project.pull, env_sessions, pull_options)
 
@@ -84,13 +108,16 @@ def validate(project_path, autocorrect):
 @project.command(help='Build distributable package for Project')
 @click.option('--project', 'project_path',  default='./', help='File location of project')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
-def build(project_path, autocorrect):
+@click.option('--incremental', default=False, is_flag=True, help='only stage and compile subprojects with source changes since the last incremental build, reusing the previous output of the others')
+@click.option('--compression-level', default=compression.DEFAULT_COMPRESSION_LEVEL, type=click.IntRange(min=0, max=9), help='compression level of the package and Resource packages, from 0 (store only, fastest) to 9 (smallest). Files which are already compressed, such as qcow2 images, are always stored as they are')
+@click.option('--reproducible', default=False, is_flag=True, help='give every file in the package and Resource packages the same timestamp, owner and permissions, so building the same sources always produces an identical package')
+def build(project_path, autocorrect, incremental, compression_level, reproducible):
     """Builds an Assembly/Resource project"""
     logger.debug('Building project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
     controller = lifecycle_cli.ExecutionController(BUILD_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
-    exec_build(controller, project, allow_autocorrect=autocorrect)
+    exec_build(controller, project, allow_autocorrect=autocorrect, incremental=incremental, compression_level=compression_level, reproducible=reproducible)
     controller.finalise()
 
 
@@ -101,15 +128,27 @@ def build(project_path, autocorrect):
 @click.option('--armname', default='defaultrm', help='if using ansible-rm packaging the name of ARM to upload Resources must be provided')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
-def push(project_path, environment, config, armname, pwd, autocorrect):
+@click.option('--parallel', default=1, type=click.IntRange(min=1), help='number of subprojects/subpackages to push at the same time. Sibling subprojects are pushed in parallel but each parent is still pushed after its own subprojects')
+@click.option('--incremental', default=False, is_flag=True, help='only stage and compile subprojects with source changes since the last incremental build, reusing the previous output of the others')
+@click.option('--compression-level', default=compression.DEFAULT_COMPRESSION_LEVEL, type=click.IntRange(min=0, max=9), help='compression level of the package and Resource packages, from 0 (store only, fastest) to 9 (smallest). Files which are already compressed, such as qcow2 images, are always stored as they are')
+@click.option('--reproducible', default=False, is_flag=True, help='give every file in the package and Resource packages the same timestamp, owner and permissions, so building the same sources always produces an identical package')
+@click.option('--delta', default=False, is_flag=True, help='skip content unchanged since the last push to this environment (descriptors are compared with the copy in the environment, other content with a record of the last push kept in ~/.lmctl/push-state)')
+@click.option('--pipeline', default=False, is_flag=True, help='push the content of each subproject as soon as it has been compiled, so uploads overlap with compiling the rest of the project. Cannot be used with --parallel')
+@click.option('--behaviour-parallel', default=1, type=click.IntRange(min=1), help='number of Assembly Configurations/Scenarios of each project to create or update at the same time')
+def push(project_path, environment, config, armname, pwd, autocorrect, parallel, incremental, compression_level, reproducible, delta, pipeline, behaviour_parallel):
     """Push an Assembly/Resource project"""
     logger.debug('Pushing project at: {0}'.format(project_path))
+    if pipeline and parallel > 1:
+        raise click.UsageError('--pipeline cannot be used with --parallel')
     project = lifecycle_cli.open_project(project_path)
     env_sessions = lifecycle_cli.build_sessions_for_project(project.config, environment, pwd, armname, config)
     controller = lifecycle_cli.ExecutionController(PUSH_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
-    build_result = exec_build(controller, project, allow_autocorrect=autocorrect)
-    exec_push(controller, build_result.pkg, env_sessions)
+    if pipeline:
+        exec_build_and_push(controller, project, env_sessions, allow_autocorrect=autocorrect, incremental=incremental, delta=delta, compression_level=compression_level, reproducible=reproducible, behaviour_parallel=behaviour_parallel)
+    else:
+        build_result = exec_build(controller, project, allow_autocorrect=autocorrect, incremental=incremental, compression_level=compression_level, reproducible=reproducible)
+        exec_push(controller, build_result.pkg, env_sessions, parallel=parallel, delta=delta, behaviour_parallel=behaviour_parallel)
     controller.finalise()
 
 def __parse_tests_option(tests):
@@ -127,16 +166,20 @@ def __parse_tests_option(tests):
 @click.option('--tests', default=None, help='specify comma separated list of individual tests to execute')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
 @click.option('--autocorrect', default=False, is_flag=True, help='allow validation warnings and errors to be autocorrected if supported')
-def test(project_path, environment, config, armname, tests, pwd, autocorrect):
+@click.option('--parallel', default=1, type=click.IntRange(min=1), help='number of tests to execute at the same time')
+@click.option('--incremental', default=False, is_flag=True, help='only stage and compile subprojects with source changes since the last incremental build, reusing the previous output of the others')
+@click.option('--compression-level', default=compression.DEFAULT_COMPRESSION_LEVEL, type=click.IntRange(min=0, max=9), help='compression level of the package and Resource packages, from 0 (store only, fastest) to 9 (smallest). Files which are already compressed, such as qcow2 images, are always stored as they are')
+@click.option('--reproducible', default=False, is_flag=True, help='give every file in the package and Resource packages the same timestamp, owner and permissions, so building the same sources always produces an identical package')
+def test(project_path, environment, config, armname, tests, pwd, autocorrect, parallel, incremental, compression_level, reproducible):
     """Builds, pushes and runs the tests of an Assembly/Resource project on a target CP4NA orchestration (and ARM) environment"""
     logger.debug('Testing project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
     env_sessions = lifecycle_cli.build_sessions_for_project(project.config, environment, pwd, armname, config)
     controller = lifecycle_cli.ExecutionController(TEST_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
-    build_result = exec_build(controller, project, allow_autocorrect=autocorrect)
+    build_result = exec_build(controller, project, allow_autocorrect=autocorrect, incremental=incremental, compression_level=compression_level, reproducible=reproducible)
     pkg_content = exec_push(controller, build_result.pkg, env_sessions)
-    exec_test(controller, pkg_content, env_sessions, __parse_tests_option(tests))
+    exec_test(controller, pkg_content, env_sessions, __parse_tests_option(tests), parallel=parallel)
     controller.finalise()
 
 
@@ -145,14 +188,15 @@ def test(project_path, environment, config, armname, tests, pwd, autocorrect):
 @click.argument('environment', required=False, default=None)
 @click.option('--config', default=None, help='configuration file')
 @click.option('--pwd', '--api-key', default=None, help='password/api_key used for authenticating with CP4NA orchestration. Only required if the environment is secure and a username has been included in your configuration file with no password (api_key when using auth_mode=zen)')
-def pull(project_path, environment, config, pwd):
+@click.option('--parallel', default=1, type=click.IntRange(min=1), help='number of subprojects to fetch content for at the same time. Local files are still backed up and written in order, once all content has been fetched')
+def pull(project_path, environment, config, pwd, parallel):
     """Pulls the content of a Assembly/Resource from a target CP4NA orchestration environment, overidding local content"""
     logger.debug('Pulling project at: {0}'.format(project_path))
     project = lifecycle_cli.open_project(project_path)
     env_sessions = lifecycle_cli.build_sessions_for_project(project.config, environment, pwd, None, config)
     controller = lifecycle_cli.ExecutionController(PULL_HEADER)
     controller.start('{0} at {1}'.format(project.config.name, project_path))
-    exec_pull(controller, project, env_sessions)
+    exec_pull(controller, project, env_sessions, parallel=parallel)
     controller.finalise()
 
 @project.command(help='List element(s) of a Project. Element options: tests')
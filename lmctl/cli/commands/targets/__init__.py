@@ -1,43 +1,34 @@
+from lmctl.cli.command_registry import lazy_attributes
 
 # Targets
-from .deployment_location import DeploymentLocations
-from .resource_driver import ResourceDrivers
-from .env import Environments
-from .infrastructure_keys import InfrastructureKeys
-from .behaviour_assembly_configurations import AssemblyConfigurations
-from .behaviour_projects import Projects
-from .behaviour_scenarios import Scenarios
-from .behaviour_scenario_executions import ScenarioExecutions
-from .descriptors import Descriptors
-from .descriptor_templates import DescriptorTemplates
-from .resource_managers import ResourceManagers
-from .resource_packages import ResourcePackages
-from .assemblies import Assemblies
-from .clusters import Cluster
-from .assembly_components import AssemblyComponents
-from .resources import Resource
-from .intents import Intents
-from .processes import Processes
-from .config import Configuration
+# Imported on first use, so invoking a command on one Target does not import all of them (see lmctl.cli.command_registry)
+_target_types = {
+    'DeploymentLocations': ('.deployment_location', 'DeploymentLocations'),
+    'ResourceDrivers': ('.resource_driver', 'ResourceDrivers'),
+    'Environments': ('.env', 'Environments'),
+    'InfrastructureKeys': ('.infrastructure_keys', 'InfrastructureKeys'),
+    'AssemblyConfigurations': ('.behaviour_assembly_configurations', 'AssemblyConfigurations'),
+    'Projects': ('.behaviour_projects', 'Projects'),
+    'Scenarios': ('.behaviour_scenarios', 'Scenarios'),
+    'ScenarioExecutions': ('.behaviour_scenario_executions', 'ScenarioExecutions'),
+    'Descriptors': ('.descriptors', 'Descriptors'),
+    'DescriptorTemplates': ('.descriptor_templates', 'DescriptorTemplates'),
+    'ResourceManagers': ('.resource_managers', 'ResourceManagers'),
+    'ResourcePackages': ('.resource_packages', 'ResourcePackages'),
+    'Assemblies': ('.assemblies', 'Assemblies'),
+    'Cluster': ('.clusters', 'Cluster'),
+    'AssemblyComponents': ('.assembly_components', 'AssemblyComponents'),
+    'Resource': ('.resources', 'Resource'),
+    'Intents': ('.intents', 'Intents'),
+    'Processes': ('.processes', 'Processes'),
+    'Configuration': ('.config', 'Configuration')
+}
 
-target_instances = [
-    DeploymentLocations(), 
-    ResourceDrivers(), 
-    Environments(), 
-    InfrastructureKeys(), 
-    AssemblyConfigurations(), 
-    Projects(),
-    Scenarios(),
-    ScenarioExecutions(),
-    Descriptors(),
-    DescriptorTemplates(),
-    ResourceManagers(),
-    ResourcePackages(),
-    Assemblies(),
-    Cluster(),
-    AssemblyComponents(),
-    Resource(), 
-    Intents(),
-    Processes(),
-    Configuration()
-]
\ No newline at end of file
+_get_target_type = lazy_attributes(__name__, _target_types)
+
+def __getattr__(name):
+    if name == 'target_instances':
+        target_instances = [_get_target_type(class_name)() for class_name in _target_types]
+        globals()['target_instances'] = target_instances
+        return target_instances
+    return _get_target_type(name)
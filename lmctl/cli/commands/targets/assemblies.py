@@ -1,7 +1,7 @@
 import click
 from typing import Dict
 from lmctl.client import TNCOClient, TNCOClientHttpError, TNCOClientError
-from lmctl.cli.arguments import common_output_format_handler, default_file_inputs_handler, set_param_option
+from lmctl.cli.arguments import common_output_format_handler, default_file_inputs_handler, set_param_option, wait_option
 from lmctl.cli.format import Table, Column
 from .tnco_target import TNCOTarget, LmGet, LmCreate, LmUpdate, LmDelete, LmGen, LmCmd
 
@@ -61,7 +61,7 @@ class Assemblies(TNCOTarget):
         elif name_contains is not None:
             if topn is True:
                 raise click.BadArgumentUsage('Do not use "--name-contains" option when using the "--topN" option', ctx=ctx)
-            return api.all_with_name_containing(name_contains).get('assemblies', [])
+            return api.iter_all_with_name_containing(name_contains)
         elif topn is True:
             return api.get_topN()
         else:
@@ -77,7 +77,8 @@ class Assemblies(TNCOTarget):
                     ''',
                     print_result=False)
     @set_param_option(options=['--prop'], var_name='prop_values', help='Directly set a property passed to the request')
-    def create(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None, prop_values: Dict = None):
+    @wait_option()
+    def create(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None, prop_values: Dict = None, wait: bool = False, wait_timeout: float = None):
         api = tnco_client.assemblies
         if file_content is not None:
             if set_values is not None and len(set_values) > 0:
@@ -94,8 +95,7 @@ class Assemblies(TNCOTarget):
             if prop_values is not None:
                 assembly_req['properties'].update(prop_values)
         result = api.intent_create(assembly_req)
-        ctl = self._get_controller()
-        ctl.io.print(f'Accepted - Process: {result}')
+        self._handle_accepted_process(tnco_client, result, wait=wait, wait_timeout=wait_timeout)
 
     @LmUpdate(short_help=f'Request an intent to upgrade an {display_name}', 
                     help=f'''\
@@ -179,7 +179,8 @@ class Assemblies(TNCOTarget):
     @click.option('--id', help=f'Reference the target {display_name} by ID instead of name')
     @click.option('--intended-state', '--state', help='Intended state to change to, if not included in "-f, --file" option')
     @file_inputs.option()
-    def changestate(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, file_content: Dict = None, intended_state: str = None):
+    @wait_option()
+    def changestate(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, file_content: Dict = None, intended_state: str = None, wait: bool = False, wait_timeout: float = None):
         api = tnco_client.assemblies
         assembly_req_content = self._resolve_assembly_identity_crisis(ctx, request_content=file_content, name=name, id=id)
         if 'intendedState' in assembly_req_content:
@@ -196,8 +197,7 @@ class Assemblies(TNCOTarget):
             'intendedState': assembly_req_content.get('intendedState')
         }
         result = api.intent_change_state(change_state_req)
-        ctl = self._get_controller()
-        ctl.io.print(f'Accepted - Process: {result}')
+        self._handle_accepted_process(tnco_client, result, wait=wait, wait_timeout=wait_timeout)
 
     @LmCmd(short_help=f'Request an intent to adopt an {display_name}', 
                     help=f'''\
@@ -209,7 +209,8 @@ class Assemblies(TNCOTarget):
                         \n\nclusters - An optional map of cluster sizes, if the descriptor includes clusters\
                         \n\nresources - Associated topology for each resource instance
                     ''')
-    def adopt(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None):
+    @wait_option()
+    def adopt(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None, wait: bool = False, wait_timeout: float = None):
         api = tnco_client.assemblies
         if file_content is not None:
             if set_values is not None and len(set_values) > 0:
@@ -218,8 +219,7 @@ class Assemblies(TNCOTarget):
         else:
             assembly_req = set_values
         result = api.intent_adopt(assembly_req)
-        ctl = self._get_controller()
-        ctl.io.print(f'Accepted - Process: {result}')
+        self._handle_accepted_process(tnco_client, result, wait=wait, wait_timeout=wait_timeout)
 
     def _resolve_assembly_identity_crisis(self, ctx: click.Context, request_content: Dict = None, name: str = None, id: str = None):
         if request_content is None:
@@ -1,10 +1,11 @@
 import click
 from lmctl.client import TNCOClient
+from lmctl.cli.arguments import wait_option
 from .tnco_target import TNCOTarget, LmCmd
 
 class AssemblyComponentMixin:
 
-    def request_heal(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, metric_key: str = None, assembly_name: str = None, assembly_id: str = None):
+    def request_heal(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, metric_key: str = None, assembly_name: str = None, assembly_id: str = None, wait: bool = False, wait_timeout: float = None):
         api = tnco_client.assemblies
         request = {}
         if assembly_id is not None:
@@ -30,8 +31,7 @@ class AssemblyComponentMixin:
         else:
             raise click.BadArgumentUsage(message=f'Must set "NAME" argument or "--id" option or "--metric-key" to identify the {self.display_name} to be healed', ctx=ctx)   
         result = api.intent_heal(request)
-        ctl = self._get_controller()
-        ctl.io.print(f'Accepted - Process: {result}')
+        self._handle_accepted_process(tnco_client, result, wait=wait, wait_timeout=wait_timeout)
 
 class AssemblyComponents(AssemblyComponentMixin, TNCOTarget):
     name = 'assemblycomponent'
@@ -54,12 +54,15 @@ class AssemblyComponents(AssemblyComponentMixin, TNCOTarget):
     @click.option('--metric-key', help='Reference the target component by metric key')
     @click.option('--assembly-id', help='Reference the target Assembly by ID')
     @click.option('--assembly-name', help='Reference the target Assembly by ID')
-    def heal(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, metric_key: str = None, assembly_name: str = None, assembly_id: str = None):
+    @wait_option()
+    def heal(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, metric_key: str = None, assembly_name: str = None, assembly_id: str = None, wait: bool = False, wait_timeout: float = None):
         return self.request_heal(
             tnco_client=tnco_client, 
             ctx=ctx, name=name, 
             id=id, 
             metric_key=metric_key, 
             assembly_name=assembly_name, 
-            assembly_id=assembly_id
+            assembly_id=assembly_id,
+            wait=wait,
+            wait_timeout=wait_timeout
         )
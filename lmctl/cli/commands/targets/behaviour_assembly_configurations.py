@@ -46,7 +46,7 @@ class AssemblyConfigurations(TNCOTarget):
                 raise click.BadArgumentUsage('Do not use "ID" argument when using the "--project" option', ctx=ctx)
             return api.get(id)
         elif project is not None:
-            return api.all_in_project(project)
+            return api.iter_all(projectId=project)
         else:
             raise click.BadArgumentUsage('Must set either "ID" argument or "--project" option', ctx=ctx) 
         
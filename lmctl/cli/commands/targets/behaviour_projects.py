@@ -36,7 +36,7 @@ class Projects(TNCOTarget):
         if name is not None:
             return api.get(name)
         else:
-            return api.all()
+            return api.iter_all()
 
     @LmCreate()
     def create(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None):
@@ -55,9 +55,9 @@ class ScenarioExecutions(TNCOTarget):
         elif project is not None:
             if scenario is not None:
                 raise click.BadArgumentUsage('Do not use "--project" option when using the "--scenario" option', ctx=ctx)
-            return api.all_in_project(project)
+            return api.iter_all(projectId=project)
         elif scenario is not None:
-            return api.all_of_scenario(scenario)
+            return api.iter_all(scenarioId=scenario)
         else:
             raise click.BadArgumentUsage('Must set one of "ID" argument, "--project" option or "--scenario" option', ctx=ctx) 
 
@@ -83,7 +83,7 @@ class Scenarios(TNCOTarget):
                 raise click.BadArgumentUsage('Do not use "ID" argument when using the "--project" option', ctx=ctx)
             return api.get(id)
         elif project is not None:
-            return api.all_in_project(project)
+            return api.iter_all(projectId=project)
         else:
             raise click.BadArgumentUsage('Must set either "ID" argument or "--project" option', ctx=ctx) 
         
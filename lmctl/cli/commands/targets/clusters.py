@@ -1,5 +1,6 @@
 import click
 from lmctl.client import TNCOClient
+from lmctl.cli.arguments import wait_option
 from .tnco_target import TNCOTarget, LmCmd
 
 class Cluster(TNCOTarget):
@@ -21,7 +22,8 @@ class Cluster(TNCOTarget):
     @click.option('--assembly-name', help='Reference the target Assembly by ID')
     @click.option('--in', 'scale_in', is_flag=True, help=f'Scale the {display_name} in')
     @click.option('--out', 'scale_out', is_flag=True, help=f'Scale the {display_name} out')
-    def scale(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, assembly_name: str = None, assembly_id: str = None, scale_in: bool = False, scale_out: bool = False):
+    @wait_option()
+    def scale(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, assembly_name: str = None, assembly_id: str = None, scale_in: bool = False, scale_out: bool = False, wait: bool = False, wait_timeout: float = None):
         api = tnco_client.assemblies
         scale_req = {
             'clusterName': name
@@ -42,6 +44,5 @@ class Cluster(TNCOTarget):
             result = api.intent_scale_out(scale_req)
         else:
             raise click.BadArgumentUsage(message=f'Must set "--in" option or "--out" option to identify the type of scale operation', ctx=ctx)   
-        ctl = self._get_controller()
-        ctl.io.print(f'Accepted - Process: {result}')
+        self._handle_accepted_process(tnco_client, result, wait=wait, wait_timeout=wait_timeout)
 
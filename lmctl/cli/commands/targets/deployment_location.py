@@ -48,7 +48,7 @@ class DeploymentLocations(TNCOTarget):
         elif name_contains is not None:
             return api.all_with_name(name_contains)
         else:
-            return api.all() 
+            return api.iter_all()
         
     @LmCreate()
     def create(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None):
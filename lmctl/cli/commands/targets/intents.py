@@ -1,6 +1,7 @@
 import click
 from typing import Dict
 from lmctl.client import TNCOClient, TNCOClientHttpError, TNCOClientError
+from lmctl.client.bulk import DEFAULT_BULK_CONCURRENCY
 from lmctl.cli.arguments import common_output_format_handler, default_file_inputs_handler
 from lmctl.cli.format import Table, Column
 from .tnco_target import TNCOTarget, LmGet, LmCreate, LmUpdate, LmDelete, LmCmd, LmGen
@@ -39,10 +40,16 @@ class Intents(TNCOTarget):
                         \n\nThe properties of a request depend on the type of intent being performed.\
                         \n\nKnown types: createAssembly, changeAssemblyState, upgradeAssembly, deleteAssembly, healAssembly, scaleOutAssembly, scaleInAssembly, adoptAssembly
                         \n\nNote: your chosen type is not validated against this list so if a new type of intent has been added in TNCO, this command is still usable
+                        \n\nUse "--bulk" to submit many intents from a list in the content of "-f, file" (either a list or an object with an "items" list), each with their own "intentType" attribute
                     ''',
                     print_result=False)
-    def create(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None):
+    @click.option('--bulk', is_flag=True, default=False, show_default=True, help='Submit a list of intents from the content of "-f, --file"')
+    @click.option('--concurrency', type=int, default=DEFAULT_BULK_CONCURRENCY, show_default=True, help='Maximum number of intent requests in progress at once (only used with "--bulk")')
+    @click.option('--rate-limit', type=float, default=None, help='Maximum number of intent requests started per second (only used with "--bulk")')
+    def create(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None, bulk: bool = False, concurrency: int = DEFAULT_BULK_CONCURRENCY, rate_limit: float = None):
         api = tnco_client.assemblies
+        if bulk:
+            return self._create_bulk(tnco_client, ctx, file_content=file_content, set_values=set_values, concurrency=concurrency, rate_limit=rate_limit)
         if file_content is not None:
             if set_values is not None and len(set_values) > 0:
                 raise click.BadArgumentUsage(message='Do not use "--set" option when using "-f, --file" option', ctx=ctx)
@@ -57,4 +64,27 @@ class Intents(TNCOTarget):
                 raise click.BadArgumentUsage(message='Must set "intentType" attribute e.g. "--set intentType=createAssembly"', ctx=ctx)
         result = api.intent(intent_name, intent_request)
         ctl = self._get_controller()
-        ctl.io.print(f'Accepted - Process: {result}')
\ No newline at end of file
+        ctl.io.print(f'Accepted - Process: {result}')
+
+    def _create_bulk(self, tnco_client: TNCOClient, ctx: click.Context, file_content: Dict = None, set_values: Dict = None, concurrency: int = DEFAULT_BULK_CONCURRENCY, rate_limit: float = None):
+        if file_content is None:
+            raise click.BadArgumentUsage(message='Must use "-f, --file" option when using "--bulk" option', ctx=ctx)
+        if set_values is not None and len(set_values) > 0:
+            raise click.BadArgumentUsage(message='Do not use "--set" option when using "--bulk" option', ctx=ctx)
+        if isinstance(file_content, dict):
+            file_content = file_content.get('items', None)
+        if not isinstance(file_content, list):
+            raise click.BadArgumentUsage(message='Content of file passed to "-f, --file" option must be a list of intents (or an object with an "items" list) when using "--bulk" option', ctx=ctx)
+        ctl = self._get_controller()
+        accepted = 0
+        failed = 0
+        for result in tnco_client.assemblies.bulk_intents(file_content, concurrency=concurrency, rate_limit=rate_limit):
+            if result.succeeded:
+                accepted += 1
+                ctl.io.print(f'Accepted - Process: {result.process_id} (item {result.index}: {result.intent_name})')
+            else:
+                failed += 1
+                ctl.io.print_error(f'Failed - item {result.index}: {result.intent_name}: {result.error}')
+        ctl.io.print(f'Submitted {accepted + failed} intent(s): {accepted} accepted, {failed} failed')
+        if failed > 0:
+            exit(1)
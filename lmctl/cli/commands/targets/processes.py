@@ -1,6 +1,7 @@
 import click
 from typing import Dict, List
 from lmctl.client import TNCOClient, TNCOClientHttpError
+from lmctl.client.pagination import DEFAULT_PAGE_SIZE
 from lmctl.cli.arguments import common_output_format_handler
 from lmctl.cli.format import Table, Column
 from .tnco_target import TNCOTarget, LmGet
@@ -37,6 +38,7 @@ class Processes(TNCOTarget):
     @click.option('--status', multiple=True, help='Filter processes by Status (may provide option multiple times)')
     @click.option('--intent-type', multiple=True, help='Filter processes by Intent Type (may provide option multiple times)')
     @click.option('--limit', type=int, help='Limit the number of processes to retrieve')
+    @click.option('--page-size', type=click.IntRange(min=1), default=DEFAULT_PAGE_SIZE, show_default=True, help='Number of processes to retrieve per request when no "--limit" is set. Results are printed as each page is retrieved')
     def get(self, 
                 tnco_client: TNCOClient, 
                 ctx: click.Context, 
@@ -49,7 +51,8 @@ class Processes(TNCOTarget):
                 end_time: str = None,
                 status: List[str] = None,
                 intent_type: List[str] = None,
-                limit: int = None
+                limit: int = None,
+                page_size: int = DEFAULT_PAGE_SIZE
             ):
         api = tnco_client.processes
         if id is not None:
@@ -82,7 +85,8 @@ class Processes(TNCOTarget):
                 query_params['intentTypes'] = ','.join(intent_type)
             if limit is not None:
                 query_params['limit'] = limit
-            return api.query(**query_params)
+                return api.query(**query_params)
+            return api.iter_all(page_size=page_size, **query_params)
             
     def _check_var_not_set_with_id(self, ctx, var_name, var, check_empty_list=False):
         if var is not None:
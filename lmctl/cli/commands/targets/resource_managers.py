@@ -47,7 +47,7 @@ class ResourceManagers(TNCOTarget):
         if name is not None:
             return api.get(name)
         else:
-            return api.all() 
+            return api.iter_all()
 
     def _report_dict_to_list(self, orig: Dict) -> List:
         new_list = []
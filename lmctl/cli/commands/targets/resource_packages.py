@@ -1,14 +1,22 @@
+import os
 import click
 from typing import Dict
 from lmctl.client import TNCOClient, TNCOClientHttpError
 from lmctl.cli.arguments import common_output_format_handler, ignore_missing_option
 from lmctl.cli.format import Table, Column
+from lmctl.utils.uploads import UploadProgressReporter
 from .tnco_target import TNCOTarget, LmCmd
 
 class ResourcePackages(TNCOTarget):
     name = 'resourcepkg'
     plural = 'resourcepkgs'
     display_name = 'Brent Resource Package'
+
+    def _build_progress_callback(self, file_path: str, show_progress: bool):
+        if not show_progress:
+            return None
+        ctl = self._get_controller()
+        return UploadProgressReporter(ctl.io.print, os.path.basename(file_path))
     
     @LmCmd(short_help=f'Upload {display_name}', help=f'''Upload {display_name}\
                         \n\nNOTE: Resource Packages are not synonymous with LMCTL project packages, even when the project contains a Resource.
@@ -17,9 +25,10 @@ class ResourcePackages(TNCOTarget):
                     required=True,
                     type=click.Path(exists=True)
                 )
-    def create(self, tnco_client: TNCOClient, ctx: click.Context, file_path: str):
+    @click.option('--progress', 'show_progress', is_flag=True, default=False, help='Print progress as the package is uploaded')
+    def create(self, tnco_client: TNCOClient, ctx: click.Context, file_path: str, show_progress: bool = False):
         api = tnco_client.resource_packages
-        resource_name = api.create(file_path)
+        resource_name = api.create(file_path, progress_callback=self._build_progress_callback(file_path, show_progress))
         return f'Created from package: {resource_name}'
 
     @LmCmd(short_help=f'Update {display_name}', help=f'''Update {display_name}\
@@ -30,9 +39,10 @@ class ResourcePackages(TNCOTarget):
                     required=True,
                     type=click.Path(exists=True)
                 )
-    def update(self, tnco_client: TNCOClient, ctx: click.Context, resource_name: str, file_path: str):
+    @click.option('--progress', 'show_progress', is_flag=True, default=False, help='Print progress as the package is uploaded')
+    def update(self, tnco_client: TNCOClient, ctx: click.Context, resource_name: str, file_path: str, show_progress: bool = False):
         api = tnco_client.resource_packages
-        api.update(resource_name, file_path)
+        api.update(resource_name, file_path, progress_callback=self._build_progress_callback(file_path, show_progress))
         return f'Updated package for: {resource_name}'
 
     @LmCmd()
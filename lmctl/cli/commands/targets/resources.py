@@ -1,5 +1,6 @@
 import click
 from lmctl.client import TNCOClient
+from lmctl.cli.arguments import wait_option
 from .tnco_target import TNCOTarget, LmCmd
 from .assembly_components import AssemblyComponentMixin, AssemblyComponents
 
@@ -24,12 +25,15 @@ class Resource(TNCOTarget, AssemblyComponentMixin):
     @click.option('--metric-key', help='Reference the target resource by metric key')
     @click.option('--assembly-id', help='Reference the target Assembly by ID')
     @click.option('--assembly-name', help='Reference the target Assembly by ID')
-    def heal(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, metric_key: str = None, assembly_name: str = None, assembly_id: str = None):
+    @wait_option()
+    def heal(self, tnco_client: TNCOClient, ctx: click.Context, name: str = None, id: str = None, metric_key: str = None, assembly_name: str = None, assembly_id: str = None, wait: bool = False, wait_timeout: float = None):
         return self.request_heal(
             tnco_client=tnco_client, 
             ctx=ctx, name=name, 
             id=id, 
             metric_key=metric_key, 
             assembly_name=assembly_name, 
-            assembly_id=assembly_id
+            assembly_id=assembly_id,
+            wait=wait,
+            wait_timeout=wait_timeout
         )
\ No newline at end of file
@@ -1,6 +1,6 @@
 
 from .target import Target
-from typing import Callable, Any
+from typing import Callable, Any, Iterator
 from lmctl.cli.arguments import (OutputFormats, 
                                 FileInputs, 
                                 default_output_format_handler, 
@@ -52,6 +52,18 @@ class TNCOTarget(Target):
         functools.update_wrapper(wrapped_cmd_builder, handler_function)
         return wrapped_cmd_builder
 
+    def _handle_accepted_process(self, tnco_client: 'TNCOClient', process_id: str, wait: bool = False, wait_timeout: float = None):
+        ctl = self._get_controller()
+        ctl.io.print(f'Accepted - Process: {process_id}')
+        if wait:
+            process = tnco_client.processes.wait_for(process_id, timeout=wait_timeout)[process_id]
+            status = process.get('status')
+            if status == 'Completed':
+                ctl.io.print(f'Process {process_id} finished with status: {status}')
+            else:
+                ctl.io.print_error(f'Process {process_id} finished with status: {status}, reason: {process.get("statusReason")}')
+                exit(1)
+
     def _get_help(self, handler_function: Callable, default_help: str = None):
         if hasattr(handler_function, '__help__'):
             return handler_function.__help__
@@ -100,6 +112,8 @@ class TNCOTarget(Target):
                     path += '.yaml'
                 elif output_format == 'json':
                     path += '.json'
+                elif output_format == 'jsonl':
+                    path += '.jsonl'
             if os.path.exists(path) and not overwrite:
                 ctl.io.print_error(f'File with name "{path}" already exists. Choose different file path or use "--overwrite" to replace the existing file')
                 exit(1)
@@ -140,8 +154,9 @@ class TNCOTarget(Target):
             with ctl.tnco_client_safety_net():
                 tnco_client = ctl.get_tnco_client(environment_name, input_pwd=pwd, input_client_secret=client_secret)
                 result = handler_function(tnco_client, ctx=ctx, **kwargs)
-                if isinstance(result, list):
-                    ctl.io.print(output_formatter.convert_list(result))
+                if isinstance(result, (list, Iterator)):
+                    # Print each element as it's converted (and, for iterators, as it's retrieved)
+                    ctl.io.print_stream(output_formatter.stream_list(result))
                 else:
                     ctl.io.print(output_formatter.convert_element(result))
 
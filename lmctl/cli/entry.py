@@ -1,38 +1,46 @@
 import click
-import os
 import logging
-import urllib3
-import lmctl.cli.commands as lmctl_commands
+import warnings
 import lmctl.utils.logging as lmctl_logging
+from lmctl.utils.profiling import profiler, is_profile_requested, requested_trace_path, default_trace_path, PROFILE_ENV_VAR
 from .safety_net import safety_net
-from .cmd_tags import TagFormattedGroup
+from .command_registry import LazyCommandGroup, CommandIndex
+from .command_index import COMMAND_INDEX
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Startup time matters (lmctl is called from shell loops and shell completion), so avoid importing anything heavy here.
+# Commands are listed from the index and only imported when invoked. Matches the urllib3 InsecureRequestWarning without importing urllib3
+warnings.filterwarnings('ignore', message='Unverified HTTPS request')
 logging.captureWarnings(True)
 
 
-@click.group(cls=TagFormattedGroup, help=f'CP4NA orchestration command line tools')
+@click.group(cls=LazyCommandGroup, command_index=CommandIndex(COMMAND_INDEX), help=f'CP4NA orchestration command line tools')
 @click.version_option()
-def cli():
-    pass
+@click.option('--no-cache', is_flag=True, default=False, help='Do not use cached responses from CP4NA orchestration (for environments with response_cache enabled)')
+@click.option('--profile', is_flag=True, default=False, help=f'Record the time spent loading config, authenticating, making requests to CP4NA orchestration, in each project stage, building archives and parsing YAML. A summary is printed when the command ends and a Chrome trace file is written (to ~/.lmctl/profiles, or the path set in the {PROFILE_ENV_VAR} environment variable). Setting {PROFILE_ENV_VAR} also enables profiling')
+@click.pass_context
+def cli(ctx, no_cache, profile):
+    # Not needed for --help, --version or shell completion, which end before this is called
+    lmctl_logging.setup_logging()
+    if no_cache:
+        from lmctl.client.response_cache import disable_response_cache
+        disable_response_cache()
+    if profile or is_profile_requested():
+        profiler.enable()
+        ctx.call_on_close(_report_profile)
+
+
+def _report_profile():
+    # Written to stderr, so the output of commands (e.g. in json/yaml format) can still be parsed
+    click.echo('\nProfile:', err=True)
+    click.echo(profiler.summary_table(), err=True)
+    trace_path = requested_trace_path() or default_trace_path()
+    try:
+        profiler.write_trace(trace_path)
+        click.echo(f'Trace written to: {trace_path}', err=True)
+    except OSError as e:
+        click.echo(f'Failed to write trace to {trace_path}: {e}', err=True)
 
 
-lmctl_logging.setup_logging()
-
-cli.add_command(lmctl_commands.deployment_group)
-cli.add_command(lmctl_commands.env_group)
-cli.add_command(lmctl_commands.resourcedriver_group)
-cli.add_command(lmctl_commands.pkg_group)
-cli.add_command(lmctl_commands.project_group)
-cli.add_command(lmctl_commands.key_group)    
-cli.add_command(lmctl_commands.lifecycledriver_group) 
-cli.add_command(lmctl_commands.vimdriver_group) 
-cli.add_command(lmctl_commands.login_cmd) 
-cli.add_command(lmctl_commands.logdir_cmd)
-
-for action in lmctl_commands.action_types:
-    cli.add_command(action(targets=lmctl_commands.target_instances))
-
 def init_cli():
     with safety_net():
         cli()
@@ -1,6 +1,6 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
-from .json import JsonFormat
+from .json import JsonFormat, NdjsonFormat
 from .yaml import YamlFormat
 from .table import TableFormat, Table, Column
 from .exceptions import BadFormatError
@@ -1,29 +1,49 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
 from .exceptions import BadFormatError
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Iterable, Iterator
 from lmctl.utils.dcutils.dc_to_dict import asdict
 import dataclasses
 import json 
 
+def _to_serializable(element: Any) -> Any:
+    if dataclasses.is_dataclass(type(element)):
+        return asdict(element)
+    return element
+
 class JsonFormat(OutputFormat, InputFormat):
 
     def convert_list(self, element_list: List[Any]) -> str:
         converted_element_list = []
         for e in element_list:
-            if dataclasses.is_dataclass(type(e)):
-                converted_element_list.append(asdict(e))
-            else:
-                converted_element_list.append(e)
+            converted_element_list.append(_to_serializable(e))
         data = {'items': converted_element_list}
         try:
             return json.dumps(data, indent=2)
         except json.JSONDecodeError as e:
             raise BadFormatError(f'Failed to convert to JSON: {e}') from e
 
+    def stream_list(self, elements: Iterable[Any]) -> Iterator[str]:
+        # Writes the same document as convert_list, one element at a time
+        first = True
+        for element in elements:
+            try:
+                element_str = json.dumps(_to_serializable(element), indent=2)
+            except json.JSONDecodeError as e:
+                raise BadFormatError(f'Failed to convert to JSON: {e}') from e
+            indented_element = '\n'.join('    ' + line for line in element_str.split('\n'))
+            if first:
+                yield '{\n  "items": [\n' + indented_element
+                first = False
+            else:
+                yield ',\n' + indented_element
+        if first:
+            yield '{\n  "items": []\n}'
+        else:
+            yield '\n  ]\n}'
+
     def convert_element(self, element: Any) -> str:
-        if dataclasses.is_dataclass(type(element)):
-            element = asdict(element)
+        element = _to_serializable(element)
         try:
             return json.dumps(element, indent=2)
         except json.JSONDecodeError as e:
@@ -34,3 +54,35 @@ class JsonFormat(OutputFormat, InputFormat):
             return json.loads(content)
         except json.JSONDecodeError as e:
             raise BadFormatError(f'Failed to read content as JSON: {e}') from e
+
+class NdjsonFormat(OutputFormat, InputFormat):
+    """
+    Newline delimited JSON: each element is written as a single line of JSON, 
+    so results can be processed line by line (e.g. with `jq -c` or `grep`) as they are printed
+    """
+
+    def convert_list(self, element_list: List[Any]) -> str:
+        return ''.join(self.stream_list(element_list))
+
+    def stream_list(self, elements: Iterable[Any]) -> Iterator[str]:
+        first = True
+        for element in elements:
+            line = self.convert_element(element)
+            if first:
+                first = False
+                yield line
+            else:
+                yield '\n' + line
+
+    def convert_element(self, element: Any) -> str:
+        element = _to_serializable(element)
+        try:
+            return json.dumps(element, separators=(',', ':'))
+        except json.JSONDecodeError as e:
+            raise BadFormatError(f'Failed to convert to JSON: {e}') from e
+
+    def read(self, content: str) -> List[Any]:
+        try:
+            return [json.loads(line) for line in content.splitlines() if len(line.strip()) > 0]
+        except json.JSONDecodeError as e:
+            raise BadFormatError(f'Failed to read content as JSON lines: {e}') from e
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import List, Any, Iterable, Iterator
 
 class OutputFormat(ABC):
 
@@ -10,3 +10,12 @@ class OutputFormat(ABC):
     @abstractmethod
     def convert_element(self, element: Any) -> str:
         pass
+
+    def stream_list(self, elements: Iterable[Any]) -> Iterator[str]:
+        """
+        Convert the elements to output in fragments which, joined together, match the output of `convert_list`.
+
+        Formats which can write each element as soon as it is available override this so large results
+        are printed as they arrive, without holding them (or the full output) in memory.
+        """
+        yield self.convert_list(list(elements))
@@ -1,7 +1,11 @@
 from .output_format import OutputFormat
-from typing import Union, Callable, List, Any
+from typing import Union, Callable, List, Any, Iterable, Iterator
+from itertools import islice
 from tabulate import tabulate
 
+# Number of rows used to size the columns when streaming a table
+DEFAULT_SAMPLE_SIZE = 100
+
 class Column:
 
     def __init__(self, name: str, header: str = None, accessor: Union[str, callable] = None):
@@ -14,7 +18,8 @@ class Table:
 
 class TableFormat(OutputFormat):
 
-    def __init__(self, headers: List[str] = None, row_processor: Callable = None, table: Table = None):
+    def __init__(self, headers: List[str] = None, row_processor: Callable = None, table: Table = None, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        self.sample_size = sample_size
         if table is not None:
             if headers is not None or row_processor is not None:
                 raise ValueError('"headers" and "row_processor" should NOT be supplied when "table" is set')
@@ -46,22 +51,64 @@ class TableFormat(OutputFormat):
                     raise TypeError(f'Found an instance of "{type(c)}" in table "{self.table}" columns when they must be an instance of "{Column.__name__}"')
         return columns
 
+    def _get_headers(self, columns: List[Column]) -> List[str]:
+        if columns is None:
+            return self.headers
+        headers = []
+        for c in columns:
+            if c.header is not None:
+                headers.append(c.header)
+            else:
+                headers.append(c.name)
+        return headers
+
     def convert_list(self, element_list: List[Any]):
         columns = self._get_columns()
-        if columns is None:
-            headers = self.headers
-        else:
-            headers = []
-            for c in columns:
-                if c.header is not None:
-                    headers.append(c.header)
-                else:
-                    headers.append(c.name)
+        headers = self._get_headers(columns)
         rows = []
         for element in element_list:
             rows.append(self.__element_to_table_row(element, columns))
         return tabulate(rows, headers=headers, tablefmt='orgtbl')
 
+    def stream_list(self, elements: Iterable[Any]) -> Iterator[str]:
+        """
+        Column widths are calculated from the first `sample_size` rows only, which are written as soon as they are read. 
+        Any later rows are written one at a time using the same widths (a longer value extends its own row only). 
+        Lists no longer than the sample produce the same table as convert_list.
+        """
+        columns = self._get_columns()
+        headers = self._get_headers(columns)
+        element_iter = iter(elements)
+        sample_rows = [self.__element_to_table_row(element, columns) for element in islice(element_iter, self.sample_size)]
+        sample_table = tabulate(sample_rows, headers=headers, tablefmt='orgtbl')
+        yield sample_table
+        if len(sample_rows) < self.sample_size:
+            return
+        # The separator line (e.g. "|-----+-----|") shows the width tabulate chose for each column
+        separator_line = sample_table.split('\n')[1]
+        widths = [len(segment) - 2 for segment in separator_line[1:-1].split('+')]
+        numeric_columns = [self.__is_numeric_column(sample_rows, idx) for idx in range(len(widths))]
+        for element in element_iter:
+            row = self.__element_to_table_row(element, columns)
+            yield '\n' + self.__format_row(row, widths, numeric_columns)
+
+    def __is_numeric_column(self, rows: List[List[Any]], idx: int) -> bool:
+        values = [row[idx] for row in rows if idx < len(row) and row[idx] is not None]
+        return len(values) > 0 and all(isinstance(v, (int, float)) for v in values)
+
+    def __format_row(self, row: List[Any], widths: List[int], numeric_columns: List[bool]) -> str:
+        cells = []
+        for idx, width in enumerate(widths):
+            value = row[idx] if idx < len(row) else None
+            if value is None:
+                cell = ''
+            elif isinstance(value, float):
+                cell = format(value, 'g')
+            else:
+                cell = str(value)
+            cells.append(cell.rjust(width) if numeric_columns[idx] else cell.ljust(width))
+        return '| ' + ' | '.join(cells) + ' |'
+
     def convert_element(self, element: Any):
         return self.convert_list([element])
 
@@ -1,7 +1,7 @@
 from .output_format import OutputFormat
 from .input_format import InputFormat
 from .exceptions import BadFormatError
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Iterable, Iterator
 from lmctl.utils.dcutils.dc_to_dict import asdict
 import dataclasses
 import yaml
@@ -21,6 +21,25 @@ class YamlFormat(OutputFormat):
         except yaml.YAMLError as e:
             raise BadFormatError(f'Failed to convert to YAML: {e}') from e
 
+    def stream_list(self, elements: Iterable[Any]) -> Iterator[str]:
+        # Items of a top level sequence are not indented by the dumper, so each element 
+        # can be dumped as a single item list to write the same document as convert_list
+        first = True
+        for element in elements:
+            if dataclasses.is_dataclass(type(element)):
+                element = asdict(element)
+            try:
+                element_str = yaml.dump([element], sort_keys=False)
+            except yaml.YAMLError as e:
+                raise BadFormatError(f'Failed to convert to YAML: {e}') from e
+            if first:
+                first = False
+                yield 'items:\n' + element_str
+            else:
+                yield element_str
+        if first:
+            yield 'items: []\n'
+
     def convert_element(self, element: Any) -> str:
         if dataclasses.is_dataclass(type(element)):
             element = asdict(element)
@@ -34,4 +53,3 @@ class YamlFormat(OutputFormat):
             return yaml.safe_load(content)
         except yaml.YAMLError as e:
             raise BadFormatError(f'Failed to read content as YAML: {e}') from e
-
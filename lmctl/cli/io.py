@@ -23,5 +23,13 @@ class IOController:
     def print(self, text):
         self.__print(text)
 
+    def print_stream(self, fragments):
+        """
+        Print each fragment as soon as it's produced (flushing), then end the line as `print` would
+        """
+        for fragment in fragments:
+            self.__print(fragment, nl=False)
+        self.__print('')
+
     def __print(self, text, **kwargs):
         click.echo(text, **kwargs)
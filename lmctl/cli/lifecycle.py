@@ -60,18 +60,18 @@ def open_project(project_path):
         logger.exception(str(e))
         exit(1)
 
-def get_pkg_and_open(pkg_path):
+def get_pkg_and_read_meta(pkg_path):
     try:
         pkg = pkgs.Pkg(pkg_path)
-        return pkg, pkg.open()
+        return pkg, pkg.read_meta()
     except pkgs.InvalidPackageError as e:
         printer.print_text('Error: {0}'.format(str(e)))
         logger.exception(str(e))
         exit(1)
 
-def open_pkg(pkg_path):
+def inspect_pkg(pkg_path):
     try:
-        return pkgs.Pkg(pkg_path).open()
+        return pkgs.Pkg(pkg_path).inspect()
     except pkgs.InvalidPackageError as e:
         printer.print_text('Error: {0}'.format(str(e)))
         logger.exception(str(e))
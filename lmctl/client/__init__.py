@@ -1,4 +1,5 @@
 from .client import TNCOClient
+from .async_client import AsyncTNCOClient, AsyncTNCOAPI
 from .exceptions import TNCOClientError, TNCOClientHttpError
 from .client_builder import TNCOClientBuilder
 from .auth_type import AuthType
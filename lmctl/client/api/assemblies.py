@@ -1,9 +1,10 @@
 import urllib
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Iterable, Iterator, Tuple
 from lmctl.client.exceptions import TNCOClientError
 from lmctl.client.models import (CreateAssemblyIntent, UpgradeAssemblyIntent, ChangeAssemblyStateIntent, 
                                     DeleteAssemblyIntent, ScaleAssemblyIntent, HealAssemblyIntent,
-                                    AdoptAssemblyIntent, CreateOrUpgradeAssemblyIntent, Intent)
+                                    AdoptAssemblyIntent, CreateOrUpgradeAssemblyIntent, Intent, IntentResult)
+from lmctl.client.bulk import execute_bulk, DEFAULT_BULK_CONCURRENCY
 
 from lmctl.client.client_request import TNCOClientRequest
 from .tnco_api_base import TNCOAPI
@@ -11,6 +12,16 @@ from lmctl.client.utils import build_relative_endpoint, read_response_location_h
 
 class AssembliesAPI(TNCOAPI):
     topology_endpoint = 'api/topology/assemblies'
+    # ScaleAssemblyIntent is absent as it may be used for scaleOutAssembly or scaleInAssembly
+    intent_names_by_type = {
+        CreateAssemblyIntent: 'createAssembly',
+        UpgradeAssemblyIntent: 'upgradeAssembly',
+        CreateOrUpgradeAssemblyIntent: 'createOrUpgradeAssembly',
+        ChangeAssemblyStateIntent: 'changeAssemblyState',
+        DeleteAssemblyIntent: 'deleteAssembly',
+        HealAssemblyIntent: 'healAssembly',
+        AdoptAssemblyIntent: 'adoptAssembly'
+    }
 
     def get(self, id: str) -> Dict:
         return self._get_json(
@@ -33,6 +44,9 @@ class AssembliesAPI(TNCOAPI):
     def all_with_name_containing(self, search_string: str) -> List:
         return self._get_json(self.topology_endpoint, query_params={'nameContains': search_string})
 
+    def iter_all_with_name_containing(self, search_string: str) -> Iterator:
+        return self._iter_all(endpoint=self.topology_endpoint, query_params={'nameContains': search_string}, items_key='assemblies')
+
     def intent(self, intent_name: str, intent_obj: Union[Dict, 
                                                         AdoptAssemblyIntent,
                                                         CreateAssemblyIntent, 
@@ -70,6 +84,46 @@ class AssembliesAPI(TNCOAPI):
     def intent_adopt(self, intent_obj: Union[Dict, AdoptAssemblyIntent]) -> str:
         return self._intent_request_impl('adoptAssembly', intent_obj)   
 
+    def bulk_intents(self, intents: Iterable[Union[Dict, Intent, Tuple[str, Union[Dict, Intent]]]], 
+                        concurrency: int = DEFAULT_BULK_CONCURRENCY, rate_limit: float = None) -> Iterator[IntentResult]:
+        """
+        Submit many intents, with at most `concurrency` requests in progress and at most `rate_limit` requests started per second.
+
+        Each intent may be:
+            - a dict including an "intentType" attribute (e.g. "createAssembly")
+            - a tuple of (intent name, intent dict or Intent object)
+            - an Intent object (except ScaleAssemblyIntent, which must be given as a tuple to choose between scaleOutAssembly/scaleInAssembly)
+        
+        Results are yielded as each request completes (not in the order of the intents) and failed requests do not stop the remaining intents.
+        """
+        def submit(intent: Union[Dict, Intent, Tuple[str, Union[Dict, Intent]]]) -> str:
+            intent_name, intent_obj = self._resolve_bulk_intent(intent)
+            return self._intent_request_impl(intent_name, intent_obj)
+
+        for bulk_result in execute_bulk(submit, intents, concurrency=concurrency, rate_limit=rate_limit):
+            try:
+                intent_name, intent_obj = self._resolve_bulk_intent(bulk_result.item)
+            except TNCOClientError:
+                intent_name, intent_obj = None, bulk_result.item
+            yield IntentResult(index=bulk_result.index, intent_name=intent_name, intent=intent_obj, process_id=bulk_result.result, error=bulk_result.error)
+
+    def _resolve_bulk_intent(self, intent: Union[Dict, Intent, Tuple[str, Union[Dict, Intent]]]) -> Tuple[str, Union[Dict, Intent]]:
+        if isinstance(intent, tuple):
+            return intent
+        elif isinstance(intent, Intent):
+            intent_name = self.intent_names_by_type.get(type(intent), None)
+            if intent_name is None:
+                raise TNCOClientError(f'Cannot determine intent name for {type(intent).__name__}, provide it as a tuple of (intent_name, intent)')
+            return (intent_name, intent)
+        elif isinstance(intent, dict):
+            intent = intent.copy()
+            intent_name = intent.pop('intentType', None)
+            if intent_name is None:
+                raise TNCOClientError('Intent must include "intentType" attribute')
+            return (intent_name, intent)
+        else:
+            raise TNCOClientError(f'Intent must be a dict, Intent object or tuple but was {type(intent).__name__}')
+
     def intent_endpoint(self, intent_name: str) -> str:
         return f'api/intent/{intent_name}'
 
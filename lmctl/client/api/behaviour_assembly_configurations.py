@@ -3,6 +3,7 @@ from .tnco_api_base import TNCOAPI
 
 class BehaviourAssemblyConfigurationsAPI(TNCOAPI):
     endpoint = 'api/behaviour/assemblyConfigurations'
+    cache_ttl = 60
 
     def get(self, id: str) -> Dict:
         return self._get(id_value=id)
@@ -3,6 +3,7 @@ from .tnco_api_base import TNCOAPI
 
 class DeploymentLocationAPI(TNCOAPI):
     endpoint = 'api/deploymentLocations'
+    cache_ttl = 300
 
     def all(self) -> List:
         return self._all()
@@ -4,6 +4,7 @@ from .descriptors import DescriptorsAPI
 
 class DescriptorTemplatesAPI(DescriptorsAPI):
     endpoint = 'api/catalog/descriptorTemplates'
+    cache_ttl = 300
 
     def __init__(self, base_client: 'TNCOClient'):
         if base_client.kami_address is not None:
@@ -8,6 +8,7 @@ from lmctl.client.utils import build_relative_endpoint_from_data, build_relative
 class DescriptorsAPI(TNCOAPI):
     endpoint = 'api/catalog/descriptors'
     id_attr = 'name'
+    cache_ttl = 300
 
     def create(self, descriptor: Dict):
         request = TNCOClientRequest(method='POST', endpoint=self.endpoint).add_yaml_body(descriptor)
@@ -1,9 +1,22 @@
-from typing import List, Dict
+import time
+import logging
+from typing import List, Dict, Union
 from .tnco_api_base import TNCOAPI
 from lmctl.client.client_request import TNCOClientRequest
+from lmctl.client.exceptions import TNCOClientError
+from lmctl.client.pagination import OffsetPaging
+
+logger = logging.getLogger(__name__)
+
+PROCESS_END_STATUSES = ['Completed', 'Cancelled', 'Failed']
+# Page size of the batched query for finished Processes
+PROCESS_QUERY_PAGE_SIZE = 100
+# Every this many batched checks, Processes the query did not find are also checked individually, to detect a query missing them
+PROCESS_QUERY_VERIFY_INTERVAL = 5
 
 class ProcessesAPI(TNCOAPI):
     endpoint = 'api/processes'
+    paging = OffsetPaging(limit_param='limit', offset_param='offset')
 
     def get(self, id: str, shallow: bool = None) -> Dict:
         query_params = {}
@@ -13,3 +26,99 @@ class ProcessesAPI(TNCOAPI):
 
     def query(self, **query_params) -> List:
         return self._get_json(self.endpoint, query_params=query_params)
+
+    def wait_for(self, ids: Union[str, List[str]], timeout: float = None, initial_interval: float = 1, max_interval: float = 15,
+                    backoff_factor: float = 1.5, batch_query: bool = True) -> Dict[str, Dict]:
+        """
+        Wait for one or more Processes to reach an end status (Completed, Cancelled or Failed)
+
+        The polling interval starts at `initial_interval` and grows by `backoff_factor` (up to `max_interval`) each time a check finds no newly finished Processes.
+
+        When waiting on more than one Process and `batch_query` is True, each check is a (paged) query for Processes in an end status
+        started since the earliest of the pending Processes, rather than one GET per Process. Paging stops once every pending Process has been found.
+        Checks fall back to one GET per Process if the start time of any Process is unknown, if the query fails, or if a periodic
+        individual check finds a finished Process the query did not return.
+
+        Returns:
+            Dict of Process ID to the final (shallow) copy of the Process
+        Raises:
+            TNCOClientError: if `timeout` seconds pass before all Processes have finished
+        """
+        if isinstance(ids, str):
+            ids = [ids]
+        deadline = (time.monotonic() + timeout) if timeout is not None else None
+        finished = {}
+        # Initial GET for each Process gives the start times required for batched queries
+        pending = {}
+        for process_id in ids:
+            process = self.get(process_id, shallow=True)
+            if process.get('status') in PROCESS_END_STATUSES:
+                finished[process_id] = process
+            else:
+                pending[process_id] = process
+        interval = initial_interval
+        batched_checks = 0
+        while len(pending) > 0:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TNCOClientError(f'Timed out after {timeout} seconds waiting for Process(es) to finish: {list(pending.keys())}')
+                time.sleep(min(interval, remaining))
+            else:
+                time.sleep(interval)
+            if batch_query and len(pending) > 1:
+                newly_finished = self._check_pending_with_query(pending)
+                if newly_finished is None:
+                    logger.debug('Batched process status query not possible, falling back to checking each process')
+                    batch_query = False
+                    newly_finished = self._check_pending_individually(pending)
+                else:
+                    batched_checks += 1
+                    unresolved = {process_id: process for process_id, process in pending.items() if process_id not in newly_finished}
+                    if len(unresolved) > 0 and batched_checks % PROCESS_QUERY_VERIFY_INTERVAL == 0:
+                        missed = self._check_pending_individually(unresolved)
+                        if len(missed) > 0:
+                            logger.debug(f'Batched process status query missed finished process(es) {list(missed.keys())}, falling back to checking each process')
+                            batch_query = False
+                            newly_finished.update(missed)
+            else:
+                newly_finished = self._check_pending_individually(pending)
+            for process_id, process in newly_finished.items():
+                finished[process_id] = process
+                pending.pop(process_id)
+            if len(newly_finished) == 0:
+                interval = min(interval * backoff_factor, max_interval)
+        return {process_id: finished[process_id] for process_id in ids}
+
+    def _check_pending_individually(self, pending: Dict[str, Dict]) -> Dict[str, Dict]:
+        newly_finished = {}
+        for process_id in pending.keys():
+            process = self.get(process_id, shallow=True)
+            if process.get('status') in PROCESS_END_STATUSES:
+                newly_finished[process_id] = process
+        return newly_finished
+
+    def _check_pending_with_query(self, pending: Dict[str, Dict]) -> Dict[str, Dict]:
+        start_times = [p.get('startTime') for p in pending.values() if p.get('startTime') is not None]
+        if len(start_times) < len(pending):
+            # Without a start time the query would return the whole history of finished Processes
+            return None
+        # ISO-8601 timestamps from the same server sort lexicographically
+        query_params = {'processStatuses': ','.join(PROCESS_END_STATUSES), 'startDateTime': min(start_times)}
+        assembly_ids = set(p.get('assemblyId') for p in pending.values())
+        if len(assembly_ids) == 1 and None not in assembly_ids:
+            query_params['assemblyId'] = assembly_ids.pop()
+        newly_finished = {}
+        try:
+            for process in self._iter_all(query_params=query_params, page_size=PROCESS_QUERY_PAGE_SIZE, prefetch=False):
+                if not isinstance(process, dict):
+                    return None
+                process_id = process.get('id')
+                if process_id in pending and process.get('status') in PROCESS_END_STATUSES:
+                    newly_finished[process_id] = process
+                    if len(newly_finished) == len(pending):
+                        break
+        except TNCOClientError as e:
+            logger.debug(f'Failed to query process statuses: {e}')
+            return None
+        return newly_finished
@@ -3,6 +3,7 @@ from .tnco_api_base import TNCOAPI
 
 class ResourceDriversAPI(TNCOAPI):
     endpoint = 'api/resource-manager/resource-drivers'
+    cache_ttl = 300
 
     def get(self, id: str) -> Dict:
         return self._get(id_value=id)
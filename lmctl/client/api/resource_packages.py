@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Callable, Union
 from pathlib import Path
 from lmctl.client.client_request import TNCOClientRequest
 from .tnco_api_base import TNCOAPI
@@ -7,18 +7,22 @@ from lmctl.client.utils import build_relative_endpoint
 class ResourcePackagesAPI(TNCOAPI):
     endpoint = 'api/resource-manager/resource-packages'
 
-    def create(self, resource_pkg_path: Union[str,Path]) -> str:
+    def create(self, resource_pkg_path: Union[str,Path], progress_callback: Callable[[int, int], None] = None) -> str:
         with open(resource_pkg_path, 'rb') as resource_pkg:
             files = {'file': resource_pkg}
             request = TNCOClientRequest(method='POST', endpoint=self.endpoint).add_files(files)
+            if progress_callback is not None:
+                request.add_upload_progress_callback(progress_callback)
             return self._exec_request_and_get_location_header(request)
 
-    def update(self, resource_name: str, resource_pkg_path: Union[str,Path]):
+    def update(self, resource_name: str, resource_pkg_path: Union[str,Path], progress_callback: Callable[[int, int], None] = None):
         with open(resource_pkg_path, 'rb') as resource_pkg:
             files = {'file': resource_pkg}
             request = TNCOClientRequest(method='PUT', 
                                         endpoint=build_relative_endpoint(base_endpoint=self.endpoint, id_value=resource_name)
                                     ).add_files(files)
+            if progress_callback is not None:
+                request.add_upload_progress_callback(progress_callback)
             self._exec_request(request)
 
     def delete(self, resource_name: str):
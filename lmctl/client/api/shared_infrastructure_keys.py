@@ -3,6 +3,7 @@ from .tnco_api_base import TNCOAPI
 class SharedInfrastructureKeysAPI(TNCOAPI):
     endpoint = 'api/resource-manager/infrastructure-keys/shared'
     id_attr = 'name'
+    cache_ttl = 300
 
     def all(self, include_private_key: bool = None) -> List:
         query_params = None
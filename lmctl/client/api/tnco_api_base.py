@@ -1,6 +1,7 @@
-from typing import Dict, Callable, List
+from typing import Dict, Callable, List, Iterator
 from lmctl.client.client_request import TNCOClientRequest
 from lmctl.client.exceptions import TNCOClientError
+from lmctl.client.pagination import iterate_pages
 from lmctl.client.utils import (build_relative_endpoint, convert_dict_to_json, build_relative_endpoint_from_data, 
                         read_response_location_header, read_response_body_as_json, read_response_body_as_yaml, 
                         read_response_body_as_plaintext)
@@ -14,6 +15,10 @@ def default_create_response_handler_placeholder(response):
 
 class TNCOAPI:
     id_attr = 'id'
+    # Set to an instance of lmctl.client.pagination.OffsetPaging on APIs whose list endpoint supports paging
+    paging = None
+    # Seconds a response from this API may be re-used from the response cache (when enabled on the client). None means never cached
+    cache_ttl = None
 
     def __init__(self, base_client: 'TNCOClient'):
         self.base_client = base_client
@@ -49,6 +54,27 @@ class TNCOAPI:
             query_params=query_params
         )
 
+    def _iter_all(self, query_params: Dict[str,str] = None, endpoint: str = None, page_size: int = None, items_key: str = None, prefetch: bool = True) -> Iterator:
+        if endpoint is None:
+            endpoint = self.endpoint
+        def fetch(page_params: Dict):
+            params = dict(query_params) if query_params is not None else {}
+            params.update(page_params)
+            result = self._get_json(endpoint=endpoint, query_params=params)
+            if items_key is not None:
+                result = result.get(items_key, [])
+            return result
+        return iterate_pages(fetch, paging=self.paging, page_size=page_size, prefetch=prefetch)
+
+    def iter_all(self, page_size: int = None, **query_params) -> Iterator:
+        """
+        Iterate over the items of the list endpoint of this API, filtered by any query parameters.
+
+        On APIs which support paging, items are retrieved `page_size` at a time, with the next page requested whilst the current one
+        is being consumed. Otherwise (or when `page_size` is None) all items are retrieved in a single request.
+        """
+        return self._iter_all(query_params=query_params, page_size=page_size)
+
     def _get(self, id_value: str, query_params: Dict[str,str] = None, endpoint: str = None) -> Dict:
         if endpoint is None:
             endpoint = self.endpoint
@@ -0,0 +1,223 @@
+import asyncio
+import functools
+import inspect
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from .auth_type import AuthType
+from .token_cache import TokenCache
+from .auth_tracker import DEFAULT_REFRESH_FRACTION
+from .client import TNCOClient, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_MAX_RETRIES
+from .client_request import TNCOClientRequest
+
+logger = logging.getLogger(__name__)
+
+_END_OF_ITERATION = object()
+
+class AsyncTNCOIterator:
+    """
+    Async iterator over the items of a blocking iterator method (such as `iter_all`). The method is called, and each item retrieved
+    (so each further page requested), on the client's executor so the event loop is never blocked.
+    """
+
+    def __init__(self, async_client: 'AsyncTNCOClient', func: Callable, *args, **kwargs):
+        self.async_client = async_client
+        self.func = functools.partial(func, *args, **kwargs)
+        self._iterator = None
+
+    def __aiter__(self) -> 'AsyncTNCOIterator':
+        return self
+
+    async def __anext__(self) -> Any:
+        await self.async_client.get_access_token()
+        if self._iterator is None:
+            self._iterator = await self.async_client._run_in_executor(lambda: iter(self.func()))
+        item = await self.async_client._run_in_executor(next, self._iterator, _END_OF_ITERATION)
+        if item is _END_OF_ITERATION:
+            raise StopAsyncIteration
+        return item
+
+class AsyncTNCOAPI:
+    """
+    Awaitable view of a TNCO API group.
+
+    Every public method of the wrapped API is exposed as a coroutine function with the same signature, except iterator methods
+    (`iter_*` and generators) which return an AsyncTNCOIterator to be used with `async for`.
+    """
+
+    def __init__(self, async_client: 'AsyncTNCOClient', api: 'TNCOAPI'):
+        self.async_client = async_client
+        self.api = api
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.api, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        if name.startswith('iter_') or inspect.isgeneratorfunction(attr):
+            @functools.wraps(attr)
+            def async_iterator(*args, **kwargs):
+                return AsyncTNCOIterator(self.async_client, attr, *args, **kwargs)
+            return async_iterator
+        @functools.wraps(attr)
+        async def awaitable_call(*args, **kwargs):
+            return await self.async_client._run(attr, *args, **kwargs)
+        return awaitable_call
+
+class AsyncTNCOClient:
+    """
+    Asyncio client for TNCO, with the same API groups as TNCOClient
+
+    lmctl has no non-blocking HTTP transport (requests is its only HTTP library), so each request is made by the synchronous
+    TNCOClient on a bounded thread pool: an in-flight request occupies one of `max_concurrency` threads, but the event loop is never blocked.
+    All calls share one pooled session. At most `max_concurrency` requests are in-flight at once,
+    further calls wait for a free connection rather than opening new ones.
+    Authentication is refreshed once on behalf of all concurrent calls.
+
+    Use as an async context manager (or await `close`) to release the pooled connections.
+    """
+
+    def __init__(self, address: str, auth_type: AuthType = None, kami_address: str = None, max_concurrency: int = DEFAULT_POOL_MAXSIZE,
+                    pool_connections: int = DEFAULT_POOL_CONNECTIONS, max_retries: int = DEFAULT_MAX_RETRIES, token_cache: TokenCache = None,
+                    token_refresh_fraction: float = DEFAULT_REFRESH_FRACTION, background_token_refresh: bool = False):
+        self.max_concurrency = max_concurrency
+        # Pool size matches the concurrency limit so every in-flight request has a kept-alive connection
+        self.sync_client = TNCOClient(address, auth_type=auth_type, kami_address=kami_address, use_sessions=True,
+                                        pool_connections=pool_connections, pool_maxsize=max_concurrency, max_retries=max_retries,
+                                        token_cache=token_cache, token_refresh_fraction=token_refresh_fraction, background_token_refresh=background_token_refresh)
+        self._executor = None
+        self._auth_lock = None
+
+    @property
+    def address(self) -> str:
+        return self.sync_client.address
+
+    @property
+    def kami_address(self) -> str:
+        return self.sync_client.kami_address
+
+    @property
+    def auth_type(self) -> AuthType:
+        return self.sync_client.auth_type
+
+    @property
+    def auth_tracker(self):
+        return self.sync_client.auth_tracker
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='lmctl-async-client')
+        return self._executor
+
+    def _get_auth_lock(self) -> asyncio.Lock:
+        # Created on first use so it belongs to the running event loop
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        return self._auth_lock
+
+    async def _run_in_executor(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        await self.get_access_token()
+        return await self._run_in_executor(func, *args, **kwargs)
+
+    async def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.sync_client.close()
+
+    async def __aenter__(self) -> 'AsyncTNCOClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def get_access_token(self) -> str:
+        auth_tracker = self.sync_client.auth_tracker
+        if auth_tracker is None:
+            return None
+        if not auth_tracker.has_access_expired:
+            # Never blocks: if the token is due to be renewed, the sync client does so in the background
+            return self.sync_client.get_access_token()
+        async with self._get_auth_lock():
+            # Another coroutine may have refreshed the token while this one was waiting on the lock
+            if auth_tracker.has_access_expired:
+                logger.debug('Refreshing CP4NA orchestration access token for async client')
+                await self._run_in_executor(self.sync_client.get_access_token)
+            return auth_tracker.current_access_token
+
+    async def make_request(self, request: TNCOClientRequest) -> requests.Response:
+        return await self._run(self.sync_client.make_request, request)
+
+    async def make_request_for_json(self, request: TNCOClientRequest) -> Dict:
+        return await self._run(self.sync_client.make_request_for_json, request)
+
+    async def ping(self, include_template_engine: bool = False) -> Dict:
+        return await self._run(self.sync_client.ping, include_template_engine=include_template_engine)
+
+    @property
+    def auth(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.auth)
+
+    @property
+    def assemblies(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.assemblies)
+
+    @property
+    def behaviour_assembly_confs(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.behaviour_assembly_confs)
+
+    @property
+    def behaviour_projects(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.behaviour_projects)
+
+    @property
+    def behaviour_scenarios(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.behaviour_scenarios)
+
+    @property
+    def behaviour_scenario_execs(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.behaviour_scenario_execs)
+
+    @property
+    def deployment_locations(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.deployment_locations)
+
+    @property
+    def descriptors(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.descriptors)
+
+    @property
+    def descriptor_templates(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.descriptor_templates)
+
+    @property
+    def lifecycle_drivers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.lifecycle_drivers)
+
+    @property
+    def processes(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.processes)
+
+    @property
+    def resource_drivers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.resource_drivers)
+
+    @property
+    def resource_packages(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.resource_packages)
+
+    @property
+    def resource_managers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.resource_managers)
+
+    @property
+    def shared_inf_keys(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.shared_inf_keys)
+
+    @property
+    def vim_drivers(self) -> AsyncTNCOAPI:
+        return AsyncTNCOAPI(self, self.sync_client.vim_drivers)
@@ -1,17 +1,23 @@
 from datetime import datetime, timedelta
 import logging
-import time
 import jwt
 import os
 
 logger = logging.getLogger(__name__)
 
+# Tokens expiring within this many seconds are treated as expired, so they are not sent only to be rejected
+EXPIRY_MARGIN_SECONDS = 0.75
+# Fraction of a token's lifetime after which it should be renewed (while still valid)
+DEFAULT_REFRESH_FRACTION = 0.8
+
 class AuthTracker:
 
-    def __init__(self):
+    def __init__(self, refresh_fraction: float = DEFAULT_REFRESH_FRACTION):
         self.current_access_token = None
         self.time_of_auth = None # Datetime obj of when we're authenticated
+        self._time_of_issue = None # Datetime obj of when the current token was issued (from "iat", if included)
         self._time_of_expiry = None # Datetime obj of when the current token expires
+        self.refresh_fraction = refresh_fraction
         tmp_jwt_algo = os.environ.get('LM_JWT_ALGO', None)
         if tmp_jwt_algo is None or len(tmp_jwt_algo.strip()) == 0:
             tmp_jwt_algo = ['HS256', 'HS384', 'HS512']
@@ -19,6 +25,29 @@ class AuthTracker:
             tmp_jwt_algo = tmp_jwt_algo.split(',')
         self.jwt_algorithms = tmp_jwt_algo
 
+    @property
+    def time_of_expiry(self) -> datetime:
+        return self._time_of_expiry
+
+    @property
+    def time_of_refresh(self) -> datetime:
+        """
+        Datetime obj of when the current token should be renewed: after `refresh_fraction` of its lifetime has passed
+        """
+        if self.current_access_token is None:
+            return None
+        start = self._time_of_issue if self._time_of_issue is not None else self.time_of_auth
+        lifetime = self._time_of_expiry - start
+        return start + (lifetime * self.refresh_fraction)
+
+    def expires_within(self, seconds: float) -> bool:
+        """
+        Check if there is no current access token or it expires within the given number of seconds (without waiting)
+        """
+        if self.current_access_token is None:
+            return True
+        return datetime.now() + timedelta(seconds=seconds) >= self._time_of_expiry
+
     @property
     def has_access_expired(self):
         if self.current_access_token is None:
@@ -27,28 +56,44 @@ class AuthTracker:
         logger.debug('Checking if CP4NA orchestration access token has expired')
         now = datetime.now()
         logger.debug(f'Authenticated at {self.time_of_auth.isoformat()}, the time is {now.isoformat()}, token has an expiration timestamp of {self._time_of_expiry.isoformat()}')
-        if now >= self._time_of_expiry:
-            logger.debug('Token expired, must request a new one')
-            return True
-        # If the token expires within 3/4 of a second, wait and get a new one
-        if now + timedelta(seconds = 0.75) >= self._time_of_expiry:
-            logger.debug('Expires in less than 1 second, must request a new one')
-            time.sleep(0.75)
+        if now + timedelta(seconds=EXPIRY_MARGIN_SECONDS) >= self._time_of_expiry:
+            logger.debug('Token expired (or expires in less than 1 second), must request a new one')
             return True
         return False
-    
+
+    @property
+    def is_refresh_due(self) -> bool:
+        """
+        Check if the current token has passed the point it should be renewed. The token may still be valid (see `has_access_expired`)
+        so can continue to be used while a new one is requested
+        """
+        if self.current_access_token is None:
+            return True
+        return datetime.now() >= self.time_of_refresh
+
+    def seconds_until_refresh(self) -> float:
+        if self.current_access_token is None:
+            return 0
+        return max(0, (self.time_of_refresh - datetime.now()).total_seconds())
+
     def accept_auth_response(self, auth_response):
         self.time_of_auth = datetime.now()
         if 'token' in auth_response:
             self.current_access_token = auth_response.get('token')
-            self._time_of_expiry = self._get_expires_time_from_jwt(self.current_access_token)
         else:
             self.current_access_token = auth_response.get('access_token', auth_response.get('accessToken'))
-            self._time_of_expiry = self._get_expires_time_from_jwt(self.current_access_token)
+        jwt_content = self._decode_jwt(self.current_access_token)
+        self._time_of_expiry = self._get_expires_time_from_jwt(self.current_access_token, jwt_content=jwt_content)
+        iat = jwt_content.get('iat')
+        self._time_of_issue = datetime.fromtimestamp(iat) if iat is not None else None
+
+    def _decode_jwt(self, token):
+        return jwt.decode(token, options={'verify_signature': False, 'verify_aud': False}, algorithms=self.jwt_algorithms)
 
-    def _get_expires_time_from_jwt(self, token):
-        jwt_content = jwt.decode(token, options={'verify_signature': False, 'verify_aud': False}, algorithms=self.jwt_algorithms)
+    def _get_expires_time_from_jwt(self, token, jwt_content=None):
+        if jwt_content is None:
+            jwt_content = self._decode_jwt(token)
         exp = jwt_content.get('exp')
         if exp is None:
             raise ValueError('Expected "exp" in token content')
-        return datetime.fromtimestamp(exp)
\ No newline at end of file
+        return datetime.fromtimestamp(exp)
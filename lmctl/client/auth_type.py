@@ -1,8 +1,18 @@
-from typing import Dict
+from typing import Dict, Optional
 
 
 class AuthType:
 
+    # False when authenticating again would not produce a new token, so there is no use renewing it before it expires
+    renewable = True
+
     def handle(self, client: 'TNCOClient') -> Dict:
         pass
 
+    def token_cache_key(self, client: 'TNCOClient') -> Optional[str]:
+        """
+        Key identifying the address and credentials used to authenticate, so the resulting token can be cached between invocations.
+        Return None if tokens from this type of auth should not be cached
+        """
+        return None
+
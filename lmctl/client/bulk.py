@@ -0,0 +1,82 @@
+import time
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BULK_CONCURRENCY = 10
+
+class RateLimiter:
+    """
+    Thread-safe limiter which spaces out calls to `acquire` so no more than `max_per_second` pass each second
+    """
+
+    def __init__(self, max_per_second: float):
+        if max_per_second <= 0:
+            raise ValueError(f'Rate limit must be greater than zero but was {max_per_second}')
+        self.interval = 1.0 / max_per_second
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+class BulkItemResult(NamedTuple):
+    index: int
+    item: Any
+    result: Any = None
+    error: Exception = None
+
+def execute_bulk(func: Callable, items: Iterable, concurrency: int = DEFAULT_BULK_CONCURRENCY, rate_limit: float = None) -> Iterator[BulkItemResult]:
+    """
+    Call `func` on each item with at most `concurrency` calls in progress (and at most `rate_limit` calls started per second).
+
+    Results are yielded as each call completes, so may not be in the order of the items.
+    Items are read lazily, so only a small window of them are held in memory at once.
+    An error raised by `func` is captured on the result for that item instead of stopping the remaining items.
+    """
+    if concurrency < 1:
+        raise ValueError(f'Concurrency must be at least 1 but was {concurrency}')
+    rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+
+    def run(index: int, item: Any) -> BulkItemResult:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return BulkItemResult(index=index, item=item, result=func(item))
+        except Exception as e:
+            logger.debug(f'Bulk item {index} failed: {e}')
+            return BulkItemResult(index=index, item=item, error=e)
+
+    item_iter = iter(enumerate(items))
+    # Keep the queue of submitted items just ahead of the workers
+    window_size = concurrency * 2
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='lmctl-bulk')
+    in_flight = set()
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < window_size:
+                next_item = next(item_iter, None)
+                if next_item is None:
+                    exhausted = True
+                else:
+                    in_flight.add(executor.submit(run, *next_item))
+            if len(in_flight) == 0:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # Caller may stop iterating early, so don't start anything not yet running
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
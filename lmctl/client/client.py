@@ -3,21 +3,66 @@ from typing import Dict
 from urllib.parse import urlparse, urlencode
 from .exceptions import TNCOClientError, TNCOClientHttpError
 from .auth_type import AuthType
-from .auth_tracker import AuthTracker
+from .auth_tracker import AuthTracker, DEFAULT_REFRESH_FRACTION
 from .error_capture import tnco_error_capture
 from .client_test_result import TestResult, TestResults
 from .client_request import TNCOClientRequest
 from lmctl.utils.trace_ctx import trace_ctx
+from lmctl.utils.profiling import profiler
+from lmctl.utils.uploads import MultipartEncoder
+from .response_cache import ResponseCache, DEFAULT_CACHE_MAX_BYTES, default_cache_directory
+from .token_cache import TokenCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import requests
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+# Wait before trying to renew an access token again, after a failed attempt in the background
+TOKEN_REFRESH_RETRY_SECONDS = 5
+
+# APIs for resources which change rarely, with a "cache_ttl", used when response caching is enabled
+CACHEABLE_APIS = [
+    DescriptorsAPI,
+    DescriptorTemplatesAPI,
+    ResourceDriversAPI,
+    DeploymentLocationAPI,
+    SharedInfrastructureKeysAPI,
+    BehaviourAssemblyConfigurationsAPI
+]
+
+def default_cache_ttls() -> Dict[str, float]:
+    return {api.endpoint: api.cache_ttl for api in CACHEABLE_APIS if api.cache_ttl is not None}
+
+def build_default_response_cache(directory: str = None, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> ResponseCache:
+    if directory is None:
+        directory = default_cache_directory()
+    return ResponseCache(directory, ttls=default_cache_ttls(), max_bytes=max_bytes)
+
 class TNCOClient:
     """
     Base client for TNCO 
 
     TNCO APIs are grouped by functional attributes.
+
+    By default, requests are sent through a pooled keep-alive session so connections (and TLS handshakes) are re-used between calls. 
+    Call `close` (or use the client as a context manager) to release the pooled connections.
+
+    When a `response_cache` is provided, GET requests for rarely changing resources are answered from (or revalidated against) the cache.
+
+    When a `token_cache` is provided, access tokens are shared with other clients (and lmctl invocations) authenticating with the same credentials.
+
+    Access tokens are renewed once `token_refresh_fraction` of their lifetime has passed. The renewal happens on a background thread, 
+    so requests continue with the current (still valid) token rather than waiting. Only when there is no valid token do requests wait for authentication. 
+    With `background_token_refresh`, renewal is scheduled on a timer so long running processes always have a fresh token, even between requests.
     """
 
     POST = 'post'
@@ -25,13 +70,30 @@ class TNCOClient:
     PUT = 'put'
     DELETE = 'delete'
 
-    def __init__(self, address: str, auth_type: AuthType = None, kami_address: str = None, use_sessions: bool = False):
+    def __init__(self, address: str, auth_type: AuthType = None, kami_address: str = None, use_sessions: bool = True, 
+                    pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                    response_cache: ResponseCache = None, token_cache: TokenCache = None, token_refresh_fraction: float = DEFAULT_REFRESH_FRACTION,
+                    background_token_refresh: bool = False):
         self.address = self._parse_address(address)
         self.auth_type = auth_type
         self.kami_address = kami_address
-        self.auth_tracker = AuthTracker() if self.auth_type is not None else None
+        self.auth_tracker = AuthTracker(refresh_fraction=token_refresh_fraction) if self.auth_type is not None else None
+        self._auth_lock = threading.Lock()
+        self._refresh_state_lock = threading.Lock()
+        self._refresh_thread = None
+        self._refresh_timer = None
+        self._refresh_failed_at = None
+        self._closed = False
+        self.background_token_refresh = background_token_refresh
+        # Requests may be made from several threads sharing this client, which must all use the same pooled session
+        self._session_lock = threading.Lock()
         self._session = None
         self.use_sessions = use_sessions
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.response_cache = response_cache
+        self.token_cache = token_cache
 
     def _parse_address(self, address: str) -> str:
         if address is not None:
@@ -40,30 +102,127 @@ class TNCOClient:
         return address
 
     def close(self):
-        if self._session is not None:
-            self._session.close()
-    
+        with self._refresh_state_lock:
+            self._closed = True
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self) -> 'TNCOClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _build_retry(self) -> Retry:
+        # Retries connection errors on any method but only retries on bad gateway/unavailable responses 
+        # for idempotent methods (the default set allowed by urllib3), so intents are never resubmitted
+        return Retry(
+            total=self.max_retries, 
+            backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR, 
+            status_forcelist=RETRY_STATUS_CODES, 
+            raise_on_status=False
+        )
+
+    def _build_session(self) -> requests.Session:
+        logger.debug(f'Creating pooled CP4NA orchestration session: pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, max_retries={self.max_retries}')
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, max_retries=self._build_retry())
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def _curr_session(self):
         if self.use_sessions:
-            if self._session is None:
-                self._session = requests.Session()
-            return self._session
+            session = self._session
+            if session is None:
+                with self._session_lock:
+                    if self._session is None:
+                        self._session = self._build_session()
+                    session = self._session
+            return session
         else:
             return requests
 
     def get_access_token(self) -> str:
-        if self.auth_tracker is not None:
-            if self.auth_tracker.has_access_expired:
-                auth_response = self.auth_type.handle(self)
-                self.auth_tracker.accept_auth_response(auth_response)
-            return self.auth_tracker.current_access_token
-        else:
+        if self.auth_tracker is None:
             return None
+        if self.auth_tracker.has_access_expired:
+            # No usable token, so only one thread authenticates and the others wait and re-use the new token
+            with self._auth_lock:
+                if self.auth_tracker.has_access_expired:
+                    self._authenticate()
+        elif self.auth_tracker.is_refresh_due:
+            # The current token is still valid, so keep using it while a new one is requested
+            self._start_background_refresh()
+        return self.auth_tracker.current_access_token
+
+    def _authenticate(self, use_cached: bool = True):
+        token_cache_key = self.auth_type.token_cache_key(self) if self.token_cache is not None else None
+        cached_token = self.token_cache.get(token_cache_key) if token_cache_key is not None and use_cached else None
+        if cached_token is not None:
+            logger.debug('Using cached CP4NA orchestration access token')
+            self.auth_tracker.accept_auth_response({'token': cached_token})
+        else:
+            with profiler.span(type(self.auth_type).__name__, 'auth', address=self.address):
+                auth_response = self.auth_type.handle(self)
+            self.auth_tracker.accept_auth_response(auth_response)
+            if token_cache_key is not None:
+                self.token_cache.put(token_cache_key, self.auth_tracker.current_access_token, self.auth_tracker.time_of_expiry.timestamp())
+        self._schedule_refresh(self.auth_tracker.seconds_until_refresh())
+
+    def _start_background_refresh(self):
+        if not self.auth_type.renewable:
+            return
+        with self._refresh_state_lock:
+            if self._closed or (self._refresh_thread is not None and self._refresh_thread.is_alive()):
+                return
+            if self._refresh_failed_at is not None and time.monotonic() - self._refresh_failed_at < TOKEN_REFRESH_RETRY_SECONDS:
+                return
+            self._refresh_thread = threading.Thread(target=self._background_refresh, name='lmctl-token-refresh', daemon=True)
+            self._refresh_thread.start()
+
+    def _background_refresh(self):
+        try:
+            with self._auth_lock:
+                # Another thread may have already renewed the token
+                if self.auth_tracker.is_refresh_due:
+                    logger.debug('Renewing CP4NA orchestration access token in the background')
+                    self._authenticate(use_cached=False)
+            self._refresh_failed_at = None
+        except Exception as e:
+            self._refresh_failed_at = time.monotonic()
+            logger.warning(f'Failed to renew CP4NA orchestration access token, the current token will be used until it expires: {e}')
+            self._schedule_refresh(TOKEN_REFRESH_RETRY_SECONDS)
+
+    def _schedule_refresh(self, delay: float):
+        if not self.background_token_refresh or not self.auth_type.renewable:
+            return
+        with self._refresh_state_lock:
+            if self._closed:
+                return
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = threading.Timer(delay, self._background_refresh)
+            self._refresh_timer.name = 'lmctl-token-refresh-timer'
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _forget_cached_token(self):
+        # The token may have been revoked before it expired, so don't hand it to later invocations
+        if self.token_cache is not None and self.auth_type is not None:
+            token_cache_key = self.auth_type.token_cache_key(self)
+            if token_cache_key is not None:
+                self.token_cache.remove(token_cache_key)
 
     def _add_auth_headers(self, headers: Dict) -> Dict:
         if self.auth_tracker is not None:
             access_token = self.get_access_token()
-            headers['Authorization'] = f'Bearer {self.auth_tracker.current_access_token}'
+            headers['Authorization'] = f'Bearer {access_token}'
         return headers
 
     def _supplement_headers(self, headers: Dict, inject_current_auth: bool = True) -> Dict:
@@ -74,24 +233,65 @@ class TNCOClient:
             self._add_auth_headers(headers=headers)
         return headers
 
-    def make_request(self, request: TNCOClientRequest) -> requests.Response:
+    def _build_url(self, request: TNCOClientRequest) -> str:
         url = request.override_address if request.override_address else self.address
         if request.endpoint is not None:
             url = f'{url}/{request.endpoint}'
+        return url
+
+    def make_request(self, request: TNCOClientRequest) -> requests.Response:
+        response = self.make_raw_request(request)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            raise TNCOClientHttpError(f'{request.method} request to {self._build_url(request)} failed', e) from e
+        return response
+
+    def make_raw_request(self, request: TNCOClientRequest) -> requests.Response:
+        """
+        Send a request through the pooled session, returning the response whatever its status code (unlike `make_request`, which raises an error on 4xx/5xx responses)
+        """
+        with profiler.span(f'{request.method} {request.endpoint}', 'http', method=request.method, endpoint=request.endpoint) as span:
+            response = self._send_request(request)
+            if span.active:
+                # "elapsed" is from sending the request until its response headers arrived, so excludes time spent on our side before and after
+                span.set(status=response.status_code, bytes=len(response.content), elapsed_ms=round(response.elapsed.total_seconds() * 1000, 1))
+            return response
+
+    def _send_request(self, request: TNCOClientRequest) -> requests.Response:
+        url = self._build_url(request)
             
         request_kwargs = {}
         if request.query_params is not None and len(request.query_params) > 0:
             request_kwargs['params'] = request.query_params
 
-        if request.body is not None:
-            request_kwargs['data'] = request.body
-        if request.files is not None and len(request.files) > 0:
-            request_kwargs['files'] = request.files
-
         request_kwargs['headers'] = {}
         if request.headers is not None:
             request_kwargs['headers'].update(request.headers)
 
+        if request.files is not None and len(request.files) > 0:
+            # Stream the multipart body from the files, rather than letting requests build it all in memory
+            fields = dict(request.body) if isinstance(request.body, dict) else {}
+            fields.update(request.files)
+            multipart_body = MultipartEncoder(fields, progress_callback=request.upload_progress_callback)
+            request_kwargs['data'] = multipart_body
+            request_kwargs['headers']['Content-Type'] = multipart_body.content_type
+        elif request.body is not None:
+            request_kwargs['data'] = request.body
+
+        cache_address = request.override_address if request.override_address else self.address
+        cache_accept = request_kwargs['headers'].get('Accept', '')
+        use_cache = self.response_cache is not None and 'data' not in request_kwargs \
+                        and self.response_cache.is_cacheable(request.method, request.endpoint, request.query_params)
+        cached_entry = None
+        if use_cache:
+            cached_entry = self.response_cache.lookup(cache_address, request.endpoint, url, request.query_params, cache_accept)
+            if cached_entry is not None:
+                if cached_entry.is_fresh():
+                    logger.debug(f'CP4NA orchestration request answered from cache: Method={request.method}, URL={url}')
+                    return cached_entry.to_response()
+                request_kwargs['headers'].update(cached_entry.validation_headers())
+
         # Log before adding sensitive data
         logger.debug(f'CP4NA orchestration request: Method={request.method}, URL={url}, Request Kwargs={request_kwargs}')
 
@@ -104,10 +304,18 @@ class TNCOClient:
         except requests.RequestException as e:
             raise TNCOClientError(str(e)) from e
         logger.debug(f'CP4NA orchestration request has returned: Method={request.method}, URL={url}, Response={response}')
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as e:
-            raise TNCOClientHttpError(f'{request.method} request to {url} failed', e) from e
+        if self.response_cache is not None:
+            if use_cache:
+                if response.status_code == 304 and cached_entry is not None:
+                    logger.debug(f'Cached response still valid: Method={request.method}, URL={url}')
+                    self.response_cache.refresh(cached_entry, request.endpoint)
+                    return cached_entry.to_response()
+                if response.status_code == 200:
+                    self.response_cache.store(cache_address, request.endpoint, url, request.query_params, cache_accept, response)
+            elif request.method.upper() != 'GET':
+                self.response_cache.invalidate(cache_address, request.endpoint)
+        if response.status_code == 401 and request.inject_current_auth:
+            self._forget_cached_token()
         return response
 
     def make_request_for_json(self, request: TNCOClientRequest) -> Dict:
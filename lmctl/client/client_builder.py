@@ -2,8 +2,12 @@ from .client_credentials_auth import ClientCredentialsAuth
 from .pass_auth import UserPassAuth, LegacyUserPassAuth
 from .zen_auth import ZenAPIKeyAuth
 from .token_auth import JwtTokenAuth
-from .client import TNCOClient
+from .client import TNCOClient, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_MAX_RETRIES
+from .response_cache import ResponseCache
+from .token_cache import TokenCache
+from .auth_tracker import DEFAULT_REFRESH_FRACTION
 from .auth_type import AuthType
+from .async_client import AsyncTNCOClient
 
 class TNCOClientBuilder:
 
@@ -11,6 +15,14 @@ class TNCOClientBuilder:
         self._address = None
         self._kami_address = None
         self._auth = None
+        self._use_sessions = True
+        self._pool_connections = DEFAULT_POOL_CONNECTIONS
+        self._pool_maxsize = DEFAULT_POOL_MAXSIZE
+        self._max_retries = DEFAULT_MAX_RETRIES
+        self._response_cache = None
+        self._token_cache = None
+        self._token_refresh_fraction = DEFAULT_REFRESH_FRACTION
+        self._background_token_refresh = False
     
     @property
     def address(self):
@@ -56,5 +68,48 @@ class TNCOClientBuilder:
         self._auth = LegacyUserPassAuth(username=username, password=password, legacy_auth_address=legacy_auth_address)
         return self
     
+    def use_sessions(self, use_sessions: bool) -> 'TNCOClientBuilder':
+        self._use_sessions = use_sessions
+        return self
+
+    def pool_connections(self, pool_connections: int) -> 'TNCOClientBuilder':
+        self._pool_connections = pool_connections
+        return self
+
+    def pool_maxsize(self, pool_maxsize: int) -> 'TNCOClientBuilder':
+        self._pool_maxsize = pool_maxsize
+        return self
+
+    def max_retries(self, max_retries: int) -> 'TNCOClientBuilder':
+        self._max_retries = max_retries
+        return self
+
+    def response_cache(self, response_cache: ResponseCache) -> 'TNCOClientBuilder':
+        self._response_cache = response_cache
+        return self
+
+    def token_cache(self, token_cache: TokenCache) -> 'TNCOClientBuilder':
+        self._token_cache = token_cache
+        return self
+
+    def token_refresh_fraction(self, token_refresh_fraction: float) -> 'TNCOClientBuilder':
+        self._token_refresh_fraction = token_refresh_fraction
+        return self
+
+    def background_token_refresh(self, background_token_refresh: bool) -> 'TNCOClientBuilder':
+        self._background_token_refresh = background_token_refresh
+        return self
+
     def build(self):
-        return TNCOClient(self._address, auth_type=self._auth, kami_address=self._kami_address)
+        return TNCOClient(self._address, auth_type=self._auth, kami_address=self._kami_address, use_sessions=self._use_sessions,
+                            pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize, max_retries=self._max_retries,
+                            response_cache=self._response_cache, token_cache=self._token_cache, token_refresh_fraction=self._token_refresh_fraction,
+                            background_token_refresh=self._background_token_refresh)
+
+
+    def build_async(self, max_concurrency: int = None) -> AsyncTNCOClient:
+        if max_concurrency is None:
+            max_concurrency = self._pool_maxsize
+        return AsyncTNCOClient(self._address, auth_type=self._auth, kami_address=self._kami_address, max_concurrency=max_concurrency,
+                                pool_connections=self._pool_connections, max_retries=self._max_retries, token_cache=self._token_cache,
+                                token_refresh_fraction=self._token_refresh_fraction, background_token_refresh=self._background_token_refresh)
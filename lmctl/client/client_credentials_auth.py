@@ -1,5 +1,6 @@
 from typing import Dict
 from .auth_type import AuthType
+from .token_cache import credential_hash
 
 class ClientCredentialsAuth(AuthType):
 
@@ -10,4 +11,7 @@ class ClientCredentialsAuth(AuthType):
     def handle(self, client: 'TNCOClient') -> Dict:
         return client.auth.request_client_access(self.client_id, self.client_secret)
 
+    def token_cache_key(self, client: 'TNCOClient') -> str:
+        return f'client_credentials|{client.address}|{self.client_id}|{credential_hash(self.client_secret)}'
+
     
\ No newline at end of file
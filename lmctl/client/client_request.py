@@ -1,5 +1,5 @@
 from pydantic.dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from dataclasses import field
 from requests.auth import AuthBase
 from .utils import convert_dict_to_yaml, convert_dict_to_json
@@ -15,6 +15,7 @@ class TNCOClientRequest:
     query_params: Dict[str, Any] = field(default_factory=dict)
     body: Any = None
     files: Dict[str, Any] = field(default_factory=dict)
+    upload_progress_callback: Any = None
     override_address: str = None
     inject_current_auth: bool = True
     additional_auth_handler: AuthBase = None
@@ -52,6 +53,10 @@ class TNCOClientRequest:
     def add_files(self, files: Dict[str, Any]) -> 'TNCOClientRequest':
         self.files.update(files)
         return self
+
+    def add_upload_progress_callback(self, upload_progress_callback: Callable[[int, int], None]) -> 'TNCOClientRequest':
+        self.upload_progress_callback = upload_progress_callback
+        return self
     
     def disable_auth_token(self) -> 'TNCOClientRequest':
         self.inject_current_auth = False
@@ -1,3 +1,4 @@
 from .intents import (Intent, ExistingAssemblyIntent, CreateAssemblyIntent, 
                         ChangeAssemblyStateIntent, DeleteAssemblyIntent, HealAssemblyIntent,
-                        ScaleAssemblyIntent, UpgradeAssemblyIntent, CreateOrUpgradeAssemblyIntent, AdoptAssemblyIntent)
+                        ScaleAssemblyIntent, UpgradeAssemblyIntent, CreateOrUpgradeAssemblyIntent, AdoptAssemblyIntent,
+                        IntentResult)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict
 from abc import ABC, abstractmethod
 
 class Intent(ABC):
@@ -299,4 +299,29 @@ class AdoptAssemblyIntent(Intent):
             obj['properties'] = self.properties
         if self.clusters is not None:
             obj['clusters'] = self.clusters
-        return obj
\ No newline at end of file
+        return obj
+
+class IntentResult:
+    """
+    Outcome of one intent submitted as part of a bulk request: either the ID of the Process created or the error raised
+    """
+
+    def __init__(self, index: int, intent_name: str = None, intent: Any = None, process_id: str = None, error: Exception = None):
+        self.index = index
+        self.intent_name = intent_name
+        self.intent = intent
+        self.process_id = process_id
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def __str__(self):
+        return (
+            f"index={self.index}, "
+            f"intent_name={self.intent_name}, "
+            f"process_id={self.process_id}, "
+            f"error={self.error}"
+        )
+
@@ -0,0 +1,102 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+
+FetchPage = Callable[[Dict[str, Any]], List[Any]]
+
+class OffsetPaging:
+    """
+    Paging through a list endpoint with query parameters for the maximum number of items to return (limit)
+    and the number of items to skip (offset)
+    """
+
+    def __init__(self, limit_param: str = 'limit', offset_param: str = 'offset'):
+        self.limit_param = limit_param
+        self.offset_param = offset_param
+
+    def page_params(self, page_number: int, page_size: int) -> Dict[str, Any]:
+        return {
+            self.limit_param: page_size,
+            self.offset_param: page_number * page_size
+        }
+
+class _DeferredResult:
+    """
+    Page requested only when its result is needed, so without prefetch no page is requested before the items of the previous one are consumed
+    """
+
+    def __init__(self, fetch: FetchPage, params: Dict[str, Any]):
+        self._fetch = fetch
+        self._params = params
+
+    def result(self) -> List[Any]:
+        return self._fetch(self._params)
+
+def _item_identity(item: Any) -> Any:
+    if isinstance(item, dict):
+        if 'id' in item:
+            return item['id']
+        return json.dumps(item, sort_keys=True, default=str)
+    return item
+
+def iterate_pages(fetch: FetchPage, paging: OffsetPaging = None, page_size: int = None, prefetch: bool = True) -> Iterator[Any]:
+    """
+    Yield the items of a list endpoint one page at a time.
+
+    `fetch` is called with the paging query parameters for each page and must return the items of that page.
+    Paging ends on the first page with fewer than `page_size` items. When `prefetch` is True, the next page
+    is requested in the background while the items of the current page are consumed.
+
+    Without `paging` or `page_size` the items are retrieved with a single request (still yielded one at a time).
+
+    Items are identified by their "id" (or their whole content when they have none) and each is only yielded once.
+    Servers which ignore the paging parameters are handled: a page larger than `page_size` is treated as the full
+    result, and a full page containing items already yielded (offset ignored, or the result shifting as items are
+    added or removed) causes the rest of the result to be retrieved with a single request, yielding only the items
+    not already seen. This way paging always ends, even when the result changes on every request.
+    """
+    if paging is None or page_size is None:
+        yield from fetch({})
+        return
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='lmctl-page') if prefetch else None
+    def request_page(page_number: int):
+        params = paging.page_params(page_number, page_size)
+        logger.debug(f'Requesting page {page_number} with params {params}')
+        if executor is not None:
+            return executor.submit(fetch, params)
+        return _DeferredResult(fetch, params)
+    seen = set()
+    def unseen(items: List[Any]) -> Iterator[Any]:
+        for item in items:
+            identity = _item_identity(item)
+            if identity not in seen:
+                seen.add(identity)
+                yield item
+    try:
+        page_number = 0
+        next_page = request_page(page_number)
+        while True:
+            page = next_page.result()
+            if len(page) > page_size:
+                logger.debug(f'Page of {len(page)} items exceeds page size of {page_size}, treating as the full result')
+                yield from unseen(page)
+                return
+            is_last_page = len(page) < page_size
+            if not is_last_page and any(_item_identity(item) in seen for item in page):
+                logger.debug('Page contains items already seen, retrieving all items in a single request')
+                yield from unseen(fetch({}))
+                return
+            if not is_last_page:
+                next_page = request_page(page_number + 1)
+            yield from unseen(page)
+            if is_last_page:
+                return
+            page_number += 1
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
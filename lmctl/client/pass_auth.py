@@ -1,5 +1,6 @@
 from typing import Dict
 from .auth_type import AuthType
+from .token_cache import credential_hash
 
 class UserPassAuth(AuthType):
 
@@ -15,6 +16,9 @@ class UserPassAuth(AuthType):
                                                 username=self.username, 
                                                 password=self.password)
 
+    def token_cache_key(self, client: 'TNCOClient') -> str:
+        return f'user_pass|{client.address}|{self.client_id}|{self.username}|{credential_hash(self.client_secret, self.password)}'
+
 class LegacyUserPassAuth(AuthType):
 
     def __init__(self, username: str, password: str, legacy_auth_address: str = None):
@@ -24,3 +28,7 @@ class LegacyUserPassAuth(AuthType):
 
     def handle(self, client: 'TNCOClient') -> Dict:
         return client.auth.legacy_login(username=self.username, password=self.password, legacy_auth_address=self.legacy_auth_address)
+
+    def token_cache_key(self, client: 'TNCOClient') -> str:
+        auth_address = self.legacy_auth_address if self.legacy_auth_address is not None else client.address
+        return f'legacy_user_pass|{auth_address}|{self.username}|{credential_hash(self.password)}'
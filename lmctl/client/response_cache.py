@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+import tempfile
+import threading
+import requests
+from pathlib import Path
+from typing import Dict, Any, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+NO_CACHE_ENV_VAR = 'LMCTL_NO_CACHE'
+DEFAULT_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Responses to requests with these query parameters contain secrets so are never written to disk
+NEVER_CACHE_QUERY_PARAMS = ('includePrivateKey',)
+CACHE_FORMAT_VERSION = 1
+CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+_cache_disabled = False
+
+def disable_response_cache(disabled: bool = True):
+    """
+    Turn off response caching for any client created after this call (used by the `--no-cache` CLI option)
+    """
+    global _cache_disabled
+    _cache_disabled = disabled
+
+def is_response_cache_disabled() -> bool:
+    if _cache_disabled:
+        return True
+    return os.environ.get(NO_CACHE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes')
+
+def default_cache_directory() -> Path:
+    return Path.home().joinpath('.lmctl').joinpath('cache').joinpath('responses')
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+class CacheEntry:
+
+    def __init__(self, path: str, data: Dict[str, Any]):
+        self.path = path
+        self.data = data
+
+    @property
+    def expires_at(self) -> float:
+        return self.data['expires_at']
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validation_headers(self) -> Dict[str, str]:
+        headers = {}
+        etag = self.data['headers'].get('ETag')
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        last_modified = self.data['headers'].get('Last-Modified')
+        if last_modified is not None:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.data['status_code']
+        response.url = self.data['url']
+        response.headers.update(self.data['headers'])
+        response.encoding = self.data.get('encoding')
+        response._content = base64.b64decode(self.data['content'])
+        return response
+
+class ResponseCache:
+    """
+    Disk cache of responses to GET requests for resources which change rarely.
+
+    Each endpoint prefix in `ttls` is a scope with its own time-to-live (in seconds). Only GET requests to an endpoint in a scope are cached.
+    Cached responses are keyed by the environment address, endpoint, query parameters and Accept header.
+
+    Once a response expires, the next request for it is sent with If-None-Match/If-Modified-Since headers (when the server provided an ETag/Last-Modified),
+    so an unchanged resource is confirmed with a 304 rather than downloaded again.
+
+    Any other request (e.g. POST/PUT/DELETE) to an endpoint in a scope removes all cached responses in that scope for the environment.
+    When the total size of the cache exceeds `max_bytes`, the least recently used responses are removed.
+    """
+
+    def __init__(self, directory: str, ttls: Dict[str, float], max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.directory = str(directory)
+        self.ttls = ttls
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _scope(self, endpoint: Optional[str]) -> Optional[str]:
+        if endpoint is None:
+            return None
+        endpoint = endpoint.strip('/')
+        matched = None
+        for prefix in self.ttls.keys():
+            if endpoint == prefix or endpoint.startswith(prefix + '/'):
+                if matched is None or len(prefix) > len(matched):
+                    matched = prefix
+        return matched
+
+    def _entry_path(self, address: str, scope: str, url: str, query_params: Dict[str, Any], accept: str) -> str:
+        # Files for the same environment and scope share a prefix so a scope can be invalidated without reading every entry
+        query_str = urlencode(sorted((query_params or {}).items()), doseq=True)
+        key = f'{url}?{query_str}|{accept}'
+        return os.path.join(self.directory, f'{self._scope_prefix(address, scope)}-{_hash(key)[:32]}.json')
+
+    def _scope_prefix(self, address: str, scope: str) -> str:
+        return _hash(f'{address}|{scope}')[:16]
+
+    def is_cacheable(self, method: str, endpoint: str, query_params: Dict[str, Any]) -> bool:
+        if method.upper() != 'GET' or self._scope(endpoint) is None:
+            return False
+        for param in NEVER_CACHE_QUERY_PARAMS:
+            if str((query_params or {}).get(param, '')).lower() == 'true':
+                return False
+        return True
+
+    def lookup(self, address: str, endpoint: str, url: str, query_params: Dict[str, Any], accept: str) -> Optional[CacheEntry]:
+        scope = self._scope(endpoint)
+        if scope is None:
+            return None
+        path = self._entry_path(address, scope, url, query_params, accept)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (IOError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable cached response at {path}: {e}')
+            return None
+        if data.get('version') != CACHE_FORMAT_VERSION:
+            return None
+        try:
+            # Access time (as mtime) orders entries for LRU eviction
+            os.utime(path, None)
+        except OSError:
+            pass
+        return CacheEntry(path, data)
+
+    def store(self, address: str, endpoint: str, url: str, query_params: Dict[str, Any], accept: str, response: requests.Response):
+        scope = self._scope(endpoint)
+        if scope is None:
+            return
+        data = {
+            'version': CACHE_FORMAT_VERSION,
+            'url': url,
+            'status_code': response.status_code,
+            'headers': {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers},
+            'encoding': response.encoding,
+            'content': base64.b64encode(response.content).decode('ascii'),
+            'expires_at': time.time() + self.ttls[scope]
+        }
+        self._write(self._entry_path(address, scope, url, query_params, accept), data)
+        if os.path.exists(self.directory):
+            self._evict()
+
+    def refresh(self, entry: CacheEntry, endpoint: str):
+        scope = self._scope(endpoint)
+        if scope is None:
+            return
+        entry.data['expires_at'] = time.time() + self.ttls[scope]
+        self._write(entry.path, entry.data)
+
+    def invalidate(self, address: str, endpoint: str):
+        scope = self._scope(endpoint)
+        if scope is None or not os.path.exists(self.directory):
+            return
+        prefix = self._scope_prefix(address, scope) + '-'
+        logger.debug(f'Invalidating cached responses for {address}/{scope}')
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith(prefix):
+                self._remove(os.path.join(self.directory, file_name))
+
+    def clear(self):
+        if os.path.exists(self.directory):
+            for file_name in os.listdir(self.directory):
+                self._remove(os.path.join(self.directory, file_name))
+
+    def _write(self, path: str, data: Dict[str, Any]):
+        # A failure to write to the cache should never fail the request
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file and then replace, so a reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError as e:
+            logger.debug(f'Failed to write cached response to {path}: {e}')
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f'Failed to write cached response to {path}: {e}')
+            self._remove(tmp_path)
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f'Failed to remove cached response at {path}: {e}')
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total_size = 0
+            for file_name in os.listdir(self.directory):
+                if not file_name.endswith('.json'):
+                    continue
+                path = os.path.join(self.directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+            if total_size <= self.max_bytes:
+                return
+            for mtime, size, path in sorted(entries):
+                self._remove(path)
+                total_size -= size
+                if total_size <= self.max_bytes:
+                    break
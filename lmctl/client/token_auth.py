@@ -3,6 +3,8 @@ from .auth_type import AuthType
 
 class JwtTokenAuth(AuthType):
 
+    renewable = False
+
     def __init__(self, token: str = None):
         self.token = token
 
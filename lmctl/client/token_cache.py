@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+NO_TOKEN_CACHE_ENV_VAR = 'LMCTL_NO_TOKEN_CACHE'
+# A cached token is only re-used if it remains valid for at least this long, so it's not expired by the time it's used
+DEFAULT_MIN_VALIDITY_SECONDS = 30
+TOKEN_CACHE_FORMAT_VERSION = 1
+
+def is_token_cache_disabled() -> bool:
+    return os.environ.get(NO_TOKEN_CACHE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes')
+
+def default_token_cache_directory() -> Path:
+    return Path.home().joinpath('.lmctl').joinpath('cache').joinpath('tokens')
+
+def credential_hash(*values: str) -> str:
+    """
+    One-way hash of credential values, used to key cached tokens without writing secrets to disk
+    """
+    return hashlib.sha256('|'.join('' if v is None else str(v) for v in values).encode('utf-8')).hexdigest()
+
+class TokenCache:
+    """
+    Disk cache of access tokens, shared between lmctl invocations so each one does not need to re-authenticate.
+
+    Tokens are keyed by a hash of the authentication address and credentials (see `AuthType.token_cache_key`), so
+    changing the credentials of an environment results in a new token. Each token is stored with the expiry time
+    from its JWT "exp" claim and is only returned while it remains valid for at least `min_validity_seconds`.
+
+    The directory and files are created readable/writable by the current user only.
+    """
+
+    def __init__(self, directory: str, min_validity_seconds: float = DEFAULT_MIN_VALIDITY_SECONDS):
+        self.directory = str(directory)
+        self.min_validity_seconds = min_validity_seconds
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{credential_hash(key)[:40]}.json')
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (IOError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable cached token at {path}: {e}')
+            return None
+        if data.get('version') != TOKEN_CACHE_FORMAT_VERSION:
+            return None
+        if time.time() + self.min_validity_seconds >= data.get('expires_at', 0):
+            logger.debug('Cached access token has expired (or expires soon)')
+            self.remove(key)
+            return None
+        return data.get('token')
+
+    def put(self, key: str, token: str, expires_at: float):
+        path = self._path(key)
+        data = {
+            'version': TOKEN_CACHE_FORMAT_VERSION,
+            'token': token,
+            'expires_at': expires_at
+        }
+        # A failure to write to the cache should never fail authentication
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            # mkstemp creates the file with 0600 permissions; replace so a reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError as e:
+            logger.debug(f'Failed to write cached token to {path}: {e}')
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f'Failed to write cached token to {path}: {e}')
+            self._remove_path(tmp_path)
+
+    def remove(self, key: str):
+        self._remove_path(self._path(key))
+
+    def _remove_path(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f'Failed to remove cached token at {path}: {e}')
+
+def build_default_token_cache(directory: str = None) -> TokenCache:
+    if directory is None:
+        directory = default_token_cache_directory()
+    return TokenCache(directory)
@@ -1,5 +1,6 @@
 from typing import Dict
 from .auth_type import AuthType
+from .token_cache import credential_hash
 
 class ZenAPIKeyAuth(AuthType):
 
@@ -10,3 +11,7 @@ class ZenAPIKeyAuth(AuthType):
 
     def handle(self, client: 'TNCOClient') -> Dict:
         return client.auth.request_zen_api_key_access(username=self.username, api_key=self.api_key, zen_auth_address=self.zen_auth_address)
+
+    def token_cache_key(self, client: 'TNCOClient') -> str:
+        auth_address = self.zen_auth_address if self.zen_auth_address is not None else client.address
+        return f'zen|{auth_address}|{self.username}|{credential_hash(self.api_key)}'
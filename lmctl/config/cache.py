@@ -0,0 +1,123 @@
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+NO_CONFIG_CACHE_ENV_VAR = 'LMCTL_NO_CONFIG_CACHE'
+CONFIG_CACHE_FORMAT_VERSION = 1
+
+def is_config_cache_disabled() -> bool:
+    return os.environ.get(NO_CONFIG_CACHE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes')
+
+def default_config_cache_directory() -> Path:
+    return Path.home().joinpath('.lmctl').joinpath('cache').joinpath('config')
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Modification time (in nanoseconds) and size of a file, or None if it cannot be read
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+class ConfigCache:
+    """
+    Disk cache of validated lmctl config files, so each lmctl invocation does not need to parse the YAML (and rewrite old style files) again.
+
+    The config is stored as JSON, after the environment groups have been pre-parsed (see EnvironmentGroupPreParser) and the
+    whole config has been validated. Entries are keyed by the absolute path of the config file and are only returned while the
+    file has the same modification time and size as when it was cached.
+
+    Config files may include credentials, so the directory and files are created readable/writable by the current user only.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = str(directory)
+
+    def _path(self, config_path: str) -> str:
+        return os.path.join(self.directory, f'{hashlib.sha256(os.path.abspath(config_path).encode("utf-8")).hexdigest()[:40]}.json')
+
+    def get(self, config_path: str, signature: Tuple[int, int]) -> Optional[Dict]:
+        """
+        Get the pre-parsed config cached for the file, only if it was cached when the file had the given signature (see `file_signature`)
+        """
+        if signature is None:
+            return None
+        path = self._path(config_path)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (IOError, ValueError) as e:
+            logger.debug(f'Ignoring unreadable cached config at {path}: {e}')
+            return None
+        if data.get('version') != CONFIG_CACHE_FORMAT_VERSION or data.get('path') != os.path.abspath(config_path):
+            return None
+        if data.get('mtime_ns') != signature[0] or data.get('size') != signature[1]:
+            logger.debug(f'Config file {config_path} has changed since it was cached')
+            return None
+        return data.get('config')
+
+    def put(self, config_path: str, signature: Tuple[int, int], config_dict: Dict):
+        if signature is None:
+            return
+        path = self._path(config_path)
+        try:
+            content = json.dumps({
+                'version': CONFIG_CACHE_FORMAT_VERSION,
+                'path': os.path.abspath(config_path),
+                'mtime_ns': signature[0],
+                'size': signature[1],
+                'config': config_dict
+            })
+        except (TypeError, ValueError) as e:
+            logger.debug(f'Config file {config_path} cannot be cached: {e}')
+            return
+        # JSON only has string keys and no dates etc., so don't cache any config which would not load back the same
+        if json.loads(content).get('config') != config_dict:
+            logger.debug(f'Config file {config_path} cannot be cached, it includes values which cannot be stored as JSON')
+            return
+        # A failure to write to the cache should never fail loading config
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            # mkstemp creates the file with 0600 permissions; replace so a reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError as e:
+            logger.debug(f'Failed to write cached config to {path}: {e}')
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f'Failed to write cached config to {path}: {e}')
+            self._remove_path(tmp_path)
+
+    def remove(self, config_path: str):
+        self._remove_path(self._path(config_path))
+
+    def _remove_path(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f'Failed to remove cached config at {path}: {e}')
+
+def build_default_config_cache(directory: str = None) -> Optional[ConfigCache]:
+    """
+    Returns None if the cache has been disabled with the LMCTL_NO_CONFIG_CACHE environment variable
+    """
+    if is_config_cache_disabled():
+        return None
+    if directory is None:
+        directory = default_config_cache_directory()
+    return ConfigCache(directory)
@@ -1,9 +1,12 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
+from collections.abc import MutableMapping
 from lmctl.environment.group import EnvironmentGroup
 from pydantic.dataclasses import dataclass
-from pydantic import Field
+from pydantic import Field, parse_obj_as, ValidationError
 from lmctl.utils.dcutils.dc_capture import recordattrs
 from lmctl.utils.dcutils.dc_to_dict import asdict
+from lmctl.utils.profiling import profiler
+from .exceptions import ConfigError
 
 @recordattrs
 @dataclass
@@ -15,5 +18,53 @@ class Config:
     def raw_environments(self):
         raw = {}
         for k,v in self.environments.items():
-            raw[k] = asdict(v)   
+            raw[k] = asdict(v)
         return raw
+
+
+class LazyEnvironmentGroups(MutableMapping):
+    """
+    Environment groups of a Config, each only validated (into an EnvironmentGroup) when first accessed. Used for config loaded from
+    the ConfigCache, which has already been validated, so a command using one environment group does not pay for validating all of them.
+    """
+
+    def __init__(self, raw_groups: Dict[str, Dict]):
+        # Raw group config is replaced by its EnvironmentGroup once validated (keeping the order of the groups)
+        self._groups = dict(raw_groups)
+        self._validated = set()
+
+    def __getitem__(self, name: str) -> EnvironmentGroup:
+        group = self._groups[name]
+        if name not in self._validated:
+            with profiler.span(f'environment {name}', 'config'):
+                try:
+                    group = parse_obj_as(EnvironmentGroup, group)
+                except (TypeError, ValidationError) as e:
+                    raise ConfigError(f'Config error: {str(e)}') from e
+            self._groups[name] = group
+            self._validated.add(name)
+        return group
+
+    def __setitem__(self, name: str, group: EnvironmentGroup):
+        self._groups[name] = group
+        self._validated.add(name)
+
+    def __delitem__(self, name: str):
+        del self._groups[name]
+        self._validated.discard(name)
+
+    def __contains__(self, name: Any) -> bool:
+        # Mapping's default would validate the group
+        return name in self._groups
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __as_dict__(self) -> Dict[str, Dict]:
+        return {name: asdict(group) for name, group in self.items()}
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
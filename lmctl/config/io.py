@@ -1,19 +1,24 @@
-from .config import Config
+from .config import Config, LazyEnvironmentGroups
 from .finder import ConfigFinder
+from .cache import ConfigCache, file_signature
 from .exceptions import ConfigError
 from .env_pre_parser import EnvironmentGroupPreParser
 from typing import Dict, Tuple
 from lmctl.utils.dcutils.dc_to_dict import asdict
 from pydantic import parse_obj_as, ValidationError
 import yaml
+from lmctl.utils.profiling import profiler, profiled
 import os
+import copy
 import shutil
 
 class ConfigIO:
 
-    def __init__(self):
+    def __init__(self, config_cache: ConfigCache = None):
         self.finder = ConfigFinder()
+        self.config_cache = config_cache
 
+    @profiled('ConfigIO.read_discovered_file', 'config')
     def read_discovered_file(self, override_path: str = None) -> Tuple[Config, str]:
         if override_path is None:
             file_path = self.finder.find()
@@ -28,9 +33,35 @@ class ConfigIO:
             return self.config_to_file(config, override_path, backup_existing=backup_existing)
 
     def file_to_config(self, path: str) -> Config:
+        if self.config_cache is not None:
+            return self.__cached_file_to_config(path)
         config_dict = self.file_to_dict(path)
         return self.dict_to_config(config_dict)
 
+    def __cached_file_to_config(self, path: str) -> Config:
+        # Signature taken before reading, so a file changed whilst being read is not cached as the new version
+        signature = file_signature(path)
+        with profiler.span('config cache', 'config', path=path) as span:
+            cached_dict = self.config_cache.get(path, signature)
+            span.set(hit=cached_dict is not None)
+        if cached_dict is not None:
+            return self.__cached_dict_to_config(cached_dict)
+        config_dict = self.file_to_dict(path)
+        cache_dict = copy.deepcopy(config_dict)
+        # Validate every environment group before caching, so cached config only needs validating as each group is used
+        config = self.dict_to_config(config_dict)
+        self.config_cache.put(path, signature, cache_dict)
+        return config
+
+    def __cached_dict_to_config(self, cached_dict: Dict) -> Config:
+        config_args = {k: v for k, v in cached_dict.items() if k != 'environments'}
+        try:
+            config = Config(**config_args)
+        except (TypeError, ValidationError) as e:
+            raise ConfigError(f'Config error: {str(e)}') from e
+        config.environments = LazyEnvironmentGroups(cached_dict.get('environments', {}))
+        return config
+
     def file_to_dict(self, path: str) -> Dict:
         config_dict = self.__read_yaml_file(path)
         self.__pre_parse_envs(config_dict)
@@ -76,7 +107,7 @@ class ConfigIO:
         if not os.path.exists(path):
             raise ConfigError(f'Config path does not exist: {path}')
         try:
-            with open(path, 'rt') as f:
+            with open(path, 'rt') as f, profiler.span('config file', 'yaml', path=path):
                 config_dict = yaml.safe_load(f.read())
             return config_dict
         except (yaml.YAMLError, OSError) as e:
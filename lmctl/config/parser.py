@@ -8,17 +8,19 @@ from .config import Config
 from .env_pre_parser import EnvironmentGroupPreParser
 from pydantic import parse_obj_as, ValidationError
 from dataclasses import asdict
+from lmctl.utils.profiling import profiler, profiled
 
 class ConfigParser:
 
     def __read_file(self, path):
         try:
-            with open(path, 'rt') as f:
+            with open(path, 'rt') as f, profiler.span('config file', 'yaml', path=path):
                 config_dict = yaml.safe_load(f.read())
             return config_dict
         except Exception as e:
             raise ConfigError('Failed to load file {0}: {1}'.format(path, str(e))) from e
 
+    @profiled('ConfigParser.from_file', 'config')
     def from_file(self, config_path) -> Config:
         config_dict = self.from_file_as_dict(config_path)
         return self.from_dict(config_dict)
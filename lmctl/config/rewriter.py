@@ -2,6 +2,7 @@ import os
 import yaml
 import shutil 
 from .exceptions import ConfigError
+from lmctl.utils.profiling import profiled
 
 class ConfigRewriter:
 
@@ -9,6 +10,7 @@ class ConfigRewriter:
         self.path = path
         self.config = config
 
+    @profiled('ConfigRewriter.rewrite', 'config')
     def rewrite(self):
         new_config = {}
         if type(self.config) is not dict:
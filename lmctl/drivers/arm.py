@@ -1,5 +1,6 @@
 import json
-import requests
+from lmctl.client import TNCOClient, TNCOClientRequest
+from lmctl.utils.uploads import MultipartEncoder
 
 
 class AnsibleRmDriver:
@@ -7,18 +8,29 @@ class AnsibleRmDriver:
     Handles communication with a target Ansible RM
     """
 
-    def __init__(self, ansible_rm_base):
+    def __init__(self, ansible_rm_base, client=None):
         self.ansible_rm_base = ansible_rm_base
+        self._client = client
 
-    def onboard_type(self, resource_name, resource_version, resource_csar):
+    @property
+    def client(self):
+        # Requests are sent through a pooled client, so connections are re-used and retried on connection errors
+        if self._client is None:
+            self._client = TNCOClient(self.ansible_rm_base)
+        return self._client
+
+    def onboard_type(self, resource_name, resource_version, resource_csar, progress_callback=None):
         """Push a Resource to the target Ansible RM"""
         url = '{0}/api/v1.0/resource-manager/types'.format(self.ansible_rm_base)
-        files = {'upfile': open(resource_csar, 'rb')}
-        data = {
-            'resource_name': resource_name,
-            'resource_version': resource_version
-        }
-        response = requests.post(url, files=files, data=data, verify=False)
+        with open(resource_csar, 'rb') as csar_file:
+            fields = {
+                'resource_name': resource_name,
+                'resource_version': resource_version,
+                'upfile': csar_file
+            }
+            multipart_body = MultipartEncoder(fields, progress_callback=progress_callback)
+            request = TNCOClientRequest(method='POST', override_address=url, headers={'Content-Type': multipart_body.content_type}, body=multipart_body, inject_current_auth=False)
+            response = self.client.make_raw_request(request)
         if response.status_code == 200:
             return True
         else:
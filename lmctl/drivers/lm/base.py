@@ -1,10 +1,45 @@
 import yaml
+from lmctl.client import TNCOClient, TNCOClientRequest
 
 class LmDriver:
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        """
+        Args:
+            lm_base (str): the base URL of the target CP4NA orchestration environment
+            lm_security_ctrl (LmSecurityCtrl): provides the access headers for each request (if the environment is secure)
+            client (TNCOClient): transport used to send requests. Share one client between drivers so they re-use the same pooled connections.
+                If not set, a client is created for this driver
+        """
         self.lm_base = lm_base
         self.lm_security_ctrl = lm_security_ctrl
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = TNCOClient(self.lm_base)
+        return self._client
+
+    def _request(self, method, url, headers=None, json=None, data=None):
+        """
+        Send a request through the client, which adds trace headers, re-uses pooled connections and retries connection errors.
+        The response is returned whatever the status code, so it can be checked by the caller.
+        Auth headers are not added, they are expected to be included in `headers` (see `_configure_access_headers`)
+        """
+        request = TNCOClientRequest(method=method, headers=dict(headers or {}), inject_current_auth=False)
+        base = self.lm_base.rstrip('/')
+        if url.startswith(base + '/'):
+            # Keeping the endpoint separate allows the client to recognise it (e.g. for response caching)
+            request.override_address = base
+            request.endpoint = url[len(base)+1:]
+        else:
+            request.override_address = url
+        if json is not None:
+            request.add_json_body(json)
+        elif data is not None:
+            request.body = data
+        return self.client.make_raw_request(request)
 
     def _configure_access_headers(self, headers=None):
         if headers is None:
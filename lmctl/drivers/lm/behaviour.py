@@ -1,5 +1,4 @@
 import json
-import requests
 from .base import LmDriver, NotFoundException
 
 
@@ -8,8 +7,8 @@ class LmBehaviourDriver(LmDriver):
     Client for the CP4NA orchestration Behaviour APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def __projects_api(self):
         return '{0}/api/behaviour/projects'.format(self.lm_base)
@@ -47,7 +46,7 @@ class LmBehaviourDriver(LmDriver):
     def create_project(self, project):
         url = self.__projects_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=project, headers=headers, verify=False)
+        response = self._request('POST', url, json=project, headers=headers)
         if response.status_code == 201:
             return True
         else:
@@ -56,7 +55,7 @@ class LmBehaviourDriver(LmDriver):
     def update_project(self, project):
         url = self.__project_api(project['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=project, headers=headers, verify=False)
+        response = self._request('PUT', url, json=project, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -67,7 +66,7 @@ class LmBehaviourDriver(LmDriver):
     def get_project(self, project_id):
         url = self.__project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             project = response.json()
             return project
@@ -79,7 +78,7 @@ class LmBehaviourDriver(LmDriver):
     def create_assembly_configuration(self, assembly_configuration):
         url = self.__assembly_configurations_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=assembly_configuration, headers=headers, verify=False)
+        response = self._request('POST', url, json=assembly_configuration, headers=headers)
         if response.status_code == 201:
             return True
         else:
@@ -88,7 +87,7 @@ class LmBehaviourDriver(LmDriver):
     def update_assembly_configuration(self, assembly_configuration):
         url = self.__assembly_configuration_api(assembly_configuration['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=assembly_configuration, headers=headers, verify=False)
+        response = self._request('PUT', url, json=assembly_configuration, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -99,7 +98,7 @@ class LmBehaviourDriver(LmDriver):
     def get_assembly_configuration(self, assembly_configuration_id):
         url = self.__assembly_configuration_api(assembly_configuration_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             template = response.json()
             return template
@@ -111,7 +110,7 @@ class LmBehaviourDriver(LmDriver):
     def get_assembly_configurations(self, project_id):
         url = self.__assembly_configurations_in_project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             templates = response.json()
             return templates
@@ -123,7 +122,7 @@ class LmBehaviourDriver(LmDriver):
     def create_scenario(self, scenario):
         url = self.__scenarios_api()
         headers = self._configure_access_headers()
-        response = requests.post(url, json=scenario, headers=headers, verify=False)
+        response = self._request('POST', url, json=scenario, headers=headers)
         if response.status_code == 201:
             return True
         else:
@@ -132,7 +131,7 @@ class LmBehaviourDriver(LmDriver):
     def update_scenario(self, scenario):
         url = self.__scenario_api(scenario['id'])
         headers = self._configure_access_headers()
-        response = requests.put(url, json=scenario, headers=headers, verify=False)
+        response = self._request('PUT', url, json=scenario, headers=headers)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -143,7 +142,7 @@ class LmBehaviourDriver(LmDriver):
     def get_scenario(self, scenario_id):
         url = self.__scenario_api(scenario_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             scenario = response.json()
             return scenario
@@ -162,7 +161,7 @@ class LmBehaviourDriver(LmDriver):
     def get_scenarios(self, project_id):
         url = self.__scenarios_in_project_api(project_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             scenarios = response.json()
             return scenarios
@@ -178,7 +177,7 @@ class LmBehaviourDriver(LmDriver):
         body = {}
         body['scenarioId'] = '{0}'.format(scenario_id)
 
-        response = requests.post(url, json=body, headers=headers, verify=False)
+        response = self._request('POST', url, json=body, headers=headers)
         if response.status_code == 201:
             return response.headers['location']
         elif response.status_code == 404:
@@ -189,7 +188,7 @@ class LmBehaviourDriver(LmDriver):
     def get_execution(self, exec_id):
         url = self.__scenario_exec_api(exec_id)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             execution = response.json()
             return execution
@@ -1,5 +1,4 @@
 import json
-import requests
 import logging
 from .base import LmDriver, NotFoundException
 
@@ -11,13 +10,13 @@ class LmDescriptorDriver(LmDriver):
     Client for CP4NA orchestration Descriptor APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def delete_descriptor(self, descriptor_name):
         url = '{0}/api/catalog/descriptors/{1}'.format(self.lm_base, descriptor_name)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 404:
             raise NotFoundException('No descriptor with name {0}'.format(descriptor_name))
         elif response.status_code == 204:
@@ -31,7 +30,7 @@ class LmDescriptorDriver(LmDriver):
             'Accept': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 404:
             raise NotFoundException('No descriptor with name {0}'.format(descriptor_name))
         elif response.status_code == 200:
@@ -45,7 +44,7 @@ class LmDescriptorDriver(LmDriver):
             'Content-Type': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.post(url, headers=headers, data=descriptor_content, verify=False)
+        response = self._request('POST', url, headers=headers, data=descriptor_content)
         if response.status_code == 201:
             return True
         else:
@@ -57,7 +56,7 @@ class LmDescriptorDriver(LmDriver):
             'Content-Type': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.put(url, headers=headers, data=descriptor_content, verify=False)
+        response = self._request('PUT', url, headers=headers, data=descriptor_content)
         if response.status_code == 200:
             return True
         else:
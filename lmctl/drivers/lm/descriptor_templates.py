@@ -1,5 +1,4 @@
 import json
-import requests
 import logging
 from .base import LmDriver, NotFoundException
 
@@ -13,13 +12,13 @@ class LmDescriptorTemplatesDriver(LmDriver):
 
     TEMPLATES_API = 'api/catalog/descriptorTemplates'
 
-    def __init__(self, lm_base):
-        super().__init__(lm_base)
+    def __init__(self, lm_base, client=None):
+        super().__init__(lm_base, client=client)
 
     def delete_descriptor_template(self, descriptor_name):
         url = '{0}/{1}/{2}'.format(self.lm_base, self.TEMPLATES_API, descriptor_name)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 404:
             raise NotFoundException('No descriptor template with name {0}'.format(descriptor_name))
         elif response.status_code == 204:
@@ -33,7 +32,7 @@ class LmDescriptorTemplatesDriver(LmDriver):
             'Accept': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 404:
             raise NotFoundException('No descriptor template with name {0}'.format(descriptor_name))
         elif response.status_code == 200:
@@ -47,7 +46,7 @@ class LmDescriptorTemplatesDriver(LmDriver):
             'Content-Type': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.post(url, headers=headers, data=descriptor_content, verify=False)
+        response = self._request('POST', url, headers=headers, data=descriptor_content)
         if response.status_code == 201:
             return True
         else:
@@ -59,7 +58,7 @@ class LmDescriptorTemplatesDriver(LmDriver):
             'Content-Type': 'application/yaml'
         }
         headers = self._configure_access_headers(headers)
-        response = requests.put(url, headers=headers, data=descriptor_content, verify=False)
+        response = self._request('PUT', url, headers=headers, data=descriptor_content)
         if response.status_code == 200:
             return True
         else:
@@ -1,6 +1,6 @@
 import logging
-import requests
 import json
+from lmctl.utils.uploads import ProgressReader
 from .base import LmDriver, NotFoundException
 
 logger = logging.getLogger(__name__)
@@ -10,8 +10,8 @@ class EtsiPackageMgmtDriver(LmDriver):
     Client for managing packages
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def __packages_api(self):
         return '{0}/api/etsi/vnfpkgm/v2/vnf_packages'.format(self.lm_base)
@@ -37,23 +37,23 @@ class EtsiPackageMgmtDriver(LmDriver):
         headers['Content-Type'] = content_type
         return headers
 
-    def onboard_package(self, package_id, resource_pkg_path):
+    def onboard_package(self, package_id, resource_pkg_path, progress_callback=None):
         self.__create_package(package_id)
         url = self.__packages_api_package_content(package_id)
         headers = self.__configure_headers('application/zip')
         with open(resource_pkg_path, 'rb') as resource_pkg:
-            response = requests.put(url, headers=headers, data=resource_pkg, verify=False)
+            response = self._request('PUT', url, headers=headers, data=ProgressReader(resource_pkg, progress_callback=progress_callback))
             if response.status_code == 202:
                 return True
             else:
                 self._raise_unexpected_status_exception(response)
 
-    def onboard_nsd_package(self, package_id, resource_pkg_path):
+    def onboard_nsd_package(self, package_id, resource_pkg_path, progress_callback=None):
         self.__create_nsd_package_entry(package_id)
         url = self.__nsd_api_package_content(package_id)
         headers = self.__configure_headers('application/zip')
         with open(resource_pkg_path, 'rb') as resource_pkg:
-            response = requests.put(url, headers=headers, data=resource_pkg, verify=False)
+            response = self._request('PUT', url, headers=headers, data=ProgressReader(resource_pkg, progress_callback=progress_callback))
             if response.status_code == 202:
                 return True
             else:
@@ -65,7 +65,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         package_user_data_json = json.loads(package_user_data)
         url = self.__packages_api()
         headers = self.__configure_headers()
-        response = requests.post(url, headers=headers, json=package_user_data_json, verify=False)
+        response = self._request('POST', url, headers=headers, json=package_user_data_json)
         if response.status_code == 201:
             return response.json()
         else:
@@ -76,7 +76,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         package_user_data_json = json.loads(package_user_data)
         url = self.__nsd_api()
         headers = self.__configure_headers()
-        response = requests.post(url, headers=headers, json=package_user_data_json, verify=False)
+        response = self._request('POST', url, headers=headers, json=package_user_data_json)
         if response.status_code == 201:
             return response.json()
         else:
@@ -86,7 +86,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         self.__disable_package(package_id)    
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -99,7 +99,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         self.__disable_nsd_package(package_id)    
         url = self.__nsd_api_by_id(package_id)
         headers = self.__configure_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 204:
             return True
         elif response.status_code == 404:
@@ -111,7 +111,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
         data='{"operationalState": "DISABLED"}'
-        response = requests.patch(url, data, headers=headers, verify=False)
+        response = self._request('PATCH', url, headers=headers, data=data)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -123,7 +123,7 @@ class EtsiPackageMgmtDriver(LmDriver):
         url = self.__nsd_api_by_id(package_id)
         headers = self.__configure_headers()
         data='{"nsdOperationalState": "DISABLED"}'
-        response = requests.patch(url, data, headers=headers, verify=False)
+        response = self._request('PATCH', url, headers=headers, data=data)
         if response.status_code == 200:
             return True
         elif response.status_code == 404:
@@ -134,7 +134,7 @@ class EtsiPackageMgmtDriver(LmDriver):
     def get_package_details(self, package_id):
         url = self.__packages_api_by_id_api(package_id)
         headers = self.__configure_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
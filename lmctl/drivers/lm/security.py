@@ -1,11 +1,10 @@
 import datetime
-import requests
 import logging
 import time
 from .base import LmDriver
 # Temporarily use new client to control auth in order to support client_credential authentication
 # Eventually this class and all classes in the drivers section will be replaced by the new client
-from lmctl.client import TNCOClientBuilder, TNCOClient, AuthTracker, ZEN_AUTH_MODE, TOKEN_AUTH_MODE, OAUTH_MODE
+from lmctl.client import TNCOClientBuilder, TNCOClient, ZEN_AUTH_MODE, TOKEN_AUTH_MODE, OAUTH_MODE
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +14,8 @@ class LmSecurityDriver(LmDriver):
     Client for CP4NA orchestration Security APIs
     """
 
-    def __init__(self, lm_base):
-        super().__init__(lm_base)
+    def __init__(self, lm_base, client=None):
+        super().__init__(lm_base, client=client)
 
     def login(self, username, password):
         url = '{0}/ui/api/login'.format(self.lm_base)
@@ -24,11 +23,11 @@ class LmSecurityDriver(LmDriver):
             'username': username,
             'password': password
         }
-        response = requests.post(url, json=data, verify=False)
+        response = self._request('POST', url, json=data)
         if response.status_code == 404 or response.status_code == 405:
             old_url = '{0}/api/login'.format(self.lm_base)
             logger.info('Failed to access login at {0} with {1} repsonse code...may be an older LM environment, trying {2}'.format(url, response.status_code, old_url))
-            response = requests.post(old_url, json=data, verify=False)
+            response = self._request('POST', old_url, json=data)
         if response.status_code == 200:
             login_result = response.json()
             return login_result
@@ -40,7 +39,7 @@ class LmSecurityCtrl:
     Manages authentication with a target CP4NA orchestration environment 
     """
 
-    def __init__(self, auth_address, username=None, password=None, client_id=None, client_secret=None, token=None, api_key=None, auth_mode=None):
+    def __init__(self, auth_address, username=None, password=None, client_id=None, client_secret=None, token=None, api_key=None, auth_mode=None, token_cache=None):
         """
         Constructs a new instance of controller for a target CP4NA orchestration environment and target user
 
@@ -53,6 +52,7 @@ class LmSecurityCtrl:
             api_key (str): API key used for Zen based auth
             token (str): Token used for authentication
             auth_mode (str): Determines if we're using Zen or Oauth
+            token_cache (TokenCache): cache of access tokens shared with other clients using the same credentials
         """
         self.__auth_address = auth_address
         self.__username = username
@@ -62,11 +62,11 @@ class LmSecurityCtrl:
         self.__api_key = api_key
         self.__token = token
         self.__auth_mode = auth_mode
-        self.__auth_tracker = AuthTracker()
         # Using the new client authentication methods in the "legacy" driver so we only need to maintain one impl
         # Eventually this LmSecurityCtrl will be removed, once we switch all of the "lmctl project" functionality to use the new client
         client_builder = TNCOClientBuilder()
         client_builder.address(self.__auth_address)
+        client_builder.token_cache(token_cache)
         if self.__auth_mode.lower() == ZEN_AUTH_MODE:
             client_builder.zen_api_key_auth(username=self.__username, api_key=self.__api_key, zen_auth_address=self.__auth_address)
         elif self.__auth_mode.lower() == TOKEN_AUTH_MODE:
@@ -93,22 +93,7 @@ class LmSecurityCtrl:
         Returns:
             str: the current Access Token for the user
         """
-        if self.__need_new_token():
-            logger.debug('Requesting new access token')
-            auth_response = self.__client.auth_type.handle(self.__client)
-            self.__auth_tracker.accept_auth_response(auth_response)
-        return self.__auth_tracker.current_access_token
-
-    def __need_new_token(self):
-        """
-        Determines if we need an Access Token by checking if there is one already, if there is then check it hasn't expired (using local knowledge of when the token would expire).
-        This method adds a "wait period" of 1 second to any previous Access Token expiration time, meaning if the Token is going to expire within 
-        1 second it waits till the Token expires before returning True to indicate a new one is needed. This gives clients a reasonable time to use the Token after checking it.
-
-        Returns:
-            bool: True if there is no Access Token for the user or it is believed to be expired based on time of last authentication
-        """
-        return self.__auth_tracker.has_access_expired
+        return self.__client.get_access_token()
 
     def add_access_headers(self, headers=None):
         """
@@ -1,5 +1,4 @@
 import json
-import requests
 from .base import LmDriver, NotFoundException
 
 
@@ -8,13 +7,13 @@ class LmTopologyDriver(LmDriver):
     Client for CP4NA orchestration Topology APIs
     """
 
-    def __init__(self, lm_base, lm_security_ctrl=None):
-        super().__init__(lm_base, lm_security_ctrl)
+    def __init__(self, lm_base, lm_security_ctrl=None, client=None):
+        super().__init__(lm_base, lm_security_ctrl, client=client)
 
     def get_assembly_by_name(self, assembly_name):
         url = '{0}/api/topology/assemblies/?name={1}'.format(self.lm_base, assembly_name)
         headers = self._configure_access_headers()
-        response = requests.get(url, headers=headers, verify=False)
+        response = self._request('GET', url, headers=headers)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -25,7 +24,7 @@ class LmTopologyDriver(LmDriver):
     def delete_assembly(self, assembly_id):
         url = '{0}/api/topology/assemblies/{1}'.format(self.lm_base, assembly_id)
         headers = self._configure_access_headers()
-        response = requests.delete(url, headers=headers, verify=False)
+        response = self._request('DELETE', url, headers=headers)
         if response.status_code == 204:
             return True
         else:
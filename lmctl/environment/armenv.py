@@ -1,3 +1,4 @@
+import threading
 from .common import build_address
 from typing import Union
 import lmctl.drivers.arm as arm_drivers
@@ -53,10 +54,13 @@ class ArmSession:
         if not session_config:
             raise ValueError('config not provided to session')
         self.env = session_config.env
+        # Drivers may be requested from several threads (e.g. parallel push)
+        self.__driver_lock = threading.Lock()
         self.__arm_driver = None
 
     @property
     def arm_driver(self):
-        if not self.__arm_driver:
-            self.__arm_driver = arm_drivers.AnsibleRmDriver(self.env.api_address)
-        return self.__arm_driver
+        with self.__driver_lock:
+            if not self.__arm_driver:
+                self.__arm_driver = arm_drivers.AnsibleRmDriver(self.env.api_address)
+            return self.__arm_driver
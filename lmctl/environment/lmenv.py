@@ -1,8 +1,12 @@
+import threading
 import lmctl.drivers.lm as lm_drivers
 from typing import Union, Optional
 from .common import build_address
 from urllib.parse import urlparse
 from lmctl.client import TNCOClient, TNCOClientBuilder, TOKEN_AUTH_MODE, ZEN_AUTH_MODE, OAUTH_MODE
+from lmctl.client.client import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_MAX_RETRIES, build_default_response_cache
+from lmctl.client.response_cache import is_response_cache_disabled
+from lmctl.client.token_cache import TokenCache, build_default_token_cache, is_token_cache_disabled
 from pydantic.dataclasses import dataclass
 from pydantic import constr, root_validator
 from lmctl.utils.dcutils.dc_capture import recordattrs
@@ -43,6 +47,13 @@ class TNCOEnvironment:
     kami_port: Optional[Union[str,int]] = DEFAULT_KAMI_PORT 
     kami_protocol: Optional[str] = DEFAULT_KAMI_PROTOCOL
 
+    keep_alive: Optional[bool] = True
+    pool_connections: Optional[int] = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: Optional[int] = DEFAULT_POOL_MAXSIZE
+    max_retries: Optional[int] = DEFAULT_MAX_RETRIES
+    response_cache: Optional[bool] = False
+    token_cache: Optional[bool] = True
+
     @root_validator(pre=True)
     @classmethod
     def check_security(cls, values):
@@ -148,9 +159,35 @@ class TNCOEnvironment:
                                 auth_mode=self.auth_mode
                             )
     def build_client(self):
+        return self._configure_client_builder().build()
+
+    def build_async_client(self, max_concurrency: int = None):
+        return self._configure_client_builder().build_async(max_concurrency=max_concurrency)
+
+    def build_driver_client(self) -> TNCOClient:
+        """
+        Build a client without authentication, for use as the pooled transport shared by the drivers of an LmSession (which add their own auth headers)
+        """
+        return self._configure_client_builder(include_auth=False).build()
+
+    def build_token_cache(self) -> Optional[TokenCache]:
+        if self.token_cache and not is_token_cache_disabled():
+            return build_default_token_cache()
+        return None
+
+    def _configure_client_builder(self, include_auth: bool = True) -> TNCOClientBuilder:
         builder = TNCOClientBuilder()
         builder.address(self.address)
         builder.kami_address(self.kami_address)
+        builder.use_sessions(self.keep_alive)
+        builder.pool_connections(self.pool_connections)
+        builder.pool_maxsize(self.pool_maxsize)
+        builder.max_retries(self.max_retries)
+        if self.response_cache and not is_response_cache_disabled():
+            builder.response_cache(build_default_response_cache())
+        if not include_auth:
+            return builder
+        builder.token_cache(self.build_token_cache())
         if self.secure:
             if self.auth_mode == ZEN_AUTH_MODE:
                 builder.zen_api_key_auth(username=self.username, api_key=self.api_key, zen_auth_address=self.auth_address)
@@ -166,7 +203,7 @@ class TNCOEnvironment:
                         builder.legacy_user_pass_auth(username=self.username, password=self.password, legacy_auth_address=self.auth_address)
                 else:
                     builder.client_credentials_auth(client_id=self.client_id, client_secret=self.client_secret)
-        return builder.build()
+        return builder
 
     @property
     def api_address(self):
@@ -224,7 +261,10 @@ class LmSession:
         self.api_key = session_config.api_key
         self.token = session_config.token
         self.auth_mode = session_config.auth_mode
+        # Guards creating the drivers and the client/security controller they share, as drivers may be requested from several threads (e.g. parallel push or pull)
+        self.__shared_lock = threading.RLock()
         self.__lm_security_ctrl = None
+        self.__driver_client = None
         self.__descriptor_driver = None
         self.__onboard_rm_driver = None
         self.__topology_driver = None
@@ -238,19 +278,28 @@ class LmSession:
         self.__infrastructure_keys_driver = None
         self.__descriptor_template_driver = None
 
+    def __get_driver_client(self):
+        # All drivers share one client, so they re-use the same pooled connections
+        with self.__shared_lock:
+            if self.__driver_client is None:
+                self.__driver_client = self.env.build_driver_client()
+            return self.__driver_client
+
     def __get_lm_security_ctrl(self):
         if self.env.secure:
-            if not self.__lm_security_ctrl:
-                self.__lm_security_ctrl = lm_drivers.LmSecurityCtrl(self.env.auth_address, 
-                                                                    username=self.username, 
-                                                                    password=self.password,
-                                                                    client_id=self.client_id, 
-                                                                    client_secret=self.client_secret,
-                                                                    api_key=self.api_key,
-                                                                    token=self.token,
-                                                                    auth_mode=self.auth_mode
-                                                                )
-            return self.__lm_security_ctrl
+            with self.__shared_lock:
+                if not self.__lm_security_ctrl:
+                    self.__lm_security_ctrl = lm_drivers.LmSecurityCtrl(self.env.auth_address, 
+                                                                        username=self.username, 
+                                                                        password=self.password,
+                                                                        client_id=self.client_id, 
+                                                                        client_secret=self.client_secret,
+                                                                        api_key=self.api_key,
+                                                                        token=self.token,
+                                                                        auth_mode=self.auth_mode,
+                                                                        token_cache=self.env.build_token_cache()
+                                                                    )
+                return self.__lm_security_ctrl
         return None
 
 
@@ -262,9 +311,10 @@ class LmSession:
         Returns:
             LmDescriptorDriver: a configured DescriptorDriver for this CP4NA orchestration environment
         """
-        if not self.__descriptor_driver:
-            self.__descriptor_driver = lm_drivers.LmDescriptorDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__descriptor_driver
+        with self.__shared_lock:
+            if not self.__descriptor_driver:
+                self.__descriptor_driver = lm_drivers.LmDescriptorDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__descriptor_driver
 
     @property
     def onboard_rm_driver(self):
@@ -274,9 +324,10 @@ class LmSession:
         Returns:
             LmOnboardRmDriver: a configured LmOnboardRmDriver for this CP4NA orchestration environment
         """
-        if not self.__onboard_rm_driver:
-            self.__onboard_rm_driver = lm_drivers.LmOnboardRmDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__onboard_rm_driver
+        with self.__shared_lock:
+            if not self.__onboard_rm_driver:
+                self.__onboard_rm_driver = lm_drivers.LmOnboardRmDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__onboard_rm_driver
 
     @property
     def topology_driver(self):
@@ -286,9 +337,10 @@ class LmSession:
         Returns:
             LmTopologyDriver: a configured LmTopologyDriver for this CP4NA orchestration environment
         """
-        if not self.__topology_driver:
-            self.__topology_driver = lm_drivers.LmTopologyDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__topology_driver
+        with self.__shared_lock:
+            if not self.__topology_driver:
+                self.__topology_driver = lm_drivers.LmTopologyDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__topology_driver
 
     @property
     def behaviour_driver(self):
@@ -298,9 +350,10 @@ class LmSession:
         Returns:
             LmBehaviourDriver: a configured LmBehaviourDriver for this CP4NA orchestration environment
         """
-        if not self.__behaviour_driver:
-            self.__behaviour_driver = lm_drivers.LmBehaviourDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__behaviour_driver
+        with self.__shared_lock:
+            if not self.__behaviour_driver:
+                self.__behaviour_driver = lm_drivers.LmBehaviourDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__behaviour_driver
 
     @property
     def deployment_location_driver(self):
@@ -310,9 +363,10 @@ class LmSession:
         Returns:
             LmDeploymentLocationDriver: a configured LmDeploymentLocationDriver for this CP4NA orchestration environment
         """
-        if not self.__deployment_location_driver:
-            self.__deployment_location_driver = lm_drivers.LmDeploymentLocationDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__deployment_location_driver
+        with self.__shared_lock:
+            if not self.__deployment_location_driver:
+                self.__deployment_location_driver = lm_drivers.LmDeploymentLocationDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__deployment_location_driver
 
     @property
     def resource_pkg_driver(self):
@@ -322,9 +376,10 @@ class LmSession:
         Returns:
             LmResourcePkgDriver: a configured LmResourcePkgDriver for this CP4NA orchestration environment
         """
-        if not self.__resource_pkg_driver:
-            self.__resource_pkg_driver = lm_drivers.LmResourcePkgDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__resource_pkg_driver
+        with self.__shared_lock:
+            if not self.__resource_pkg_driver:
+                self.__resource_pkg_driver = lm_drivers.LmResourcePkgDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__resource_pkg_driver
 
     @property
     def pkg_mgmt_driver(self):
@@ -334,9 +389,10 @@ class LmSession:
         Returns:
             EtsiPackageMgmtDriver: a configured EtsiPackageMgmtDriver for this CP4NA orchestration environment
         """
-        if not self.__pkg_mgmt_driver:
-            self.__pkg_mgmt_driver = lm_drivers.EtsiPackageMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__pkg_mgmt_driver        
+        with self.__shared_lock:
+            if not self.__pkg_mgmt_driver:
+                self.__pkg_mgmt_driver = lm_drivers.EtsiPackageMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__pkg_mgmt_driver
 
     @property
     def resource_driver_mgmt_driver(self):
@@ -346,9 +402,10 @@ class LmSession:
         Returns:
             LmResourceDriverMgmtDriver: a configured LmResourceDriverMgmtDriver for this CP4NA orchestration environment
         """
-        if not self.__resource_driver_mgmt_driver:
-            self.__resource_driver_mgmt_driver = lm_drivers.LmResourceDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__resource_driver_mgmt_driver
+        with self.__shared_lock:
+            if not self.__resource_driver_mgmt_driver:
+                self.__resource_driver_mgmt_driver = lm_drivers.LmResourceDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__resource_driver_mgmt_driver
 
     @property
     def vim_driver_mgmt_driver(self):
@@ -358,9 +415,10 @@ class LmSession:
         Returns:
             LmVimDriverMgmtDriver: a configured LmVimDriverMgmtDriver for this CP4NA orchestration environment
         """
-        if not self.__vim_driver_mgmt_driver:
-            self.__vim_driver_mgmt_driver = lm_drivers.LmVimDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__vim_driver_mgmt_driver
+        with self.__shared_lock:
+            if not self.__vim_driver_mgmt_driver:
+                self.__vim_driver_mgmt_driver = lm_drivers.LmVimDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__vim_driver_mgmt_driver
 
     @property
     def lifecycle_driver_mgmt_driver(self):
@@ -370,9 +428,10 @@ class LmSession:
         Returns:
             LmLifecycleDriverMgmtDriver: a configured LmLifecycleDriverMgmtDriver for this CP4NA orchestration environment
         """
-        if not self.__lifecycle_driver_mgmt_driver:
-            self.__lifecycle_driver_mgmt_driver = lm_drivers.LmLifecycleDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__lifecycle_driver_mgmt_driver
+        with self.__shared_lock:
+            if not self.__lifecycle_driver_mgmt_driver:
+                self.__lifecycle_driver_mgmt_driver = lm_drivers.LmLifecycleDriverMgmtDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__lifecycle_driver_mgmt_driver
 
     @property
     def infrastructure_keys_driver(self):
@@ -382,9 +441,10 @@ class LmSession:
         Returns:
             LmInfrastructureKeysDriver: a configured LmInfrastructureKeysDriver for this CP4NA orchestration environment
         """
-        if not self.__infrastructure_keys_driver:
-            self.__infrastructure_keys_driver = lm_drivers.LmInfrastructureKeysDriver(self.env.api_address, self.__get_lm_security_ctrl())
-        return self.__infrastructure_keys_driver
+        with self.__shared_lock:
+            if not self.__infrastructure_keys_driver:
+                self.__infrastructure_keys_driver = lm_drivers.LmInfrastructureKeysDriver(self.env.api_address, self.__get_lm_security_ctrl(), client=self.__get_driver_client())
+            return self.__infrastructure_keys_driver
 
     @property
     def descriptor_template_driver(self):
@@ -394,8 +454,9 @@ class LmSession:
         Returns:
             LmDescriptorTemplatesDriver: a configured LmDescriptorTemplatesDriver for this CP4NA orchestration environment
         """
-        if not self.__descriptor_template_driver:
-            self.__descriptor_template_driver = lm_drivers.LmDescriptorTemplatesDriver(self.env.kami_address)
-        return self.__descriptor_template_driver
+        with self.__shared_lock:
+            if not self.__descriptor_template_driver:
+                self.__descriptor_template_driver = lm_drivers.LmDescriptorTemplatesDriver(self.env.kami_address, client=self.__get_driver_client())
+            return self.__descriptor_template_driver
 
 LmEnvironment = TNCOEnvironment
\ No newline at end of file
@@ -1,6 +1,5 @@
 import os
 import shutil
-import distutils.dir_util
 import string
 import unicodedata
 import logging
@@ -42,7 +41,8 @@ def copy_file(src, dest):
 
 
 def copy_tree(src, dest):
-    distutils.dir_util.copy_tree(src, dest, 0)
+    # distutils.dir_util.copy_tree remembers directories it has created, so fails to copy into one removed since (e.g. on an incremental rebuild)
+    shutil.copytree(src, dest, copy_function=shutil.copyfile, dirs_exist_ok=True)
 
 
 def immediate_sub_directories(parent_directory):
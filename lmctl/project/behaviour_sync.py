@@ -0,0 +1,218 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import lmctl.project.delta as delta
+import lmctl.project.mutate.behaviour as behaviour_mutations
+import lmctl.project.handlers.interface as handlers_api
+
+CREATE = 'create'
+UPDATE = 'update'
+UNCHANGED = 'unchanged'
+
+
+class BehaviourKind:
+    """
+    A type of Service Behaviour content which can be synced: the names used to describe it and the behaviour driver methods to create/update it
+    """
+
+    def __init__(self, label, plural_label, push_state_prefix, create_method, update_method):
+        self.label = label
+        self.plural_label = plural_label
+        self.push_state_prefix = push_state_prefix
+        self.create_method = create_method
+        self.update_method = update_method
+
+ASSEMBLY_CONFIGURATIONS = BehaviourKind('Assembly Configuration', 'Assembly Configurations', 'assembly-configuration', 'create_assembly_configuration', 'update_assembly_configuration')
+SCENARIOS = BehaviourKind('Scenario', 'Scenarios', 'scenario', 'create_scenario', 'update_scenario')
+
+
+def index_by_name(items):
+    """
+    Index a list of Assembly Configurations/Scenarios by name. If a name is used more than once, the first is indexed
+    """
+    indexed = {}
+    for item in items:
+        indexed.setdefault(item['name'], item)
+    return indexed
+
+
+def find_behaviour_files(path):
+    """
+    Read every JSON file below path (if it exists), returning a list of (file_path, content) tuples
+    """
+    found = []
+    if not os.path.exists(path):
+        return found
+    for root, dirs, file_names in os.walk(path):
+        for file_name in file_names:
+            if file_name.endswith('.json'):
+                file_path = os.path.join(root, file_name)
+                try:
+                    with open(file_path, 'rt') as f:
+                        found.append((file_path, json.loads(f.read())))
+                except (IOError, json.JSONDecodeError) as e:
+                    raise handlers_api.ContentHandlerError(str(e)) from e
+    return found
+
+
+class BehaviourSyncItem:
+
+    def __init__(self, file_path, content, action, push_state_key, content_hash):
+        self.file_path = file_path
+        self.content = content
+        self.action = action
+        self.push_state_key = push_state_key
+        self.content_hash = content_hash
+
+    @property
+    def name(self):
+        return self.content['name']
+
+
+class BehaviourSyncPlan:
+    """
+    The action (create, update or unchanged) planned for each local item of one kind of behaviour content
+    """
+
+    def __init__(self, kind, items):
+        self.kind = kind
+        self.items = items
+        self.completed = {CREATE: [], UPDATE: [], UNCHANGED: []}
+
+    @property
+    def created(self):
+        return self.completed[CREATE]
+
+    def summary(self):
+        return '{0}: {1} created, {2} updated, {3} unchanged'.format(self.kind.plural_label, len(self.completed[CREATE]), len(self.completed[UPDATE]), len(self.completed[UNCHANGED]))
+
+
+class BehaviourSync:
+    """
+    Pushes all Assembly Configurations or Scenarios of a Service Behaviour project as one batch.
+
+    Existing content is indexed by name once and a plan is made for every local item before anything is pushed. The creates and updates
+    in the plan are then executed on up to `workers` threads. Journal events are only written from the calling thread, in plan order.
+    """
+
+    def __init__(self, journal, env_sessions, project_id, workers=1):
+        self.journal = journal
+        self.env_sessions = env_sessions
+        self.project_id = project_id
+        self.workers = workers
+
+    def push_project(self, configurations_path, scenario_paths):
+        """
+        Push the Assembly Configurations found at configurations_path, then the Scenarios found at each of scenario_paths as one batch
+        """
+        behaviour_driver = self.env_sessions.lm.behaviour_driver
+        existing_configurations = behaviour_driver.get_assembly_configurations(self.project_id)
+        configurations_plan = self.push_configurations(configurations_path, existing_configurations)
+        existing_scenarios = behaviour_driver.get_scenarios(self.project_id)
+        if len(configurations_plan.created) > 0:
+            # Only new configurations need their IDs retrieving, otherwise the configurations fetched before the push are still accurate
+            available_configurations = behaviour_driver.get_assembly_configurations(self.project_id)
+        else:
+            available_configurations = existing_configurations
+        self.push_scenarios(scenario_paths, existing_scenarios, available_configurations)
+
+    def push_configurations(self, configurations_path, existing_configurations):
+        configurations = find_behaviour_files(configurations_path)
+        for file_path, configuration in configurations:
+            configuration['projectId'] = self.project_id
+        return self.execute(self.plan(ASSEMBLY_CONFIGURATIONS, configurations, existing_configurations))
+
+    def push_scenarios(self, scenario_paths, existing_scenarios, available_configurations):
+        scenario_mutator = behaviour_mutations.ScenarioPushMutator(available_configurations)
+        scenarios = []
+        for scenario_path in scenario_paths:
+            for file_path, scenario in find_behaviour_files(scenario_path):
+                scenario['projectId'] = self.project_id
+                scenarios.append((file_path, scenario_mutator.apply(scenario)))
+        return self.execute(self.plan(SCENARIOS, scenarios, existing_scenarios))
+
+    def plan(self, kind, local_items, existing_items):
+        """
+        Plan the push of local_items, a list of (file_path, content) tuples, against the existing_items in CP4NA orchestration.
+        When more than one local file has the same name, the last one found is pushed
+        """
+        existing_by_name = index_by_name(existing_items)
+        push_tracker = self.env_sessions.push_tracker
+        planned_by_name = {}
+        for file_path, content in local_items:
+            name = content['name']
+            if name in planned_by_name:
+                self.journal.event('{0} {1} at {2} replaces the one found at {3}'.format(kind.label, name, file_path, planned_by_name[name].file_path))
+            push_state_key = '{0}/{1}/{2}'.format(kind.push_state_prefix, self.project_id, name)
+            content_hash = delta.normalised_hash(content)
+            matching = existing_by_name.get(name)
+            if matching is None:
+                action = CREATE
+            elif push_tracker.unchanged_since_last_push(push_state_key, content_hash):
+                action = UNCHANGED
+            else:
+                action = UPDATE
+                content['id'] = matching['id']
+            planned_by_name.pop(name, None)
+            planned_by_name[name] = BehaviourSyncItem(file_path, content, action, push_state_key, content_hash)
+        return BehaviourSyncPlan(kind, list(planned_by_name.values()))
+
+    def execute(self, plan):
+        kind = plan.kind
+        if len(plan.items) == 0:
+            return plan
+        self.journal.event('Found {0} {1} to push to CP4NA orchestration ({2}) project {3}'.format(len(plan.items), kind.plural_label, self.env_sessions.lm.env.address, self.project_id))
+        pending = []
+        for item in plan.items:
+            if item.action == UNCHANGED:
+                self.journal.event('{0} {1} unchanged since last push, skipping update'.format(kind.label, item.name))
+                self.env_sessions.push_tracker.record(delta.SKIPPED)
+                plan.completed[UNCHANGED].append(item.name)
+            elif item.action == UPDATE:
+                self.journal.event('{0} {1} already exists, updating'.format(kind.label, item.name))
+                pending.append(item)
+            else:
+                self.journal.event('Not found, creating {0} {1}'.format(kind.label, item.name))
+                pending.append(item)
+        try:
+            self.__execute_pending(kind, plan, pending)
+        finally:
+            if len(plan.created) > 0 or len(plan.completed[UPDATE]) > 0:
+                self.env_sessions.mark_lm_updated()
+            self.journal.event(plan.summary())
+        return plan
+
+    def __execute_pending(self, kind, plan, pending):
+        if self.workers <= 1 or len(pending) <= 1:
+            for item in pending:
+                self.__push_item(kind, item)
+                self.__complete_item(plan, item)
+            return
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='lmctl-behaviour') as executor:
+            futures = {executor.submit(self.__push_item, kind, item): item for item in pending}
+            error = None
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                if future.exception() is not None:
+                    if error is None:
+                        error = future.exception()
+                        for other in futures:
+                            other.cancel()
+                    continue
+                self.__complete_item(plan, futures[future])
+        if error is not None:
+            raise error
+
+    def __push_item(self, kind, item):
+        behaviour_driver = self.env_sessions.lm.behaviour_driver
+        if item.action == UPDATE:
+            getattr(behaviour_driver, kind.update_method)(item.content)
+        else:
+            getattr(behaviour_driver, kind.create_method)(item.content)
+
+    def __complete_item(self, plan, item):
+        push_tracker = self.env_sessions.push_tracker
+        push_tracker.record(delta.UPDATED if item.action == UPDATE else delta.CREATED)
+        push_tracker.remember(item.push_state_key, item.content_hash)
+        plan.completed[item.action].append(item.name)
@@ -0,0 +1,155 @@
+import os
+import json
+import yaml
+import hashlib
+import zipfile
+import logging
+import threading
+from pathlib import Path
+import lmctl.files as files
+
+logger = logging.getLogger(__name__)
+
+CREATED = 'created'
+UPDATED = 'updated'
+SKIPPED = 'skipped'
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def push_state_directory():
+    return Path.home().joinpath('.lmctl').joinpath('push-state')
+
+
+def normalised_hash(content):
+    """
+    Hash of a dict/list that ignores key order and formatting
+    """
+    normalised = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(normalised.encode('utf-8')).hexdigest()
+
+
+def yaml_str_hash(yaml_str):
+    return normalised_hash(yaml.safe_load(yaml_str))
+
+
+def zip_content_hash(zip_path):
+    """
+    Hash of the names and content of each member of a zip, ignoring metadata (such as timestamps) which changes on every build
+    """
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(zip_path, 'r') as zip_file:
+        for info in sorted(zip_file.infolist(), key=lambda i: i.filename):
+            digest.update(info.filename.encode('utf-8'))
+            digest.update(b'\0')
+            if not info.is_dir():
+                with zip_file.open(info) as member:
+                    for chunk in iter(lambda: member.read(HASH_CHUNK_SIZE), b''):
+                        digest.update(chunk)
+            digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def directory_content_hash(directory):
+    """
+    Hash of the names and content of every file below a directory, independent of the order files are found in and of their metadata.
+    Zips (such as Resource packages) are included by their own content hash (see zip_content_hash), so rebuilding them does not change the result
+    """
+    digest = hashlib.sha256()
+    for root, dirs, file_names in os.walk(directory):
+        dirs.sort()
+        for file_name in sorted(file_names):
+            full_path = os.path.join(root, file_name)
+            digest.update(os.path.relpath(full_path, directory).replace(os.sep, '/').encode('utf-8'))
+            digest.update(b'\0')
+            if file_name.lower().endswith('.zip') and zipfile.is_zipfile(full_path):
+                digest.update(('zip:' + zip_content_hash(full_path)).encode('utf-8'))
+            else:
+                with open(full_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                        digest.update(chunk)
+            digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class PushStateManifest:
+    """
+    Record of the hash of each item of content last pushed to an environment (stored under ~/.lmctl/push-state)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = None
+
+    @staticmethod
+    def for_environment(address):
+        file_name = files.safe_file_name(address) + '.json'
+        return PushStateManifest(str(push_state_directory().joinpath(file_name)))
+
+    def __load(self):
+        if self._state is None:
+            self._state = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r') as f:
+                        self._state = json.load(f)
+                except (IOError, ValueError) as e:
+                    logger.debug('Ignoring unreadable push state at {0}: {1}'.format(self.path, str(e)))
+        return self._state
+
+    def get(self, key):
+        with self._lock:
+            return self.__load().get(key)
+
+    def put(self, key, content_hash):
+        with self._lock:
+            self.__load()[key] = content_hash
+
+    def save(self):
+        with self._lock:
+            if self._state is None:
+                return
+            directory = os.path.dirname(self.path)
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(self.path, 'w') as f:
+                json.dump(self._state, f, indent=2, sort_keys=True)
+
+
+class PushTracker:
+    """
+    Counts the content created, updated or skipped by a push.
+
+    Handlers remember the hash of all content they push in the PushStateManifest, whether in delta mode or not. Only in delta mode do they
+    ask the tracker if content is unchanged from the last push so they can skip it.
+    Safe to share between subpackages pushed in parallel.
+    """
+
+    def __init__(self, delta=False, manifest=None):
+        self.delta = delta
+        self.manifest = manifest
+        self._lock = threading.Lock()
+        self.counts = {CREATED: 0, UPDATED: 0, SKIPPED: 0}
+
+    def record(self, outcome):
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def unchanged_since_last_push(self, key, content_hash):
+        if not self.delta or self.manifest is None:
+            return False
+        return self.manifest.get(key) == content_hash
+
+    def remember(self, key, content_hash):
+        if self.manifest is not None:
+            self.manifest.put(key, content_hash)
+
+    def save(self):
+        if self.manifest is not None:
+            self.manifest.save()
+
+    def summary(self):
+        with self._lock:
+            counts = dict(self.counts)
+        return 'Created: {0}, Updated: {1}, Skipped (unchanged): {2}'.format(counts[CREATED], counts[UPDATED], counts[SKIPPED])
@@ -2,6 +2,7 @@ import os
 import lmctl.files as files
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
+from lmctl.utils.uploads import UploadProgressReporter
 import lmctl.project.validation as validation 
 import lmctl.project.handlers.interface as handlers_api
 
@@ -84,7 +85,7 @@ class AnsibleRmContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegat
     def __clear_existing_descriptor(self, journal, env_sessions):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.gen_root_descriptor_file_path(self.meta.full_name)
-        descriptor = descriptors.DescriptorParser().read_from_file(descriptor_path)
+        descriptor = descriptors.DescriptorParser().read_from_file(descriptor_path, readonly=True)
         descriptor_name = descriptor.get_name()
         descriptor_version = descriptor.get_version()
         journal.event('Removing descriptor {0} from CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
@@ -106,6 +107,6 @@ class AnsibleRmContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegat
         csar_path = self.tree.gen_csar_file_path(self.meta.full_name)
         journal.event('Pushing {0} (version: {1}) CSAR to ansible-rm: {2} ({3})'.format(self.meta.full_name, descriptor_version, arm_session.env.name, arm_session.env.address))
         driver = arm_session.arm_driver
-        driver.onboard_type(self.meta.full_name, descriptor_version, csar_path)
+        driver.onboard_type(self.meta.full_name, descriptor_version, csar_path, progress_callback=UploadProgressReporter(journal.event, 'CSAR {0}'.format(self.meta.full_name)))
         env_sessions.mark_arm_updated()
 
@@ -1,7 +1,7 @@
 import os
-import zipfile
 import yaml
 import lmctl.files as files
+import lmctl.project.package.compression as compression
 import lmctl.project.validation as project_validation
 import lmctl.project.handlers.interface as handlers_api
 from lmctl.project.mutate.base import Mutator
@@ -138,7 +138,7 @@ class AnsibleRmStagedSourceHandlerDelegate(handlers_api.ResourceStagedSourceHand
         relative_csar_path = pkg_tree.gen_csar_file_path(self.source_config.full_name)
         full_csar_path = source_compiler.make_file_path(relative_csar_path)
         journal.event('Creating CSAR for Resource {0}: {1}'.format(self.source_config.name, relative_csar_path))
-        with zipfile.ZipFile(full_csar_path, "w") as csar:
+        with compression.ZipWriter(full_csar_path, source_compiler.compression_options) as csar:
             included_items = [
                 {'path': self.tree.descriptor_path, 'alias': csar_content_tree.descriptor_path, 'required': True},
                 {'path': self.tree.lifecycle_path, 'alias': csar_content_tree.lifecycle_path, 'required': True},
@@ -152,12 +152,8 @@ class AnsibleRmStagedSourceHandlerDelegate(handlers_api.ResourceStagedSourceHand
         path = included_item['path']
         if os.path.exists(path):
             journal.event('Adding directory to CSAR: {0}'.format(os.path.basename(path)))
-            csar.write(path, arcname=included_item['alias'])
-            rootlen = len(path) + 1
-            for root, dirs, files in os.walk(path):
-                for filename in files:
-                    full_path = os.path.join(root, filename)
-                    csar.write(full_path, arcname=os.path.join(included_item['alias'], full_path[rootlen:]))
+            csar.add_directory(path, included_item['alias'])
+            csar.add_tree(path, included_item['alias'], include_directories=False)
         else:
             if included_item['required']:
                 msg = 'Required directory for Resource CSAR not found: {0}'.format(path)
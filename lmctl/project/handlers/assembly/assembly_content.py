@@ -4,8 +4,9 @@ import json
 import lmctl.files as files
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
-import lmctl.project.mutate.behaviour as behaviour_mutations
 import lmctl.project.handlers.interface as handlers_api
+import lmctl.project.delta as delta
+import lmctl.project.behaviour_sync as behaviour_sync_api
 import lmctl.project.testing as project_testing
 from lmctl.project.validation import ValidationResult, ValidationViolation
 
@@ -108,21 +109,28 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
     def __push_descriptor(self, journal, env_sessions):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.descriptor_file_path
-        descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+        descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path, readonly=True)
         descriptor_name = descriptor.get_name()
         descriptor_driver = lm_session.descriptor_driver
         journal.event('Checking for Descriptor {0} in CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
+        push_tracker = env_sessions.push_tracker
         found = True
         try:
-            descriptor_driver.get_descriptor(descriptor_name)
+            remote_descriptor_yml_str = descriptor_driver.get_descriptor(descriptor_name)
         except lm_drivers.NotFoundException:
             found = False
         if found:
+            if push_tracker.delta and delta.yaml_str_hash(remote_descriptor_yml_str) == delta.yaml_str_hash(descriptor_yml_str):
+                journal.event('Descriptor {0} unchanged, skipping update'.format(descriptor_name))
+                push_tracker.record(delta.SKIPPED)
+                return descriptor_name
             journal.event('Descriptor {0} already exists, updating'.format(descriptor_name))
             descriptor_driver.update_descriptor(descriptor_name, descriptor_yml_str)
+            push_tracker.record(delta.UPDATED)
         else:
             journal.event('Not found, creating Descriptor {0}'.format(descriptor_name))
             descriptor_driver.create_descriptor(descriptor_yml_str)
+            push_tracker.record(delta.CREATED)
         env_sessions.mark_lm_updated()
         return descriptor_name
 
@@ -130,90 +138,40 @@ class AssemblyContentHandler(handlers_api.PkgContentHandler):
         lm_session = env_sessions.lm
         descriptor_template_path = self.tree.descriptor_template_file_path
         if os.path.exists(descriptor_template_path):
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_template_path)
+            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_template_path, readonly=True)
             descriptor_name = descriptor.get_name()
             descriptor_template_driver = lm_session.descriptor_template_driver
             journal.event('Checking for Descriptor Template {0} in CP4NA orchestration ({1})'.format(descriptor_name, descriptor_template_driver.lm_base))
+            push_tracker = env_sessions.push_tracker
             found = True
             try:
-                descriptor_template_driver.get_descriptor_template(descriptor_name)
+                remote_descriptor_yml_str = descriptor_template_driver.get_descriptor_template(descriptor_name)
             except lm_drivers.NotFoundException:
                 found = False
             if found:
+                if push_tracker.delta and delta.yaml_str_hash(remote_descriptor_yml_str) == delta.yaml_str_hash(descriptor_yml_str):
+                    journal.event('Descriptor Template {0} unchanged, skipping update'.format(descriptor_name))
+                    push_tracker.record(delta.SKIPPED)
+                    return
                 journal.event('Descriptor Template {0} already exists, updating'.format(descriptor_name))
                 descriptor_template_driver.update_descriptor_template(descriptor_name, descriptor_yml_str)
+                push_tracker.record(delta.UPDATED)
             else:
                 journal.event('Not found, creating Descriptor Template {0}'.format(descriptor_name))
                 descriptor_template_driver.create_descriptor_template(descriptor_yml_str)
+                push_tracker.record(delta.CREATED)
 
     def __push_service_behaviour(self, journal, env_sessions, project_id):
-        lm_session = env_sessions.lm
         behaviour_path = self.tree.service_behaviour_path
         if not os.path.exists(behaviour_path):
             journal.event('Skipping Service Behaviour - nothing to push at {0}'.format(behaviour_path))
             return
         journal.stage('Pushing Service Behaviour for {0} at {1}'.format(self.meta.name, behaviour_path))
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_configurations(journal, env_sessions, project_id, existing_configurations)
-        existing_scenarios = lm_session.behaviour_driver.get_scenarios(project_id)
-        all_available_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_runtime_scenarios(journal, env_sessions, project_id, existing_scenarios, all_available_configurations)
-        self.__push_test_scenarios(journal, env_sessions, project_id, existing_scenarios, all_available_configurations)
-
-    def __push_configurations(self, journal, env_sessions, project_id, existing_configurations):
-        lm_session = env_sessions.lm
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        configurations_path = self.tree.service_behaviour_configurations_path
-        if os.path.exists(configurations_path):
-            walk_and_find_json(configurations_path, 'Assembly Configuration', self.__push_configuration, journal, env_sessions, project_id, existing_configurations)
-
-    def __push_configuration(self, file_path, configuration, journal, env_sessions, project_id, existing_configurations):
-        lm_session = env_sessions.lm
-        configuration['projectId'] = project_id
-        project_descriptor_name = project_id
-        behaviour_driver = lm_session.behaviour_driver
-        journal.event('Checking for assembly configuration {0} in CP4NA orchestration ({1}) project {2}'.format(configuration['name'], lm_session.env.address, project_id))
-        matching_configuration = self.__find_assembly_configuration_by_name(existing_configurations, configuration['name'])
-        if matching_configuration:
-            journal.event('Assembly Configuration {0} already exists, updating'.format(configuration['name']))
-            configuration['id'] = matching_configuration['id']
-            behaviour_driver.update_assembly_configuration(configuration)
-        else:
-            journal.event('Not found, creating assembly configuration {0}'.format(configuration['name']))
-            behaviour_driver.create_assembly_configuration(configuration)
-        env_sessions.mark_lm_updated()
-
-    def __push_runtime_scenarios(self, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        runtimes_path = self.tree.service_behaviour_runtime_path
-        if os.path.exists(runtimes_path):
-            walk_and_find_json(runtimes_path, 'Runtime', self.__push_scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations)
+        behaviour_sync = behaviour_sync_api.BehaviourSync(journal, env_sessions, project_id, workers=env_sessions.behaviour_sync_workers)
+        behaviour_sync.push_project(self.tree.service_behaviour_configurations_path, [self.tree.service_behaviour_runtime_path, self.tree.service_behaviour_tests_path])
 
-    def __push_test_scenarios(self, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        tests_path = self.tree.service_behaviour_tests_path
-        if os.path.exists(tests_path):
-            walk_and_find_json(tests_path, 'Test', self.__push_scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations)
-
-    def __push_scenario(self, file_path, scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        lm_session = env_sessions.lm
-        scenario['projectId'] = project_id
-        behaviour_driver = lm_session.behaviour_driver
-        scenario = behaviour_mutations.ScenarioPushMutator(available_configurations).apply(scenario)
-        journal.event('Checking for Scenario {0} in CP4NA orchestration ({1}) project {2}'.format(scenario['name'], lm_session.env.address, project_id))
-        matching_scenario = next((x for x in existing_scenarios if x["name"] == scenario['name']), None)
-        if matching_scenario:
-            journal.event('Scenario {0} already exists, updating'.format(scenario['name']))
-            scenario['id'] = matching_scenario['id']
-            behaviour_driver.update_scenario(scenario)
-        else:
-            journal.event('Not found, creating Scenario {0}'.format(scenario['name']))
-            behaviour_driver.create_scenario(scenario)
-        env_sessions.mark_lm_updated()
-
-    def __find_assembly_configuration_by_name(self, all_available_configurations, assembly_name):
-        return next((x for x in all_available_configurations if x["name"] == assembly_name), None)
-
-    def execute_tests(self, journal, env_sessions, selected_tests):
-        return AssemblyTestManager(self.root_path, self.meta).execute_tests(journal, env_sessions, selected_tests)
+    def execute_tests(self, journal, env_sessions, selected_tests, parallel=1):
+        return AssemblyTestManager(self.root_path, self.meta).execute_tests(journal, env_sessions, selected_tests, parallel=parallel)
 
 
 def walk_and_find_json(path, type_name, action, *action_args):
@@ -240,7 +198,7 @@ class AssemblyTestManager:
 
     def __determine_project_id(self):
         descriptor_path = self.tree.descriptor_file_path
-        descriptor = descriptors.DescriptorParser().read_from_file(descriptor_path)
+        descriptor = descriptors.DescriptorParser().read_from_file(descriptor_path, readonly=True)
         descriptor_name = descriptor.get_name()
         return descriptor_name
 
@@ -253,16 +211,31 @@ class AssemblyTestManager:
             test_scenarios.extend(test_capture.captives)
         return test_scenarios
 
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, parallel=1):
         test_scenarios = self.__filter_scenarios_to_execute(self.get_tests(), selected_tests)
         if len(test_scenarios) == 0:
             journal.event('No matching tests found to execute at {0}'.format(self.tree.service_behaviour_tests_path))
             return project_testing.TestSuiteExecutionReport([])
-        lm_session = env_sessions.lm
+        behaviour_driver = env_sessions.lm.behaviour_driver
         project_id = self.__determine_project_id()
-        report_entries = []
-        for test_scenario in test_scenarios:
-            report_entries.append(self.__execute_test(journal, lm_session, project_id, test_scenario))
+        report_entries = [None for _ in test_scenarios]
+        waiting = list(enumerate(test_scenarios))
+        running = []
+        # Up to `parallel` tests run at once, all polled together on each cycle
+        while len(waiting) > 0 or len(running) > 0:
+            while len(waiting) > 0 and len(running) < parallel:
+                idx, test_scenario = waiting.pop(0)
+                running.append((idx, self.__start_test(journal, behaviour_driver, project_id, test_scenario)))
+            still_running = []
+            for idx, test_execution in running:
+                exec_report = self.__check_test(journal, behaviour_driver, test_execution)
+                if exec_report is not None:
+                    report_entries[idx] = exec_report
+                else:
+                    still_running.append((idx, test_execution))
+            running = still_running
+            if len(running) > 0:
+                time.sleep(POLLING_PERIOD)
         return project_testing.TestSuiteExecutionReport(report_entries)
 
     def __filter_scenarios_to_execute(self, test_scenarios, selected_test_names):
@@ -272,39 +245,37 @@ class AssemblyTestManager:
                 scenarios_to_execute.append(test_scenario)
         return scenarios_to_execute
 
-    def __execute_test(self, journal, lm_session, project_id, test_scenario):
+    def __start_test(self, journal, behaviour_driver, project_id, test_scenario):
         scenario_name = test_scenario['name']
         journal.event('Executing test: {0}'.format(scenario_name))
-        behaviour_driver = lm_session.behaviour_driver
         remote_scenario = behaviour_driver.get_scenario_by_name(project_id, scenario_name)
         execution_location = behaviour_driver.execute_scenario(remote_scenario['id'])
         location_parts = execution_location.split('/')
         execution_id = location_parts[len(location_parts) - 1]
-        finished = False
-        report_entries = []
-        current_step = 0
-        while not finished:
-            execution = behaviour_driver.get_execution(execution_id)
-            finished = self.__is_exec_finished(execution)
-            if finished:
-                journal.event('Test {0} completed with result: {1}'.format(scenario_name, execution['status']))
-                if execution['status'] == 'FAIL':
-                    journal.error_event('Execution failed with reason: {0}'.format(execution['error']))
-                exec_report = self.__build_execution_report(scenario_name, execution)
-                return exec_report
-            else:
-                stage_results = execution['stageReports']
-                total_steps = self.__calc_total_steps(stage_results)
-                prev_step = current_step
-                current_step = self.__calc_current_step(stage_results)
-                steps_difference = current_step - prev_step
-                if steps_difference > 1:
-                    for i in range(prev_step+1, current_step):
-                        step_str = 'step {0}/{1}'.format(i, total_steps)
-                        journal.event('Test \'{0}\' in progress: {1}'.format(scenario_name, step_str))
-                step_str = 'step {0}/{1}'.format(current_step, total_steps) if current_step > 0 else 'pending...'
+        return TestExecution(scenario_name, execution_id)
+
+    def __check_test(self, journal, behaviour_driver, test_execution):
+        scenario_name = test_execution.scenario_name
+        execution = behaviour_driver.get_execution(test_execution.execution_id)
+        if self.__is_exec_finished(execution):
+            duration = test_execution.elapsed()
+            journal.event('Test {0} completed with result: {1} (took {2:.1f} seconds)'.format(scenario_name, execution['status'], duration))
+            if execution['status'] == 'FAIL':
+                journal.error_event('Execution failed with reason: {0}'.format(execution['error']))
+            return self.__build_execution_report(scenario_name, execution, duration)
+        stage_results = execution['stageReports']
+        total_steps = self.__calc_total_steps(stage_results)
+        prev_step = test_execution.current_step
+        current_step = self.__calc_current_step(stage_results)
+        test_execution.current_step = current_step
+        steps_difference = current_step - prev_step
+        if steps_difference > 1:
+            for i in range(prev_step+1, current_step):
+                step_str = 'step {0}/{1}'.format(i, total_steps)
                 journal.event('Test \'{0}\' in progress: {1}'.format(scenario_name, step_str))
-                time.sleep(POLLING_PERIOD)
+        step_str = 'step {0}/{1}'.format(current_step, total_steps) if current_step > 0 else 'pending...'
+        journal.event('Test \'{0}\' in progress: {1}'.format(scenario_name, step_str))
+        return None
 
     def __calc_current_step(self, stage_results):
         current_step = 0
@@ -330,7 +301,7 @@ class AssemblyTestManager:
             return True
         return False
 
-    def __build_execution_report(self, scenario_name, execution):
+    def __build_execution_report(self, scenario_name, execution, duration=None):
         status = execution['status']
         detail = None
         if status == 'PASS':
@@ -342,10 +313,22 @@ class AssemblyTestManager:
                 detail += ' {0}'.format(execution['error'])
             else:
                 detail += ' no reason given'
-        entry = project_testing.TestExecutionReportEntry(scenario_name, result, detail)
+        entry = project_testing.TestExecutionReportEntry(scenario_name, result, detail, duration=duration)
         return entry
 
 
+class TestExecution:
+
+    def __init__(self, scenario_name, execution_id):
+        self.scenario_name = scenario_name
+        self.execution_id = execution_id
+        self.current_step = 0
+        self.start_time = time.monotonic()
+
+    def elapsed(self):
+        return time.monotonic() - self.start_time
+
+
 class TestCapture:
 
     def __init__(self):
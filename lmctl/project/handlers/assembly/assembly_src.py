@@ -3,7 +3,6 @@ import json
 import lmctl.files as files
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.utils.descriptors as descriptors
-import lmctl.drivers.lm.base as lm_drivers
 import lmctl.project.mutate.behaviour as behaviour_mutations
 import lmctl.project.mutate.descriptor as descriptor_mutations
 from lmctl.project.validation import ValidationResult, ValidationViolation
@@ -276,7 +275,7 @@ class AssemblySourceHandler(handlers_api.SourceHandler):
         descriptor_path = self.tree.descriptor_file_path
         journal.stage('Staging assembly descriptor for {0} at {1}'.format(self.source_config.name, descriptor_path))
         staged_descriptor_path = source_stager.stage_descriptor(descriptor_path, staging_tree.descriptor_file_path)
-        descriptor = descriptors.DescriptorParser().read_from_file(staged_descriptor_path)
+        descriptor = descriptors.DescriptorParser().read_from_file(staged_descriptor_path, readonly=True)
         return descriptor.get_name()
 
     def __stage_descriptor_template(self, journal, source_stager, staging_tree):
@@ -323,24 +322,28 @@ class AssemblySourceHandler(handlers_api.SourceHandler):
         relative_staging_path = os.path.join(staging_tree.service_behaviour_tests_path, os.path.basename(test_path))
         source_stager.stage_file(test_path, relative_staging_path, behaviour_mutations.ScenarioStagingMutator(self.source_config))
 
-    def pull_sources(self, journal, backup_tool, env_sessions, references):
+    def fetch_pull_sources(self, env_sessions):
+        descriptor_name = descriptors.descriptor_named(descriptors.ASSEMBLY_DESCRIPTOR_TYPE, self.source_config.full_name, self.source_config.version)
+        return handlers_api.fetch_descriptor_and_behaviour(env_sessions, descriptor_name)
+
+    def pull_sources(self, journal, backup_tool, env_sessions, references, fetched=None):
         lm_session = env_sessions.lm
+        if fetched is None:
+            fetched = self.fetch_pull_sources(env_sessions)
         backup_tree = AssemblySourceTree()
-        self.__pull_descriptor(journal, backup_tool, backup_tree, lm_session, references)
-        self.__pull_behaviour(journal, backup_tool, backup_tree, lm_session, references)
+        self.__pull_descriptor(journal, backup_tool, backup_tree, lm_session, references, fetched)
+        self.__pull_behaviour(journal, backup_tool, backup_tree, lm_session, references, fetched)
 
-    def __pull_descriptor(self, journal, backup_tool, backup_tree, lm_session, references):
+    def __pull_descriptor(self, journal, backup_tool, backup_tree, lm_session, references, fetched):
         journal.stage('Pulling descriptor for {0}'.format(self.source_config.name))
         descriptor_name = descriptors.descriptor_named(descriptors.ASSEMBLY_DESCRIPTOR_TYPE, self.source_config.full_name, self.source_config.version)
-        descriptor_driver = lm_session.descriptor_driver
         journal.event('Pulling descriptor {0} from CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
-        try:
-            raw_descriptor = descriptor_driver.get_descriptor(descriptor_name)
-            descriptor = descriptors.DescriptorParser().read_from_str(raw_descriptor)
-        except lm_drivers.NotFoundException:
+        raw_descriptor = fetched['descriptor']
+        if raw_descriptor is None:
             msg = 'Descriptor {0} not found'.format(descriptor_name)
             journal.error_event(msg)
             return
+        descriptor = descriptors.DescriptorParser().read_from_str(raw_descriptor)
         descriptor_path = self.tree.descriptor_file_path
         if os.path.exists(descriptor_path):
             self.__backup_descriptor(journal, backup_tool, backup_tree, descriptor_path)
@@ -352,21 +355,16 @@ class AssemblySourceHandler(handlers_api.SourceHandler):
         journal.event('Creating backup of descriptor {0}'.format(descriptor_path))
         backup_tool.backup_file(descriptor_path, backup_tree.descriptor_file_path)
 
-    def __pull_behaviour(self, journal, backup_tool, backup_tree, lm_session, references):
+    def __pull_behaviour(self, journal, backup_tool, backup_tree, lm_session, references, fetched):
         journal.stage('Pulling service behaviour for {0}'.format(self.source_config.name))
         project_id = descriptors.descriptor_named(descriptors.ASSEMBLY_DESCRIPTOR_TYPE, self.source_config.full_name, self.source_config.version)
-        behaviour_driver = lm_session.behaviour_driver
-        try:
-            behaviour_driver.get_project(project_id)
-        except lm_drivers.NotFoundException:
+        if not fetched['behaviour_project_found']:
             journal.event('No Service Behaviour project with name {0} found in CP4NA orchestration {1}, skipping pull'.format(project_id, lm_session.env.address))
             return
-        discovered_configurations_by_id = self.__pull_assembly_configurations(journal, backup_tool, backup_tree, lm_session, project_id, references)
-        self.__pull_scenarios(journal, backup_tool, backup_tree, lm_session, project_id, discovered_configurations_by_id, references)
+        discovered_configurations_by_id = self.__pull_assembly_configurations(journal, backup_tool, backup_tree, fetched['assembly_configurations'], references)
+        self.__pull_scenarios(journal, backup_tool, backup_tree, fetched['scenarios'], discovered_configurations_by_id, references)
 
-    def __pull_assembly_configurations(self, journal, backup_tool, backup_tree, lm_session, behaviour_project_id, references):
-        behaviour_driver = lm_session.behaviour_driver
-        assembly_configurations = behaviour_driver.get_assembly_configurations(behaviour_project_id)
+    def __pull_assembly_configurations(self, journal, backup_tool, backup_tree, assembly_configurations, references):
         journal.event('Found {0} assembly configuration(s) to pull'.format(len(assembly_configurations)))
         discovered_configurations_by_id = {}
         for assembly_configuration in assembly_configurations:
@@ -384,9 +382,7 @@ class AssemblySourceHandler(handlers_api.SourceHandler):
                 json.dump(assembly_configuration, out, indent=2)
         return discovered_configurations_by_id
 
-    def __pull_scenarios(self, journal, backup_tool, backup_tree, lm_session, behaviour_project_id, discovered_configurations_by_id, references):
-        behaviour_driver = lm_session.behaviour_driver
-        scenarios = behaviour_driver.get_scenarios(behaviour_project_id)
+    def __pull_scenarios(self, journal, backup_tool, backup_tree, scenarios, discovered_configurations_by_id, references):
         journal.event('Found {0} scenario(s) to pull'.format(len(scenarios)))
         for scenario in scenarios:
             scenario_name = scenario['name']
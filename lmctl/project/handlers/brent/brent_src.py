@@ -1,11 +1,11 @@
 import os
 import yaml
-import zipfile
 import shutil
 import lmctl.files as files
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.validation as project_validation
 import lmctl.utils.descriptors as descriptor_utils
+import lmctl.project.package.compression as compression
 from .brent_content import BrentResourcePackageContentTree, BrentPkgContentTree
 from .brent_autocorrect import BrentCorrectableValidation
 
@@ -532,7 +532,7 @@ class BrentStagedSourceHandlerDelegate(handlers_api.ResourceStagedSourceHandlerD
         relative_res_pkg_path = pkg_tree.gen_resource_package_file_path(self.source_config.full_name)
         full_res_pkg_path = source_compiler.make_file_path(relative_res_pkg_path)
         journal.event('Creating Resource package for {0}: {1}'.format(self.source_config.name, relative_res_pkg_path))
-        with zipfile.ZipFile(full_res_pkg_path, "w") as res_pkg:
+        with compression.ZipWriter(full_res_pkg_path, source_compiler.compression_options) as res_pkg:
             included_items = [
                 {'path': self.tree.definitions_path, 'alias': res_pkg_content_tree.definitions_path, 'required': True},
                 {'path': self.tree.lifecycle_path, 'alias': res_pkg_content_tree.lifecycle_path, 'required': True}
@@ -544,15 +544,7 @@ class BrentStagedSourceHandlerDelegate(handlers_api.ResourceStagedSourceHandlerD
         path = included_item['path']
         if os.path.exists(path):
             journal.event('Adding directory to Resource package: {0}'.format(os.path.basename(path)))
-            res_pkg.write(path, arcname=included_item['alias'])
-            rootlen = len(path) + 1
-            for root, dirs, files in os.walk(path):
-                for dirname in dirs:
-                    full_path = os.path.join(root, dirname)
-                    res_pkg.write(full_path, arcname=os.path.join(included_item['alias'], full_path[rootlen:]))
-                for filename in files:
-                    full_path = os.path.join(root, filename)
-                    res_pkg.write(full_path, arcname=os.path.join(included_item['alias'], full_path[rootlen:]))
+            res_pkg.add_tree(path, included_item['alias'])
         else:
             if included_item['required']:
                 msg = 'Required directory for Resource package not found: {0}'.format(path)
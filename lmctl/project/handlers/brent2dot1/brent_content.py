@@ -4,6 +4,8 @@ import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.validation as project_validation
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.drivers.lm.base as lm_drivers
+from lmctl.utils.uploads import UploadProgressReporter
+import lmctl.project.delta as delta
 
 class BrentPkgContentTree(files.Tree):
 
@@ -77,21 +79,41 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
     def __clear_existing_descriptor(self, journal, env_sessions):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.root_descriptor_file_path
-        descriptor = descriptor_utils.DescriptorParser().read_from_file(descriptor_path)
+        descriptor = descriptor_utils.DescriptorParser().read_from_file(descriptor_path, readonly=True)
         descriptor_name = descriptor.get_name()
-        descriptor_version = descriptor.get_version()
         journal.event('Removing descriptor {0} from CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
         descriptor_driver = lm_session.descriptor_driver
         try:
             descriptor_driver.delete_descriptor(descriptor_name)
             env_sessions.mark_lm_updated()
+            existed = True
         except lm_drivers.NotFoundException:
             journal.event('Descriptor {0} not found'.format(descriptor_name))
-        return descriptor_name, descriptor_version
+            existed = False
+        return descriptor_name, existed
 
     def push_content(self, journal, env_sessions):
-        descriptor_name, descriptor_version = self.__clear_existing_descriptor(journal, env_sessions)
+        push_tracker = env_sessions.push_tracker
+        res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
+        push_state_key = 'resource-package/{0}'.format(self.meta.full_name)
+        # Hashed on every push, so the recorded state always matches the last package uploaded (even by a push without delta)
+        content_hash = delta.zip_content_hash(res_pkg_path)
+        if push_tracker.unchanged_since_last_push(push_state_key, content_hash) and self.__descriptor_exists(env_sessions):
+            journal.event('Resource package {0} unchanged since last push, skipping'.format(self.meta.full_name))
+            push_tracker.record(delta.SKIPPED)
+            return
+        descriptor_name, descriptor_existed = self.__clear_existing_descriptor(journal, env_sessions)
         self.__push_res_pkg(journal, env_sessions, descriptor_name)
+        push_tracker.record(delta.UPDATED if descriptor_existed else delta.CREATED)
+        push_tracker.remember(push_state_key, content_hash)
+
+    def __descriptor_exists(self, env_sessions):
+        descriptor = descriptor_utils.DescriptorParser().read_from_file(self.tree.root_descriptor_file_path, readonly=True)
+        try:
+            env_sessions.lm.descriptor_driver.get_descriptor(descriptor.get_name())
+            return True
+        except lm_drivers.NotFoundException:
+            return False
 
     def __push_res_pkg(self, journal, env_sessions, descriptor_name):
         lm_session = env_sessions.lm
@@ -103,5 +125,5 @@ class BrentContentHandlerDelegate(handlers_api.ResourceContentHandlerDelegate):
             journal.event('No package named {0} found'.format(descriptor_name))
         res_pkg_path = self.tree.gen_resource_package_file_path(self.meta.full_name)
         journal.event('Pushing {0} (version: {1}) Resource package to Brent: {2} ({3})'.format(self.meta.full_name, self.meta.version, lm_session.env.name, lm_session.env.address))
-        pkg_driver.onboard_package(res_pkg_path)
+        pkg_driver.onboard_package(res_pkg_path, progress_callback=UploadProgressReporter(journal.event, 'Resource package {0}'.format(self.meta.full_name)))
         env_sessions.mark_brent_updated()
@@ -82,7 +82,7 @@ class EtsiNsSourceHandler(assembly_api.AssemblySourceHandler):
         descriptor_path = self.tree.descriptor_file_path
         journal.stage('Staging assembly descriptor for {0} at {1}'.format(self.source_config.name, descriptor_path))
         staged_descriptor_path = source_stager.stage_descriptor(descriptor_path, staging_tree.descriptor_definitions_file_path)
-        descriptor = descriptors.DescriptorParser().read_from_file(staged_descriptor_path)
+        descriptor = descriptors.DescriptorParser().read_from_file(staged_descriptor_path, readonly=True)
         return descriptor.get_name()
 
     def __stage_etsi_files(self, journal, source_stager, staging_tree):
@@ -1,6 +1,7 @@
 import os
 import zipfile
 import shutil
+import lmctl.project.package.compression as compression
 import lmctl.project.handlers.resource as resource_api
 import lmctl.project.handlers.brent as brent_api
 import lmctl.project.validation as project_validation
@@ -81,7 +82,7 @@ class EtsiVnfContentHandler(resource_api.ResourceContentHandler):
                 BrentCorrectableValidation().validate_and_autocorrect(journal, validation_options, errors, warnings, tree.descriptor_file_path, \
                 tree.infrastructure_definitions_path, tree.infrastructure_manifest_file_path, tree.lifecycle_path, \
                     tree.lifecycle_manifest_file_path)
-                with zipfile.ZipFile(res_pkg_path, "w") as res_pkg:
+                with compression.ZipWriter(res_pkg_path) as res_pkg:
                     res_pkg_content_tree = BrentResourcePackageContentTree()
                     included_items = [
                         {'path': tree.definitions_path, 'alias': res_pkg_content_tree.definitions_path},
@@ -95,15 +96,7 @@ class EtsiVnfContentHandler(resource_api.ResourceContentHandler):
 
     def __add_directory(self, journal, res_pkg, included_item):
         path = included_item['path']
-        res_pkg.write(path, arcname=included_item['alias'])
-        rootlen = len(path) + 1
-        for root, dirs, files in os.walk(path):
-            for dirname in dirs:
-                full_path = os.path.join(root, dirname)
-                res_pkg.write(full_path, arcname=os.path.join(included_item['alias'], full_path[rootlen:]))
-            for filename in files:
-                full_path = os.path.join(root, filename)
-                res_pkg.write(full_path, arcname=os.path.join(included_item['alias'], full_path[rootlen:]))
+        res_pkg.add_tree(path, included_item['alias'])
 
     def push_content(self, journal, env_sessions):
         raise NotImplementedError('This method (push_content) is not implemented')
@@ -1,8 +1,8 @@
 import os
-import zipfile
 import lmctl.project.handlers.resource as resource_api
 import lmctl.project.handlers.brent as brent_api
 import lmctl.project.handlers.interface as handlers_api
+import lmctl.project.package.compression as compression
 from lmctl.project.handlers.brent.brent_content import BrentResourcePackageContentTree, BrentPkgContentTree
 from .etsi_vnf_content import EtsiVnfPkgContentTree
 
@@ -54,7 +54,7 @@ class EtsiVnfSourceHandler(brent_api.BrentSourceHandlerDelegate):
     def build_staged_source_handler(self, staging_path):
         return EtsiVnfStagedSourceHandler(staging_path, self.source_config)
 
-    def pull_sources(self, journal, backup_tool, env_sessions, references):
+    def pull_sources(self, journal, backup_tool, env_sessions, references, fetched=None):
         journal.event('Nothing to pull')
         return
 
@@ -93,7 +93,7 @@ class EtsiVnfStagedSourceHandler(brent_api.BrentStagedSourceHandlerDelegate):
         relative_res_pkg_path = pkg_tree.gen_resource_package_file_path(self.source_config.full_name)
         full_res_pkg_path = source_compiler.make_file_path(relative_res_pkg_path)
         journal.event('Creating Resource package for {0}: {1}'.format(self.source_config.name, relative_res_pkg_path))
-        with zipfile.ZipFile(full_res_pkg_path, "w") as res_pkg:
+        with compression.ZipWriter(full_res_pkg_path, source_compiler.compression_options) as res_pkg:
             included_items = [
                 {'path': self.tree.definitions_path, 'alias': res_pkg_content_tree.definitions_path, 'required': True},
                 {'path': self.tree.lifecycle_path, 'alias': res_pkg_content_tree.lifecycle_path, 'required': True}
@@ -105,15 +105,7 @@ class EtsiVnfStagedSourceHandler(brent_api.BrentStagedSourceHandlerDelegate):
         path = included_item['path']
         if os.path.exists(path):
             journal.event('Adding directory to Resource package: {0}'.format(os.path.basename(path)))
-            res_pkg.write(path, arcname=included_item['alias'])
-            rootlen = len(path) + 1
-            for root, dirs, files in os.walk(path):
-                for dirname in dirs:
-                    full_path = os.path.join(root, dirname)
-                    res_pkg.write(full_path, arcname=os.path.join(included_item['alias'], full_path[rootlen:]))
-                for filename in files:
-                    full_path = os.path.join(root, filename)
-                    res_pkg.write(full_path, arcname=os.path.join(included_item['alias'], full_path[rootlen:]))
+            res_pkg.add_tree(path, included_item['alias'])
         else:
             if included_item['required']:
                 msg = 'Required directory for Resource package not found: {0}'.format(path)
@@ -3,6 +3,7 @@ import os
 import shutil
 from lmctl.project.source.config import RootProjectConfig
 import lmctl.project.types as project_types
+import lmctl.drivers.lm.base as lm_drivers
 from datetime import datetime, timezone
 
 PACKAGING_PARAM = 'packaging'
@@ -314,14 +315,47 @@ class SourceHandler(abc.ABC):
     def build_staged_source_handler(self, staging_path):
         pass
 
+    def fetch_pull_sources(self, env_sessions):
+        """
+        Fetch the remote content to be pulled into this project, without writing anything locally, so it may be called concurrently
+        for each project in a tree. The result is passed to pull_sources as "fetched"
+        """
+        return None
+
     @abc.abstractmethod
-    def pull_sources(self, journal, backup_tool, env_sessions, references):
+    def pull_sources(self, journal, backup_tool, env_sessions, references, fetched=None):
         pass
 
     @abc.abstractmethod
     def list_elements(self, journal, element_type):
         pass
 
+def fetch_descriptor_and_behaviour(env_sessions, descriptor_name):
+    """
+    Fetch a descriptor and the Assembly Configurations and Scenarios of its Service Behaviour project, for the fetch_pull_sources
+    of a SourceHandler. Returns a dict with the descriptor (None if not found), whether the behaviour project was found and its content
+    """
+    lm_session = env_sessions.lm
+    fetched = {
+        'descriptor': None,
+        'behaviour_project_found': False,
+        'assembly_configurations': [],
+        'scenarios': []
+    }
+    try:
+        fetched['descriptor'] = lm_session.descriptor_driver.get_descriptor(descriptor_name)
+    except lm_drivers.NotFoundException:
+        pass
+    behaviour_driver = lm_session.behaviour_driver
+    try:
+        behaviour_driver.get_project(descriptor_name)
+    except lm_drivers.NotFoundException:
+        return fetched
+    fetched['behaviour_project_found'] = True
+    fetched['assembly_configurations'] = behaviour_driver.get_assembly_configurations(descriptor_name)
+    fetched['scenarios'] = behaviour_driver.get_scenarios(descriptor_name)
+    return fetched
+
 ELEMENT_TYPE_TESTS = 'tests'
 
 class StagedSourceHandler(abc.ABC):
@@ -409,7 +443,7 @@ class PkgContentHandler(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, parallel=1):
         pass
 
 
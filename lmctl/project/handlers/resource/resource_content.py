@@ -37,6 +37,6 @@ class ResourceContentHandler(handlers_api.PkgContentHandler):
     def push_content(self, journal, env_sessions):
         self.delegate.push_content(journal, env_sessions)
 
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, parallel=1):
         journal.event('No tests to execute')
         return project_testing.TestSuiteExecutionReport([])
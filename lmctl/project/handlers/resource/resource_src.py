@@ -73,7 +73,7 @@ class ResourceSourceHandler(handlers_api.SourceHandler):
     def build_staged_source_handler(self, staging_path):
         return ResourceStagedSourceHandler(staging_path, self.source_config, self.delegate.build_staged_source_delegate(staging_path))
 
-    def pull_sources(self, journal, backup_tool, env_sessions, references):
+    def pull_sources(self, journal, backup_tool, env_sessions, references, fetched=None):
         journal.event('Nothing to pull')
         return
 
@@ -4,8 +4,9 @@ import json
 import lmctl.files as files
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
-import lmctl.project.mutate.behaviour as behaviour_mutations
 import lmctl.project.handlers.interface as handlers_api
+import lmctl.project.delta as delta
+import lmctl.project.behaviour_sync as behaviour_sync_api
 import lmctl.project.testing as project_testing
 from lmctl.project.validation import ValidationResult, ValidationViolation
 
@@ -91,85 +92,41 @@ class TypeContentHandler(handlers_api.PkgContentHandler):
     def __push_descriptor(self, journal, env_sessions):
         lm_session = env_sessions.lm
         descriptor_path = self.tree.descriptor_file_path
-        descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+        descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path, readonly=True)
         descriptor_name = descriptor.get_name()
         descriptor_driver = lm_session.descriptor_driver
         journal.event('Checking for Descriptor {0} in CP4NA orchestration ({1})'.format(descriptor_name, lm_session.env.address))
+        push_tracker = env_sessions.push_tracker
         found = True
         try:
-            descriptor_driver.get_descriptor(descriptor_name)
+            remote_descriptor_yml_str = descriptor_driver.get_descriptor(descriptor_name)
         except lm_drivers.NotFoundException:
             found = False
         if found:
+            if push_tracker.delta and delta.yaml_str_hash(remote_descriptor_yml_str) == delta.yaml_str_hash(descriptor_yml_str):
+                journal.event('Descriptor {0} unchanged, skipping update'.format(descriptor_name))
+                push_tracker.record(delta.SKIPPED)
+                return descriptor_name
             journal.event('Descriptor {0} already exists, updating'.format(descriptor_name))
             descriptor_driver.update_descriptor(descriptor_name, descriptor_yml_str)
+            push_tracker.record(delta.UPDATED)
         else:
             journal.event('Not found, creating Descriptor {0}'.format(descriptor_name))
             descriptor_driver.create_descriptor(descriptor_yml_str)
+            push_tracker.record(delta.CREATED)
         env_sessions.mark_lm_updated()
         return descriptor_name
 
     def __push_service_behaviour(self, journal, env_sessions, project_id):
-        lm_session = env_sessions.lm
         behaviour_path = self.tree.service_behaviour_path
         if not os.path.exists(behaviour_path):
             journal.event('Skipping Service Behaviour - nothing to push at {0}'.format(behaviour_path))
             return
         journal.stage('Pushing Service Behaviour for {0} at {1}'.format(self.meta.name, behaviour_path))
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_configurations(journal, env_sessions, project_id, existing_configurations)
-        existing_scenarios = lm_session.behaviour_driver.get_scenarios(project_id)
-        all_available_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        self.__push_test_scenarios(journal, env_sessions, project_id, existing_scenarios, all_available_configurations)
-
-    def __push_configurations(self, journal, env_sessions, project_id, existing_configurations):
-        lm_session = env_sessions.lm
-        existing_configurations = lm_session.behaviour_driver.get_assembly_configurations(project_id)
-        configurations_path = self.tree.service_behaviour_configurations_path
-        if os.path.exists(configurations_path):
-            walk_and_find_json(configurations_path, 'Assembly Configuration', self.__push_configuration, journal, env_sessions, project_id, existing_configurations)
-
-    def __push_configuration(self, file_path, configuration, journal, env_sessions, project_id, existing_configurations):
-        lm_session = env_sessions.lm
-        configuration['projectId'] = project_id
-        project_descriptor_name = project_id
-        behaviour_driver = lm_session.behaviour_driver
-        journal.event('Checking for assembly configuration {0} in CP4NA orchestration ({1}) project {2}'.format(configuration['name'], lm_session.env.address, project_id))
-        matching_configuration = self.__find_assembly_configuration_by_name(existing_configurations, configuration['name'])
-        if matching_configuration:
-            journal.event('Assembly Configuration {0} already exists, updating'.format(configuration['name']))
-            configuration['id'] = matching_configuration['id']
-            behaviour_driver.update_assembly_configuration(configuration)
-        else:
-            journal.event('Not found, creating assembly configuration {0}'.format(configuration['name']))
-            behaviour_driver.create_assembly_configuration(configuration)
-        env_sessions.mark_lm_updated()
-
-    def __push_test_scenarios(self, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        tests_path = self.tree.service_behaviour_tests_path
-        if os.path.exists(tests_path):
-            walk_and_find_json(tests_path, 'Test', self.__push_scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations)
-
-    def __push_scenario(self, file_path, scenario, journal, env_sessions, project_id, existing_scenarios, available_configurations):
-        lm_session = env_sessions.lm
-        scenario['projectId'] = project_id
-        behaviour_driver = lm_session.behaviour_driver
-        scenario = behaviour_mutations.ScenarioPushMutator(available_configurations).apply(scenario)
-        journal.event('Checking for Scenario {0} in CP4NA orchestration ({1}) project {2}'.format(scenario['name'], lm_session.env.address, project_id))
-        matching_scenario = next((x for x in existing_scenarios if x["name"] == scenario['name']), None)
-        if matching_scenario:
-            journal.event('Scenario {0} already exists, updating'.format(scenario['name']))
-            scenario['id'] = matching_scenario['id']
-            behaviour_driver.update_scenario(scenario)
-        else:
-            journal.event('Not found, creating Scenario {0}'.format(scenario['name']))
-            behaviour_driver.create_scenario(scenario)
-        env_sessions.mark_lm_updated()
-
-    def __find_assembly_configuration_by_name(self, all_available_configurations, assembly_name):
-        return next((x for x in all_available_configurations if x["name"] == assembly_name), None)
+        behaviour_sync = behaviour_sync_api.BehaviourSync(journal, env_sessions, project_id, workers=env_sessions.behaviour_sync_workers)
+        behaviour_sync.push_project(self.tree.service_behaviour_configurations_path, [self.tree.service_behaviour_tests_path])
 
-    def execute_tests(self, journal, env_sessions, selected_tests):
+    def execute_tests(self, journal, env_sessions, selected_tests, parallel=1):
         journal.event('No tests to execute')
         return project_testing.TestSuiteExecutionReport([])
 
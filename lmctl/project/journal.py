@@ -1,4 +1,44 @@
 import lmctl.journal as journal
+from lmctl.utils.profiling import profiler
+
+
+class _SectionSpans:
+    """
+    Profiling spans for the sections and stages of a journal. A section (or stage) lasts until the next one starts at the same
+    subproject level, or the subproject ends
+    """
+
+    def __init__(self):
+        self.levels = [[None, None]]
+        self.subprojects = []
+
+    def subproject(self, name):
+        self.subprojects.append(name)
+        self.levels.append([None, None])
+
+    def subproject_end(self):
+        self.__finish(section=True)
+        if len(self.levels) > 1:
+            self.levels.pop()
+            self.subprojects.pop()
+
+    def section(self, title):
+        self.__finish(section=True)
+        self.levels[-1][0] = profiler.span(title, 'project', subproject='/'.join(self.subprojects))
+
+    def stage(self, title):
+        self.__finish(section=False)
+        self.levels[-1][1] = profiler.span(title, 'project-stage', subproject='/'.join(self.subprojects))
+
+    def __finish(self, section):
+        level = self.levels[-1]
+        spans = level if section else level[1:]
+        for span in spans:
+            if span is not None:
+                span.finish()
+        level[1] = None
+        if section:
+            level[0] = None
 
 
 class ProjectJournal:
@@ -8,24 +48,50 @@ class ProjectJournal:
         if journal_consumer is not None:
             self.journal.register_consumer(journal_consumer)
         self.journal.open_chapter('Start')
+        self._spans = _SectionSpans()
 
     def subproject(self, sub_project_name):
-        self.journal.add_entry(SubprojectEvent(sub_project_name))
+        self._spans.subproject(sub_project_name)
+        self._add_entry(SubprojectEvent(sub_project_name))
 
     def subproject_end(self, sub_project_name):
-        self.journal.add_entry(SubprojectEndEvent(sub_project_name))
+        self._spans.subproject_end()
+        self._add_entry(SubprojectEndEvent(sub_project_name))
 
     def section(self, title):
-        self.journal.add_entry(SectionEvent(title))
+        self._spans.section(title)
+        self._add_entry(SectionEvent(title))
 
     def stage(self, title):
-        self.journal.add_entry(StageEvent(title))
+        self._spans.stage(title)
+        self._add_entry(StageEvent(title))
 
     def event(self, message):
-        self.journal.add_entry(Event(message))
+        self._add_entry(Event(message))
 
     def error_event(self, message):
-        self.journal.add_entry(Event(message, journal.EntryType.ERROR))
+        self._add_entry(Event(message, journal.EntryType.ERROR))
+
+    def add_entries(self, entries):
+        for entry in entries:
+            self._add_entry(entry)
+
+    def _add_entry(self, entry):
+        self.journal.add_entry(entry)
+
+
+class BufferedProjectJournal(ProjectJournal):
+    """
+    Holds entries instead of handing them to consumers, so work running in another thread can have its entries
+    added to the main ProjectJournal as one group once it completes (with `add_entries`)
+    """
+
+    def __init__(self):
+        self.entries = []
+        self._spans = _SectionSpans()
+
+    def _add_entry(self, entry):
+        self.entries.append(entry)
 
 
 class ProjectEvent(journal.Entry):
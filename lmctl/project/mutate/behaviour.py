@@ -93,6 +93,10 @@ class ScenarioPushMutator(BehaviourMutator):
 
     def __init__(self, available_configurations):
         self.available_configurations = available_configurations
+        # Indexed once, rather than searched for every actor of every scenario
+        self.available_configurations_by_name = {}
+        for configuration in available_configurations:
+            self.available_configurations_by_name.setdefault(configuration['name'], configuration)
 
     def apply(self, original_scenario):
         return self.__replace_actor_refs_with_ids(original_scenario)
@@ -123,7 +127,7 @@ class ScenarioPushMutator(BehaviourMutator):
         return scenario
 
     def __find_assembly_configuration_by_name(self, assembly_name):
-        return next((x for x in self.available_configurations if x["name"] == assembly_name), None)
+        return self.available_configurations_by_name.get(assembly_name)
 
 
 class ScenarioPullMutator(BehaviourMutator):
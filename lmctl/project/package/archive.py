@@ -0,0 +1,93 @@
+import tarfile
+import zipfile
+
+
+class PkgArchiveError(Exception):
+    pass
+
+
+class MemberNotFoundError(PkgArchiveError):
+    pass
+
+
+def _normalise_name(name):
+    name = name.replace('\\', '/')
+    while name.startswith('./'):
+        name = name[2:]
+    return name.rstrip('/')
+
+
+class PkgArchive:
+    """
+    Read access to the members of a package file (.tgz or .csar) without extracting the whole file first.
+
+    CSAR (zip) members are read directly using the archive's central directory. A tgz has no index, so members
+    are found by streaming through the compressed file, stopping as soon as the requested member is found.
+    Member names seen are cached so later lookups do not need to decompress the file again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._is_tar = None
+        self._member_names = None
+
+    def is_tar(self):
+        if self._is_tar is None:
+            if tarfile.is_tarfile(self.path):
+                self._is_tar = True
+            elif zipfile.is_zipfile(self.path):
+                self._is_tar = False
+            else:
+                raise PkgArchiveError('Could not determine if pkg {0} was a tgz or csar'.format(self.path))
+        return self._is_tar
+
+    def member_names(self):
+        if self._member_names is None:
+            if self.is_tar():
+                with tarfile.open(self.path, mode='r|gz') as pkg_tar:
+                    self._member_names = [_normalise_name(member.name) for member in pkg_tar if member.isfile()]
+            else:
+                with zipfile.ZipFile(self.path, mode='r') as pkg_zip:
+                    self._member_names = [_normalise_name(info.filename) for info in pkg_zip.infolist() if not info.is_dir()]
+        return self._member_names
+
+    def read_member(self, name):
+        """
+        Returns the bytes of a single member of the archive
+
+        Raises:
+            MemberNotFoundError: if there is no file member with this name
+        """
+        name = _normalise_name(name)
+        if self._member_names is not None and name not in self._member_names:
+            raise MemberNotFoundError('Could not find {0} in pkg {1}'.format(name, self.path))
+        if self.is_tar():
+            seen_names = []
+            with tarfile.open(self.path, mode='r|gz') as pkg_tar:
+                for member in pkg_tar:
+                    if member.isfile():
+                        member_name = _normalise_name(member.name)
+                        if member_name == name:
+                            return pkg_tar.extractfile(member).read()
+                        seen_names.append(member_name)
+            # Scanned the whole file, so the index is now known
+            self._member_names = seen_names
+        else:
+            with zipfile.ZipFile(self.path, mode='r') as pkg_zip:
+                try:
+                    return pkg_zip.read(name)
+                except KeyError:
+                    pass
+        raise MemberNotFoundError('Could not find {0} in pkg {1}'.format(name, self.path))
+
+    def extract(self, target_directory):
+        """
+        Stream the members of the archive to disk in a single pass
+        """
+        if self.is_tar():
+            with tarfile.open(self.path, mode='r|gz') as pkg_tar:
+                for member in pkg_tar:
+                    pkg_tar.extract(member, target_directory)
+        else:
+            with zipfile.ZipFile(self.path, mode='r') as pkg_zip:
+                pkg_zip.extractall(target_directory)
@@ -0,0 +1,436 @@
+import abc
+import os
+import stat
+import time
+import zlib
+import struct
+import tarfile
+import collections
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from lmctl.utils.profiling import profiler
+
+# zlib's own default level, much faster than the maximum (9) for little difference in size
+DEFAULT_COMPRESSION_LEVEL = 6
+STORE_ONLY_LEVEL = 0
+# Files which are already compressed, or are disk images (which rarely compress well), are always stored as they are
+STORE_ONLY_EXTENSIONS = ('.qcow2', '.img', '.iso', '.vmdk', '.vhd', '.vhdx', '.zip', '.csar', '.jar', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rpm', '.deb', '.png', '.jpg', '.jpeg')
+# Files are compressed in chunks of this size, so a single large file is also spread across workers
+CHUNK_SIZE = 1024 * 1024
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP64_LIMIT = (1 << 31) - 1
+ZIP_MAX_ENTRIES = (1 << 16) - 1
+ZIP_DEFAULT_VERSION = 20
+ZIP64_VERSION = 45
+ZIP_CREATE_SYSTEM_UNIX = 3
+ZIP_UTF8_FLAG = 0x800
+
+# An empty final deflate block, ending a stream made up of chunks compressed with `_deflate`
+_DEFLATE_END = b'\x03\x00'
+# gzip header with no file name and a zero modification time, so the same content always produces the same header
+_GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+# Modification time given to every member of a reproducible archive: 1980-01-01T00:00:00Z, the earliest time a zip can hold
+REPRODUCIBLE_MTIME = 315532800
+REPRODUCIBLE_DOS_DATE = (1 << 5) | 1
+REPRODUCIBLE_DOS_TIME = 0
+
+
+class CompressionError(Exception):
+    pass
+
+
+class CompressionOptions:
+
+    def __init__(self, level=DEFAULT_COMPRESSION_LEVEL, workers=None, store_only_extensions=STORE_ONLY_EXTENSIONS, reproducible=False):
+        if level < STORE_ONLY_LEVEL or level > 9:
+            raise ValueError('Compression level must be between 0 (store only) and 9, not {0}'.format(level))
+        self.level = level
+        self.workers = workers or os.cpu_count() or 1
+        self.store_only_extensions = tuple(ext.lower() for ext in store_only_extensions)
+        # Give every member the same timestamp, owner and permissions (see normalised_mode), so the same content always produces the same archive
+        self.reproducible = reproducible
+
+    def level_for(self, path):
+        if path.lower().endswith(self.store_only_extensions):
+            return STORE_ONLY_LEVEL
+        return self.level
+
+
+def normalised_mode(mode, is_dir=False):
+    """
+    Permissions used for a member of a reproducible archive: 755 for directories and executable files, otherwise 644
+    """
+    if is_dir or mode & 0o111:
+        return 0o755
+    return 0o644
+
+
+def _deflate(data, level):
+    # Raw deflate ending with a sync flush (rather than a final block), so the output for each chunk can be joined to the next
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class _OrderedCompressor:
+    """
+    Runs compression of chunks on a pool of worker threads (zlib releases the GIL whilst compressing), handing each result to its callback
+    in the order submitted. Plain actions can be queued between chunks and are also run in order.
+
+    Only a limited number of chunks may be in progress at once, so memory use does not depend on the size of the content.
+    """
+
+    def __init__(self, workers):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lmctl-compress')
+        self.max_pending = workers * 2
+        self.pending = collections.deque()
+
+    def submit(self, data, level, callback):
+        self.__append(self.executor.submit(_deflate, data, level), callback)
+
+    def add_action(self, action):
+        self.__append(None, action)
+
+    def __append(self, future, callback):
+        self.pending.append((future, callback))
+        while len(self.pending) > self.max_pending:
+            self.__complete_next()
+
+    def __complete_next(self):
+        future, callback = self.pending.popleft()
+        if future is None:
+            callback()
+        else:
+            callback(future.result())
+
+    def drain(self):
+        while len(self.pending) > 0:
+            self.__complete_next()
+
+    def shutdown(self, cancel=False):
+        if cancel:
+            for future, _ in self.pending:
+                if future is not None:
+                    future.cancel()
+            self.pending.clear()
+        self.executor.shutdown(wait=True)
+
+
+class ParallelGzipFile:
+    """
+    Write-only file object which gzips the data written to it, compressing it in chunks spread across worker threads.
+    The compression level may be changed part way through (with `set_level`), so already compressed content can be stored as it is.
+    """
+
+    def __init__(self, fileobj, options):
+        self.fileobj = fileobj
+        self.level = options.level
+        self._compressor = _OrderedCompressor(options.workers)
+        self._buffer = bytearray()
+        self._crc = 0
+        self._size = 0
+        self.fileobj.write(_GZIP_HEADER)
+
+    def tell(self):
+        return self._size + len(self._buffer)
+
+    def write(self, data):
+        self._buffer += data
+        while len(self._buffer) >= CHUNK_SIZE:
+            self.__submit(bytes(self._buffer[:CHUNK_SIZE]))
+            del self._buffer[:CHUNK_SIZE]
+        return len(data)
+
+    def set_level(self, level):
+        if level != self.level:
+            self.__submit_buffer()
+            self.level = level
+
+    def __submit_buffer(self):
+        if len(self._buffer) > 0:
+            self.__submit(bytes(self._buffer))
+            self._buffer = bytearray()
+
+    def __submit(self, chunk):
+        self._crc = zlib.crc32(chunk, self._crc)
+        self._size += len(chunk)
+        self._compressor.submit(chunk, self.level, self.fileobj.write)
+
+    def close(self):
+        try:
+            self.__submit_buffer()
+            self._compressor.drain()
+            self.fileobj.write(_DEFLATE_END)
+            self.fileobj.write(struct.pack('<LL', self._crc & 0xFFFFFFFF, self._size & 0xFFFFFFFF))
+        finally:
+            self._compressor.shutdown()
+
+    def abort(self):
+        self._compressor.shutdown(cancel=True)
+
+
+class ArchiveWriter(abc.ABC):
+
+    def _start_span(self, path, archive_format):
+        self._span = profiler.span('{0} {1}'.format(archive_format, os.path.basename(path)), 'archive', path=path, level=self.options.level, workers=self.options.workers)
+
+    def _finish_span(self, path):
+        if self._span.active and os.path.exists(path):
+            self._span.set(bytes=os.path.getsize(path))
+        self._span.finish()
+
+    @abc.abstractmethod
+    def add_file(self, path, arcname):
+        pass
+
+    @abc.abstractmethod
+    def add_directory(self, path, arcname):
+        pass
+
+    def add_tree(self, path, arcname, include_directories=True):
+        """
+        Add a directory and everything below it. Entries are added in name order, so the same content always produces the same archive layout
+        """
+        if include_directories:
+            self.add_directory(path, arcname)
+        rootlen = len(path) + 1
+        for root, dirs, file_names in os.walk(path):
+            dirs.sort()
+            if include_directories:
+                for dir_name in dirs:
+                    full_path = os.path.join(root, dir_name)
+                    self.add_directory(full_path, os.path.join(arcname, full_path[rootlen:]))
+            for file_name in sorted(file_names):
+                full_path = os.path.join(root, file_name)
+                self.add_file(full_path, os.path.join(arcname, full_path[rootlen:]))
+
+    @abc.abstractmethod
+    def close(self):
+        pass
+
+    @abc.abstractmethod
+    def abort(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class TgzWriter(ArchiveWriter):
+    """
+    Writes a tgz, gzipping the tar stream in parallel (see ParallelGzipFile). The output is a standard gzip stream so can be read by any tool
+    """
+
+    def __init__(self, path, options=None):
+        self.options = options or CompressionOptions()
+        self.path = path
+        self._start_span(path, 'tgz')
+        self._file = open(path, 'wb')
+        try:
+            self._gzip = ParallelGzipFile(self._file, self.options)
+            self._tar = tarfile.open(fileobj=self._gzip, mode='w')
+        except Exception:
+            self._file.close()
+            self._finish_span(path)
+            raise
+
+    def add_file(self, path, arcname):
+        self._gzip.set_level(self.options.level_for(path))
+        self._tar.add(path, arcname=arcname, recursive=False, filter=self.__filter)
+
+    def add_directory(self, path, arcname):
+        self._tar.add(path, arcname=arcname, recursive=False, filter=self.__filter)
+
+    def __filter(self, tarinfo):
+        if self.options.reproducible:
+            tarinfo.mtime = REPRODUCIBLE_MTIME
+            tarinfo.uid = tarinfo.gid = 0
+            tarinfo.uname = tarinfo.gname = ''
+            tarinfo.mode = normalised_mode(tarinfo.mode, is_dir=tarinfo.isdir())
+        return tarinfo
+
+    def close(self):
+        try:
+            self._tar.close()
+            self._gzip.close()
+        finally:
+            self._file.close()
+            self._finish_span(self.path)
+
+    def abort(self):
+        try:
+            self._gzip.abort()
+        finally:
+            self._file.close()
+            self._finish_span(self.path)
+
+
+class _ZipEntry:
+
+    def __init__(self, arcname, stat_result, compress_type, zip64=False, is_dir=False, reproducible=False):
+        self.arcname = arcname.replace(os.sep, '/')
+        self.compress_type = compress_type
+        self.zip64 = zip64
+        self.crc = 0
+        self.file_size = 0
+        self.compress_size = 0
+        self.header_offset = 0
+        if reproducible:
+            file_type = stat.S_IFDIR if is_dir else stat.S_IFREG
+            self.external_attr = (file_type | normalised_mode(stat_result.st_mode, is_dir=is_dir)) << 16
+            self.dos_date, self.dos_time = REPRODUCIBLE_DOS_DATE, REPRODUCIBLE_DOS_TIME
+        else:
+            self.external_attr = (stat_result.st_mode & 0xFFFF) << 16
+            self.dos_date, self.dos_time = self.__dos_timestamp(stat_result.st_mtime)
+        if is_dir:
+            self.external_attr |= 0x10
+
+    def __dos_timestamp(self, mtime):
+        date_time = time.localtime(mtime)
+        if date_time.tm_year < 1980:
+            date_time = time.localtime(time.mktime((1980, 1, 1, 0, 0, 0, 0, 0, -1)))
+        dos_date = (date_time.tm_year - 1980) << 9 | date_time.tm_mon << 5 | date_time.tm_mday
+        dos_time = date_time.tm_hour << 11 | date_time.tm_min << 5 | (date_time.tm_sec // 2)
+        return dos_date, dos_time
+
+    @property
+    def encoded_name(self):
+        try:
+            return self.arcname.encode('ascii'), 0
+        except UnicodeEncodeError:
+            return self.arcname.encode('utf-8'), ZIP_UTF8_FLAG
+
+
+class ZipWriter(ArchiveWriter):
+    """
+    Writes a zip, deflating the members in chunks spread across worker threads. Members are written in the order they are added.
+
+    Members stored without compression (level 0 or a store only extension, see CompressionOptions) are written as they are.
+    Zip64 extensions are used for members and archives too large for the original zip format.
+    """
+
+    def __init__(self, path, options=None):
+        self.options = options or CompressionOptions()
+        self.path = path
+        self._start_span(path, 'zip')
+        self._file = open(path, 'wb')
+        self._compressor = _OrderedCompressor(self.options.workers)
+        self._entries = []
+
+    def add_directory(self, path, arcname):
+        entry = _ZipEntry(arcname.rstrip('/\\') + '/', os.stat(path), ZIP_STORED, is_dir=True, reproducible=self.options.reproducible)
+        self._compressor.add_action(partial(self.__start_entry, entry))
+        self._compressor.add_action(partial(self.__end_entry, entry))
+
+    def add_file(self, path, arcname):
+        stat_result = os.stat(path)
+        level = self.options.level_for(path)
+        compress_type = ZIP_STORED if level == STORE_ONLY_LEVEL else ZIP_DEFLATED
+        entry = _ZipEntry(arcname, stat_result, compress_type, zip64=(stat_result.st_size * 1.05 > ZIP64_LIMIT), reproducible=self.options.reproducible)
+        self._compressor.add_action(partial(self.__start_entry, entry))
+        with open(path, 'rb') as f:
+            for chunk in iter(partial(f.read, CHUNK_SIZE), b''):
+                entry.crc = zlib.crc32(chunk, entry.crc)
+                entry.file_size += len(chunk)
+                if compress_type == ZIP_STORED:
+                    self._compressor.add_action(partial(self.__write_data, entry, chunk))
+                else:
+                    self._compressor.submit(chunk, level, partial(self.__write_data, entry))
+        if compress_type == ZIP_DEFLATED:
+            self._compressor.add_action(partial(self.__write_data, entry, _DEFLATE_END))
+        self._compressor.add_action(partial(self.__end_entry, entry))
+
+    def __extract_version(self, entry):
+        return ZIP64_VERSION if entry.zip64 else ZIP_DEFAULT_VERSION
+
+    def __start_entry(self, entry):
+        entry.header_offset = self._file.tell()
+        name, flags = entry.encoded_name
+        extra = b''
+        size = 0
+        if entry.zip64:
+            extra = struct.pack('<HHQQ', 1, 16, 0, 0)
+            size = 0xFFFFFFFF
+        self._file.write(struct.pack('<4s2B4HL2L2H', b'PK\x03\x04', self.__extract_version(entry), 0, flags, entry.compress_type,
+                                     entry.dos_time, entry.dos_date, 0, size, size, len(name), len(extra)))
+        self._file.write(name)
+        self._file.write(extra)
+
+    def __write_data(self, entry, data):
+        self._file.write(data)
+        entry.compress_size += len(data)
+
+    def __end_entry(self, entry):
+        if not entry.zip64 and (entry.file_size > ZIP64_LIMIT or entry.compress_size > ZIP64_LIMIT):
+            raise CompressionError('{0} grew too large whilst being added to the zip'.format(entry.arcname))
+        end_offset = self._file.tell()
+        name, _ = entry.encoded_name
+        self._file.seek(entry.header_offset + 14)
+        if entry.zip64:
+            self._file.write(struct.pack('<L', entry.crc))
+            self._file.seek(entry.header_offset + 30 + len(name) + 4)
+            self._file.write(struct.pack('<QQ', entry.file_size, entry.compress_size))
+        else:
+            self._file.write(struct.pack('<3L', entry.crc, entry.compress_size, entry.file_size))
+        self._file.seek(end_offset)
+        self._entries.append(entry)
+
+    def __write_central_directory(self):
+        start_offset = self._file.tell()
+        for entry in self._entries:
+            name, flags = entry.encoded_name
+            zip64_values = []
+            file_size = entry.file_size
+            compress_size = entry.compress_size
+            header_offset = entry.header_offset
+            if file_size > ZIP64_LIMIT or compress_size > ZIP64_LIMIT:
+                zip64_values.extend([file_size, compress_size])
+                file_size = compress_size = 0xFFFFFFFF
+            if header_offset > ZIP64_LIMIT:
+                zip64_values.append(header_offset)
+                header_offset = 0xFFFFFFFF
+            extra = b''
+            version = self.__extract_version(entry)
+            if len(zip64_values) > 0:
+                extra = struct.pack('<HH' + 'Q' * len(zip64_values), 1, 8 * len(zip64_values), *zip64_values)
+                version = ZIP64_VERSION
+            self._file.write(struct.pack('<4s4B4HL2L5H2L', b'PK\x01\x02', version, ZIP_CREATE_SYSTEM_UNIX, version, 0, flags, entry.compress_type,
+                                         entry.dos_time, entry.dos_date, entry.crc, compress_size, file_size, len(name), len(extra), 0, 0, 0,
+                                         entry.external_attr, header_offset))
+            self._file.write(name)
+            self._file.write(extra)
+        end_offset = self._file.tell()
+        self.__write_end_record(start_offset, end_offset - start_offset, end_offset)
+
+    def __write_end_record(self, directory_offset, directory_size, end_offset):
+        count = len(self._entries)
+        if count > ZIP_MAX_ENTRIES or directory_offset > ZIP64_LIMIT or directory_size > ZIP64_LIMIT:
+            self._file.write(struct.pack('<4sQ2H2L4Q', b'PK\x06\x06', 44, ZIP64_VERSION, ZIP64_VERSION, 0, 0, count, count, directory_size, directory_offset))
+            self._file.write(struct.pack('<4sLQL', b'PK\x06\x07', 0, end_offset, 1))
+            count = min(count, ZIP_MAX_ENTRIES)
+            directory_offset = min(directory_offset, 0xFFFFFFFF)
+            directory_size = min(directory_size, 0xFFFFFFFF)
+        self._file.write(struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, count, count, directory_size, directory_offset, 0))
+
+    def close(self):
+        try:
+            self._compressor.drain()
+            self.__write_central_directory()
+        finally:
+            self._compressor.shutdown()
+            self._file.close()
+            self._finish_span(self.path)
+
+    def abort(self):
+        try:
+            self._compressor.shutdown(cancel=True)
+        finally:
+            self._file.close()
+            self._finish_span(self.path)
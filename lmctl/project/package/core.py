@@ -1,15 +1,17 @@
 import os
 import yaml
 import tarfile
-import zipfile
 import tempfile
 import shutil
 import lmctl.utils.descriptors as descriptor_utils
 import lmctl.files as files
 import lmctl.journal as journal
 import lmctl.project.journal as project_journal
+import lmctl.project.delta as delta
 import lmctl.project.package.meta as pkg_metas
+import lmctl.project.package.archive as pkg_archive
 import lmctl.project.processes.push as push_exec
+import lmctl.project.processes.pipeline as pipeline_exec
 import lmctl.project.processes.etsi_push as etsi_push_exec
 import lmctl.project.processes.pkg_validation as pkg_validation_exec
 import lmctl.project.processes.testing as test_exec
@@ -63,6 +65,12 @@ class PushOptions(ValidateOptions):
 
     def __init__(self):
         super().__init__()
+        # Number of subpackages which may be pushed at the same time
+        self.parallel = 1
+        # Skip content unchanged since the last push to the environment
+        self.delta = False
+        # Number of Assembly Configurations/Scenarios of each project which may be created/updated at the same time
+        self.behaviour_parallel = 1
 
 class TestOptions(Options):
 
@@ -72,6 +80,8 @@ class TestOptions(Options):
             self.selected_tests = tests
         else:
             self.selected_tests = ['*']
+        # Number of tests which may be executed at the same time
+        self.parallel = 1
 
 
 class PkgContentBase():
@@ -126,6 +136,16 @@ class PkgInspectionReport:
             tpl['includes'].append(include.to_dict())
         return tpl
     
+def build_inspection_report(meta):
+    return PkgInspectionReport(meta.full_name, meta.version, _inspect_meta_entry(meta))
+
+def _inspect_meta_entry(meta_entry):
+    includes = []
+    includes.append(PkgIncludeEntry(meta_entry))
+    for subpkg in meta_entry.subpkgs:
+        includes.extend(_inspect_meta_entry(subpkg))
+    return includes
+
 class PkgIncludeEntry:
 
     def __init__(self, meta_entry):
@@ -156,25 +176,37 @@ class Pkg:
 
     def __init__(self, path):
         self.path = path
+        self.archive = pkg_archive.PkgArchive(path)
 
     def inspect(self):
+        return build_inspection_report(self.read_meta())
+
+    def read_meta(self):
+        """
+        Read the meta of the package straight from the archive, only extracting the package if it has a deprecated structure
+        """
+        try:
+            meta_content = self.archive.read_member(ExpandedPkgTree.PKG_META_FILE_YML)
+        except pkg_archive.MemberNotFoundError:
+            return self.__read_meta_from_extracted_pkg()
+        except pkg_archive.PkgArchiveError as e:
+            raise InvalidPackageError(str(e)) from e
+        config_dict = yaml.safe_load(meta_content.decode('utf-8'))
+        return self.__parse_meta(config_dict)
+
+    def __read_meta_from_extracted_pkg(self):
         tempdir = tempfile.mkdtemp()
         try:
-            pkg_content = self.open(tempdir)
-            return pkg_content.inspect()
+            return self.open(tempdir).meta
         finally:
             if os.path.exists(tempdir):
                 shutil.rmtree(tempdir)
 
     def extract(self, target_directory):
-        if tarfile.is_tarfile(self.path):
-            with tarfile.open(self.path, mode='r:gz') as pkg_tar:
-                pkg_tar.extractall(target_directory)
-        elif zipfile.is_zipfile(self.path):
-            with zipfile.ZipFile(self.path, mode='r') as pkg_csar:
-                pkg_csar.extractall(target_directory)
-        else:
-            raise InvalidPackageError('Could not determine if pkg {0} was a tgz or csar'.format(self.path))
+        try:
+            self.archive.extract(target_directory)
+        except pkg_archive.PkgArchiveError as e:
+            raise InvalidPackageError(str(e)) from e
 
 
     def open(self, target_directory=None):
@@ -214,6 +246,9 @@ class Pkg:
             raise InvalidPackageError('Could not find meta file at path: {0}'.format(meta_file_path))
         with open(meta_file_path, 'rt') as f:
             config_dict = yaml.safe_load(f.read())
+        return self.__parse_meta(config_dict)
+
+    def __parse_meta(self, config_dict):
         if not config_dict:
             config_dict = {}
         try:
@@ -225,7 +260,7 @@ class Pkg:
         try:
             potential_descriptor = os.path.join(self.path, 'Descriptor', 'assembly.yml')
             if os.path.exists(potential_descriptor):
-                descriptor = descriptor_utils.DescriptorParser().read_from_file(potential_descriptor)
+                descriptor = descriptor_utils.DescriptorParser().read_from_file(potential_descriptor, readonly=True)
                 return descriptor.get_version()
         except Exception:
             return None
@@ -274,15 +309,7 @@ class PkgContent(PkgContentBase):
         return project_journal.ProjectJournal(journal_consumer)
 
     def inspect(self):
-        includes = self.__inspect_meta(self.meta)
-        return PkgInspectionReport(self.meta.full_name, self.meta.version, includes)
-
-    def __inspect_meta(self, meta_entry):
-        includes = []
-        includes.append(PkgIncludeEntry(meta_entry))
-        for subpkg in meta_entry.subpkgs:
-            includes.extend(self.__inspect_meta(subpkg))
-        return includes
+        return build_inspection_report(self.meta)
 
     def validate(self, env_sessions, options):
         journal = self.__init_journal(options.journal_consumer)
@@ -302,10 +329,44 @@ class PkgContent(PkgContentBase):
         validate_result = self.__do_validate(env_sessions, options, journal)
         if validate_result.has_errors():
             raise PushValidationError(validate_result)
+        self.__prepare_push_sessions(env_sessions, options)
         try:
             push_exec.PushProcess(self, options, journal, env_sessions).execute()
         except push_exec.PushProcessError as e:
             raise PushError(str(e)) from e
+        finally:
+            # Content pushed before any failure is still recorded, so it may be skipped next time
+            env_sessions.push_tracker.save()
+        self.__complete_push(env_sessions, options, journal)
+
+    def push_while_compiling(self, env_sessions, options, compile_content):
+        """
+        Push this content while it is still being compiled, instead of validating and pushing once it is complete (see PipelinedPushProcess).
+        `compile_content` is called with a function to be notified of each (sub)package once compiled. Returns the result of `compile_content`
+        """
+        journal = self.__init_journal(options.journal_consumer)
+        self.__prepare_push_sessions(env_sessions, options)
+        try:
+            compile_result, validate_result = pipeline_exec.PipelinedPushProcess(self, options, journal, env_sessions, compile_content).execute()
+        except pipeline_exec.PipelinedPushProcessError as e:
+            raise PushError(str(e)) from e
+        finally:
+            env_sessions.push_tracker.save()
+        if validate_result.has_errors():
+            raise PushValidationError(validate_result)
+        self.__complete_push(env_sessions, options, journal)
+        return compile_result
+
+    def __prepare_push_sessions(self, env_sessions, options):
+        env_sessions.behaviour_sync_workers = options.behaviour_parallel
+        # The push state is recorded on every push, otherwise a later delta push compares against content which has since been replaced
+        push_state = delta.PushStateManifest.for_environment(env_sessions.lm.env.address)
+        env_sessions.push_tracker = delta.PushTracker(delta=options.delta, manifest=push_state)
+
+    def __complete_push(self, env_sessions, options, journal):
+        if options.delta:
+            journal.section('Push Summary')
+            journal.event(env_sessions.push_tracker.summary())
         journal.section('Post process environments')
         self.__post_process_updated_environments(env_sessions, options, journal)
 
@@ -142,7 +142,7 @@ class PkgMetaBase(PkgMeta):
 
 class RootPkgMeta(PkgMetaBase):
 
-    def __init__(self, schema, name, version, content_type, resource_manager=None, subpkg_entries=None):
+    def __init__(self, schema, name, version, content_type, resource_manager=None, subpkg_entries=None, content_hash=None):
         super().__init__(name, content_type, resource_manager, subpkg_entries)
         if not schema:
             raise ValueError('schema must be defined')
@@ -150,6 +150,8 @@ class RootPkgMeta(PkgMetaBase):
         if not version:
             raise ValueError('version must be defined')
         self._version = version
+        # Hash of the compiled content of the package (see delta.directory_content_hash), not included in packages built by older versions
+        self._content_hash = content_hash
 
     @property
     def schema(self):
@@ -159,6 +161,10 @@ class RootPkgMeta(PkgMetaBase):
     def version(self):
         return self._version
 
+    @property
+    def content_hash(self):
+        return self._content_hash
+
     def to_dict(self):
         data = {}
         data['schema'] = self.schema
@@ -168,6 +174,8 @@ class RootPkgMeta(PkgMetaBase):
         data['version'] = self.version
         for key, value in base_data.items():
             data[key] = value
+        if self.content_hash:
+            data['content-hash'] = self.content_hash
         return data
 
 
@@ -253,6 +261,7 @@ class RootPkgMetaBuilder(PkgMetaBaseBuilder):
         super().__init__()
         self._schema = None
         self.__version = None
+        self._content_hash = None
 
     def schema(self, schema):
         self._schema = schema
@@ -262,12 +271,16 @@ class RootPkgMetaBuilder(PkgMetaBaseBuilder):
         self._version = version
         return self
 
+    def content_hash(self, content_hash):
+        self._content_hash = content_hash
+        return self
+
     def build(self):
         name = self._name
         content_type = self._content_type
         resource_manager = self._resource_manager
         subpkg_entries = self._build_subpkg_entries()
-        return RootPkgMeta(self._schema, name, self._version, content_type, resource_manager, subpkg_entries)
+        return RootPkgMeta(self._schema, name, self._version, content_type, resource_manager, subpkg_entries, self._content_hash)
 
 
 class SubPkgEntryBuilder(PkgMetaBaseBuilder):
@@ -314,7 +327,8 @@ class PkgMetaParserWorker:
         subcontent = self.__read_subcontents(self.meta_dict)
         if self.content_type in [types.RESOURCE_PROJECT_TYPE, types.ETSI_VNF_PROJECT_TYPE]:
             resource_manager = self.__read_resource_manager(self.meta_dict)
-        return RootPkgMeta(self.schema, self.content_name, self.content_version, self.content_type, resource_manager, subcontent)
+        content_hash = self.meta_dict.get('content-hash', None)
+        return RootPkgMeta(self.schema, self.content_name, self.content_version, self.content_type, resource_manager, subcontent, content_hash)
 
     def __read_schema(self):
         return self.meta_dict.get('schema', None)
@@ -0,0 +1,202 @@
+import os
+import json
+import hashlib
+import logging
+import lmctl.files as files
+import lmctl.project.package.core as pkgs
+from .common import LIFECYCLE_WORKSPACE
+
+logger = logging.getLogger(__name__)
+
+BUILD_CACHE_FILE = 'build-cache.json'
+# Change when the way sources are staged/compiled changes, so existing caches are ignored
+BUILD_CACHE_VERSION = '1'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _compression_key(compression_options):
+    return 'level={0},reproducible={1},store-only={2}'.format(compression_options.level, compression_options.reproducible,
+                                                              ','.join(compression_options.store_only_extensions))
+
+
+def _root_project_of(project):
+    while getattr(project, 'parent_project', None) is not None:
+        project = project.parent_project
+    return project
+
+
+class BuildCache:
+    """
+    Fingerprints of the sources of a Project and each of its Subprojects, taken when they were last built.
+
+    A (sub)project whose fingerprint matches the one recorded by the previous build, and whose staged/compiled
+    output still exists, does not need to be staged or compiled again. Fingerprints cover the content of the files
+    owned by the (sub)project (excluding those of its own Subprojects), plus the root project file, as its
+    configuration is used to resolve references in the descriptors of every Subproject.
+
+    The package created by the last build is also recorded, with the content hash from its meta, keyed by the fingerprints
+    of the whole Project. When none of the sources have changed the package can be returned without building anything.
+
+    Fingerprints also cover the compression options, as compiled output (such as Resource packages) depends on them.
+    """
+
+    def __init__(self, project, compression_options=None):
+        self.project = _root_project_of(project)
+        self.compression_options = compression_options
+        self.cache_path = os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, BUILD_CACHE_FILE)
+        self._previous, self._previous_package = self.__load()
+        self._current = {}
+        self._built = {}
+        self._package = None
+
+    def __load(self):
+        if not os.path.exists(self.cache_path):
+            return {}, None
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache_data = json.load(f)
+        except (IOError, ValueError) as e:
+            logger.debug('Ignoring unreadable build cache at {0}: {1}'.format(self.cache_path, str(e)))
+            return {}, None
+        if cache_data.get('version') != BUILD_CACHE_VERSION:
+            return {}, None
+        return cache_data.get('fingerprints', {}), cache_data.get('package', None)
+
+    def save(self):
+        fingerprints = dict(self._previous)
+        fingerprints.update(self._built)
+        cache_data = {'version': BUILD_CACHE_VERSION, 'fingerprints': fingerprints}
+        if self._package is not None:
+            cache_data['package'] = self._package
+        directory = os.path.dirname(self.cache_path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(self.cache_path, 'w') as f:
+            json.dump(cache_data, f, indent=2, sort_keys=True)
+
+    def __key(self, project):
+        relative_path = os.path.relpath(project.tree.root_path, self.project.tree.root_path)
+        return relative_path.replace(os.sep, '/')
+
+    def fingerprint(self, project):
+        key = self.__key(project)
+        if key not in self._current:
+            self._current[key] = self.__calculate_fingerprint(project)
+        return self._current[key]
+
+    def __calculate_fingerprint(self, project):
+        digest = hashlib.sha256()
+        digest.update(BUILD_CACHE_VERSION.encode('utf-8'))
+        if self.compression_options is not None:
+            digest.update(_compression_key(self.compression_options).encode('utf-8'))
+        project_file_path = self.project.tree.project_file_path
+        if os.path.exists(project_file_path):
+            self.__add_file(digest, 'root:' + os.path.basename(project_file_path), project_file_path)
+        root_path = project.tree.root_path
+        excluded_dirs = set(os.path.abspath(subproject.tree.root_path) for subproject in project.subprojects)
+        excluded_dirs.add(os.path.abspath(os.path.join(root_path, LIFECYCLE_WORKSPACE)))
+        for walk_root, dirs, filenames in os.walk(root_path):
+            # Sort (in place) so the walk order, and therefore the fingerprint, is stable
+            dirs[:] = sorted(d for d in dirs if os.path.abspath(os.path.join(walk_root, d)) not in excluded_dirs)
+            for filename in sorted(filenames):
+                full_path = os.path.join(walk_root, filename)
+                relative_path = os.path.relpath(full_path, root_path).replace(os.sep, '/')
+                self.__add_file(digest, relative_path, full_path)
+        return digest.hexdigest()
+
+    def __add_file(self, digest, name, path):
+        digest.update(name.encode('utf-8'))
+        digest.update(b'\0')
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        digest.update(b'\0')
+
+    def is_unchanged(self, project, *output_paths):
+        """
+        True if the sources of this project are the same as the last build and all of the given output paths still exist
+        """
+        previous_fingerprint = self._previous.get(self.__key(project))
+        if previous_fingerprint is None or previous_fingerprint != self.fingerprint(project):
+            return False
+        return all(os.path.exists(path) for path in output_paths)
+
+    def record_built(self, project):
+        self._built[self.__key(project)] = self.fingerprint(project)
+
+    def __package_fingerprint(self, compression_options):
+        digest = hashlib.sha256()
+        for project in self.__all_projects(self.project):
+            digest.update('{0}={1}\0'.format(self.__key(project), self.fingerprint(project)).encode('utf-8'))
+        # The same sources packaged with different options produce a different file
+        digest.update(_compression_key(compression_options).encode('utf-8'))
+        return digest.hexdigest()
+
+    def __all_projects(self, project):
+        yield project
+        for subproject in project.subprojects:
+            yield from self.__all_projects(subproject)
+
+    def unchanged_package(self, compression_options):
+        """
+        Path of the package created by the last build, if none of the sources have changed since and the package still exists with
+        the content hash it was created with. Otherwise None
+        """
+        if self._previous_package is None:
+            return None
+        if self._previous_package.get('fingerprint') != self.__package_fingerprint(compression_options):
+            return None
+        pkg_path = os.path.join(self.project.tree.root_path, self._previous_package.get('path', ''))
+        if not os.path.isfile(pkg_path):
+            return None
+        try:
+            pkg_meta = pkgs.Pkg(pkg_path).read_meta()
+        except pkgs.PackageError as e:
+            logger.debug('Ignoring unreadable package from the last build at {0}: {1}'.format(pkg_path, str(e)))
+            return None
+        if pkg_meta.content_hash is None or pkg_meta.content_hash != self._previous_package.get('content-hash'):
+            return None
+        return pkg_path
+
+    def record_package(self, pkg, compression_options):
+        self._package = {
+            'fingerprint': self.__package_fingerprint(compression_options),
+            'path': os.path.relpath(pkg.path, self.project.tree.root_path).replace(os.sep, '/'),
+            'content-hash': pkg.read_meta().content_hash
+        }
+
+
+def discard_build_cache(project):
+    """
+    Remove the build cache of a Project. A build which is not incremental replaces the staged/compiled output the cache describes,
+    so a later incremental build must not trust fingerprints recorded before it
+    """
+    cache_path = os.path.join(_root_project_of(project).tree.root_path, LIFECYCLE_WORKSPACE, BUILD_CACHE_FILE)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+
+def clean_directory_except(directory, child_dir_name, keep_child_dirs):
+    """
+    Clean a directory ready for new output but keep the output of selected subprojects (under `child_dir_name`),
+    which are managed separately by their own (incremental) build.
+    Subproject output no longer in `keep_child_dirs` is removed.
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+        return
+    for entry in os.listdir(directory):
+        entry_path = os.path.join(directory, entry)
+        if entry == child_dir_name and os.path.isdir(entry_path):
+            for child_entry in os.listdir(entry_path):
+                if child_entry not in keep_child_dirs:
+                    __remove_path(os.path.join(entry_path, child_entry))
+        else:
+            __remove_path(entry_path)
+
+
+def __remove_path(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        files.remove_directory(path)
+    else:
+        os.remove(path)
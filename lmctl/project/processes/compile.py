@@ -3,50 +3,69 @@ import lmctl.files as files
 import lmctl.project.handlers.interface as handlers_api
 from lmctl.project.package.core import ExpandedPkgTree
 from .common import LIFECYCLE_WORKSPACE
+from .build_cache import clean_directory_except
 
 class CompileProcessError(Exception):
     pass
 
 class CompileProcess:
 
-    def __init__(self, project, options, staging_tree, journal):
+    def __init__(self, project, options, staging_tree, journal, build_cache=None, on_compiled=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
+        self.build_cache = build_cache
+        # Called with the content tree of each (sub)project once it, and all of its own subprojects, have been compiled
+        self.on_compiled = on_compiled
+        self.content_tree = self.__create_content_tree()
 
     def __create_content_tree(self):
         compile_workspace = os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'compile')
         return ExpandedPkgTree(compile_workspace)
 
     def execute(self):
-        content_tree = self.__create_content_tree()
-        CompileWorker(self.project, self.options, self.staging_tree, content_tree, self.journal).work()
-        return content_tree
+        CompileWorker(self.project, self.options, self.staging_tree, self.content_tree, self.journal, build_cache=self.build_cache, on_compiled=self.on_compiled).work()
+        return self.content_tree
 
 
 class CompileWorker:
 
-    def __init__(self, project, options, staging_tree, content_tree, journal):
+    def __init__(self, project, options, staging_tree, content_tree, journal, build_cache=None, on_compiled=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
         self.content_tree = content_tree
+        self.build_cache = build_cache
+        self.on_compiled = on_compiled
 
     def work(self):
-        self.__prepare_compile_directories()
-        self.__compile_sources()
+        if self.build_cache is not None and self.build_cache.is_unchanged(self.project, self.content_tree.root_path):
+            self.journal.section('Compile Package')
+            self.journal.event('No changes to sources of {0} since the last build, reusing compiled content'.format(self.project.config.name))
+        else:
+            self.__prepare_compile_directories()
+            self.__compile_sources()
         self.__compile_child_projects()
+        if self.build_cache is not None:
+            self.build_cache.record_built(self.project)
+        if self.on_compiled is not None:
+            self.on_compiled(self.content_tree)
 
     def __prepare_compile_directories(self):
-        files.clean_directory(self.content_tree.root_path)
+        if self.build_cache is None:
+            files.clean_directory(self.content_tree.root_path)
+        else:
+            # Compiled Subprojects are kept, as each decides whether it needs to be compiled again
+            subproject_dirs = [subproject.config.directory for subproject in self.project.subprojects]
+            clean_directory_except(self.content_tree.root_path, ExpandedPkgTree.CONTAINS_DIR, subproject_dirs)
 
     def __compile_sources(self):
         self.journal.section('Compile Package')
         try:
             staged_source_handler = self.project.source_handler.build_staged_source_handler(self.staging_tree.root_path)
-            source_compiler = SourceCompiler(self.journal, self.project.config, self.content_tree.root_path)
+            source_compiler = SourceCompiler(self.journal, self.project.config, self.content_tree.root_path, compression_options=self.options.compression)
             staged_source_handler.compile_sources(self.journal, source_compiler)
         except handlers_api.SourceHandlerError as e:
             raise CompileProcessError(str(e)) from e
@@ -65,15 +84,17 @@ class CompileWorker:
             self.journal.subproject(subproject.config.name)
             child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
             child_content_tree = self.content_tree.gen_child_content_tree(subproject.config.directory)
-            CompileWorker(subproject, self.options, child_staging_tree, child_content_tree, self.journal).work()
+            CompileWorker(subproject, self.options, child_staging_tree, child_content_tree, self.journal, build_cache=self.build_cache, on_compiled=self.on_compiled).work()
             self.journal.subproject_end(subproject.config.name)
 
 class SourceCompiler:
 
-    def __init__(self, journal, source_config, compile_path):
+    def __init__(self, journal, source_config, compile_path, compression_options=None):
         self.journal = journal
         self.source_config = source_config
         self.compile_path = compile_path
+        # Used by handlers when creating archives (e.g. Resource packages) as part of compiling
+        self.compression_options = compression_options
 
     def _join_path(self, base_path, relative_path):
         return os.path.join(base_path, relative_path)
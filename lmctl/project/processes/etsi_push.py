@@ -3,6 +3,7 @@ import lmctl.project.handlers.etsi_ns as etsi_ns_handler_api
 import lmctl.project.handlers.etsi_vnf as etsi_vnf_handler_api
 import lmctl.utils.descriptors as descriptors
 import lmctl.drivers.lm.base as lm_drivers
+from lmctl.utils.uploads import UploadProgressReporter
 
 class EtsiPushProcessError(Exception):
     pass
@@ -23,7 +24,7 @@ class EtsiPushProcess:
         if (self.pkg_meta.is_etsi_ns_content()):
             # Need to get the descriptor to determin the full ID (descriptor_name) as namein the pkg_meta is not full
             descriptor_path = etsi_ns_handler_api.EtsiNsPkgContentTree(self.push_workspace).descriptor_definitions_file_path
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path, readonly=True)
             descriptor_name = descriptor.get_name()            
             self.journal.event('Removing any existing ETSI_NS assembly package named {0} (version: {1}) from TNC-O: {2} ({3})'
                 .format(descriptor_name, self.pkg_meta.version, lm_session.env.name, lm_session.env.address))
@@ -31,10 +32,10 @@ class EtsiPushProcess:
                 pkg_driver.delete_nsd_package(descriptor_name)
             except lm_drivers.NotFoundException:
                 self.journal.event('No package named {0} found'.format(descriptor_name))            
-            pkg_driver.onboard_nsd_package(descriptor_name, self.pkg.path)
+            pkg_driver.onboard_nsd_package(descriptor_name, self.pkg.path, progress_callback=UploadProgressReporter(self.journal.event, 'package {0}'.format(descriptor_name)))
         elif (self.pkg_meta.is_etsi_vnf_content()):
             descriptor_path = etsi_vnf_handler_api.EtsiVnfPkgContentTree(self.push_workspace).definitions_descriptor_file_path
-            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path)
+            descriptor, descriptor_yml_str = descriptors.DescriptorParser().read_from_file_with_raw(descriptor_path, readonly=True)
             descriptor_name = descriptor.get_name()
             self.journal.event('Removing any existing ETSI_NS assembly package named {0} (version: {1}) from TNC-O: {2} ({3})'
                 .format(descriptor_name, self.pkg_meta.version, lm_session.env.name, lm_session.env.address))
@@ -42,6 +43,6 @@ class EtsiPushProcess:
                 pkg_driver.delete_package(descriptor_name)
             except lm_drivers.NotFoundException:
                 self.journal.event('No package named {0} found'.format(descriptor_name))
-            pkg_driver.onboard_package(descriptor_name, self.pkg.path)
+            pkg_driver.onboard_package(descriptor_name, self.pkg.path, progress_callback=UploadProgressReporter(self.journal.event, 'package {0}'.format(descriptor_name)))
         else:
             raise EtsiPushProcessError('Not an ETSI package, Not pushing.')
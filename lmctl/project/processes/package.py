@@ -1,10 +1,10 @@
 import os
-import tarfile
-import zipfile
 import yaml
 import lmctl.files as files
 import lmctl.project.package.core as pkgs
+import lmctl.project.package.compression as compression
 import lmctl.project.package.meta as pkg_metas
+import lmctl.project.delta as delta
 from .common import LIFECYCLE_WORKSPACE
 from lmctl.project.handlers.interface import CSAR_PACKAGING, TGZ_PACKAGING
 
@@ -28,11 +28,13 @@ class PkgProcessError(Exception):
 
 class PkgProcess:
 
-    def __init__(self, project, options, content_tree, journal):
+    def __init__(self, project, options, content_tree, journal, keep_compiled_content=False):
         self.project = project
         self.options = options
         self.content_tree = content_tree
         self.journal = journal
+        # Leave the compiled content in place (e.g. because it is still being pushed), so the caller is responsible for removing it
+        self.keep_compiled_content = keep_compiled_content
 
     def __create_pkg_build_tree(self):
         return PkgBuildTree(os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'build'))
@@ -41,62 +43,71 @@ class PkgProcess:
         self.journal.section('Finalise Package')
         build_tree = self.__create_pkg_build_tree()
         files.clean_directory(build_tree.root_path)
+        compiled_content_path = self.content_tree.root_path
         pkg_meta_file_path = build_tree.pkg_meta_file_path()
-        self.__create_pkg_meta(pkg_meta_file_path)
+        self.__create_pkg_meta(pkg_meta_file_path, delta.directory_content_hash(compiled_content_path))
         pkg_path = build_tree.gen_pkg_path(self.project.config.full_name, self.project.config.version, packaging=self.project.config.packaging)
         self.journal.event('Creating package at: {0}'.format(pkg_path))
         pkg_tree = pkgs.ExpandedPkgTree()
-        compiled_content_path = self.content_tree.root_path
         if self.project.config.packaging == CSAR_PACKAGING:
-            with zipfile.ZipFile(pkg_path, mode='w') as pkg_zip:
-                self.__build_package(pkg_zip.write, pkg_tree, compiled_content_path, pkg_meta_file_path)
+            writer_class = compression.ZipWriter
         else:
-            with tarfile.open(pkg_path, mode='w:gz') as pkg_tar:
-                self.__build_package(pkg_tar.add, pkg_tree, compiled_content_path, pkg_meta_file_path)
-        self.__clear_compile_directory()
+            writer_class = compression.TgzWriter
+        with writer_class(pkg_path, self.options.compression) as pkg_writer:
+            self.__build_package(pkg_writer, pkg_tree, compiled_content_path, pkg_meta_file_path)
+        if not self.options.incremental and not self.keep_compiled_content:
+            # Incremental builds keep compiled content for reuse by the next build
+            self.__clear_compile_directory()
         try:
             return pkgs.Pkg(pkg_path)
         except pkgs.InvalidPackageError as e:
             raise PkgProcessError(str(e)) from e
 
-    def __build_package(self, add_method, pkg_tree, compiled_content_path, pkg_meta_file_path):
+    def __build_package(self, pkg_writer, pkg_tree, compiled_content_path, pkg_meta_file_path):
+        # Meta file goes first, so it can be read without streaming through the rest of a tgz
+        pkg_writer.add_file(pkg_meta_file_path, pkg_tree.pkg_meta_file_name)
         rootlen = len(compiled_content_path) + 1
         for root, dirs, filelist in os.walk(compiled_content_path):
-            for file_name in filelist:
+            # Sorted, so the same content is always added in the same order
+            dirs.sort()
+            for file_name in sorted(filelist):
                 full_path = os.path.join(root, file_name)
                 file_size = os.path.getsize(full_path)
                 arcname = full_path[rootlen:]
                 if file_size > 100000000:
                     # For big files let people know. TODO: make this more generic, so we can report long running tasks as events
                     self.journal.event('Processing large file {0} ({1:.2f} mb), this may take some time...'.format(os.path.basename(full_path), (file_size/1000000)))
-                add_method(full_path, arcname=arcname)
-        add_method(pkg_meta_file_path, arcname=pkg_tree.pkg_meta_file_name)
+                pkg_writer.add_file(full_path, arcname)
 
     def __clear_compile_directory(self):
         files.remove_directory(self.content_tree.root_path)
 
-    def __create_pkg_meta(self, pkg_meta_file_path):
-        builder = pkg_metas.RootPkgMetaBuilder()
-        builder.schema(self.project.config.schema)
-        builder.name(self.project.config.name)
-        builder.content_type(self.project.config.project_type)
-        builder.version(self.project.config.version)
-        builder.resource_manager(self.project.config.resource_manager)
-        self.__add_child_projects_to_pkg_meta(self.project.config, builder)
-        try:
-            pkg_meta = builder.build()
-        except pkg_metas.PkgMetaError as e:
-           raise PkgProcessError(str(e)) from e
+    def __create_pkg_meta(self, pkg_meta_file_path, content_hash):
+        pkg_meta = build_pkg_meta(self.project.config, content_hash=content_hash)
         with open(pkg_meta_file_path, 'w') as pkg_meta_file:
             yaml.dump(pkg_meta.to_dict(), pkg_meta_file, default_flow_style=False, sort_keys=False)
         return pkg_meta_file_path
 
-    def __add_child_projects_to_pkg_meta(self, config, meta_builder):
-        subprojects = config.subprojects
-        for subproject_config in subprojects:
-            subpkg_builder = meta_builder.subpkg_entry_builder()
-            subpkg_builder.name(subproject_config.name)
-            subpkg_builder.content_type(subproject_config.project_type)
-            subpkg_builder.directory(subproject_config.directory)
-            subpkg_builder.resource_manager(subproject_config.resource_manager)
-            self.__add_child_projects_to_pkg_meta(subproject_config, subpkg_builder)
+def build_pkg_meta(project_config, content_hash=None):
+    builder = pkg_metas.RootPkgMetaBuilder()
+    builder.schema(project_config.schema)
+    builder.name(project_config.name)
+    builder.content_type(project_config.project_type)
+    builder.version(project_config.version)
+    builder.resource_manager(project_config.resource_manager)
+    builder.content_hash(content_hash)
+    _add_child_projects_to_pkg_meta(project_config, builder)
+    try:
+        return builder.build()
+    except pkg_metas.PkgMetaError as e:
+        raise PkgProcessError(str(e)) from e
+
+def _add_child_projects_to_pkg_meta(config, meta_builder):
+    subprojects = config.subprojects
+    for subproject_config in subprojects:
+        subpkg_builder = meta_builder.subpkg_entry_builder()
+        subpkg_builder.name(subproject_config.name)
+        subpkg_builder.content_type(subproject_config.project_type)
+        subpkg_builder.directory(subproject_config.directory)
+        subpkg_builder.resource_manager(subproject_config.resource_manager)
+        _add_child_projects_to_pkg_meta(subproject_config, subpkg_builder)
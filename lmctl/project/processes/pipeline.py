@@ -0,0 +1,112 @@
+import os
+import queue
+import logging
+import threading
+import lmctl.project.handlers.interface as handlers_api
+import lmctl.project.validation as validation
+from .push import PushTask
+
+logger = logging.getLogger(__name__)
+
+# Number of compiled (sub)packages which may be waiting to be pushed before compiling pauses for the uploads to catch up
+PIPELINE_QUEUE_SIZE = 2
+
+class PipelinedPushProcessError(Exception):
+    pass
+
+class PipelinedPushProcess:
+    """
+    Push the content of a package while it is still being compiled, so uploads to the environment overlap with the (CPU bound) compiling/zipping
+    of the rest of the Project.
+
+    `compile_content` is called (on this thread) with a function which must be called with the content tree of each (sub)package once it,
+    and all of its own subpackages, have been compiled. That content is validated straight away and added to a bounded queue, which a single
+    uploader thread pushes from in order, so each parent is still pushed after its own subpackages.
+
+    Once a push fails, or any content has validation errors, no further content is pushed. Journal entries for pushes are held until
+    compiling has finished, so they are not mixed with the entries for compiling.
+    """
+
+    def __init__(self, pkg_content, options, journal, env_sessions, compile_content, queue_size=PIPELINE_QUEUE_SIZE):
+        self.pkg_content = pkg_content
+        self.options = options
+        self.journal = journal
+        self.env_sessions = env_sessions
+        self.compile_content = compile_content
+        self.validation_options = handlers_api.ContentValidationOptions(allow_autocorrect=options.allow_autocorrect)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.contents = {}
+        self.__index_contents(self.pkg_content, [])
+        self.validation_errors = []
+        self.validation_warnings = []
+        self.push_errors = []
+        self.completed_tasks = []
+
+    def __index_contents(self, content, path):
+        self.contents[os.path.normpath(content.tree.root_path)] = (content, path)
+        for subcontent in content.subcontents:
+            self.__index_contents(subcontent, path + [subcontent.meta.name])
+
+    def execute(self):
+        """
+        Returns the result of `compile_content` and the ValidationResult of all content
+        """
+        uploader = threading.Thread(target=self.__push_queued_content, name='lmctl-push-pipeline', daemon=True)
+        uploader.start()
+        try:
+            compile_result = self.compile_content(self.__content_compiled)
+        finally:
+            self.queue.put(None)
+            uploader.join()
+            self.__write_push_journals()
+        self.__raise_push_error()
+        return compile_result, validation.ValidationResult(self.validation_errors, self.validation_warnings)
+
+    def __content_compiled(self, content_tree):
+        self.__raise_push_error()
+        content, path = self.contents.get(os.path.normpath(content_tree.root_path), (None, None))
+        if content is None:
+            logger.debug('No content in package for compiled tree at {0}, it will not be pushed'.format(content_tree.root_path))
+            return
+        self.journal.section('Validate Content')
+        try:
+            validate_content_result = content.handler.validate_content(self.journal, self.env_sessions, self.validation_options)
+        except handlers_api.ContentHandlerError as e:
+            raise PipelinedPushProcessError(str(e)) from e
+        self.validation_errors.extend(validate_content_result.errors)
+        self.validation_warnings.extend(validate_content_result.warnings)
+        if len(self.validation_errors) == 0:
+            # Blocks whilst the queue is full, so compiling never gets too far ahead of uploading
+            self.queue.put(PushTask(content, path))
+
+    def __push_queued_content(self):
+        while True:
+            task = self.queue.get()
+            if task is None:
+                return
+            # Keep taking tasks after a failure, so the compiling thread is never left blocked on a full queue
+            if len(self.push_errors) > 0:
+                continue
+            task.journal.section('Push Content')
+            try:
+                task.content.handler.push_content(task.journal, self.env_sessions)
+            except Exception as e:
+                logger.debug('Push of {0} failed: {1}'.format('/'.join(task.path) or task.content.meta.name, str(e)))
+                self.push_errors.append(e)
+            self.completed_tasks.append(task)
+
+    def __write_push_journals(self):
+        for task in self.completed_tasks:
+            for name in task.path:
+                self.journal.subproject(name)
+            self.journal.add_entries(task.journal.entries)
+            for name in reversed(task.path):
+                self.journal.subproject_end(name)
+        self.completed_tasks = []
+
+    def __raise_push_error(self):
+        if len(self.push_errors) > 0:
+            error = self.push_errors[0]
+            if isinstance(error, handlers_api.ContentHandlerError):
+                raise PipelinedPushProcessError(str(error)) from error
+            raise error
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 import lmctl.files as files
 import lmctl.project.handlers.interface as handlers_api
 from .common import LIFECYCLE_WORKSPACE
@@ -45,23 +46,60 @@ class PullProcess:
 
 class PullWorker:
 
-    def __init__(self, project, options, backup_tree, journal, env_sessions, references):
+    def __init__(self, project, options, backup_tree, journal, env_sessions, references, fetched_sources=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.backup_tree = backup_tree
         self.env_sessions = env_sessions
         self.references = references
+        # Content fetched ahead of time for each project in the tree (by root path), when pulling in parallel
+        self.fetched_sources = fetched_sources
 
     def work(self):
+        if self.fetched_sources is None and self.options.parallel > 1 and len(self.project.subprojects) > 0:
+            self.fetched_sources = self.__fetch_sources_in_parallel(self.options.parallel)
         self.__pull_sources()
         self.__pull_child_projects()
 
+    def __all_projects(self, project):
+        projects = [project]
+        for subproject in project.subprojects:
+            projects.extend(self.__all_projects(subproject))
+        return projects
+
+    def __fetch_sources(self, project):
+        try:
+            return project.source_handler.fetch_pull_sources(self.env_sessions)
+        except handlers_api.SourceHandlerError as e:
+            raise PullProcessError(str(e)) from e
+
+    def __fetch_sources_in_parallel(self, parallel):
+        # Only the remote content is fetched concurrently; backups and writes happen afterwards, one project at a time in tree order
+        projects = self.__all_projects(self.project)
+        self.journal.section('Fetch Sources')
+        self.journal.event('Fetching content for {0} project(s) from CP4NA orchestration ({1} at a time)'.format(len(projects), parallel))
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix='lmctl-pull') as executor:
+            futures = [executor.submit(self.__fetch_sources, project) for project in projects]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                if future.done() and future.exception() is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    raise future.exception()
+            fetched_sources = {}
+            for project, future in zip(projects, futures):
+                fetched_sources[project.tree.root_path] = future.result()
+        return fetched_sources
+
     def __pull_sources(self):
         self.journal.section('Pull Sources')
         backup_tool = SourceBackupTool(self.journal, self.project.config, self.backup_tree.root_path)
+        fetched = None
+        if self.fetched_sources is not None:
+            fetched = self.fetched_sources.get(self.project.tree.root_path)
         try:
-            self.project.source_handler.pull_sources(self.journal, backup_tool, self.env_sessions, self.references)
+            self.project.source_handler.pull_sources(self.journal, backup_tool, self.env_sessions, self.references, fetched=fetched)
         except handlers_api.SourceHandlerError as e:
             raise PullProcessError(str(e)) from e
         
@@ -72,7 +110,7 @@ class PullWorker:
         for subproject in subprojects:
             self.journal.subproject(subproject.config.name)
             child_backup_tree = self.backup_tree.gen_subproject_backup_tree(subproject.config.directory)
-            PullWorker(subproject, self.options, child_backup_tree, self.journal, self.env_sessions, self.references).work()
+            PullWorker(subproject, self.options, child_backup_tree, self.journal, self.env_sessions, self.references, fetched_sources=self.fetched_sources).work()
             self.journal.subproject_end(subproject.config.name)
 
 class SourceBackupTool:
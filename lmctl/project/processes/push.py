@@ -1,4 +1,9 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import lmctl.project.handlers.interface as handlers_api
+from lmctl.project.journal import BufferedProjectJournal
+
+logger = logging.getLogger(__name__)
 
 class PushProcessError(Exception):
     pass
@@ -14,6 +19,19 @@ class PushProcess:
     def execute(self):
         return PushWorker(self.pkg_content, self.options, self.journal, self.env_sessions).work()
 
+class PushTask:
+    """
+    A subcontent to be pushed as part of a parallel push. The task may only start once all tasks for its own subcontents have completed
+    """
+
+    def __init__(self, content, path, parent=None):
+        self.content = content
+        self.path = path
+        self.parent = parent
+        self.pending_children = len(content.subcontents)
+        self.journal = BufferedProjectJournal()
+        self.written = False
+
 class PushWorker:
 
     def __init__(self, pkg_content, options, journal, env_sessions):
@@ -23,7 +41,10 @@ class PushWorker:
         self.env_sessions = env_sessions
 
     def work(self):
-        self.__push_child_content()
+        if self.options.parallel > 1 and len(self.pkg_content.subcontents) > 0:
+            self.__push_child_content_in_parallel(self.options.parallel)
+        else:
+            self.__push_child_content()
         self.__push_content()
 
     def __push_content(self):
@@ -40,3 +61,60 @@ class PushWorker:
             PushWorker(subcontent, self.options, self.journal, self.env_sessions).work()
             self.journal.subproject_end(subcontent.meta.name)
 
+    def __build_push_tasks(self, content, path=None, parent=None):
+        path = path or []
+        tasks = []
+        for subcontent in content.subcontents:
+            task = PushTask(subcontent, path + [subcontent.meta.name], parent=parent)
+            tasks.append(task)
+            tasks.extend(self.__build_push_tasks(subcontent, task.path, parent=task))
+        return tasks
+
+    def __push_task_content(self, task):
+        # Children have been pushed by their own tasks, so only push the content of this subcontent
+        PushWorker(task.content, self.options, task.journal, self.env_sessions).__push_content()
+
+    def __write_task_journal(self, task):
+        # Events for a subcontent are written once, wrapped in its own subproject events, into the journal of its parent task
+        # (or this journal, for top level subcontents). Parent tasks only start once their subcontents are complete, so their
+        # journals hold the entries of their subcontents followed by their own, as in a sequential push
+        target_journal = task.parent.journal if task.parent is not None else self.journal
+        target_journal.subproject(task.content.meta.name)
+        target_journal.add_entries(task.journal.entries)
+        target_journal.subproject_end(task.content.meta.name)
+        task.written = True
+
+    def __push_child_content_in_parallel(self, parallel):
+        """
+        Push all subcontents (at any depth) with up to `parallel` pushes in progress at once.
+        Each subcontent is pushed only after all of its own subcontents, so siblings run concurrently but parents still follow children.
+        Journal entries for each subcontent are held until it completes, then added to the journal of its parent in one group.
+        """
+        tasks = self.__build_push_tasks(self.pkg_content)
+        errors = []
+        with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix='lmctl-push') as executor:
+            in_flight = {executor.submit(self.__push_task_content, task): task for task in tasks if task.pending_children == 0}
+            while len(in_flight) > 0:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    # Only this (main) thread writes to the journal, so entries from different subcontents never interleave
+                    self.__write_task_journal(task)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.debug('Push of {0} failed: {1}'.format('/'.join(task.path), str(e)))
+                        errors.append(e)
+                        continue
+                    parent = task.parent
+                    if parent is not None:
+                        parent.pending_children -= 1
+                        # Stop starting new pushes once one has failed, those in progress are left to finish
+                        if parent.pending_children == 0 and len(errors) == 0:
+                            in_flight[executor.submit(self.__push_task_content, parent)] = parent
+        if len(errors) > 0:
+            # Parents of a failed subcontent never run, so pass on the entries they hold (deepest first) until they reach this journal
+            for task in reversed(tasks):
+                if not task.written and len(task.journal.entries) > 0:
+                    self.__write_task_journal(task)
+            raise errors[0]
@@ -5,6 +5,7 @@ import lmctl.project.mutate.descriptor as descriptor_mutations
 import lmctl.project.source.config_references as refs
 import lmctl.project.handlers.interface as handlers_api
 from .common import LIFECYCLE_WORKSPACE
+from .build_cache import clean_directory_except
 from lmctl.project.source.config import RootProjectConfig
 
 class StagingTree(files.Tree):
@@ -31,11 +32,12 @@ class StageProcessError(Exception):
 
 class StageProcess:
 
-    def __init__(self, project, options, journal):
+    def __init__(self, project, options, journal, build_cache=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.references = refs.ConfigReferences(self.project.config)
+        self.build_cache = build_cache
 
     def __create_staging_tree(self):
         staging_workspace = os.path.join(self.project.tree.root_path, LIFECYCLE_WORKSPACE, 'staging')
@@ -43,25 +45,35 @@ class StageProcess:
 
     def execute(self):
         staging_tree = self.__create_staging_tree()
-        StageWorker(self.project, self.options, staging_tree, self.journal, self.references).work()
+        StageWorker(self.project, self.options, staging_tree, self.journal, self.references, build_cache=self.build_cache).work()
         return staging_tree
 
 class StageWorker:
 
-    def __init__(self, project, options, staging_tree, journal, references):
+    def __init__(self, project, options, staging_tree, journal, references, build_cache=None):
         self.project = project
         self.options = options
         self.journal = journal
         self.staging_tree = staging_tree
         self.references = references
+        self.build_cache = build_cache
 
     def work(self):
-        self.__prepare_stage_directories()
-        self.__stage_sources()
+        if self.build_cache is not None and self.build_cache.is_unchanged(self.project, self.staging_tree.root_path):
+            self.journal.section('Stage Sources')
+            self.journal.event('No changes to sources of {0} since the last build, reusing staged sources'.format(self.project.config.name))
+        else:
+            self.__prepare_stage_directories()
+            self.__stage_sources()
         self.__stage_child_projects()
 
     def __prepare_stage_directories(self):
-        files.clean_directory(self.staging_tree.root_path)
+        if self.build_cache is None:
+            files.clean_directory(self.staging_tree.root_path)
+        else:
+            # Staged Subprojects are kept, as each decides whether it needs to be staged again
+            subproject_dirs = [subproject.config.directory for subproject in self.project.subprojects]
+            clean_directory_except(self.staging_tree.root_path, StagingTree.CONTAINS_DIR, subproject_dirs)
 
     def __stage_sources(self):
         self.journal.section('Stage Sources')
@@ -86,7 +98,7 @@ class StageWorker:
         for subproject in subprojects:
             self.journal.subproject(subproject.config.name)
             child_staging_tree = self.staging_tree.gen_subproject_staging_tree(subproject.config.directory)
-            StageWorker(subproject, self.options, child_staging_tree, self.journal, self.references).work()
+            StageWorker(subproject, self.options, child_staging_tree, self.journal, self.references, build_cache=self.build_cache).work()
             self.journal.subproject_end(subproject.config.name)
 
 class SourceStager:
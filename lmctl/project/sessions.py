@@ -1,3 +1,6 @@
+import threading
+from lmctl.project.delta import PushTracker
+
 class EnvironmentSelectionError(Exception):
     pass
 
@@ -6,9 +9,14 @@ class EnvironmentSessions:
     def __init__(self, lm=None, arm=None):
         self.__lm = lm
         self.__arm = arm
+        # Content may be pushed from several threads (e.g. parallel push), which all share these sessions
+        self.__lock = threading.Lock()
         self.__lm_updated = False
         self.__arm_updated = False
         self.__brent_updated = False
+        self.push_tracker = PushTracker()
+        # Number of Assembly Configurations/Scenarios of a project which may be created/updated at the same time
+        self.behaviour_sync_workers = 1
 
     @property
     def lm(self):
@@ -23,7 +31,8 @@ class EnvironmentSessions:
         return self.__arm
 
     def mark_lm_updated(self):
-        self.__lm_updated = True
+        with self.__lock:
+            self.__lm_updated = True
 
     def is_lm_updated(self):
         if self.__lm:
@@ -31,7 +40,8 @@ class EnvironmentSessions:
         return False
 
     def mark_arm_updated(self):
-        self.__arm_updated = True
+        with self.__lock:
+            self.__arm_updated = True
 
     def is_arm_updated(self):
         if self.__arm:
@@ -39,7 +49,8 @@ class EnvironmentSessions:
         return False
 
     def mark_brent_updated(self):
-        self.__brent_updated = True
+        with self.__lock:
+            self.__brent_updated = True
 
     def is_brent_updated(self):
         if self.__lm:
@@ -9,10 +9,13 @@ import lmctl.project.processes.staging as stage_exec
 import lmctl.project.processes.compile as compile_exec
 import lmctl.project.processes.pull as pull_exec
 import lmctl.project.processes.package as package_exec
+import lmctl.project.processes.build_cache as build_cache_exec
 import lmctl.project.processes.listelement as list_exec
 import lmctl.project.handlers.interface as handlers_api
 import lmctl.project.handlers.manager as handler_manager
 import lmctl.project.package.core as pkgs
+import lmctl.project.package.compression as compression
+from lmctl.utils.profiling import profiler
 
 ########################
 # Exceptions
@@ -62,12 +65,18 @@ class BuildOptions(ValidateOptions):
 
     def __init__(self):
         super().__init__()
+        # Skip staging/compiling (sub)projects with no source changes since the last incremental build
+        self.incremental = False
+        # Compression of the package and any archives created whilst compiling (e.g. Resource packages)
+        self.compression = compression.CompressionOptions()
 
 
 class PullOptions(Options):
 
     def __init__(self):
         super().__init__()
+        # Number of (sub)projects to fetch content for at the same time (content is always written in order once fetched)
+        self.parallel = 1
 
 ########################
 # Results
@@ -79,6 +88,12 @@ class BuildResult:
         self.pkg = pkg
         self.validation_result = validation_result
 
+class BuildAndPushResult(BuildResult):
+
+    def __init__(self, pkg, validation_result, pkg_content):
+        super().__init__(pkg, validation_result)
+        self.pkg_content = pkg_content
+
 ########################
 # Projects
 ########################
@@ -130,7 +145,7 @@ class Project(ProjectBase):
         project_file_path = tree.project_file_path
         if not os.path.exists(project_file_path):
             raise InvalidProjectError('Could not find project file at path: {0}'.format(project_file_path))
-        with open(project_file_path, 'rt') as f:
+        with open(project_file_path, 'rt') as f, profiler.span('project file', 'yaml', path=project_file_path):
             config_dict = yaml.safe_load(f.read())
         if not config_dict:
             config_dict = {}
@@ -147,7 +162,7 @@ class Project(ProjectBase):
         try:
             potential_descriptor = os.path.join(self.root_path, 'Descriptor', 'assembly.yml')
             if os.path.exists(potential_descriptor):
-                descriptor = descriptor_utils.DescriptorParser().read_from_file(potential_descriptor)
+                descriptor = descriptor_utils.DescriptorParser().read_from_file(potential_descriptor, readonly=True)
                 return descriptor.get_version()
         except Exception as e:
             return None
@@ -173,14 +188,75 @@ class Project(ProjectBase):
         validate_result = self.__do_validate(options, journal)
         if validate_result.has_errors():
             raise BuildValidationError(validate_result)
+        return self.__do_build_validated(options, journal, validate_result)
+
+    def __do_build_validated(self, options, journal, validate_result):
         try:
-            staging_tree = stage_exec.StageProcess(self, options, journal).execute()
-            content_tree = compile_exec.CompileProcess(self, options, staging_tree, journal).execute()
+            build_cache = self.__open_build_cache(options)
+            if build_cache is not None:
+                unchanged_pkg_path = build_cache.unchanged_package(options.compression)
+                if unchanged_pkg_path is not None:
+                    journal.section('Finalise Package')
+                    journal.event('No changes since the last build, using existing package at: {0}'.format(unchanged_pkg_path))
+                    return BuildResult(pkgs.Pkg(unchanged_pkg_path), validate_result)
+            staging_tree = stage_exec.StageProcess(self, options, journal, build_cache=build_cache).execute()
+            content_tree = compile_exec.CompileProcess(self, options, staging_tree, journal, build_cache=build_cache).execute()
             final_pkg = package_exec.PkgProcess(self, options, content_tree, journal).execute()
+            if build_cache is not None:
+                build_cache.record_package(final_pkg, options.compression)
+                build_cache.save()
         except (stage_exec.StageProcessError, compile_exec.CompileProcessError, package_exec.PkgProcessError) as e:
             raise BuildError(str(e)) from e
         return BuildResult(final_pkg, validate_result)
-    
+
+    def __open_build_cache(self, options):
+        if options.incremental:
+            return build_cache_exec.BuildCache(self, compression_options=options.compression)
+        build_cache_exec.discard_build_cache(self)
+        return None
+
+    def build_and_push(self, env_sessions, build_options, push_options):
+        """
+        Build the Project and push it, pushing the content of each (sub)project as soon as it has been compiled so uploads overlap
+        with compiling the rest of the Project. The package is still created and is returned as part of the result
+        """
+        journal = self.__init_journal(build_options.journal_consumer)
+        validate_result = self.__do_validate(build_options, journal)
+        if validate_result.has_errors():
+            raise BuildValidationError(validate_result)
+        try:
+            pkg_meta = package_exec.build_pkg_meta(self.config)
+        except package_exec.PkgProcessError as e:
+            raise BuildError(str(e)) from e
+        if pkg_meta.is_etsi_content():
+            # ETSI packages are onboarded as a whole, so can only be pushed once complete
+            build_result = self.__do_build_validated(build_options, journal, validate_result)
+            pkg_content = build_result.pkg.push(env_sessions, push_options)
+            return BuildAndPushResult(build_result.pkg, validate_result, pkg_content)
+        try:
+            build_cache = self.__open_build_cache(build_options)
+            staging_tree = stage_exec.StageProcess(self, build_options, journal, build_cache=build_cache).execute()
+            compile_process = compile_exec.CompileProcess(self, build_options, staging_tree, journal, build_cache=build_cache)
+            content_tree = compile_process.content_tree
+            pkg_content = pkgs.PkgContent(content_tree.root_path, pkg_meta)
+
+            def compile_and_package(on_compiled):
+                compile_process.on_compiled = on_compiled
+                compile_process.execute()
+                # Compiled content is kept until the uploads from it have completed
+                final_pkg = package_exec.PkgProcess(self, build_options, content_tree, journal, keep_compiled_content=True).execute()
+                if build_cache is not None:
+                    build_cache.record_package(final_pkg, build_options.compression)
+                    build_cache.save()
+                return final_pkg
+
+            final_pkg = pkg_content.push_while_compiling(env_sessions, push_options, compile_and_package)
+        except (stage_exec.StageProcessError, compile_exec.CompileProcessError, package_exec.PkgProcessError) as e:
+            raise BuildError(str(e)) from e
+        if not build_options.incremental:
+            files.remove_directory(content_tree.root_path)
+        return BuildAndPushResult(final_pkg, validate_result, pkg_content)
+
     def pull(self, env_sessions, options):
         journal = self.__init_journal(options.journal_consumer)
         return self.__do_pull(env_sessions, options, journal)
@@ -80,7 +80,9 @@ class TestSuiteExecutionReport:
 
 class TestExecutionReportEntry:
 
-    def __init__(self, test_name, result, detail=None):
+    def __init__(self, test_name, result, detail=None, duration=None):
         self.test_name = test_name
         self.result = result
-        self.detail = detail
\ No newline at end of file
+        self.detail = detail
+        # Seconds taken to execute the test
+        self.duration = duration
\ No newline at end of file
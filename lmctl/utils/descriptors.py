@@ -1,6 +1,11 @@
 import ruamel.yaml as ryaml
+import yaml as pyyaml
 import os
+import copy
+import hashlib
+import threading
 from collections import OrderedDict
+from .profiling import profiler
 
 ASSEMBLY_DESCRIPTOR_TYPE = 'assembly'
 RESOURCE_DESCRIPTOR_TYPE = 'resource'
@@ -10,47 +15,153 @@ TYPE_DESCRIPTOR_TYPE = 'type'
 yaml = ryaml.YAML()
 yaml.default_flow_style = False
 
+# libyaml (C) loader, used for descriptors which are only inspected (not written back). Falls back to the pure Python loader if
+# PyYAML was installed without libyaml
+FastLoader = getattr(pyyaml, 'CSafeLoader', pyyaml.SafeLoader)
+
+# Maximum number of distinct descriptor contents kept by the descriptor cache
+DESCRIPTOR_CACHE_SIZE = 256
+
 class DescriptorParsingError(Exception):
     pass
 
 
+def _round_trip_load(descriptor_yml_str):
+    try:
+        with profiler.span('descriptor', 'yaml'):
+            yml_dict = yaml.load(descriptor_yml_str)
+            if yml_dict is None:
+                yml_dict = yaml.load('description: ')
+    except ryaml.YAMLError as e:
+        raise DescriptorParsingError(str(e)) from e
+    return yml_dict
+
+def _fast_load(descriptor_yml_str):
+    try:
+        with profiler.span('descriptor (fast)', 'yaml'):
+            yml_dict = pyyaml.load(descriptor_yml_str, Loader=FastLoader)
+    except pyyaml.YAMLError as e:
+        raise DescriptorParsingError(str(e)) from e
+    if yml_dict is None:
+        yml_dict = {'description': None}
+    return yml_dict
+
+
+class _DescriptorContent:
+
+    def __init__(self, yml_str):
+        self.yml_str = yml_str
+        self._round_trip = None
+        self._fast = None
+
+    def round_trip(self):
+        # Parsed once, then each caller gets a copy it may modify (copying is much quicker than parsing again)
+        if self._round_trip is None:
+            self._round_trip = _round_trip_load(self.yml_str)
+        return copy.deepcopy(self._round_trip)
+
+    def fast(self):
+        if self._fast is None:
+            self._fast = _fast_load(self.yml_str)
+        return copy.deepcopy(self._fast)
+
+
+class DescriptorCache:
+    """
+    Per-process cache of descriptor files and their parsed content, as the same descriptor is read many times when a Project is
+    validated, staged, compiled and pushed.
+
+    Parsed content is keyed by a hash of the YAML, so copies of a descriptor (e.g. in the staging and build directories) share it.
+    A file is only read again when its modification time or size changes (or it's written with DescriptorParser.write_to_file).
+    The least recently used content is dropped once there are more than `max_entries`. Safe to use from multiple threads.
+    """
+
+    def __init__(self, max_entries=DESCRIPTOR_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._files = {}
+        self._contents = OrderedDict()
+
+    def read_file(self, file_path):
+        path = os.path.abspath(file_path)
+        try:
+            stat_result = os.stat(path)
+        except FileNotFoundError:
+            raise DescriptorReaderException('Could not find descriptor at path: {0}'.format(file_path))
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._lock:
+            file_entry = self._files.get(path)
+            if file_entry is not None and file_entry[0] == signature and file_entry[1] in self._contents:
+                self._contents.move_to_end(file_entry[1])
+                return self._contents[file_entry[1]]
+        with open(path, 'rt') as f:
+            yml_str = f.read()
+        content = self.read_str(yml_str)
+        with self._lock:
+            self._files[path] = (signature, self.__content_key(yml_str))
+        return content
+
+    def read_str(self, yml_str):
+        key = self.__content_key(yml_str)
+        with self._lock:
+            content = self._contents.get(key)
+            if content is None:
+                content = _DescriptorContent(yml_str)
+                self._contents[key] = content
+                while len(self._contents) > self.max_entries:
+                    self._contents.popitem(last=False)
+            else:
+                self._contents.move_to_end(key)
+            return content
+
+    def invalidate(self, file_path):
+        with self._lock:
+            self._files.pop(os.path.abspath(file_path), None)
+
+    def clear(self):
+        with self._lock:
+            self._files = {}
+            self._contents = OrderedDict()
+
+    def __content_key(self, yml_str):
+        return hashlib.sha256(yml_str.encode('utf-8')).hexdigest()
+
+descriptor_cache = DescriptorCache()
+
+
 class DescriptorParser:
+    """
+    Reads descriptors with the round-trip YAML loader, so they can be modified and written back to file. Use `readonly=True` when a descriptor is only inspected (e.g. for its name), to parse it with the quicker libyaml loader instead,
+    but never write those back to file.
+
+    Descriptors are read through the `descriptor_cache`, so each one is only parsed once (by each loader) while it's unchanged.
+    """
 
     def __init__(self):
         pass
 
-    def read_from_file(self, descriptor_path):
-        yml_str = self.__read_yml_str_from_file(descriptor_path)
-        return self.read_from_str(yml_str)
+    def read_from_file(self, descriptor_path, readonly=False):
+        content = descriptor_cache.read_file(descriptor_path)
+        return self.__content_to_descriptor(content, readonly)
 
-    def read_from_file_with_raw(self, descriptor_path):
-        yml_str = self.__read_yml_str_from_file(descriptor_path)
-        return (self.read_from_str(yml_str), yml_str)
+    def read_from_file_with_raw(self, descriptor_path, readonly=False):
+        content = descriptor_cache.read_file(descriptor_path)
+        return (self.__content_to_descriptor(content, readonly), content.yml_str)
 
-    def read_from_str(self, descriptor_yml_str):
-        yml_dict = self.__convert_str_to_dict(descriptor_yml_str)
-        if yml_dict is None:
-            yml_dict = self.__convert_str_to_dict('description: ')
-        return Descriptor(yml_dict)
+    def read_from_str(self, descriptor_yml_str, readonly=False):
+        content = descriptor_cache.read_str(descriptor_yml_str)
+        return self.__content_to_descriptor(content, readonly)
 
-    def __convert_str_to_dict(self, descriptor_yml_str):
-        try:
-            yml_dict = yaml.load(descriptor_yml_str)
-        except ryaml.YAMLError as e:
-            raise DescriptorParsingError(str(e)) from e
-        return yml_dict
-
-    def __read_yml_str_from_file(self, file_path):
-        if os.path.exists(file_path):
-            with open(file_path, 'rt') as f:
-                return f.read()
-        else:
-            raise DescriptorReaderException('Could not find descriptor at path: {0}'.format(file_path))
+    def __content_to_descriptor(self, content, readonly):
+        if readonly:
+            return Descriptor(content.fast())
+        return Descriptor(content.round_trip())
 
     def write_to_file(self, descriptor, descriptor_path):
         descriptor.sort()
         with open(descriptor_path, 'w') as descriptor_file:
             yaml.dump(descriptor.raw, descriptor_file)
+        descriptor_cache.invalidate(descriptor_path)
 
     def write_to_str(self, descriptor):
         descriptor.sort()
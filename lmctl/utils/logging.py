@@ -1,18 +1,25 @@
 import logging.config
-import yaml
-import shutil
-from pkg_resources import resource_string
+import pkgutil
 from pathlib import Path
 from datetime import datetime
 
 def log_dir() -> Path:
   return Path.home().joinpath('.lmctl').joinpath('logs')
 
+_logging_configured = False
+
 def setup_logging(default_level=logging.INFO):
+  # Only once per process (the CLI calls this each time a command is invoked)
+  global _logging_configured
+  if _logging_configured:
+    return
+  _logging_configured = True
 
-  logging_config = resource_string("lmctl.utils", 'logging.yaml')
+  logging_config = pkgutil.get_data('lmctl.utils', 'logging.yaml')
 
   if logging_config is not None:
+    # Imported here, as this module is imported on CLI startup
+    import yaml
     config = yaml.safe_load(logging_config)
     log_dir_path = log_dir()
     log_dir_path.mkdir(parents=True, exist_ok=True)
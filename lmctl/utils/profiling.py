@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import threading
+import functools
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+from .trace_ctx import trace_ctx
+
+PROFILE_ENV_VAR = 'LMCTL_PROFILE'
+# Number of rows (slowest first) included in the summary table
+SUMMARY_MAX_ROWS = 30
+
+def is_profile_requested() -> bool:
+    """
+    Check if profiling has been requested with the LMCTL_PROFILE environment variable. The value may be a flag ("1", "true", "yes")
+    or the path the trace file should be written to
+    """
+    value = os.environ.get(PROFILE_ENV_VAR, '').strip()
+    return len(value) > 0 and value.lower() not in ('0', 'false', 'no')
+
+def requested_trace_path() -> str:
+    value = os.environ.get(PROFILE_ENV_VAR, '').strip()
+    if value.lower() in ('1', 'true', 'yes'):
+        return None
+    return value or None
+
+def profile_dir() -> Path:
+    return Path.home().joinpath('.lmctl').joinpath('profiles')
+
+def default_trace_path() -> str:
+    return str(profile_dir().joinpath(f'lmctl-profile-{datetime.now().strftime("%Y%m%d-%H%M%S")}.json'))
+
+
+class Span:
+    """
+    A timed operation. Attributes (e.g. the status of a HTTP response) can be added with `set` until it's finished
+    """
+
+    def __init__(self, name: str, category: str, attributes: Dict):
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        transaction_id = trace_ctx.get_transaction_id()
+        if transaction_id is not None:
+            self.attributes['transaction_id'] = transaction_id
+        self.start = time.perf_counter()
+        self.end = None
+
+    @property
+    def active(self) -> bool:
+        return True
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def finish(self, **attributes):
+        if self.end is None:
+            self.attributes.update(attributes)
+            self.end = time.perf_counter()
+
+    def duration(self, now: float = None) -> float:
+        end = self.end
+        if end is None:
+            end = now if now is not None else time.perf_counter()
+        return end - self.start
+
+    def __enter__(self) -> 'Span':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self.finish()
+
+
+class _NoopSpan:
+    """
+    Returned while profiling is disabled, so instrumented code costs next to nothing
+    """
+
+    @property
+    def active(self) -> bool:
+        return False
+
+    def set(self, **attributes):
+        pass
+
+    def finish(self, **attributes):
+        pass
+
+    def __enter__(self) -> '_NoopSpan':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Profiler:
+    """
+    Records spans for the operations of an lmctl command (config loading, authentication, requests to CP4NA orchestration, project
+    sections/stages, archive building and YAML parsing) when enabled. Disabled by default.
+
+    Spans can be summarised as a table of the time spent in each operation or written as a Chrome trace file
+    (viewable with chrome://tracing or https://ui.perfetto.dev). Safe to use from multiple threads.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._spans = []
+
+    def enable(self):
+        with self._lock:
+            self.enabled = True
+            self.origin = time.perf_counter()
+            self._spans = []
+
+    def disable(self):
+        self.enabled = False
+
+    def span(self, name: str, category: str, **attributes):
+        """
+        Start a span, which ends when `finish` is called or, when used as a context manager, at the end of the block
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        span = Span(name, category, attributes)
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def summary(self) -> List[Dict]:
+        """
+        Count, total and maximum duration (in seconds) of spans grouped by category and name, the longest total first.
+        Spans not finished yet are included up to now
+        """
+        now = time.perf_counter()
+        groups = {}
+        for span in self.spans:
+            key = (span.category, span.name)
+            group = groups.setdefault(key, {'category': span.category, 'name': span.name, 'count': 0, 'total': 0.0, 'max': 0.0})
+            duration = span.duration(now)
+            group['count'] += 1
+            group['total'] += duration
+            group['max'] = max(group['max'], duration)
+        return sorted(groups.values(), key=lambda g: g['total'], reverse=True)
+
+    def summary_table(self, max_rows: int = SUMMARY_MAX_ROWS) -> str:
+        rows = self.summary()
+        headers = ('Category', 'Operation', 'Count', 'Total (ms)', 'Avg (ms)', 'Max (ms)')
+        lines = []
+        for row in rows[:max_rows]:
+            lines.append((row['category'], row['name'], str(row['count']), f'{row["total"] * 1000:.1f}',
+                          f'{row["total"] * 1000 / row["count"]:.1f}', f'{row["max"] * 1000:.1f}'))
+        widths = [len(h) for h in headers]
+        for line in lines:
+            widths = [max(w, len(value)) for w, value in zip(widths, line)]
+        def format_line(values):
+            return '  '.join(value.ljust(width) if idx < 2 else value.rjust(width) for idx, (value, width) in enumerate(zip(values, widths)))
+        output = [format_line(headers), format_line(tuple('-' * w for w in widths))]
+        output.extend(format_line(line) for line in lines)
+        if len(rows) > max_rows:
+            output.append(f'... {len(rows) - max_rows} more operations in the trace file')
+        output.append(f'Total time: {(time.perf_counter() - self.origin) * 1000:.1f} ms')
+        return '\n'.join(output)
+
+    def to_chrome_trace(self) -> Dict:
+        now = time.perf_counter()
+        pid = os.getpid()
+        events = []
+        thread_names = {}
+        for span in self.spans:
+            thread_names[span.thread_id] = span.thread_name
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self.origin) * 1000000),
+                'dur': round(span.duration(now) * 1000000),
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': span.attributes
+            })
+        for thread_id, thread_name in thread_names.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': thread_name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+        return path
+
+
+profiler = Profiler()
+
+def profiled(name: str, category: str):
+    """
+    Decorator recording a span for every call to the function
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
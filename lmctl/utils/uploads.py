@@ -0,0 +1,207 @@
+import io
+import os
+import uuid
+from typing import Any, Callable, Dict
+
+ProgressCallback = Callable[[int, int], None]
+
+DEFAULT_FILE_CONTENT_TYPE = 'application/octet-stream'
+
+
+def file_size(file_obj) -> int:
+    """
+    Number of bytes left to read from an open file (from its current position)
+    """
+    try:
+        return os.fstat(file_obj.fileno()).st_size - file_obj.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        current_position = file_obj.tell()
+        file_obj.seek(0, os.SEEK_END)
+        end_position = file_obj.tell()
+        file_obj.seek(current_position, os.SEEK_SET)
+        return end_position - current_position
+
+
+def _to_bytes(data) -> bytes:
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    return data
+
+
+class _BytesPart:
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.size = len(data)
+        self.position = 0
+
+    def read(self, size: int) -> bytes:
+        chunk = self.data[self.position:self.position+size]
+        self.position += len(chunk)
+        return chunk
+
+    def seek(self, position: int):
+        self.position = position
+
+
+class _FilePart:
+
+    def __init__(self, file_obj):
+        self.file_obj = file_obj
+        self.start = file_obj.tell()
+        self.size = file_size(file_obj)
+
+    def read(self, size: int) -> bytes:
+        return _to_bytes(self.file_obj.read(size))
+
+    def seek(self, position: int):
+        self.file_obj.seek(self.start + position, os.SEEK_SET)
+
+
+class _StreamReader:
+    """
+    File-like reader over a sequence of parts, reporting progress as they are read.
+
+    Supports `tell` and `seek` so requests/urllib3 can rewind the body if the request has to be re-sent.
+    """
+
+    def __init__(self, parts, progress_callback: ProgressCallback = None):
+        self._parts = parts
+        self.len = sum(part.size for part in parts)
+        self.progress_callback = progress_callback
+        self._position = 0
+        self._part_idx = 0
+
+    def __len__(self) -> int:
+        return self.len
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset = self._position + offset
+        elif whence == os.SEEK_END:
+            offset = self.len + offset
+        offset = max(0, min(offset, self.len))
+        part_start = 0
+        self._part_idx = len(self._parts)
+        for idx, part in enumerate(self._parts):
+            if offset < part_start + part.size:
+                part.seek(offset - part_start)
+                self._part_idx = idx
+                # Parts after this one are read from their start when reached
+                for later_part in self._parts[idx+1:]:
+                    later_part.seek(0)
+                break
+            part_start += part.size
+        self._position = offset
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.len - self._position
+        chunks = []
+        remaining = size
+        while remaining > 0 and self._part_idx < len(self._parts):
+            chunk = self._parts[self._part_idx].read(remaining)
+            if not chunk:
+                self._part_idx += 1
+                continue
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        data = b''.join(chunks)
+        if len(data) > 0:
+            self._position += len(data)
+            if self.progress_callback is not None:
+                self.progress_callback(self._position, self.len)
+        return data
+
+
+class ProgressReader(_StreamReader):
+    """
+    Wraps an open file so it can be sent as the body of a request, reporting progress as it's read
+    """
+
+    def __init__(self, file_obj, progress_callback: ProgressCallback = None):
+        super().__init__([_FilePart(file_obj)], progress_callback=progress_callback)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(len={self.len})'
+
+
+class MultipartEncoder(_StreamReader):
+    """
+    Streams a multipart/form-data body, reading file content from disk as the request is sent.
+
+    Unlike passing `files=` to requests, the body is never held in memory, so the memory used is
+    constant no matter how large the files are. The length of the body is calculated up front, so
+    the request is sent with a Content-Length rather than chunked.
+
+    Fields may be given as a string (or bytes) value, an open file or a tuple of (filename, open file) or
+    (filename, open file, content type), matching the formats accepted by requests for `files=`.
+    """
+
+    def __init__(self, fields: Dict[str, Any], boundary: str = None, progress_callback: ProgressCallback = None):
+        self.fields = fields
+        self.boundary = boundary if boundary is not None else uuid.uuid4().hex
+        super().__init__(self._build_parts(), progress_callback=progress_callback)
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def _build_parts(self):
+        parts = []
+        boundary_line = f'--{self.boundary}\r\n'.encode('utf-8')
+        for name, value in self.fields.items():
+            filename = None
+            content_type = None
+            if isinstance(value, (tuple, list)):
+                filename = value[0]
+                content_type = value[2] if len(value) > 2 else None
+                value = value[1]
+            elif hasattr(value, 'read'):
+                filename = os.path.basename(getattr(value, 'name', name))
+            header = f'Content-Disposition: form-data; name="{name}"'
+            if filename is not None:
+                header += f'; filename="{filename}"\r\nContent-Type: {content_type or DEFAULT_FILE_CONTENT_TYPE}'
+            parts.append(_BytesPart(boundary_line + f'{header}\r\n\r\n'.encode('utf-8')))
+            if hasattr(value, 'read'):
+                parts.append(_FilePart(value))
+            else:
+                parts.append(_BytesPart(_to_bytes(value if isinstance(value, (str, bytes)) else str(value))))
+            parts.append(_BytesPart(b'\r\n'))
+        parts.append(_BytesPart(f'--{self.boundary}--\r\n'.encode('utf-8')))
+        return parts
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(fields={list(self.fields.keys())}, len={self.len})'
+
+
+def format_size(num_bytes: int) -> str:
+    size = float(num_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024 or unit == 'GB':
+            return f'{size:.1f} {unit}' if unit != 'B' else f'{int(size)} {unit}'
+        size /= 1024
+
+
+class UploadProgressReporter:
+    """
+    Progress callback which reports each time the upload passes another `step` percent (and on completion),
+    rather than on every chunk, so it can be written to a journal or console
+    """
+
+    def __init__(self, report: Callable[[str], None], description: str, step: int = 25):
+        self.report = report
+        self.description = description
+        self.step = step
+        self._last_reported = -1
+
+    def __call__(self, bytes_sent: int, total: int):
+        percent = 100 if total <= 0 else int(bytes_sent * 100 / total)
+        reached = percent - (percent % self.step) if percent < 100 else 100
+        if reached > 0 and reached > self._last_reported:
+            self._last_reported = reached
+            self.report(f'Uploaded {reached}% of {self.description} ({format_size(bytes_sent)} of {format_size(total)})')
@@ -6,6 +6,8 @@ import shutil
 import tarfile
 import zipfile
 import tempfile
+from pathlib import Path
+from unittest.mock import patch
 
 WORKSPACE = '_lmctl'
 
@@ -76,6 +78,14 @@ class ProjectSimTestCase(unittest.TestCase):
         self.simlab = ProjectSimLab()
         super().__init__(*args, **kwargs)
         self.maxDiff = None
+
+    def setUp(self):
+        # Every push records its state, so keep it out of the user's home directory
+        self.push_state_dir = tempfile.mkdtemp()
+        push_state_patcher = patch('lmctl.project.delta.push_state_directory', return_value=Path(self.push_state_dir))
+        push_state_patcher.start()
+        self.addCleanup(push_state_patcher.stop)
+        self.addCleanup(shutil.rmtree, self.push_state_dir, True)
     
     def tearDown(self):
         self.simlab.destroySims()
@@ -181,6 +191,9 @@ class PkgAssertions:
         self.tc.assertTrue(os.path.exists(meta_path))
         with open(meta_path, 'r') as meta_file:
             meta_content = yaml.safe_load(meta_file.read())
+        if 'content-hash' not in expected_meta_dict:
+            # The hash of the content depends on every file in the package, so only check one was recorded
+            self.tc.assertRegex(meta_content.pop('content-hash', ''), '^[0-9a-f]{64}$')
         self.tc.assertEqual(meta_content, expected_meta_dict)
 
     def assert_has_directory(self, rel_directory_path):
@@ -939,7 +939,7 @@ class SimResourcePkgDriver:
         finally:
             shutil.rmtree(tmp_dir)
 
-    def onboard_package(self, resource_pkg_path):
+    def onboard_package(self, resource_pkg_path, progress_callback=None):
         package_name = self.__get_resource_type_name(resource_pkg_path)
         try:
             self.sim_lm.add_resource_package(package_name, resource_pkg_path)
@@ -1,5 +1,5 @@
 import unittest
-from lmctl.cli.format import JsonFormat, BadFormatError
+from lmctl.cli.format import JsonFormat, NdjsonFormat, BadFormatError
 
 TEST_JSON_LIST = '''\
 {
@@ -21,6 +21,11 @@ TEST_JSON_ELEMENT='''\
   }
 }'''
 
+TEST_JSONL_LIST = '''\
+"abc"
+123
+{"someObject":{"data":"some data"}}'''
+
 class TestJsonFormat(unittest.TestCase):
 
     def test_convert_list(self):
@@ -28,6 +33,16 @@ class TestJsonFormat(unittest.TestCase):
         output = JsonFormat().convert_list(test_list)
         self.assertEqual(output, TEST_JSON_LIST)
     
+    def test_stream_list(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        fragments = list(JsonFormat().stream_list(iter(test_list)))
+        self.assertEqual(len(fragments), 4)
+        self.assertEqual(''.join(fragments), TEST_JSON_LIST)
+
+    def test_stream_empty_list(self):
+        output = ''.join(JsonFormat().stream_list(iter([])))
+        self.assertEqual(output, JsonFormat().convert_list([]))
+
     def test_convert_element(self):
         element = {'someObject': {'data': 'some data'}}
         output = JsonFormat().convert_element(element)
@@ -40,4 +55,21 @@ class TestJsonFormat(unittest.TestCase):
     def test_read_invalid(self):
         with self.assertRaises(BadFormatError) as context:
             JsonFormat().read('notJson')
-        self.assertTrue('Failed to read content as JSON: ' in str(context.exception))
\ No newline at end of file
+        self.assertTrue('Failed to read content as JSON: ' in str(context.exception))
+
+class TestNdjsonFormat(unittest.TestCase):
+
+    def test_convert_list(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        output = NdjsonFormat().convert_list(test_list)
+        self.assertEqual(output, TEST_JSONL_LIST)
+
+    def test_stream_list(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        fragments = list(NdjsonFormat().stream_list(iter(test_list)))
+        self.assertEqual(len(fragments), 3)
+        self.assertEqual(''.join(fragments), TEST_JSONL_LIST)
+
+    def test_read(self):
+        result = NdjsonFormat().read(TEST_JSONL_LIST + '\n')
+        self.assertEqual(result, ['abc', 123, {'someObject': {'data': 'some data'}}])
@@ -30,6 +30,27 @@ EXPECTED_ELEMENT_NO_HEADER_SET = '''\
 | name   | status   |
 |--------+----------|
 | A      | OK       |'''
+EXPECTED_STREAMED_LIST = '''\
+| Name   | Status    |
+|--------+-----------|
+| A      | OK        |
+| B      | Unhealthy |
+| Longer | OK        |
+| D      | Unhealthy |'''
+
+class NumberTable(Table):
+    columns = [
+        Column('name', header='Name'),
+        Column('count', header='Count')
+    ]
+
+EXPECTED_STREAMED_NUMBERS = '''\
+| Name   |   Count |
+|--------+---------|
+| A      |       1 |
+| B      |      22 |
+| C      |     333 |'''
+
 class TestTableFormat(unittest.TestCase):
     
     def test_convert_list(self):
@@ -51,3 +72,33 @@ class TestTableFormat(unittest.TestCase):
         element = {'name': 'A', 'status': 'Good'}
         output = TableFormat(table=DummyTable()).convert_element(element)
         self.assertEqual(output, EXPECTED_ELEMENT)
+
+    def test_stream_list_within_sample_matches_convert_list(self):
+        test_list = [
+            {'name': 'A', 'status': 'Good'},
+            {'name': 'B', 'status': 'Bad'},
+            {'name': 'C', 'status': 'Excellent'},
+            {'name': 'D'}
+        ]
+        output = ''.join(TableFormat(table=DummyTable()).stream_list(iter(test_list)))
+        self.assertEqual(output, EXPECTED_LIST)
+
+    def test_stream_list_sizes_columns_from_sample(self):
+        test_list = [
+            {'name': 'A', 'status': 'Good'},
+            {'name': 'B', 'status': 'Bad'},
+            {'name': 'Longer', 'status': 'Good'},
+            {'name': 'D'}
+        ]
+        fragments = list(TableFormat(table=DummyTable(), sample_size=2).stream_list(iter(test_list)))
+        self.assertEqual(len(fragments), 3)
+        self.assertEqual(''.join(fragments), EXPECTED_STREAMED_LIST)
+
+    def test_stream_list_right_aligns_numbers_after_sample(self):
+        test_list = [
+            {'name': 'A', 'count': 1},
+            {'name': 'B', 'count': 22},
+            {'name': 'C', 'count': 333}
+        ]
+        output = ''.join(TableFormat(table=NumberTable(), sample_size=2).stream_list(iter(test_list)))
+        self.assertEqual(output, EXPECTED_STREAMED_NUMBERS)
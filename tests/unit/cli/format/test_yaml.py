@@ -21,6 +21,16 @@ class TestYamlFormat(unittest.TestCase):
         output = YamlFormat().convert_list(test_list)
         self.assertEqual(output, TEST_YAML_LIST)
     
+    def test_stream_list(self):
+        test_list = ['abc', 123, {'someObject': {'data': 'some data'}}]
+        fragments = list(YamlFormat().stream_list(iter(test_list)))
+        self.assertEqual(len(fragments), 3)
+        self.assertEqual(''.join(fragments), TEST_YAML_LIST)
+
+    def test_stream_empty_list(self):
+        output = ''.join(YamlFormat().stream_list(iter([])))
+        self.assertEqual(output, YamlFormat().convert_list([]))
+
     def test_convert_element(self):
         element = {'someObject': {'data': 'some data'}}
         output = YamlFormat().convert_element(element)
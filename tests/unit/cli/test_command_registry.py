@@ -0,0 +1,78 @@
+import sys
+import json
+import click
+import subprocess
+import unittest
+from click.testing import CliRunner
+from lmctl.cli.command_index import COMMAND_INDEX
+from lmctl.cli.command_registry import CommandIndex, LazyCommandGroup, build_command_index
+from lmctl.cli.commands.actions import Get
+
+# Modules which must not be imported when lmctl starts, only by the commands that use them
+HEAVY_MODULES = ['requests', 'urllib3', 'pydantic', 'ruamel', 'yaml', 'tabulate', 'jwt', 'pkg_resources', 'lmctl.client', 'lmctl.project', 'lmctl.cli.commands.targets.env']
+
+def imported_heavy_modules(*cli_args, modules=HEAVY_MODULES):
+    script = f'''\
+import sys, json
+from lmctl.cli.entry import cli
+try:
+    cli({list(cli_args)!r}, prog_name='lmctl')
+except SystemExit:
+    pass
+print(json.dumps([m for m in {modules!r} if m in sys.modules]))
+'''
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+class TestCommandIndex(unittest.TestCase):
+
+    def test_index_is_up_to_date(self):
+        self.assertEqual(COMMAND_INDEX, build_command_index(), msg='lmctl/cli/command_index.py is out-of-date, regenerate it with "python -m lmctl.cli.command_registry"')
+
+    def test_load_target_by_name_or_plural(self):
+        command_index = CommandIndex(COMMAND_INDEX)
+        target = command_index.load_target('descriptors')
+        self.assertEqual(target.name, 'descriptor')
+        self.assertIs(command_index.load_target('descriptor'), target)
+        self.assertIsNone(command_index.load_target('notatarget'))
+
+class TestLazyCommandGroup(unittest.TestCase):
+
+    def _build_group(self):
+        @click.group(cls=LazyCommandGroup, command_index=CommandIndex(COMMAND_INDEX))
+        def group():
+            pass
+        return group
+
+    def test_commands_listed_without_loading(self):
+        group = self._build_group()
+        self.assertIn('get', group.list_commands(None))
+        self.assertIn('logdir', group.list_commands(None))
+        self.assertEqual(group.commands, {})
+        result = CliRunner().invoke(group, ['--help'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('logdir', result.output)
+        self.assertEqual(group.commands, {})
+
+    def test_command_loaded_when_invoked(self):
+        group = self._build_group()
+        cmd = group.get_command(None, 'get')
+        self.assertIsInstance(cmd, Get)
+        self.assertIs(group.get_command(None, 'get'), cmd)
+        self.assertIsNone(group.get_command(None, 'notacommand'))
+
+    def test_action_lists_targets_from_index(self):
+        action = Get(target_index=CommandIndex(COMMAND_INDEX))
+        self.assertIn('descriptor', action.list_commands(None))
+        self.assertIsInstance(action.get_command(None, 'descriptors'), click.Command)
+        self.assertIsNone(action.get_command(None, 'notatarget'))
+
+class TestStartupImports(unittest.TestCase):
+
+    def test_help_does_not_import_heavy_modules(self):
+        self.assertEqual(imported_heavy_modules('--help'), [])
+
+    def test_action_help_does_not_import_targets(self):
+        # Logging is configured (from YAML) before any subcommand, even for its help
+        modules = [m for m in HEAVY_MODULES if m != 'yaml']
+        self.assertEqual(imported_heavy_modules('get', '--help', modules=modules), [])
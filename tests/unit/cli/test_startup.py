@@ -0,0 +1,33 @@
+import os
+import sys
+import subprocess
+import unittest
+
+# Budget (in ms) for importing the CLI and printing its help (excludes starting the Python interpreter). Wall-clock time depends on
+# the machine, so the benchmark only runs when a budget is set. Slow imports are caught by default by TestStartupImports in test_command_registry.py
+STARTUP_BUDGET_MS_ENV = 'LMCTL_STARTUP_BUDGET_MS'
+STARTUP_RUNS = 3
+
+BENCHMARK_SCRIPT = '''\
+import time
+start = time.perf_counter()
+from lmctl.cli.entry import cli
+try:
+    cli(['--help'], prog_name='lmctl')
+except SystemExit:
+    pass
+print((time.perf_counter() - start) * 1000)
+'''
+
+def measure_startup_ms() -> float:
+    result = subprocess.run([sys.executable, '-c', BENCHMARK_SCRIPT], capture_output=True, text=True, check=True)
+    return float(result.stdout.splitlines()[-1])
+
+@unittest.skipUnless(os.environ.get(STARTUP_BUDGET_MS_ENV), f'set {STARTUP_BUDGET_MS_ENV} to benchmark startup time')
+class TestStartupBenchmark(unittest.TestCase):
+
+    def test_startup_within_budget(self):
+        budget_ms = float(os.environ[STARTUP_BUDGET_MS_ENV])
+        # Best of a few runs, as the first may be slowed by compiling/caching bytecode
+        startup_ms = min(measure_startup_ms() for _ in range(STARTUP_RUNS))
+        self.assertLess(startup_ms, budget_ms, msg=f'lmctl startup took {startup_ms:.1f}ms, over the budget of {budget_ms}ms')
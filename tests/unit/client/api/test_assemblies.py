@@ -56,6 +56,43 @@ class TestAssembliesAPI(unittest.TestCase):
         self.assertEqual(response, '123')
         self.mock_client.make_request.assert_called_with(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly', headers={'Content-Type': 'application/json'}, body=json.dumps(intent)))
     
+    def test_bulk_intents(self):
+        def make_request(request):
+            intent = json.loads(request.body)
+            return MagicMock(headers={'Location': f'/api/processes/{intent["assemblyName"]}-process'})
+        self.mock_client.make_request.side_effect = make_request
+        intents = [
+            {'intentType': 'createAssembly', 'assemblyName': 'A', 'descriptorName': 'assembly::Test::1.0'},
+            ('scaleOutAssembly', ScaleAssemblyIntent(assembly_name='B', cluster_name='C')),
+            DeleteAssemblyIntent(assembly_name='D')
+        ]
+        results = sorted(self.assemblies.bulk_intents(intents, concurrency=2), key=lambda r: r.index)
+        self.assertEqual(len(results), 3)
+        self.assertEqual([r.process_id for r in results], ['A-process', 'B-process', 'D-process'])
+        self.assertEqual([r.intent_name for r in results], ['createAssembly', 'scaleOutAssembly', 'deleteAssembly'])
+        self.assertTrue(all(r.succeeded for r in results))
+        self.mock_client.make_request.assert_any_call(TNCOClientRequest(method='POST', endpoint='api/intent/createAssembly', headers={'Content-Type': 'application/json'}, body=json.dumps({'assemblyName': 'A', 'descriptorName': 'assembly::Test::1.0'})))
+        self.mock_client.make_request.assert_any_call(TNCOClientRequest(method='POST', endpoint='api/intent/scaleOutAssembly', headers={'Content-Type': 'application/json'}, body=json.dumps({'assemblyName': 'B', 'clusterName': 'C'})))
+        self.mock_client.make_request.assert_any_call(TNCOClientRequest(method='POST', endpoint='api/intent/deleteAssembly', headers={'Content-Type': 'application/json'}, body=json.dumps({'assemblyName': 'D'})))
+        # Original intent dict is not modified
+        self.assertEqual(intents[0]['intentType'], 'createAssembly')
+
+    def test_bulk_intents_reports_errors_per_intent(self):
+        self.mock_client.make_request.return_value = MagicMock(headers={'Location': '/api/processes/123'})
+        intents = [
+            {'assemblyName': 'A'},
+            ScaleAssemblyIntent(assembly_name='B'),
+            {'intentType': 'deleteAssembly', 'assemblyName': 'C'}
+        ]
+        results = sorted(self.assemblies.bulk_intents(intents), key=lambda r: r.index)
+        self.assertFalse(results[0].succeeded)
+        self.assertEqual(str(results[0].error), 'Intent must include "intentType" attribute')
+        self.assertFalse(results[1].succeeded)
+        self.assertEqual(str(results[1].error), 'Cannot determine intent name for ScaleAssemblyIntent, provide it as a tuple of (intent_name, intent)')
+        self.assertTrue(results[2].succeeded)
+        self.assertEqual(results[2].process_id, '123')
+        self.assertEqual(self.mock_client.make_request.call_count, 1)
+
     def test_intent_create(self):
         mock_response = MagicMock(headers={'Location': '/api/processes/123'})
         self.mock_client.make_request.return_value = mock_response
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from lmctl.client.api import ProcessesAPI
 from lmctl.client.client_request import TNCOClientRequest
+from lmctl.client.exceptions import TNCOClientError
 
 class TestProcessesAPI(unittest.TestCase):
 
@@ -29,3 +30,160 @@ class TestProcessesAPI(unittest.TestCase):
         response = self.processes.query(assemblyName='Abc', intentTypes='healAssembly')
         self.assertEqual(response, mock_response)
         self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'assemblyName': 'Abc', 'intentTypes': 'healAssembly'}))
+
+    def test_iter_all_pages_through_processes(self):
+        processes = [{'id': str(i)} for i in range(5)]
+        def respond(request):
+            offset = request.query_params['offset']
+            limit = request.query_params['limit']
+            response = MagicMock()
+            response.json.return_value = processes[offset:offset+limit]
+            return response
+        self.mock_client.make_request.side_effect = respond
+        response = list(self.processes.iter_all(page_size=2, assemblyName='Abc'))
+        self.assertEqual(response, processes)
+        self.assertEqual(self.mock_client.make_request.call_count, 3)
+        self.mock_client.make_request.assert_any_call(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', query_params={'assemblyName': 'Abc', 'limit': 2, 'offset': 4}))
+
+class TestProcessesAPIWaitFor(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_client = MagicMock()
+        self.processes = ProcessesAPI(self.mock_client)
+        self.time_patcher = patch('lmctl.client.api.processes.time')
+        self.mock_time = self.time_patcher.start()
+        self.clock = [0]
+        self.mock_time.monotonic.side_effect = lambda: self.clock[0]
+        def sleep(seconds):
+            self.clock[0] += seconds
+        self.mock_time.sleep.side_effect = sleep
+
+    def tearDown(self):
+        self.time_patcher.stop()
+
+    def _mock_gets(self, statuses_by_id):
+        # Each GET of a process returns the next status in its list (the last status is repeated)
+        calls = {process_id: 0 for process_id in statuses_by_id}
+        def get(request):
+            process_id = request.endpoint.split('/')[-1]
+            statuses = statuses_by_id[process_id]
+            status = statuses[min(calls[process_id], len(statuses)-1)]
+            calls[process_id] += 1
+            response = MagicMock()
+            response.json.return_value = {'id': process_id, 'status': status, 'startTime': '2021-01-01T00:00:00Z', 'assemblyId': 'A'}
+            return response
+        self.mock_client.make_request.side_effect = get
+
+    def test_wait_for_single_process(self):
+        self._mock_gets({'123': ['In Progress', 'In Progress', 'Completed']})
+        result = self.processes.wait_for('123')
+        self.assertEqual(result['123']['status'], 'Completed')
+        self.assertEqual(self.mock_client.make_request.call_count, 3)
+
+    def test_wait_for_backs_off_while_nothing_finishes(self):
+        self._mock_gets({'123': ['In Progress', 'In Progress', 'In Progress', 'In Progress', 'Failed']})
+        result = self.processes.wait_for('123', initial_interval=1, backoff_factor=2, max_interval=3)
+        self.assertEqual(result['123']['status'], 'Failed')
+        sleeps = [c[0][0] for c in self.mock_time.sleep.call_args_list]
+        self.assertEqual(sleeps, [1, 2, 3, 3])
+
+    def test_wait_for_returns_immediately_when_already_finished(self):
+        self._mock_gets({'123': ['Completed'], '456': ['Cancelled']})
+        result = self.processes.wait_for(['123', '456'])
+        self.assertEqual(result['123']['status'], 'Completed')
+        self.assertEqual(result['456']['status'], 'Cancelled')
+        self.mock_time.sleep.assert_not_called()
+
+    def test_wait_for_times_out(self):
+        self._mock_gets({'123': ['In Progress']})
+        with self.assertRaises(TNCOClientError) as context:
+            self.processes.wait_for('123', timeout=5)
+        self.assertEqual(str(context.exception), "Timed out after 5 seconds waiting for Process(es) to finish: ['123']")
+
+    def test_wait_for_multiple_uses_batched_query(self):
+        get_response = MagicMock()
+        get_responses = [
+            {'id': '123', 'status': 'In Progress', 'startTime': '2021-01-01T00:00:02Z', 'assemblyId': 'A'},
+            {'id': '456', 'status': 'In Progress', 'startTime': '2021-01-01T00:00:01Z', 'assemblyId': 'B'}
+        ]
+        query_response = [{'id': '123', 'status': 'Completed'}, {'id': '789', 'status': 'Completed'}]
+        responses = [*get_responses, query_response, {'id': '456', 'status': 'Failed'}]
+        def make_request(request):
+            response = MagicMock()
+            response.json.return_value = responses.pop(0)
+            return response
+        self.mock_client.make_request.side_effect = make_request
+        result = self.processes.wait_for(['123', '456'])
+        self.assertEqual(result['123']['status'], 'Completed')
+        self.assertEqual(result['456']['status'], 'Failed')
+        # Initial GET for each, one query, then a GET for the last remaining process
+        self.assertEqual(self.mock_client.make_request.call_count, 4)
+        self.mock_client.make_request.assert_any_call(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes', 
+                                                        query_params={'processStatuses': 'Completed,Cancelled,Failed', 'startDateTime': '2021-01-01T00:00:01Z', 'limit': 100, 'offset': 0}))
+        # Only one process left so the final check is a GET
+        self.mock_client.make_request.assert_called_with(TNCOClientRequest.build_request_for_json(method='GET', endpoint='api/processes/456', query_params={'shallow': True}))
+
+    def test_wait_for_multiple_falls_back_when_query_fails(self):
+        self._mock_gets({'123': ['In Progress', 'Completed'], '456': ['In Progress', 'Completed']})
+        get_side_effect = self.mock_client.make_request.side_effect
+        def make_request(request):
+            if request.endpoint == 'api/processes':
+                raise TNCOClientError('Mock error')
+            return get_side_effect(request)
+        self.mock_client.make_request.side_effect = make_request
+        result = self.processes.wait_for(['123', '456'])
+        self.assertEqual(result['123']['status'], 'Completed')
+        self.assertEqual(result['456']['status'], 'Completed')
+
+    def _mock_processes(self, statuses_by_id, query):
+        # GETs return the next status of each process (as in _mock_gets); queries are answered by the given function of the query params
+        calls = {process_id: 0 for process_id in statuses_by_id}
+        def make_request(request):
+            response = MagicMock()
+            if request.endpoint == 'api/processes':
+                response.json.return_value = query(request.query_params)
+                return response
+            process_id = request.endpoint.split('/')[-1]
+            statuses = statuses_by_id[process_id]
+            status = statuses[min(calls[process_id], len(statuses)-1)]
+            calls[process_id] += 1
+            response.json.return_value = {'id': process_id, 'status': status, 'startTime': '2021-01-01T00:00:00Z'}
+            return response
+        self.mock_client.make_request.side_effect = make_request
+
+    def test_wait_for_multiple_pages_through_query_until_all_found(self):
+        history = [{'id': str(i), 'status': 'Completed'} for i in range(250)]
+        history.insert(120, {'id': 'a', 'status': 'Completed'})
+        history.insert(150, {'id': 'b', 'status': 'Failed'})
+        queries = []
+        def query(params):
+            queries.append(params)
+            return history[params['offset']:params['offset']+params['limit']]
+        self._mock_processes({'a': ['In Progress'], 'b': ['In Progress']}, query)
+        result = self.processes.wait_for(['a', 'b'])
+        self.assertEqual(result['a']['status'], 'Completed')
+        self.assertEqual(result['b']['status'], 'Failed')
+        # Both found on the second page, so the third is never requested
+        self.assertEqual([q['offset'] for q in queries], [0, 100])
+
+    def test_wait_for_multiple_without_start_times_checks_individually(self):
+        statuses = {'123': ['In Progress', 'Completed'], '456': ['In Progress', 'Completed']}
+        self._mock_gets(statuses)
+        get_side_effect = self.mock_client.make_request.side_effect
+        def make_request(request):
+            response = get_side_effect(request)
+            response.json.return_value.pop('startTime')
+            return response
+        self.mock_client.make_request.side_effect = make_request
+        result = self.processes.wait_for(['123', '456'])
+        self.assertEqual(result['123']['status'], 'Completed')
+        self.assertEqual(result['456']['status'], 'Completed')
+        for c in self.mock_client.make_request.call_args_list:
+            self.assertNotEqual(c[0][0].endpoint, 'api/processes')
+
+    def test_wait_for_multiple_falls_back_when_query_misses_finished_process(self):
+        # The query never returns the processes (e.g. a server capping results), but they have finished
+        self._mock_processes({'123': ['In Progress', 'Completed'], '456': ['In Progress', 'Completed']}, lambda params: [])
+        result = self.processes.wait_for(['123', '456'], timeout=600)
+        self.assertEqual(result['123']['status'], 'Completed')
+        self.assertEqual(result['456']['status'], 'Completed')
@@ -0,0 +1,121 @@
+import unittest
+import asyncio
+import threading
+import time
+import jwt
+from unittest.mock import patch, MagicMock
+from lmctl.client import AsyncTNCOClient, TNCOClientRequest, TNCOClientError, client_builder
+from datetime import datetime, timedelta
+
+class TestAsyncTNCOClient(unittest.TestCase):
+
+    def _get_requests_session(self, mock_requests):
+        return mock_requests.return_value
+
+    def _build_a_token(self, expires_in=30):
+        token_content = {
+            'sub': '1234567890',
+            'name': 'John Doe',
+            'admin': True,
+            'jti': 'c257f98d-f4dd-4fa9-afb4-6329924316f2',
+            'iat': int(datetime.now().strftime('%s')),
+            'exp': int((datetime.now() + timedelta(seconds=expires_in)).strftime('%s'))
+        }
+        return jwt.encode(token_content, 'secret', algorithm='HS256')
+
+    def _build_mocked_auth_type(self, delay=0):
+        mock_auth = MagicMock()
+        self.token = self._build_a_token()
+        def handle(client):
+            time.sleep(delay)
+            return {'token': self.token}
+        mock_auth.handle.side_effect = handle
+        return mock_auth
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request(self, requests_session_builder):
+        async def run():
+            async with AsyncTNCOClient('https://test.example.com') as client:
+                return await client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        response = asyncio.run(run())
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={}, verify=False)
+        self.assertEqual(response, mock_session.request.return_value)
+        mock_session.close.assert_called_once()
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_raises_error(self, requests_session_builder):
+        import requests
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.side_effect = requests.RequestException('Mock error')
+        async def run():
+            async with AsyncTNCOClient('https://test.example.com') as client:
+                await client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        with self.assertRaises(TNCOClientError) as context:
+            asyncio.run(run())
+        self.assertEqual(str(context.exception), 'Mock error')
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_api_groups_are_awaitable(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.return_value.json.return_value = {'id': '123'}
+        async def run():
+            async with AsyncTNCOClient('https://test.example.com') as client:
+                return await asyncio.gather(client.assemblies.get('123'), client.processes.get('456'))
+        assembly, process = asyncio.run(run())
+        self.assertEqual(assembly, {'id': '123'})
+        self.assertEqual(process, {'id': '123'})
+        self.assertEqual(mock_session.request.call_count, 2)
+        mock_session.request.assert_any_call(method='GET', url='https://test.example.com/api/topology/assemblies/123', headers={'Accept': 'application/json'}, verify=False)
+        mock_session.request.assert_any_call(method='GET', url='https://test.example.com/api/processes/456', headers={'Accept': 'application/json'}, verify=False)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_iter_methods_are_async_iterators(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.return_value.json.return_value = [{'id': '1'}, {'id': '2'}]
+        async def run():
+            async with AsyncTNCOClient('https://test.example.com') as client:
+                return [item async for item in client.descriptors.iter_all()]
+        items = asyncio.run(run())
+        self.assertEqual(items, [{'id': '1'}, {'id': '2'}])
+        mock_session.request.assert_called_once()
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_concurrent_requests_share_one_auth_refresh(self, requests_session_builder):
+        mock_auth = self._build_mocked_auth_type(delay=0.1)
+        async def run():
+            async with AsyncTNCOClient('https://test.example.com', auth_type=mock_auth, max_concurrency=5) as client:
+                await asyncio.gather(*[client.make_request(TNCOClientRequest(method='GET', endpoint='api/test')) for _ in range(20)])
+        asyncio.run(run())
+        mock_auth.handle.assert_called_once()
+        mock_session = self._get_requests_session(requests_session_builder)
+        self.assertEqual(mock_session.request.call_count, 20)
+        mock_session.request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={'Authorization': f'Bearer {self.token}'}, verify=False)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_max_concurrency_limits_in_flight_requests(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        lock = threading.Lock()
+        counters = {'current': 0, 'max': 0}
+        def request(**kwargs):
+            with lock:
+                counters['current'] += 1
+                counters['max'] = max(counters['max'], counters['current'])
+            time.sleep(0.02)
+            with lock:
+                counters['current'] -= 1
+            return MagicMock()
+        mock_session.request.side_effect = request
+        async def run():
+            async with AsyncTNCOClient('https://test.example.com', max_concurrency=3) as client:
+                await asyncio.gather(*[client.make_request(TNCOClientRequest(method='GET', endpoint='api/test')) for _ in range(12)])
+        asyncio.run(run())
+        self.assertEqual(mock_session.request.call_count, 12)
+        self.assertLessEqual(counters['max'], 3)
+
+    def test_builder_build_async(self):
+        client = client_builder().address('https://test.example.com').pool_maxsize(7).build_async()
+        self.assertIsInstance(client, AsyncTNCOClient)
+        self.assertEqual(client.address, 'https://test.example.com')
+        self.assertEqual(client.max_concurrency, 7)
+        self.assertEqual(client.sync_client.pool_maxsize, 7)
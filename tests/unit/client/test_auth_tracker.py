@@ -47,4 +47,35 @@ class TestAuthTracker(unittest.TestCase):
         # Expires in 10 minutes
         auth_response = {'token': self._build_a_token(expires_in=600)}
         tracker.accept_auth_response(auth_response)
-        self.assertFalse(tracker.has_access_expired)
\ No newline at end of file
+        self.assertFalse(tracker.has_access_expired)
+
+    def test_expires_within_true_when_no_token(self):
+        tracker = AuthTracker()
+        self.assertTrue(tracker.expires_within(0))
+
+    def test_expires_within(self):
+        tracker = AuthTracker()
+        tracker.accept_auth_response({'token': self._build_a_token(expires_in=10)})
+        self.assertFalse(tracker.expires_within(2))
+        self.assertTrue(tracker.expires_within(20))
+
+    def test_has_access_expired_does_not_wait_when_about_to_expire(self):
+        tracker = AuthTracker()
+        tracker.accept_auth_response({'token': self._build_a_token(expires_in=0.5)})
+        start = time.monotonic()
+        self.assertTrue(tracker.has_access_expired)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_is_refresh_due_false_before_fraction_of_lifetime(self):
+        tracker = AuthTracker(refresh_fraction=0.5)
+        tracker.accept_auth_response({'token': self._build_a_token(expires_in=600)})
+        self.assertFalse(tracker.is_refresh_due)
+        self.assertAlmostEqual(tracker.seconds_until_refresh(), 300, delta=2)
+
+    def test_time_of_refresh_uses_issued_at(self):
+        tracker = AuthTracker(refresh_fraction=0.5)
+        issued_at = datetime.now() - timedelta(seconds=400)
+        token = jwt.encode({'iat': int(issued_at.timestamp()), 'exp': int((issued_at + timedelta(seconds=600)).timestamp())}, 'secret', algorithm='HS256')
+        tracker.accept_auth_response({'token': token})
+        self.assertTrue(tracker.is_refresh_due)
+        self.assertFalse(tracker.has_access_expired)
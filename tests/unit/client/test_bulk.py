@@ -0,0 +1,68 @@
+import unittest
+import threading
+import time
+from lmctl.client.bulk import execute_bulk, RateLimiter
+
+class TestExecuteBulk(unittest.TestCase):
+
+    def test_executes_all_items(self):
+        results = list(execute_bulk(lambda x: x * 2, range(50), concurrency=5))
+        self.assertEqual(len(results), 50)
+        self.assertEqual(sorted(r.result for r in results), [x * 2 for x in range(50)])
+        for r in results:
+            self.assertEqual(r.result, r.item * 2)
+            self.assertEqual(r.index, r.item)
+            self.assertIsNone(r.error)
+
+    def test_captures_errors_per_item(self):
+        def func(x):
+            if x % 2 == 0:
+                raise ValueError(f'Bad {x}')
+            return x
+        results = sorted(execute_bulk(func, range(6), concurrency=3), key=lambda r: r.index)
+        self.assertEqual([r.result for r in results], [None, 1, None, 3, None, 5])
+        self.assertEqual(str(results[0].error), 'Bad 0')
+        self.assertIsNone(results[1].error)
+
+    def test_limits_concurrency(self):
+        lock = threading.Lock()
+        counters = {'current': 0, 'max': 0}
+        def func(x):
+            with lock:
+                counters['current'] += 1
+                counters['max'] = max(counters['max'], counters['current'])
+            time.sleep(0.01)
+            with lock:
+                counters['current'] -= 1
+        list(execute_bulk(func, range(20), concurrency=4))
+        self.assertLessEqual(counters['max'], 4)
+
+    def test_reads_items_lazily(self):
+        consumed = []
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+        results = execute_bulk(lambda x: x, items(), concurrency=2)
+        next(results)
+        self.assertLess(len(consumed), 100)
+        results.close()
+
+    def test_fails_with_invalid_concurrency(self):
+        with self.assertRaises(ValueError) as context:
+            list(execute_bulk(lambda x: x, range(2), concurrency=0))
+        self.assertEqual(str(context.exception), 'Concurrency must be at least 1 but was 0')
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_spaces_out_calls(self):
+        limiter = RateLimiter(50)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_fails_with_invalid_rate(self):
+        with self.assertRaises(ValueError) as context:
+            RateLimiter(0)
+        self.assertEqual(str(context.exception), 'Rate limit must be greater than zero but was 0')
@@ -1,10 +1,14 @@
 import unittest
+import io
 import requests
 import json
 import jwt
+import time
+import threading
 from unittest.mock import patch, MagicMock, Mock
 from lmctl.client import TNCOClient, TNCOClientError, TNCOClientHttpError, TNCOErrorCapture, TNCOClientRequest
 from datetime import datetime, timedelta
+from lmctl.utils.profiling import profiler
 
 class TestTNCOClient(unittest.TestCase):
 
@@ -32,6 +36,74 @@ class TestTNCOClient(unittest.TestCase):
         client = TNCOClient('https://test.example.com/')
         self.assertEqual(client.address, 'https://test.example.com')
 
+    @patch('lmctl.client.client.requests.Session')
+    def test_uses_sessions_by_default(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com')
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        requests_session_builder.assert_called_once()
+        mock_session = self._get_requests_session(requests_session_builder)
+        self.assertEqual(mock_session.request.call_count, 2)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_session_created_once_for_concurrent_requests(self, requests_session_builder):
+        def build_session():
+            # Slow to create, so every thread makes its first request before the session exists
+            time.sleep(0.05)
+            return MagicMock()
+        requests_session_builder.side_effect = build_session
+        client = TNCOClient('https://test.example.com')
+        start = threading.Barrier(5)
+        def make_request():
+            start.wait()
+            client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        threads = [threading.Thread(target=make_request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        requests_session_builder.assert_called_once()
+
+    @patch('lmctl.client.client.HTTPAdapter')
+    @patch('lmctl.client.client.requests.Session')
+    def test_session_mounts_pooled_adapter(self, requests_session_builder, mock_adapter_builder):
+        client = TNCOClient('https://test.example.com', pool_connections=5, pool_maxsize=20, max_retries=2)
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        mock_adapter_builder.assert_called_once()
+        adapter_kwargs = mock_adapter_builder.call_args.kwargs
+        self.assertEqual(adapter_kwargs['pool_connections'], 5)
+        self.assertEqual(adapter_kwargs['pool_maxsize'], 20)
+        self.assertEqual(adapter_kwargs['max_retries'].total, 2)
+        self.assertEqual(adapter_kwargs['max_retries'].status_forcelist, (502, 503, 504))
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.mount.assert_any_call('https://', mock_adapter_builder.return_value)
+        mock_session.mount.assert_any_call('http://', mock_adapter_builder.return_value)
+
+    @patch('lmctl.client.client.requests.request')
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_without_sessions(self, requests_session_builder, mock_request):
+        client = TNCOClient('https://test.example.com', use_sessions=False)
+        response = client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        requests_session_builder.assert_not_called()
+        mock_request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={}, verify=False)
+        self.assertEqual(response, mock_request.return_value)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_close_releases_session(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com')
+        client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        client.close()
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.close.assert_called_once()
+        self.assertIsNone(client._session)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_context_manager_closes_session(self, requests_session_builder):
+        with TNCOClient('https://test.example.com') as client:
+            client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.close.assert_called_once()
+
     @patch('lmctl.client.client.requests.Session')
     def test_make_request(self, requests_session_builder):
         client = TNCOClient('https://test.example.com', use_sessions=True)
@@ -48,6 +120,54 @@ class TestTNCOClient(unittest.TestCase):
         mock_session.request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={}, verify=False)
         self.assertEqual(response, mock_session.request.return_value.json.return_value)
 
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_request_streams_files_as_multipart_body(self, requests_session_builder):
+        client = TNCOClient('https://test.example.com', use_sessions=True)
+        progress = []
+        file_obj = io.BytesIO(b'package-content')
+        request = TNCOClientRequest(method='POST', endpoint='api/test').add_files({'file': ('pkg.zip', file_obj)})
+        request.add_upload_progress_callback(lambda sent, total: progress.append((sent, total)))
+        client.make_request(request)
+        mock_session = self._get_requests_session(requests_session_builder)
+        call_kwargs = mock_session.request.call_args[1]
+        self.assertNotIn('files', call_kwargs)
+        body = call_kwargs['data']
+        self.assertEqual(call_kwargs['headers']['Content-Type'], body.content_type)
+        content = body.read()
+        self.assertIn(b'Content-Disposition: form-data; name="file"; filename="pkg.zip"', content)
+        self.assertIn(b'package-content', content)
+        self.assertEqual(progress[-1], (len(content), len(content)))
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_raw_request_returns_error_response(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        mock_session.request.return_value.status_code = 404
+        client = TNCOClient('https://test.example.com')
+        response = client.make_raw_request(TNCOClientRequest(method='GET', override_address='https://other.example.com/api/test'))
+        self.assertEqual(response, mock_session.request.return_value)
+        mock_session.request.return_value.raise_for_status.assert_not_called()
+        mock_session.request.assert_called_once_with(method='GET', url='https://other.example.com/api/test', headers={}, verify=False)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_make_raw_request_recorded_when_profiling(self, requests_session_builder):
+        mock_session = self._get_requests_session(requests_session_builder)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": "123"}'
+        response.elapsed = timedelta(milliseconds=20)
+        mock_session.request.return_value = response
+        client = TNCOClient('https://test.example.com')
+        profiler.enable()
+        try:
+            client.make_raw_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+            spans = profiler.spans
+        finally:
+            profiler.disable()
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(spans[0].category, 'http')
+        self.assertEqual(spans[0].name, 'GET api/test')
+        self.assertEqual(spans[0].attributes, {'method': 'GET', 'endpoint': 'api/test', 'status': 200, 'bytes': 13, 'elapsed_ms': 20.0})
+
     @patch('lmctl.client.client.requests.Session')
     def test_make_request_for_json_fails_when_cannot_parse(self, requests_session_builder):
         mock_session = self._get_requests_session(requests_session_builder)
@@ -79,6 +199,59 @@ class TestTNCOClient(unittest.TestCase):
         mock_session = self._get_requests_session(requests_session_builder)
         mock_session.request.assert_called_with(method='GET', url='https://test.example.com/api/test', headers={'Authorization': f'Bearer {self.token}'}, verify=False)
 
+    def test_get_access_token_renews_in_background_when_refresh_due(self):
+        # Issued 190 seconds ago and valid for another 10 seconds, so past the point it should be renewed
+        first_token = jwt.encode({'iat': int(time.time()) - 190, 'exp': int(time.time()) + 10}, 'secret', algorithm='HS256')
+        second_token = self._build_a_token(expires_in=600)
+        handle_started = threading.Event()
+        release_handle = threading.Event()
+        def handle(client):
+            if mock_auth.handle.call_count == 1:
+                return {'token': first_token}
+            handle_started.set()
+            release_handle.wait(5)
+            return {'token': second_token}
+        mock_auth = MagicMock()
+        mock_auth.handle.side_effect = handle
+        client = TNCOClient('https://test.example.com', auth_type=mock_auth)
+        self.assertEqual(client.get_access_token(), first_token)
+        # Refresh is due but the token is still valid, so it's returned without waiting for the renewal
+        for _ in range(5):
+            self.assertEqual(client.get_access_token(), first_token)
+        self.assertTrue(handle_started.wait(5))
+        release_handle.set()
+        client._refresh_thread.join(5)
+        self.assertEqual(mock_auth.handle.call_count, 2)
+        self.assertEqual(client.get_access_token(), second_token)
+
+    def test_get_access_token_concurrent_expiry_authenticates_once(self):
+        mock_auth = MagicMock()
+        def handle(client):
+            time.sleep(0.1)
+            return {'token': self._build_a_token(expires_in=600)}
+        mock_auth.handle.side_effect = handle
+        client = TNCOClient('https://test.example.com', auth_type=mock_auth)
+        threads = [threading.Thread(target=client.get_access_token) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        mock_auth.handle.assert_called_once()
+
+    def test_background_token_refresh_renews_on_timer(self):
+        mock_auth = MagicMock()
+        mock_auth.handle.side_effect = lambda client: {'token': self._build_a_token(expires_in=2)}
+        client = TNCOClient('https://test.example.com', auth_type=mock_auth, token_refresh_fraction=0.05, background_token_refresh=True)
+        try:
+            client.get_access_token()
+            deadline = time.monotonic() + 5
+            while mock_auth.handle.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            self.assertGreaterEqual(mock_auth.handle.call_count, 2)
+        finally:
+            client.close()
+        self.assertIsNone(client._refresh_timer)
+
     @patch('lmctl.client.client.requests.Session')
     def test_make_request_with_auth_but_inject_current_auth_false(self, requests_session_builder):
         mock_auth = self._build_mocked_auth_type()
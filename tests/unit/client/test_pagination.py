@@ -0,0 +1,97 @@
+import unittest
+import threading
+from lmctl.client.pagination import iterate_pages, OffsetPaging
+
+class PagedServer:
+
+    def __init__(self, items, ignore_offset=False, ignore_limit=False):
+        self.items = items
+        self.ignore_offset = ignore_offset
+        self.ignore_limit = ignore_limit
+        self.requests = []
+
+    def fetch(self, params):
+        self.requests.append(params)
+        if 'limit' not in params or self.ignore_limit:
+            return list(self.items)
+        offset = 0 if self.ignore_offset else params['offset']
+        return self.items[offset:offset+params['limit']]
+
+class TestIteratePages(unittest.TestCase):
+
+    def test_without_paging_makes_single_request(self):
+        server = PagedServer(list(range(7)))
+        self.assertEqual(list(iterate_pages(server.fetch)), list(range(7)))
+        self.assertEqual(server.requests, [{}])
+
+    def test_pages_until_short_page(self):
+        server = PagedServer(list(range(7)))
+        result = list(iterate_pages(server.fetch, paging=OffsetPaging(), page_size=3))
+        self.assertEqual(result, list(range(7)))
+        self.assertEqual(server.requests, [{'limit': 3, 'offset': 0}, {'limit': 3, 'offset': 3}, {'limit': 3, 'offset': 6}])
+
+    def test_pages_until_empty_page(self):
+        server = PagedServer(list(range(6)))
+        result = list(iterate_pages(server.fetch, paging=OffsetPaging(), page_size=3, prefetch=False))
+        self.assertEqual(result, list(range(6)))
+        self.assertEqual(len(server.requests), 3)
+
+    def test_items_yielded_before_all_pages_retrieved(self):
+        server = PagedServer(list(range(9)))
+        iterator = iterate_pages(server.fetch, paging=OffsetPaging(), page_size=3, prefetch=False)
+        self.assertEqual(next(iterator), 0)
+        # Without prefetch, only the first page has been requested
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(next(iterator), 1)
+        self.assertEqual(next(iterator), 2)
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(next(iterator), 3)
+        self.assertEqual(len(server.requests), 2)
+        iterator.close()
+
+    def test_prefetches_next_page_in_background(self):
+        fetch_threads = []
+        server = PagedServer(list(range(6)))
+        def fetch(params):
+            fetch_threads.append(threading.current_thread().name)
+            return server.fetch(params)
+        result = list(iterate_pages(fetch, paging=OffsetPaging(), page_size=3))
+        self.assertEqual(result, list(range(6)))
+        self.assertTrue(all(name.startswith('lmctl-page') for name in fetch_threads))
+
+    def test_falls_back_to_single_request_when_offset_ignored(self):
+        server = PagedServer(list(range(7)), ignore_offset=True)
+        result = list(iterate_pages(server.fetch, paging=OffsetPaging(), page_size=3))
+        self.assertEqual(result, list(range(7)))
+        self.assertEqual(server.requests[-1], {})
+
+    def test_treats_oversized_page_as_full_result(self):
+        server = PagedServer(list(range(7)), ignore_limit=True)
+        result = list(iterate_pages(server.fetch, paging=OffsetPaging(), page_size=3))
+        self.assertEqual(result, list(range(7)))
+        self.assertEqual(len(server.requests), 1)
+
+    def test_ends_when_result_shifts_between_requests(self):
+        # A busy server ignoring offset, with new items arriving before every request, so each full page differs from the last
+        server = PagedServer([{'id': 'item{0}'.format(i)} for i in range(1000)], ignore_offset=True)
+        def fetch(params):
+            server.items.insert(0, {'id': 'new{0}'.format(len(server.requests))})
+            return server.fetch(params)
+        result = list(iterate_pages(fetch, paging=OffsetPaging(), page_size=100, prefetch=False))
+        result_ids = [item['id'] for item in result]
+        self.assertEqual(len(result_ids), len(set(result_ids)))
+        self.assertLessEqual(len(result_ids), len(server.items))
+        self.assertEqual(server.requests[-1], {})
+        self.assertEqual(len(server.requests), 3)
+
+    def test_does_not_repeat_items_shifted_onto_next_page(self):
+        server = PagedServer([{'id': i} for i in range(7)])
+        def fetch(params):
+            if params.get('offset') == 3:
+                # An item was added at the start, so the last item of the first page is returned again
+                server.items.insert(0, {'id': 'new'})
+            return server.fetch(params)
+        result = list(iterate_pages(fetch, paging=OffsetPaging(), page_size=3, prefetch=False))
+        result_ids = [item['id'] for item in result]
+        self.assertEqual(len(result_ids), len(set(result_ids)))
+        self.assertEqual(sorted(str(item_id) for item_id in result_ids), sorted(str(item['id']) for item in server.items))
@@ -0,0 +1,126 @@
+import unittest
+import os
+import time
+import shutil
+import tempfile
+import requests
+from unittest.mock import patch
+from lmctl.client import TNCOClient
+from lmctl.client.client import build_default_response_cache
+from lmctl.client.response_cache import ResponseCache
+
+def _build_response(status_code=200, content=b'{}', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_only_get_requests_in_scope_are_cacheable(self):
+        cache = ResponseCache(self.tmp_dir, ttls={'api/catalog/descriptors': 60})
+        self.assertTrue(cache.is_cacheable('GET', 'api/catalog/descriptors/assembly::A::1.0', {}))
+        self.assertFalse(cache.is_cacheable('PUT', 'api/catalog/descriptors/assembly::A::1.0', {}))
+        self.assertFalse(cache.is_cacheable('GET', 'api/processes', {}))
+        self.assertFalse(cache.is_cacheable('GET', 'api/catalog/descriptorsX', {}))
+
+    def test_requests_for_private_keys_are_not_cacheable(self):
+        cache = ResponseCache(self.tmp_dir, ttls={'api/resource-manager/infrastructure-keys/shared': 60})
+        self.assertFalse(cache.is_cacheable('GET', 'api/resource-manager/infrastructure-keys/shared', {'includePrivateKey': True}))
+        self.assertTrue(cache.is_cacheable('GET', 'api/resource-manager/infrastructure-keys/shared', {'includePrivateKey': False}))
+
+    def test_store_and_lookup(self):
+        cache = ResponseCache(self.tmp_dir, ttls={'api/catalog/descriptors': 60})
+        response = _build_response(content=b'{"name": "A"}', headers={'Content-Type': 'application/json', 'etag': '"v1"'})
+        cache.store('https://tnco', 'api/catalog/descriptors/A', 'https://tnco/api/catalog/descriptors/A', {}, 'application/json', response)
+        entry = cache.lookup('https://tnco', 'api/catalog/descriptors/A', 'https://tnco/api/catalog/descriptors/A', {}, 'application/json')
+        self.assertTrue(entry.is_fresh())
+        self.assertEqual(entry.validation_headers(), {'If-None-Match': '"v1"'})
+        cached_response = entry.to_response()
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response.json(), {'name': 'A'})
+        self.assertIsNone(cache.lookup('https://other-tnco', 'api/catalog/descriptors/A', 'https://other-tnco/api/catalog/descriptors/A', {}, 'application/json'))
+        self.assertIsNone(cache.lookup('https://tnco', 'api/catalog/descriptors/A', 'https://tnco/api/catalog/descriptors/A', {}, 'application/yaml'))
+
+    def test_invalidate_removes_scope_only(self):
+        cache = ResponseCache(self.tmp_dir, ttls={'api/catalog/descriptors': 60, 'api/resource-manager/deployment-locations': 60})
+        cache.store('https://tnco', 'api/catalog/descriptors/A', 'https://tnco/api/catalog/descriptors/A', {}, '', _build_response())
+        cache.store('https://tnco', 'api/resource-manager/deployment-locations', 'https://tnco/api/resource-manager/deployment-locations', {}, '', _build_response())
+        cache.invalidate('https://tnco', 'api/catalog/descriptors/B')
+        self.assertIsNone(cache.lookup('https://tnco', 'api/catalog/descriptors/A', 'https://tnco/api/catalog/descriptors/A', {}, ''))
+        self.assertIsNotNone(cache.lookup('https://tnco', 'api/resource-manager/deployment-locations', 'https://tnco/api/resource-manager/deployment-locations', {}, ''))
+
+    def test_least_recently_used_entries_evicted_when_over_max_bytes(self):
+        cache = ResponseCache(self.tmp_dir, ttls={'api/catalog/descriptors': 60}, max_bytes=2500)
+        content = b'x' * 500
+        for name in ['A', 'B']:
+            cache.store('https://tnco', f'api/catalog/descriptors/{name}', f'https://tnco/api/catalog/descriptors/{name}', {}, '', _build_response(content=content))
+        # Make A the least recently used
+        path_a = cache.lookup('https://tnco', 'api/catalog/descriptors/A', 'https://tnco/api/catalog/descriptors/A', {}, '').path
+        past = time.time() - 100
+        os.utime(path_a, (past, past))
+        for name in ['C', 'D']:
+            cache.store('https://tnco', f'api/catalog/descriptors/{name}', f'https://tnco/api/catalog/descriptors/{name}', {}, '', _build_response(content=content))
+        self.assertFalse(os.path.exists(path_a))
+        self.assertIsNotNone(cache.lookup('https://tnco', 'api/catalog/descriptors/D', 'https://tnco/api/catalog/descriptors/D', {}, ''))
+        total_size = sum(os.path.getsize(os.path.join(self.tmp_dir, f)) for f in os.listdir(self.tmp_dir))
+        self.assertLessEqual(total_size, 2500)
+
+class TestTNCOClientWithResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = build_default_response_cache(directory=self.tmp_dir)
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_fresh_response_returned_from_cache(self, requests_session_builder):
+        mock_session = requests_session_builder.return_value
+        mock_session.request.return_value = _build_response(content=b'[{"name": "A"}]')
+        client = TNCOClient('https://test.example.com', response_cache=self.cache)
+        self.assertEqual(client.descriptors.all(), [{'name': 'A'}])
+        self.assertEqual(client.descriptors.all(), [{'name': 'A'}])
+        self.assertEqual(mock_session.request.call_count, 1)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_expired_response_revalidated(self, requests_session_builder):
+        mock_session = requests_session_builder.return_value
+        mock_session.request.return_value = _build_response(content=b'[{"name": "A"}]', headers={'ETag': '"v1"'})
+        client = TNCOClient('https://test.example.com', response_cache=self.cache)
+        client.descriptors.all()
+        with patch('lmctl.client.response_cache.time.time', return_value=time.time() + 3600):
+            mock_session.request.return_value = _build_response(status_code=304, content=b'')
+            self.assertEqual(client.descriptors.all(), [{'name': 'A'}])
+        self.assertEqual(mock_session.request.call_count, 2)
+        self.assertEqual(mock_session.request.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_write_invalidates_cached_responses(self, requests_session_builder):
+        mock_session = requests_session_builder.return_value
+        mock_session.request.return_value = _build_response(content=b'[{"name": "A"}]')
+        client = TNCOClient('https://test.example.com', response_cache=self.cache)
+        client.descriptors.all()
+        client.descriptors.update({'name': 'A'})
+        client.descriptors.all()
+        self.assertEqual(mock_session.request.call_count, 3)
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_uncacheable_api_not_cached(self, requests_session_builder):
+        mock_session = requests_session_builder.return_value
+        mock_session.request.return_value = _build_response(content=b'{}')
+        client = TNCOClient('https://test.example.com', response_cache=self.cache)
+        client.assemblies.get('123')
+        client.assemblies.get('123')
+        self.assertEqual(mock_session.request.call_count, 2)
+        self.assertEqual(os.listdir(self.tmp_dir), [])
@@ -0,0 +1,112 @@
+import unittest
+import os
+import stat
+import time
+import shutil
+import tempfile
+import jwt
+import requests
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from lmctl.client import TNCOClient, TNCOClientRequest, TNCOClientHttpError, ClientCredentialsAuth, UserPassAuth, JwtTokenAuth
+from lmctl.client.token_cache import TokenCache
+
+def _build_a_token(expires_in=600):
+    token_content = {
+        'sub': '1234567890',
+        'iat': int(datetime.now().strftime('%s')),
+        'exp': int((datetime.now() + timedelta(seconds=expires_in)).strftime('%s'))
+    }
+    return jwt.encode(token_content, 'secret', algorithm='HS256')
+
+class TestTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'tokens')
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_put_and_get(self):
+        cache = TokenCache(self.cache_dir)
+        cache.put('key', 'token', time.time() + 600)
+        self.assertEqual(cache.get('key'), 'token')
+        self.assertIsNone(cache.get('other-key'))
+
+    def test_get_ignores_token_expiring_soon(self):
+        cache = TokenCache(self.cache_dir, min_validity_seconds=30)
+        cache.put('key', 'token', time.time() + 10)
+        self.assertIsNone(cache.get('key'))
+
+    def test_files_only_accessible_by_user(self):
+        cache = TokenCache(self.cache_dir)
+        cache.put('key', 'token', time.time() + 600)
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_dir).st_mode), 0o700)
+        file_names = os.listdir(self.cache_dir)
+        self.assertEqual(len(file_names), 1)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(self.cache_dir, file_names[0])).st_mode), 0o600)
+
+    def test_secrets_not_written_to_disk(self):
+        cache = TokenCache(self.cache_dir)
+        auth = ClientCredentialsAuth(client_id='MyClient', client_secret='sosecret')
+        cache.put(auth.token_cache_key(TNCOClient('https://tnco')), 'token', time.time() + 600)
+        file_name = os.listdir(self.cache_dir)[0]
+        with open(os.path.join(self.cache_dir, file_name), 'r') as f:
+            content = f.read()
+        self.assertNotIn('sosecret', file_name + content)
+
+class TestTNCOClientWithTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.token_cache = TokenCache(self.tmp_dir)
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def _build_client(self, auth_type):
+        auth_type.handle = MagicMock(return_value={'accessToken': _build_a_token()})
+        return TNCOClient('https://tnco', auth_type=auth_type, token_cache=self.token_cache)
+
+    def test_token_shared_between_clients(self):
+        first_client = self._build_client(ClientCredentialsAuth(client_id='MyClient', client_secret='secret'))
+        token = first_client.get_access_token()
+        second_client = self._build_client(ClientCredentialsAuth(client_id='MyClient', client_secret='secret'))
+        self.assertEqual(second_client.get_access_token(), token)
+        first_client.auth_type.handle.assert_called_once()
+        second_client.auth_type.handle.assert_not_called()
+
+    def test_token_not_shared_when_credentials_differ(self):
+        first_client = self._build_client(ClientCredentialsAuth(client_id='MyClient', client_secret='secret'))
+        first_client.get_access_token()
+        second_client = self._build_client(ClientCredentialsAuth(client_id='MyClient', client_secret='changed'))
+        second_client.get_access_token()
+        second_client.auth_type.handle.assert_called_once()
+
+    def test_token_auth_not_cached(self):
+        client = TNCOClient('https://tnco', auth_type=JwtTokenAuth(token=_build_a_token()), token_cache=self.token_cache)
+        client.get_access_token()
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_keys_differ_by_auth_type_and_address(self):
+        client = TNCOClient('https://tnco')
+        other_client = TNCOClient('https://other-tnco')
+        client_creds = ClientCredentialsAuth(client_id='MyClient', client_secret='secret')
+        user_pass = UserPassAuth(username='user', password='pass', client_id='MyClient', client_secret='secret')
+        self.assertNotEqual(client_creds.token_cache_key(client), client_creds.token_cache_key(other_client))
+        self.assertNotEqual(client_creds.token_cache_key(client), user_pass.token_cache_key(client))
+
+    @patch('lmctl.client.client.requests.Session')
+    def test_cached_token_removed_on_unauthorized_response(self, requests_session_builder):
+        mock_session = requests_session_builder.return_value
+        unauthorized_response = requests.Response()
+        unauthorized_response.status_code = 401
+        unauthorized_response._content = b''
+        mock_session.request.return_value = unauthorized_response
+        client = self._build_client(ClientCredentialsAuth(client_id='MyClient', client_secret='secret'))
+        with self.assertRaises(TNCOClientHttpError):
+            client.make_request(TNCOClientRequest(method='GET', endpoint='api/test'))
+        self.assertEqual(os.listdir(self.tmp_dir), [])
@@ -0,0 +1,116 @@
+import unittest
+import tempfile
+import os
+import shutil
+import stat
+from unittest.mock import patch
+from pydantic import parse_obj_as
+from lmctl.config import Config, ConfigIO, ConfigCache, ConfigError, build_default_config_cache, NO_CONFIG_CACHE_ENV_VAR
+from lmctl.config.config import LazyEnvironmentGroups
+from lmctl.config.cache import file_signature
+from lmctl.environment import EnvironmentGroup, TNCOEnvironment
+from .config_files import ConfigFileTestHelper
+
+class TestConfigCache(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.test_helper = ConfigFileTestHelper(self.tmp_dir)
+
+    def tearDown(self):
+        if self.tmp_dir and os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_put_and_get(self):
+        config_path = self.test_helper.prepare_file('simple-config')
+        cache = ConfigCache(self.cache_dir)
+        signature = file_signature(config_path)
+        cache.put(config_path, signature, {'environments': {'test': {'name': 'test'}}})
+        self.assertEqual(cache.get(config_path, signature), {'environments': {'test': {'name': 'test'}}})
+        cache_files = os.listdir(self.cache_dir)
+        self.assertEqual(len(cache_files), 1)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(self.cache_dir, cache_files[0])).st_mode), 0o600)
+
+    def test_get_returns_none_when_file_changed(self):
+        config_path = self.test_helper.prepare_file('simple-config')
+        cache = ConfigCache(self.cache_dir)
+        signature = file_signature(config_path)
+        cache.put(config_path, signature, {'environments': {}})
+        self.assertIsNone(cache.get(config_path, (signature[0] + 1, signature[1])))
+        self.assertIsNone(cache.get(config_path, (signature[0], signature[1] + 1)))
+        self.assertIsNone(cache.get(config_path, None))
+
+    def test_put_ignores_config_which_cannot_be_stored_as_json(self):
+        config_path = self.test_helper.prepare_file('simple-config')
+        cache = ConfigCache(self.cache_dir)
+        signature = file_signature(config_path)
+        cache.put(config_path, signature, {'environments': {'test': {'arms': {1: {}}}}})
+        self.assertIsNone(cache.get(config_path, signature))
+
+    def test_build_default_config_cache_disabled_by_env_var(self):
+        with patch.dict(os.environ, {NO_CONFIG_CACHE_ENV_VAR: 'true'}):
+            self.assertIsNone(build_default_config_cache(self.cache_dir))
+        self.assertIsInstance(build_default_config_cache(self.cache_dir), ConfigCache)
+
+
+class TestConfigIOWithCache(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.test_helper = ConfigFileTestHelper(self.tmp_dir)
+
+    def tearDown(self):
+        if self.tmp_dir and os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_file_to_config_from_cache_matches_file(self):
+        config_path = self.test_helper.prepare_file('simple-config')
+        expected_config = ConfigIO().file_to_config(config_path)
+        config_io = ConfigIO(config_cache=ConfigCache(self.cache_dir))
+        first_config = config_io.file_to_config(config_path)
+        self.assertEqual(first_config, expected_config)
+        with patch('lmctl.config.io.yaml') as mock_yaml:
+            cached_config = config_io.file_to_config(config_path)
+            mock_yaml.safe_load.assert_not_called()
+        self.assertIsInstance(cached_config.environments, LazyEnvironmentGroups)
+        self.assertEqual(list(cached_config.environments.keys()), list(expected_config.environments.keys()))
+        self.assertEqual(cached_config, expected_config)
+        self.assertEqual(config_io.config_to_dict(cached_config), config_io.config_to_dict(expected_config))
+
+    def test_cached_environment_groups_validated_when_used(self):
+        config_path = self.test_helper.prepare_file('simple-config')
+        config_io = ConfigIO(config_cache=ConfigCache(self.cache_dir))
+        config_io.file_to_config(config_path)
+        with patch('lmctl.config.config.parse_obj_as', wraps=parse_obj_as) as mock_parse:
+            cached_config = config_io.file_to_config(config_path)
+            self.assertIn('test', cached_config.environments)
+            mock_parse.assert_not_called()
+            test_env = cached_config.environments.get('test')
+            self.assertEqual(mock_parse.call_count, 1)
+        self.assertIsInstance(test_env, EnvironmentGroup)
+        self.assertIsInstance(test_env.tnco, TNCOEnvironment)
+        self.assertEqual(test_env.tnco.address, 'https://127.0.0.1:1111')
+        self.assertIs(cached_config.environments['test'], test_env)
+
+    def test_file_to_config_reads_file_again_when_changed(self):
+        config_path = self.test_helper.prepare_file('simple-config')
+        config_io = ConfigIO(config_cache=ConfigCache(self.cache_dir))
+        config = config_io.file_to_config(config_path)
+        config.environments['new'] = EnvironmentGroup(name='new', description='Added')
+        config_io.config_to_file(config, config_path)
+        updated_config = config_io.file_to_config(config_path)
+        self.assertIn('new', updated_config.environments)
+        self.assertEqual(updated_config.environments['new'].description, 'Added')
+
+    def test_invalid_config_not_cached(self):
+        config_path = os.path.join(self.tmp_dir, 'invalid.yaml')
+        with open(config_path, 'w') as f:
+            f.write('environments:\n  test:\n    tnco:\n      secure: True\n      address: https://127.0.0.1\n')
+        config_io = ConfigIO(config_cache=ConfigCache(self.cache_dir))
+        with self.assertRaises(ConfigError):
+            config_io.file_to_config(config_path)
+        self.assertFalse(os.path.exists(self.cache_dir))
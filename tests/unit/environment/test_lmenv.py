@@ -180,6 +180,22 @@ class TestTNCOEnvironment(unittest.TestCase):
         self.assertEqual(client.address, 'http://test:80/gateway')
         self.assertEqual(client.kami_address, 'http://test:31289')
 
+    def test_build_client_sets_pool_settings(self):
+        config = TNCOEnvironment(address='https://testing', keep_alive=False, pool_connections=2, pool_maxsize=30, max_retries=5)
+        client = config.build_client()
+        self.assertEqual(client.use_sessions, False)
+        self.assertEqual(client.pool_connections, 2)
+        self.assertEqual(client.pool_maxsize, 30)
+        self.assertEqual(client.max_retries, 5)
+
+    def test_build_client_default_pool_settings(self):
+        config = TNCOEnvironment(address='https://testing')
+        client = config.build_client()
+        self.assertEqual(client.use_sessions, True)
+        self.assertEqual(client.pool_connections, 10)
+        self.assertEqual(client.pool_maxsize, 10)
+        self.assertEqual(client.max_retries, 3)
+
     def test_build_client_legacy_auth(self):
         config = TNCOEnvironment(
                          address='https://testing',
@@ -390,7 +406,7 @@ class TestLmSession(unittest.TestCase):
     def test_descriptor_driver(self, descriptor_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None, auth_mode='oauth'))
         driver = session.descriptor_driver
-        descriptor_driver_init.assert_called_once_with('https://test:80', None)
+        descriptor_driver_init.assert_called_once_with('https://test:80', None, client=mock.ANY)
         self.assertEqual(driver, descriptor_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -398,15 +414,15 @@ class TestLmSession(unittest.TestCase):
     def test_descriptor_driver_with_security(self, descriptor_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='http'), 'user', 'secret', auth_mode='oauth'))
         driver = session.descriptor_driver
-        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth')
-        descriptor_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', token_cache=mock.ANY)
+        descriptor_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=mock.ANY)
         self.assertEqual(driver, descriptor_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmOnboardRmDriver')
     def test_onboard_rm_driver(self, onboard_rm_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.onboard_rm_driver
-        onboard_rm_driver_init.assert_called_once_with('https://test:80', None)
+        onboard_rm_driver_init.assert_called_once_with('https://test:80', None, client=mock.ANY)
         self.assertEqual(driver, onboard_rm_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -414,15 +430,15 @@ class TestLmSession(unittest.TestCase):
     def test_onboard_rm_driver_with_security(self, onboard_rm_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='http'), 'user', 'secret', auth_mode='oauth'))
         driver = session.onboard_rm_driver
-        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth')
-        onboard_rm_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', token_cache=mock.ANY)
+        onboard_rm_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=mock.ANY)
         self.assertEqual(driver, onboard_rm_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmTopologyDriver')
     def test_topology_driver(self, topology_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.topology_driver
-        topology_driver_init.assert_called_once_with('https://test:80', None)
+        topology_driver_init.assert_called_once_with('https://test:80', None, client=mock.ANY)
         self.assertEqual(driver, topology_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -430,15 +446,15 @@ class TestLmSession(unittest.TestCase):
     def test_topology_driver_with_security(self, topology_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='http'), 'user', 'secret', auth_mode='oauth'))
         driver = session.topology_driver
-        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth')
-        topology_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', token_cache=mock.ANY)
+        topology_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=mock.ANY)
         self.assertEqual(driver, topology_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmBehaviourDriver')
     def test_behaviour_driver(self, behaviour_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.behaviour_driver
-        behaviour_driver_init.assert_called_once_with('https://test:80', None)
+        behaviour_driver_init.assert_called_once_with('https://test:80', None, client=mock.ANY)
         self.assertEqual(driver, behaviour_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -446,15 +462,15 @@ class TestLmSession(unittest.TestCase):
     def test_behaviour_driver_with_security(self, behaviour_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='http'), 'user', 'secret', auth_mode='oauth'))
         driver = session.behaviour_driver
-        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth')
-        behaviour_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', token_cache=mock.ANY)
+        behaviour_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=mock.ANY)
         self.assertEqual(driver, behaviour_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmDeploymentLocationDriver')
     def test_deployment_location_driver(self, deployment_location_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.deployment_location_driver
-        deployment_location_driver_init.assert_called_once_with('https://test:80', None)
+        deployment_location_driver_init.assert_called_once_with('https://test:80', None, client=mock.ANY)
         self.assertEqual(driver, deployment_location_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -462,15 +478,15 @@ class TestLmSession(unittest.TestCase):
     def test_deployment_location_driver_with_security(self, deployment_location_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='http'), 'user', 'secret', auth_mode='oauth'))
         driver = session.deployment_location_driver
-        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth')
-        deployment_location_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', token_cache=mock.ANY)
+        deployment_location_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=mock.ANY)
         self.assertEqual(driver, deployment_location_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmInfrastructureKeysDriver')
     def test_infrastructure_keys_driver(self, infrastructure_keys_driver_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https'), None))
         driver = session.infrastructure_keys_driver
-        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', None)
+        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', None, client=mock.ANY)
         self.assertEqual(driver, infrastructure_keys_driver_init.return_value)
 
     @mock.patch('lmctl.environment.lmenv.lm_drivers.LmSecurityCtrl')
@@ -478,6 +494,15 @@ class TestLmSession(unittest.TestCase):
     def test_infrastructure_keys_driver_with_security(self, infrastructure_keys_driver_init, mock_security_ctrl_init):
         session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', secure=True, username='user', auth_host='auth', auth_port=81, auth_protocol='http'), 'user', 'secret', auth_mode='oauth'))
         driver = session.infrastructure_keys_driver
-        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth')
-        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value)
+        mock_security_ctrl_init.assert_called_once_with('http://auth:81', username='user', password='secret', client_id=None, client_secret=None, token=None, api_key=None, auth_mode='oauth', token_cache=mock.ANY)
+        infrastructure_keys_driver_init.assert_called_once_with('https://test:80', mock_security_ctrl_init.return_value, client=mock.ANY)
         self.assertEqual(driver, infrastructure_keys_driver_init.return_value)
+
+    def test_drivers_share_pooled_client(self):
+        session = LmSession(LmSessionConfig(TNCOEnvironment(host='test', port=80, protocol='https', pool_maxsize=20), None))
+        client = session.descriptor_driver.client
+        self.assertIsInstance(client, TNCOClient)
+        self.assertIsNone(client.auth_type)
+        self.assertEqual(client.pool_maxsize, 20)
+        self.assertIs(session.behaviour_driver.client, client)
+        self.assertIs(session.pkg_mgmt_driver.client, client)
@@ -0,0 +1,85 @@
+import unittest
+import tempfile
+import tarfile
+import zipfile
+import shutil
+import os
+from unittest.mock import patch
+from lmctl.project.package.archive import PkgArchive, PkgArchiveError, MemberNotFoundError
+
+class TestPkgArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.src_dir = os.path.join(self.tmp_dir, 'src')
+        os.makedirs(os.path.join(self.src_dir, 'Descriptor'))
+        with open(os.path.join(self.src_dir, 'lmpkg.yml'), 'w') as f:
+            f.write('name: basic\n')
+        with open(os.path.join(self.src_dir, 'Descriptor', 'assembly.yml'), 'w') as f:
+            f.write('name: assembly::basic::1.0\n')
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def _build_tgz(self):
+        path = os.path.join(self.tmp_dir, 'basic.tgz')
+        with tarfile.open(path, mode='w:gz') as pkg_tar:
+            pkg_tar.add(os.path.join(self.src_dir, 'lmpkg.yml'), arcname='lmpkg.yml')
+            pkg_tar.add(os.path.join(self.src_dir, 'Descriptor', 'assembly.yml'), arcname='Descriptor/assembly.yml')
+        return path
+
+    def _build_csar(self):
+        path = os.path.join(self.tmp_dir, 'basic.csar')
+        with zipfile.ZipFile(path, mode='w') as pkg_zip:
+            pkg_zip.write(os.path.join(self.src_dir, 'lmpkg.yml'), arcname='lmpkg.yml')
+            pkg_zip.write(os.path.join(self.src_dir, 'Descriptor', 'assembly.yml'), arcname='Descriptor/assembly.yml')
+        return path
+
+    def test_read_member_from_tgz(self):
+        archive = PkgArchive(self._build_tgz())
+        self.assertEqual(archive.read_member('Descriptor/assembly.yml'), b'name: assembly::basic::1.0\n')
+        self.assertEqual(archive.read_member('./lmpkg.yml'), b'name: basic\n')
+
+    def test_read_member_from_csar(self):
+        archive = PkgArchive(self._build_csar())
+        self.assertEqual(archive.read_member('Descriptor/assembly.yml'), b'name: assembly::basic::1.0\n')
+        self.assertEqual(archive.read_member('lmpkg.yml'), b'name: basic\n')
+
+    def test_read_member_stops_at_member_in_tgz(self):
+        archive = PkgArchive(self._build_tgz())
+        with patch('lmctl.project.package.archive.tarfile.TarFile.extractall') as mock_extractall:
+            archive.read_member('lmpkg.yml')
+            mock_extractall.assert_not_called()
+        # Member found before the end of the file, so the full index is not yet known
+        self.assertIsNone(archive._member_names)
+
+    def test_read_missing_member_caches_index(self):
+        archive = PkgArchive(self._build_tgz())
+        with self.assertRaises(MemberNotFoundError):
+            archive.read_member('missing.yml')
+        self.assertEqual(archive._member_names, ['lmpkg.yml', 'Descriptor/assembly.yml'])
+        with patch('lmctl.project.package.archive.tarfile.open') as mock_open:
+            with self.assertRaises(MemberNotFoundError):
+                archive.read_member('missing.yml')
+            mock_open.assert_not_called()
+
+    def test_member_names(self):
+        self.assertEqual(PkgArchive(self._build_tgz()).member_names(), ['lmpkg.yml', 'Descriptor/assembly.yml'])
+        self.assertEqual(PkgArchive(self._build_csar()).member_names(), ['lmpkg.yml', 'Descriptor/assembly.yml'])
+
+    def test_extract(self):
+        for path in [self._build_tgz(), self._build_csar()]:
+            target_dir = os.path.join(self.tmp_dir, 'extracted-{0}'.format(os.path.basename(path)))
+            PkgArchive(path).extract(target_dir)
+            with open(os.path.join(target_dir, 'Descriptor', 'assembly.yml'), 'r') as f:
+                self.assertEqual(f.read(), 'name: assembly::basic::1.0\n')
+            self.assertTrue(os.path.exists(os.path.join(target_dir, 'lmpkg.yml')))
+
+    def test_invalid_archive(self):
+        path = os.path.join(self.tmp_dir, 'invalid.txt')
+        with open(path, 'w') as f:
+            f.write('not an archive')
+        with self.assertRaises(PkgArchiveError) as context:
+            PkgArchive(path).read_member('lmpkg.yml')
+        self.assertEqual(str(context.exception), 'Could not determine if pkg {0} was a tgz or csar'.format(path))
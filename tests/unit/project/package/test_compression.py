@@ -0,0 +1,137 @@
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+import lmctl.project.package.compression as compression
+from lmctl.project.package.compression import CompressionOptions, ZipWriter, TgzWriter
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmp_dir, 'src')
+        os.makedirs(os.path.join(self.src, 'b', 'nested'))
+        os.makedirs(os.path.join(self.src, 'a'))
+        self.text = ('lifecycle script ' * 50000).encode('utf-8')
+        self.image = os.urandom(compression.CHUNK_SIZE + 100)
+        self.__write('a/script.sh', self.text)
+        self.__write('b/nested/disk.qcow2', self.image)
+        self.__write('b/empty.txt', b'')
+        self.__write('top.yml', b'name: test\n')
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def __write(self, relative_path, content):
+        with open(os.path.join(self.src, relative_path), 'wb') as f:
+            f.write(content)
+
+    def __zip(self, options=None):
+        path = os.path.join(self.tmp_dir, 'out.zip')
+        with ZipWriter(path, options) as writer:
+            writer.add_tree(self.src, 'Content')
+        return path
+
+    def test_zip_readable_with_deterministic_order(self):
+        path = self.__zip(CompressionOptions(workers=3))
+        with zipfile.ZipFile(path) as zip_file:
+            self.assertIsNone(zip_file.testzip())
+            self.assertEqual(zip_file.namelist(), [
+                'Content/', 'Content/a/', 'Content/b/', 'Content/top.yml', 'Content/a/script.sh',
+                'Content/b/nested/', 'Content/b/empty.txt', 'Content/b/nested/disk.qcow2'
+            ])
+            self.assertEqual(zip_file.read('Content/a/script.sh'), self.text)
+            self.assertEqual(zip_file.read('Content/b/nested/disk.qcow2'), self.image)
+            self.assertEqual(zip_file.read('Content/b/empty.txt'), b'')
+
+    def test_zip_stores_already_compressed_files(self):
+        path = self.__zip()
+        with zipfile.ZipFile(path) as zip_file:
+            self.assertEqual(zip_file.getinfo('Content/a/script.sh').compress_type, zipfile.ZIP_DEFLATED)
+            self.assertLess(zip_file.getinfo('Content/a/script.sh').compress_size, len(self.text))
+            self.assertEqual(zip_file.getinfo('Content/b/nested/disk.qcow2').compress_type, zipfile.ZIP_STORED)
+
+    def test_zip_store_only_level(self):
+        path = self.__zip(CompressionOptions(level=0))
+        with zipfile.ZipFile(path) as zip_file:
+            self.assertEqual(zip_file.getinfo('Content/a/script.sh').compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zip_file.read('Content/a/script.sh'), self.text)
+
+    def test_zip64_used_for_large_members(self):
+        with patch.object(compression, 'ZIP64_LIMIT', 1000):
+            path = self.__zip()
+        with zipfile.ZipFile(path) as zip_file:
+            self.assertIsNone(zip_file.testzip())
+            self.assertEqual(zip_file.read('Content/b/nested/disk.qcow2'), self.image)
+            self.assertEqual(zip_file.read('Content/top.yml'), b'name: test\n')
+
+    def test_tgz_readable(self):
+        path = os.path.join(self.tmp_dir, 'out.tgz')
+        with TgzWriter(path, CompressionOptions(workers=2)) as writer:
+            writer.add_tree(self.src, 'Content', include_directories=False)
+        with tarfile.open(path, mode='r:gz') as tar:
+            self.assertEqual(tar.getnames(), ['Content/top.yml', 'Content/a/script.sh', 'Content/b/empty.txt', 'Content/b/nested/disk.qcow2'])
+            self.assertEqual(tar.extractfile('Content/a/script.sh').read(), self.text)
+            self.assertEqual(tar.extractfile('Content/b/nested/disk.qcow2').read(), self.image)
+        self.assertLess(os.path.getsize(path), len(self.text) + len(self.image))
+
+    def test_same_content_produces_same_tgz(self):
+        first = os.path.join(self.tmp_dir, 'first.tgz')
+        second = os.path.join(self.tmp_dir, 'second.tgz')
+        for path, workers in [(first, 1), (second, 4)]:
+            with TgzWriter(path, CompressionOptions(workers=workers)) as writer:
+                writer.add_tree(self.src, 'Content')
+        with open(first, 'rb') as f1, open(second, 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def __touch_all(self, mtime, mode=None):
+        for root, dirs, file_names in os.walk(self.src):
+            for name in dirs + file_names:
+                path = os.path.join(root, name)
+                if mode is not None and name in file_names:
+                    os.chmod(path, mode)
+                os.utime(path, (mtime, mtime))
+
+    def __read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_reproducible_tgz_ignores_timestamps_and_permissions(self):
+        options = CompressionOptions(reproducible=True)
+        first = os.path.join(self.tmp_dir, 'first.tgz')
+        second = os.path.join(self.tmp_dir, 'second.tgz')
+        self.__touch_all(1000000000, mode=0o600)
+        with TgzWriter(first, options) as writer:
+            writer.add_tree(self.src, 'Content')
+        self.__touch_all(1600000000, mode=0o640)
+        with TgzWriter(second, options) as writer:
+            writer.add_tree(self.src, 'Content')
+        self.assertEqual(self.__read(first), self.__read(second))
+        with tarfile.open(first, mode='r:gz') as tar:
+            member = tar.getmember('Content/top.yml')
+            self.assertEqual(member.mtime, compression.REPRODUCIBLE_MTIME)
+            self.assertEqual((member.uid, member.gid, member.uname, member.gname), (0, 0, '', ''))
+            self.assertEqual(member.mode, 0o644)
+            self.assertEqual(tar.getmember('Content/a').mode, 0o755)
+
+    def test_reproducible_zip_ignores_timestamps_and_permissions(self):
+        options = CompressionOptions(reproducible=True)
+        self.__touch_all(1000000000, mode=0o600)
+        first = self.__read(self.__zip(options))
+        self.__touch_all(1600000000, mode=0o700)
+        executable_path = self.__zip(options)
+        # Executable files keep their execute permission
+        self.assertNotEqual(first, self.__read(executable_path))
+        with zipfile.ZipFile(executable_path) as zip_file:
+            self.assertEqual(zip_file.getinfo('Content/top.yml').date_time, (1980, 1, 1, 0, 0, 0))
+            self.assertEqual(zip_file.getinfo('Content/top.yml').external_attr >> 16, 0o100755)
+        self.__touch_all(1600000000, mode=0o640)
+        self.assertEqual(first, self.__read(self.__zip(options)))
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            CompressionOptions(level=10)
@@ -4,6 +4,7 @@ import tarfile
 import shutil
 import os
 from tests.common.project_testing import ProjectSimTestCase, PKG_META_YML_FILE, PKG_DEPRECATED_CONTENT_DIR, ASSEMBLY_DESCRIPTOR_DIR
+from unittest.mock import patch
 from lmctl.project.package.core import Pkg, PkgContent
 
 class TestPkg(ProjectSimTestCase):
@@ -92,3 +93,24 @@ class TestPkg(ProjectSimTestCase):
         self.assertEqual(second_include.descriptor_name, 'resource::sub_basic-contains_basic::1.0')
         self.assertEqual(second_include.resource_manager, 'brent')
         
+
+    def test_inspect_does_not_extract_pkg(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        pkg = Pkg(pkg_sim.path)
+        with patch.object(pkg, 'extract') as mock_extract:
+            inspection_report = pkg.inspect()
+            mock_extract.assert_not_called()
+        self.assertEqual(inspection_report.name, 'basic')
+        self.assertEqual(inspection_report.version, '1.0')
+
+    def test_inspect_pkg_with_deprecated_content_directory(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_deprecated_content_basic()
+        pkg = Pkg(pkg_sim.path)
+        inspection_report = pkg.inspect()
+        self.assertEqual(inspection_report.includes[0].descriptor_name, 'assembly::basic::1.0')
+
+    def test_read_meta(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_contains_brent_basic()
+        meta = Pkg(pkg_sim.path).read_meta()
+        self.assertEqual(meta.name, 'contains_basic')
+        self.assertEqual(len(meta.subpkgs), 1)
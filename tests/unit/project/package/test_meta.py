@@ -3,7 +3,7 @@ import tempfile
 import os
 import yaml
 import shutil
-from lmctl.project.package.meta import PkgMetaRewriter
+from lmctl.project.package.meta import PkgMetaRewriter, PkgMetaParser, RootPkgMetaBuilder
 
 OLD_STYLE_META = """\
 name: testproject
@@ -124,4 +124,23 @@ class TestPkgMetaRewriter(unittest.TestCase):
             new_config = f.read()
         self.assertEqual(new_config, NEW_STYLE_NO_VNFCS)
 
-    
\ No newline at end of file
+    
+
+
+class TestRootPkgMetaContentHash(unittest.TestCase):
+
+    def test_content_hash_included_in_dict(self):
+        meta = RootPkgMetaBuilder().schema('2.0').name('testproject').version('1.0').content_type('Assembly').content_hash('abc123').build()
+        self.assertEqual(meta.to_dict(), {
+            'schema': '2.0',
+            'name': 'testproject',
+            'version': '1.0',
+            'type': 'Assembly',
+            'content-hash': 'abc123'
+        })
+        self.assertEqual(PkgMetaParser.from_dict(meta.to_dict()).content_hash, 'abc123')
+
+    def test_content_hash_optional(self):
+        meta = PkgMetaParser.from_dict({'schema': '2.0', 'name': 'testproject', 'version': '1.0'})
+        self.assertIsNone(meta.content_hash)
+        self.assertNotIn('content-hash', meta.to_dict())
@@ -0,0 +1,121 @@
+import os
+import unittest
+import threading
+import time
+from unittest.mock import MagicMock
+import lmctl.project.handlers.interface as handlers_api
+from lmctl.files import Tree
+from lmctl.journal import JournalKeeper
+from lmctl.project.journal import ProjectJournal, SubprojectEvent, SubprojectEndEvent, Event
+from lmctl.project.package.core import PushOptions
+from lmctl.project.validation import ValidationResult, ValidationViolation
+from lmctl.project.processes.pipeline import PipelinedPushProcess, PipelinedPushProcessError
+
+class PipelineRecorder:
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.events = []
+
+    def record(self, event):
+        with self.lock:
+            self.events.append(event)
+
+    def content(self, name, subcontents=None, error=None, validation_error=None):
+        content = MagicMock()
+        content.meta.name = name
+        content.subcontents = subcontents or []
+        content.tree.root_path = os.path.join('/compile', name)
+        def push_content(journal, env_sessions):
+            self.record('push-start {0}'.format(name))
+            journal.event('Pushing {0}'.format(name))
+            time.sleep(self.delay)
+            self.record('push-end {0}'.format(name))
+            if error is not None:
+                raise handlers_api.ContentHandlerError(error)
+        content.handler.push_content.side_effect = push_content
+        errors = [ValidationViolation(validation_error)] if validation_error is not None else []
+        content.handler.validate_content.return_value = ValidationResult(errors, [])
+        return content
+
+    def compiler(self, compile_order, compile_delay=0):
+        def compile_content(on_compiled):
+            for content in compile_order:
+                time.sleep(compile_delay)
+                self.record('compiled {0}'.format(content.meta.name))
+                on_compiled(Tree(content.tree.root_path))
+            return 'compiled'
+        return compile_content
+
+class TestPipelinedPushProcess(unittest.TestCase):
+
+    def _push(self, pkg_content, compile_content):
+        keeper = JournalKeeper()
+        journal = ProjectJournal(keeper)
+        result = PipelinedPushProcess(pkg_content, PushOptions(), journal, MagicMock(), compile_content).execute()
+        return result, keeper
+
+    def test_pushes_content_in_compile_order(self):
+        recorder = PipelineRecorder()
+        a = recorder.content('A')
+        b = recorder.content('B')
+        root = recorder.content('root', subcontents=[a, b])
+        (compile_result, validation_result), _ = self._push(root, recorder.compiler([a, b, root]))
+        self.assertEqual(compile_result, 'compiled')
+        self.assertFalse(validation_result.has_errors())
+        pushed = [event.split(' ')[1] for event in recorder.events if event.startswith('push-end')]
+        self.assertEqual(pushed, ['A', 'B', 'root'])
+
+    def test_push_overlaps_with_compile(self):
+        recorder = PipelineRecorder(delay=0.05)
+        a = recorder.content('A')
+        b = recorder.content('B')
+        root = recorder.content('root', subcontents=[a, b])
+        self._push(root, recorder.compiler([a, b, root], compile_delay=0.03))
+        # A is uploaded while B is still being compiled
+        self.assertLess(recorder.events.index('push-start A'), recorder.events.index('compiled B'))
+
+    def test_stops_pushing_after_validation_error(self):
+        recorder = PipelineRecorder()
+        a = recorder.content('A', validation_error='Invalid A')
+        b = recorder.content('B')
+        root = recorder.content('root', subcontents=[a, b])
+        (_, validation_result), _ = self._push(root, recorder.compiler([a, b, root]))
+        self.assertTrue(validation_result.has_errors())
+        self.assertEqual(validation_result.errors[0].message, 'Invalid A')
+        b.handler.validate_content.assert_called_once()
+        root.handler.push_content.assert_not_called()
+        a.handler.push_content.assert_not_called()
+
+    def test_raises_push_error_and_stops_compiling(self):
+        recorder = PipelineRecorder(delay=0.02)
+        a = recorder.content('A', error='Mock error')
+        b = recorder.content('B')
+        root = recorder.content('root', subcontents=[a, b])
+        compile_order = [a, b, root]
+        def slow_compile(on_compiled):
+            for content in compile_order:
+                on_compiled(Tree(content.tree.root_path))
+                time.sleep(0.05)
+        with self.assertRaises(PipelinedPushProcessError) as context:
+            self._push(root, slow_compile)
+        self.assertEqual(str(context.exception), 'Mock error')
+        root.handler.push_content.assert_not_called()
+
+    def test_journal_entries_grouped_by_subcontent(self):
+        recorder = PipelineRecorder()
+        child = recorder.content('Child')
+        nested = recorder.content('Nested', subcontents=[child])
+        root = recorder.content('root', subcontents=[nested])
+        _, keeper = self._push(root, recorder.compiler([child, nested, root]))
+        stack = []
+        for chapter in keeper.chapters:
+            for entry in chapter.entries:
+                if isinstance(entry, SubprojectEvent):
+                    stack.append(entry.sub_project_name)
+                elif isinstance(entry, SubprojectEndEvent):
+                    self.assertEqual(stack.pop(), entry.sub_project_name)
+                elif isinstance(entry, Event) and entry.message.startswith('Pushing'):
+                    name = entry.message.split(' ')[1]
+                    self.assertEqual(stack, {'Child': ['Nested', 'Child'], 'Nested': ['Nested'], 'root': []}[name])
@@ -0,0 +1,129 @@
+import unittest
+import threading
+import time
+from unittest.mock import MagicMock
+import lmctl.project.handlers.interface as handlers_api
+from lmctl.journal import JournalKeeper
+from lmctl.project.journal import ProjectJournal, SubprojectEvent, SubprojectEndEvent, Event
+from lmctl.project.package.core import PushOptions
+from lmctl.project.processes.push import PushProcess, PushProcessError
+
+class PushRecorder:
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.pushed = []
+        self.current = 0
+        self.max_concurrent = 0
+
+    def content(self, name, subcontents=None, error=None):
+        content = MagicMock()
+        content.meta.name = name
+        content.subcontents = subcontents or []
+        def push_content(journal, env_sessions):
+            with self.lock:
+                self.current += 1
+                self.max_concurrent = max(self.max_concurrent, self.current)
+            journal.event('Pushing {0}'.format(name))
+            time.sleep(self.delay)
+            journal.event('Pushed {0}'.format(name))
+            with self.lock:
+                self.current -= 1
+                self.pushed.append(name)
+            if error is not None:
+                raise handlers_api.ContentHandlerError(error)
+        content.handler.push_content.side_effect = push_content
+        return content
+
+class TestPushProcess(unittest.TestCase):
+
+    def _push(self, pkg_content, parallel):
+        options = PushOptions()
+        options.parallel = parallel
+        keeper = JournalKeeper()
+        journal = ProjectJournal(keeper)
+        PushProcess(pkg_content, options, journal, MagicMock()).execute()
+        return keeper
+
+    def _all_entries(self, keeper):
+        entries = []
+        for chapter in keeper.chapters:
+            entries.extend(chapter.entries)
+        return entries
+
+    def test_sequential_push_pushes_children_first(self):
+        recorder = PushRecorder()
+        pkg_content = recorder.content('root', subcontents=[recorder.content('A'), recorder.content('B')])
+        self._push(pkg_content, parallel=1)
+        self.assertEqual(recorder.pushed, ['A', 'B', 'root'])
+        self.assertEqual(recorder.max_concurrent, 1)
+
+    def test_parallel_push_pushes_siblings_concurrently(self):
+        recorder = PushRecorder(delay=0.05)
+        pkg_content = recorder.content('root', subcontents=[recorder.content('Res{0}'.format(i)) for i in range(6)])
+        self._push(pkg_content, parallel=3)
+        self.assertEqual(len(recorder.pushed), 7)
+        self.assertEqual(recorder.pushed[-1], 'root')
+        self.assertEqual(recorder.max_concurrent, 3)
+
+    def test_parallel_push_pushes_parents_after_children(self):
+        recorder = PushRecorder(delay=0.01)
+        nested = recorder.content('Nested', subcontents=[recorder.content('Child1'), recorder.content('Child2')])
+        pkg_content = recorder.content('root', subcontents=[nested, recorder.content('Sibling')])
+        self._push(pkg_content, parallel=4)
+        self.assertGreater(recorder.pushed.index('Nested'), recorder.pushed.index('Child1'))
+        self.assertGreater(recorder.pushed.index('Nested'), recorder.pushed.index('Child2'))
+        self.assertEqual(recorder.pushed[-1], 'root')
+
+    def test_parallel_push_keeps_journal_entries_grouped(self):
+        recorder = PushRecorder(delay=0.02)
+        nested = recorder.content('Nested', subcontents=[recorder.content('Child')])
+        pkg_content = recorder.content('root', subcontents=[nested, recorder.content('A'), recorder.content('B')])
+        keeper = self._push(pkg_content, parallel=3)
+        entries = self._all_entries(keeper)
+        stack = []
+        for entry in entries:
+            if isinstance(entry, SubprojectEvent):
+                stack.append(entry.sub_project_name)
+            elif isinstance(entry, SubprojectEndEvent):
+                self.assertEqual(stack.pop(), entry.sub_project_name)
+            elif isinstance(entry, Event):
+                name = entry.message.split(' ')[1]
+                expected_stack = {'Child': ['Nested', 'Child'], 'Nested': ['Nested'], 'A': ['A'], 'B': ['B'], 'root': []}[name]
+                self.assertEqual(stack, expected_stack)
+        messages = [entry.message for entry in entries if isinstance(entry, Event)]
+        for name in ['Child', 'Nested', 'A', 'B', 'root']:
+            pushing_idx = messages.index('Pushing {0}'.format(name))
+            self.assertEqual(messages[pushing_idx+1], 'Pushed {0}'.format(name))
+
+    def test_parallel_push_writes_subproject_events_once(self):
+        recorder = PushRecorder(delay=0.01)
+        nested = recorder.content('Nested', subcontents=[recorder.content('Child1'), recorder.content('Child2')])
+        pkg_content = recorder.content('root', subcontents=[nested])
+        keeper = self._push(pkg_content, parallel=3)
+        subproject_names = [entry.sub_project_name for entry in self._all_entries(keeper) if isinstance(entry, SubprojectEvent)]
+        self.assertEqual(subproject_names.count('Nested'), 1)
+        self.assertEqual(sorted(subproject_names), ['Child1', 'Child2', 'Nested'])
+
+    def test_parallel_push_writes_journal_of_failed_subproject(self):
+        recorder = PushRecorder()
+        nested = recorder.content('Nested', subcontents=[recorder.content('Child', error='Mock error')])
+        pkg_content = recorder.content('root', subcontents=[nested])
+        keeper = JournalKeeper()
+        options = PushOptions()
+        options.parallel = 2
+        with self.assertRaises(PushProcessError):
+            PushProcess(pkg_content, options, ProjectJournal(keeper), MagicMock()).execute()
+        entries = self._all_entries(keeper)
+        self.assertEqual([entry.sub_project_name for entry in entries if isinstance(entry, SubprojectEvent)], ['Nested', 'Child'])
+        self.assertIn('Pushed Child', [entry.message for entry in entries if isinstance(entry, Event)])
+
+    def test_parallel_push_raises_error_and_skips_parents(self):
+        recorder = PushRecorder()
+        nested = recorder.content('Nested', subcontents=[recorder.content('Child', error='Mock error')])
+        pkg_content = recorder.content('root', subcontents=[nested])
+        with self.assertRaises(PushProcessError) as context:
+            self._push(pkg_content, parallel=2)
+        self.assertEqual(str(context.exception), 'Mock error')
+        self.assertEqual(recorder.pushed, ['Child'])
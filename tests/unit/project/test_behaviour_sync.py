@@ -0,0 +1,114 @@
+import unittest
+import threading
+import os
+import json
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+from lmctl.project.behaviour_sync import BehaviourSync, ASSEMBLY_CONFIGURATIONS, SCENARIOS, CREATE, UPDATE, UNCHANGED, index_by_name, find_behaviour_files
+from lmctl.project.delta import PushTracker, normalised_hash, CREATED, UPDATED, SKIPPED
+from lmctl.project.journal import ProjectJournal
+from lmctl.project.sessions import EnvironmentSessions
+
+class TestBehaviourSync(unittest.TestCase):
+
+    def setUp(self):
+        self.lm_session = MagicMock()
+        self.lm_session.env.address = 'http://lm'
+        self.env_sessions = EnvironmentSessions(self.lm_session)
+        self.journal = ProjectJournal()
+
+    def _local(self, *names):
+        return [('{0}.json'.format(name), {'name': name, 'projectId': 'assembly::A::1.0'}) for name in names]
+
+    def test_index_by_name_keeps_first(self):
+        indexed = index_by_name([{'name': 'A', 'id': '1'}, {'name': 'B', 'id': '2'}, {'name': 'A', 'id': '3'}])
+        self.assertEqual(indexed['A']['id'], '1')
+        self.assertEqual(indexed['B']['id'], '2')
+
+    def test_plan(self):
+        sync = BehaviourSync(self.journal, self.env_sessions, 'assembly::A::1.0')
+        plan = sync.plan(SCENARIOS, self._local('new', 'existing'), [{'name': 'existing', 'id': 'e1'}, {'name': 'other', 'id': 'o1'}])
+        self.assertEqual([(item.name, item.action) for item in plan.items], [('new', CREATE), ('existing', UPDATE)])
+        self.assertEqual(plan.items[1].content['id'], 'e1')
+        self.assertNotIn('id', plan.items[0].content)
+
+    def test_plan_unchanged_in_delta_mode(self):
+        manifest = MagicMock()
+        self.env_sessions.push_tracker = PushTracker(delta=True, manifest=manifest)
+        sync = BehaviourSync(self.journal, self.env_sessions, 'assembly::A::1.0')
+        local = self._local('same', 'changed')
+        same_hash = normalised_hash(local[0][1])
+        manifest.get.side_effect = lambda key: same_hash if key == 'assembly-configuration/assembly::A::1.0/same' else 'old'
+        plan = sync.plan(ASSEMBLY_CONFIGURATIONS, local, [{'name': 'same', 'id': 's1'}, {'name': 'changed', 'id': 'c1'}])
+        self.assertEqual([(item.name, item.action) for item in plan.items], [('same', UNCHANGED), ('changed', UPDATE)])
+
+    def test_plan_last_duplicate_wins(self):
+        sync = BehaviourSync(self.journal, self.env_sessions, 'assembly::A::1.0')
+        local = [('Runtime/dup.json', {'name': 'dup', 'description': 'runtime'}), ('Tests/dup.json', {'name': 'dup', 'description': 'test'})]
+        plan = sync.plan(SCENARIOS, local, [])
+        self.assertEqual(len(plan.items), 1)
+        self.assertEqual(plan.items[0].file_path, 'Tests/dup.json')
+
+    def test_execute(self):
+        sync = BehaviourSync(self.journal, self.env_sessions, 'assembly::A::1.0')
+        plan = sync.execute(sync.plan(ASSEMBLY_CONFIGURATIONS, self._local('new', 'existing'), [{'name': 'existing', 'id': 'e1'}]))
+        self.lm_session.behaviour_driver.create_assembly_configuration.assert_called_once_with({'name': 'new', 'projectId': 'assembly::A::1.0'})
+        self.lm_session.behaviour_driver.update_assembly_configuration.assert_called_once_with({'name': 'existing', 'projectId': 'assembly::A::1.0', 'id': 'e1'})
+        self.assertEqual(plan.created, ['new'])
+        self.assertEqual(plan.summary(), 'Assembly Configurations: 1 created, 1 updated, 0 unchanged')
+        self.assertEqual(self.env_sessions.push_tracker.counts, {CREATED: 1, UPDATED: 1, SKIPPED: 0})
+        self.assertTrue(self.env_sessions.is_lm_updated())
+
+    def test_execute_in_parallel(self):
+        names = ['scenario{0}'.format(i) for i in range(20)]
+        pushed_on = set()
+        def create_scenario(scenario):
+            pushed_on.add(threading.current_thread().name)
+        self.lm_session.behaviour_driver.create_scenario.side_effect = create_scenario
+        sync = BehaviourSync(self.journal, self.env_sessions, 'assembly::A::1.0', workers=4)
+        plan = sync.execute(sync.plan(SCENARIOS, self._local(*names), []))
+        self.assertEqual(self.lm_session.behaviour_driver.create_scenario.call_count, 20)
+        self.assertEqual(sorted(plan.created), sorted(names))
+        self.assertTrue(all(name.startswith('lmctl-behaviour') for name in pushed_on))
+
+    def test_execute_in_parallel_raises_first_error(self):
+        def create_scenario(scenario):
+            if scenario['name'] == 'bad':
+                raise ValueError('Mock error')
+        self.lm_session.behaviour_driver.create_scenario.side_effect = create_scenario
+        sync = BehaviourSync(self.journal, self.env_sessions, 'assembly::A::1.0', workers=2)
+        plan = sync.plan(SCENARIOS, self._local('good', 'bad'), [])
+        with self.assertRaises(ValueError) as context:
+            sync.execute(plan)
+        self.assertEqual(str(context.exception), 'Mock error')
+        self.assertNotIn('bad', plan.created)
+
+    def _write_json(self, directory, name, content):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, '{0}.json'.format(name)), 'w') as f:
+            json.dump(content, f)
+
+    def test_find_behaviour_files_missing_path(self):
+        self.assertEqual(find_behaviour_files(os.path.join(tempfile.gettempdir(), 'lmctl-missing-behaviour')), [])
+
+    def test_push_project(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        configurations_path = os.path.join(tmp_dir, 'Configurations')
+        runtime_path = os.path.join(tmp_dir, 'Runtime')
+        tests_path = os.path.join(tmp_dir, 'Tests')
+        self._write_json(configurations_path, 'configA', {'name': 'configA'})
+        self._write_json(runtime_path, 'runtimeA', {'name': 'runtimeA', 'assemblyActors': [{'provided': False, 'assemblyConfigurationRef': 'configA'}]})
+        self._write_json(tests_path, 'testA', {'name': 'testA', 'assemblyActors': []})
+        behaviour_driver = self.lm_session.behaviour_driver
+        behaviour_driver.get_assembly_configurations.return_value = [{'name': 'configA', 'id': 'c1'}]
+        behaviour_driver.get_scenarios.return_value = []
+        sync = BehaviourSync(self.journal, self.env_sessions, 'assembly::A::1.0')
+        sync.push_project(configurations_path, [runtime_path, tests_path])
+        behaviour_driver.update_assembly_configuration.assert_called_once_with({'name': 'configA', 'projectId': 'assembly::A::1.0', 'id': 'c1'})
+        # No configurations were created, so they are not fetched again before pushing scenarios
+        behaviour_driver.get_assembly_configurations.assert_called_once_with('assembly::A::1.0')
+        created_scenarios = {call_args[0][0]['name']: call_args[0][0] for call_args in behaviour_driver.create_scenario.call_args_list}
+        self.assertEqual(sorted(created_scenarios.keys()), ['runtimeA', 'testA'])
+        self.assertEqual(created_scenarios['runtimeA']['assemblyActors'][0]['assemblyConfigurationId'], 'c1')
@@ -0,0 +1,87 @@
+import unittest
+import os
+import shutil
+import tempfile
+import zipfile
+import time
+from lmctl.project.delta import normalised_hash, yaml_str_hash, zip_content_hash, directory_content_hash, PushStateManifest, PushTracker, CREATED, UPDATED, SKIPPED
+
+class TestContentHashes(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_normalised_hash_ignores_key_order(self):
+        self.assertEqual(normalised_hash({'a': 1, 'b': [1, 2]}), normalised_hash({'b': [1, 2], 'a': 1}))
+        self.assertNotEqual(normalised_hash({'a': 1}), normalised_hash({'a': 2}))
+
+    def test_yaml_str_hash_ignores_formatting(self):
+        self.assertEqual(yaml_str_hash('name: A\nversion: "1.0"\n'), yaml_str_hash('version:   "1.0"\n\nname: A'))
+
+    def _write_zip(self, name, members):
+        path = os.path.join(self.tmp_dir, name)
+        with zipfile.ZipFile(path, 'w') as zip_file:
+            for member_name, content in members:
+                info = zipfile.ZipInfo(member_name, date_time=time.localtime(time.time())[:6])
+                zip_file.writestr(info, content)
+        return path
+
+    def test_zip_content_hash_ignores_member_order_and_timestamps(self):
+        first = self._write_zip('first.zip', [('a.txt', 'A'), ('b/c.txt', 'C')])
+        time.sleep(2)
+        second = self._write_zip('second.zip', [('b/c.txt', 'C'), ('a.txt', 'A')])
+        self.assertEqual(zip_content_hash(first), zip_content_hash(second))
+
+    def test_zip_content_hash_changes_with_content(self):
+        first = self._write_zip('first.zip', [('a.txt', 'A')])
+        second = self._write_zip('second.zip', [('a.txt', 'B')])
+        self.assertNotEqual(zip_content_hash(first), zip_content_hash(second))
+
+    def test_directory_content_hash_ignores_zip_timestamps(self):
+        for directory in ['first', 'second']:
+            os.makedirs(os.path.join(self.tmp_dir, directory, 'Lifecycle'))
+            with open(os.path.join(self.tmp_dir, directory, 'Lifecycle', 'Install.yml'), 'w') as f:
+                f.write('install')
+        self._write_zip(os.path.join('first', 'res.zip'), [('a.txt', 'A')])
+        time.sleep(2)
+        self._write_zip(os.path.join('second', 'res.zip'), [('a.txt', 'A')])
+        first_hash = directory_content_hash(os.path.join(self.tmp_dir, 'first'))
+        self.assertEqual(first_hash, directory_content_hash(os.path.join(self.tmp_dir, 'second')))
+        with open(os.path.join(self.tmp_dir, 'second', 'Lifecycle', 'Install.yml'), 'w') as f:
+            f.write('changed')
+        self.assertNotEqual(first_hash, directory_content_hash(os.path.join(self.tmp_dir, 'second')))
+
+class TestPushTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def test_manifest_saved_and_reloaded(self):
+        path = os.path.join(self.tmp_dir, 'state', 'env.json')
+        manifest = PushStateManifest(path)
+        manifest.put('scenario/A/test', 'abc')
+        manifest.save()
+        self.assertEqual(PushStateManifest(path).get('scenario/A/test'), 'abc')
+
+    def test_unchanged_only_in_delta_mode(self):
+        manifest = PushStateManifest(os.path.join(self.tmp_dir, 'env.json'))
+        manifest.put('key', 'abc')
+        self.assertTrue(PushTracker(delta=True, manifest=manifest).unchanged_since_last_push('key', 'abc'))
+        self.assertFalse(PushTracker(delta=True, manifest=manifest).unchanged_since_last_push('key', 'def'))
+        self.assertFalse(PushTracker(delta=False, manifest=manifest).unchanged_since_last_push('key', 'abc'))
+
+    def test_summary(self):
+        tracker = PushTracker()
+        tracker.record(CREATED)
+        tracker.record(UPDATED)
+        tracker.record(UPDATED)
+        tracker.record(SKIPPED)
+        self.assertEqual(tracker.summary(), 'Created: 1, Updated: 2, Skipped (unchanged): 1')
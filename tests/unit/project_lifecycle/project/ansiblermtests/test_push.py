@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import ANY
 import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR) 
 from lmctl.project.package.core import Pkg, PkgContent, PushOptions
@@ -20,7 +21,7 @@ class TestPushAnsibleRmProjects(ProjectSimTestCase):
         result = pkg.push(env_sessions, push_options)
         self.assertIsInstance(result, PkgContent)
         csar_path = os.path.join(result.tree.root_path, 'basic.csar')
-        arm_session.arm_driver.onboard_type.assert_called_once_with('basic', '1.0', csar_path)
+        arm_session.arm_driver.onboard_type.assert_called_once_with('basic', '1.0', csar_path, progress_callback=ANY)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with(arm_session.env.name)
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': arm_session.env.name, 'url': arm_session.env.address})
         
@@ -39,7 +40,7 @@ class TestPushAnsibleRmSubprojects(ProjectSimTestCase):
         result = pkg.push(env_sessions, push_options)
         self.assertIsInstance(result, PkgContent)
         csar_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_ARM_BASIC, 'sub_basic-contains_basic.csar')
-        arm_session.arm_driver.onboard_type.assert_called_once_with('sub_basic-contains_basic', '1.0', csar_path)
+        arm_session.arm_driver.onboard_type.assert_called_once_with('sub_basic-contains_basic', '1.0', csar_path, progress_callback=ANY)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with(arm_session.env.name)
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': arm_session.env.name, 'url': arm_session.env.address})
         
\ No newline at end of file
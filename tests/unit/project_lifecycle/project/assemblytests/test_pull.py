@@ -36,6 +36,13 @@ PULLED_SIMPLE_ASSEMBLY_CONFIGURATION_WITH_UNRESOLVABLE_DESCRIPTOR = """\
   "descriptorName": "assembly::another_descriptor::1.0"
 }"""
 
+PULLED_SUBPROJECT_SIMPLE_ASSEMBLY_CONFIGURATION = """\
+{
+  "projectId": "$lmctl:/contains:/sub_with_behaviour:/descriptor_name",
+  "name": "simple",
+  "descriptorName": "$lmctl:/contains:/sub_with_behaviour:/descriptor_name"
+}"""
+
 PULLED_RUNTIME_SCENARIO = """\
 {
   "projectId": "$lmctl:/descriptor_name",
@@ -140,9 +147,10 @@ PULLED_TEST_SCENARIO_ACTORS_REPLACED = """\
 
 class TestPullAssemblyProjects(ProjectSimTestCase):
 
-    def __exec_pull(self, project_sim, lm_session):
+    def __exec_pull(self, project_sim, lm_session, parallel=1):
         project = project_sim.as_project()
         pull_options = PullOptions()
+        pull_options.parallel = parallel
         env_sessions = EnvironmentSessions(lm_session)
         project.pull(env_sessions, pull_options)
 
@@ -408,4 +416,23 @@ class TestPullAssemblyProjects(ProjectSimTestCase):
         project_assertions = self.assert_project(project_sim.as_project())
         project_assertions.assert_has_no_backup(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_TESTS_DIR, 'test.json'))
         project_assertions.assert_has_file(os.path.join(ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_TESTS_DIR, 'test.json'), current_test_content)
-     
\ No newline at end of file
+     
+
+    def test_pull_subprojects_in_parallel(self):
+        project_sim = self.simlab.simulate_assembly_contains_assembly_with_behaviour()
+        sub_configuration_path = os.path.join('Contains', 'sub_with_behaviour', ASSEMBLY_BEHAVIOUR_DIR, ASSEMBLY_CONFIGURATIONS_DIR, 'simple.json')
+        with open(os.path.join(project_sim.path, sub_configuration_path), 'r') as current_configuration:
+            current_configuration_content = current_configuration.read()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_descriptor('name: assembly::contains_with_behaviour::1.0\ndescription: parent pulled from the environment\n')
+        lm_sim.add_descriptor('name: assembly::sub_with_behaviour-contains_with_behaviour::1.0\ndescription: sub pulled from the environment\n')
+        lm_sim.add_assembly_configuration({'id': 'existing', 'projectId': 'assembly::sub_with_behaviour-contains_with_behaviour::1.0', 'name': 'simple', 'descriptorName': 'assembly::sub_with_behaviour-contains_with_behaviour::1.0'})
+        lm_session = lm_sim.as_mocked_session()
+        self.__exec_pull(project_sim, lm_session, parallel=2)
+        self.assertEqual(lm_session.descriptor_driver.get_descriptor.call_count, 2)
+        lm_session.behaviour_driver.get_assembly_configurations.assert_any_call('assembly::sub_with_behaviour-contains_with_behaviour::1.0')
+        project_assertions = self.assert_project(project_sim.as_project())
+        project_assertions.assert_has_file(os.path.join(ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), 'description: parent pulled from the environment\n')
+        project_assertions.assert_has_file(os.path.join('Contains', 'sub_with_behaviour', ASSEMBLY_DESCRIPTOR_DIR, ASSEMBLY_DESCRIPTOR_YML_FILE), 'description: sub pulled from the environment\n')
+        project_assertions.assert_has_backup(sub_configuration_path, current_configuration_content)
+        project_assertions.assert_has_file(sub_configuration_path, PULLED_SUBPROJECT_SIMPLE_ASSEMBLY_CONFIGURATION)
@@ -1,11 +1,13 @@
 import unittest
 from unittest.mock import call
 import os
+from unittest.mock import ANY
 import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR)
 from lmctl.project.sessions import EnvironmentSessions
 from lmctl.project.package.core import Pkg, PkgContent, PushOptions
 from lmctl.project.handlers.assembly.assembly_src import TEMPLATE_CONTENT
+from lmctl.project.source.core import Project, BuildOptions
 
 WITH_TEMPLATE_ASSEMBLY_TEMPLATE_DESCRIPTOR_YAML = "name: assembly-template::with_template::1.0"
 WITH_TEMPLATE_ASSEMBLY_TEMPLATE_DESCRIPTOR_YAML += "\n"
@@ -302,6 +304,54 @@ class TestPushAssemblyPkgs(ProjectSimTestCase):
         ])
 
 
+    def test_delta_push_skips_unchanged_content(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour()
+        push_options = PushOptions()
+        push_options.delta = True
+        lm_sim = self.simlab.simulate_lm()
+        first_session = lm_sim.as_mocked_session()
+        first_env_sessions = EnvironmentSessions(first_session)
+        Pkg(pkg_sim.path).push(first_env_sessions, push_options)
+        first_session.descriptor_driver.create_descriptor.assert_called_once()
+        self.assertEqual(first_env_sessions.push_tracker.counts, {'created': 4, 'updated': 0, 'skipped': 0})
+        second_session = lm_sim.as_mocked_session()
+        second_env_sessions = EnvironmentSessions(second_session)
+        Pkg(pkg_sim.path).push(second_env_sessions, push_options)
+        second_session.descriptor_driver.get_descriptor.assert_called_once_with('assembly::with_behaviour::1.0')
+        second_session.descriptor_driver.update_descriptor.assert_not_called()
+        second_session.behaviour_driver.update_assembly_configuration.assert_not_called()
+        second_session.behaviour_driver.update_scenario.assert_not_called()
+        second_session.behaviour_driver.create_scenario.assert_not_called()
+        self.assertEqual(second_env_sessions.push_tracker.counts, {'created': 0, 'updated': 0, 'skipped': 4})
+
+    def test_delta_push_of_rebuilt_package_checks_content_in_environment(self):
+        project_sim = self.simlab.simulate_assembly_basic()
+        push_options = PushOptions()
+        push_options.delta = True
+        lm_sim = self.simlab.simulate_lm()
+        pkg = Project(project_sim.path).build(BuildOptions()).pkg
+        first_session = lm_sim.as_mocked_session()
+        pkg.push(EnvironmentSessions(first_session), push_options)
+        first_session.descriptor_driver.create_descriptor.assert_called_once()
+        # Rebuilding the same sources gives a package with the same content hash but it is not skipped without checking the environment
+        lm_sim.delete_descriptor('assembly::basic::1.0')
+        pkg = Project(project_sim.path).build(BuildOptions()).pkg
+        second_session = lm_sim.as_mocked_session()
+        second_env_sessions = EnvironmentSessions(second_session)
+        self.assertIsInstance(pkg.push(second_env_sessions, push_options), PkgContent)
+        second_session.descriptor_driver.create_descriptor.assert_called_once()
+        self.assertEqual(second_env_sessions.push_tracker.counts, {'created': 1, 'updated': 0, 'skipped': 0})
+
+    def test_push_without_delta_updates_unchanged_content(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_basic()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_descriptor('name: assembly::basic::1.0\ndescription: basic_assembly\n')
+        lm_session = lm_sim.as_mocked_session()
+        Pkg(pkg_sim.path).push(EnvironmentSessions(lm_session), PushOptions())
+        lm_session.descriptor_driver.update_descriptor.assert_called_once_with('assembly::basic::1.0', 'name: assembly::basic::1.0\ndescription: basic_assembly\n')
+
+
+
 class TestPushAssemblyPkgsSubcontent(ProjectSimTestCase):
 
     def test_push_creates_descriptor(self):
@@ -541,4 +591,20 @@ class TestPushOldStyle(ProjectSimTestCase):
         self.assertIsInstance(result, PkgContent)
         csar_a_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, 'vnfcA', 'vnfcA.csar')
         csar_b_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, 'vnfcB', 'vnfcB.csar')
-        arm_session.arm_driver.onboard_type.assert_has_calls([call('vnfcA', '1.0', csar_a_path), call('vnfcB', '2.0', csar_b_path)])
+        arm_session.arm_driver.onboard_type.assert_has_calls([call('vnfcA', '1.0', csar_a_path, progress_callback=ANY), call('vnfcB', '2.0', csar_b_path, progress_callback=ANY)])
+
+class TestBuildAndPushAssemblyProjects(ProjectSimTestCase):
+
+    def test_build_and_push_contains_assembly(self):
+        project_sim = self.simlab.simulate_assembly_contains_assembly_basic()
+        project = Project(project_sim.path)
+        lm_sim = self.simlab.simulate_lm()
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        result = project.build_and_push(env_sessions, BuildOptions(), PushOptions())
+        self.assertIsInstance(result.pkg_content, PkgContent)
+        self.assertTrue(os.path.exists(result.pkg.path))
+        lm_session.descriptor_driver.create_descriptor.assert_has_calls([
+            call('name: assembly::sub_basic-contains_basic::1.0\ndescription: descriptor\n'),
+            call('name: assembly::contains_basic::1.0\ndescription: basic_assembly\n')])
+        self.assertFalse(os.path.exists(os.path.join(project_sim.path, '_lmctl', 'compile')))
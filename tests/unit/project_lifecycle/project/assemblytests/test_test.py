@@ -11,6 +11,7 @@ import lmctl.project.handlers.assembly.assembly_content as assembly_content
 class TestTestAssemblyPkgs(ProjectSimTestCase):
 
     def setUp(self):
+        super().setUp()
         assembly_content.set_polling_period(0.1)
 
     def tearDown(self):
@@ -122,10 +123,34 @@ class TestTestAssemblyPkgs(ProjectSimTestCase):
         self.assertEqual(test3_entry.result, TEST_STATUS_PASSED)
         self.assertIsNone(test3_entry.detail)
 
+    def test_runs_multi_tests_in_parallel(self):
+        pkg_sim = self.simlab.simulate_pkg_assembly_with_behaviour_multi_tests() 
+        pkg = Pkg(pkg_sim.path)
+        push_options = PushOptions()
+        test_options = TestOptions()
+        test_options.parallel = 3
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.execution_listener.add_step_failure_trigger('assembly::with_behaviour_multi_tests::1.0', 'test2', 1, 0, 'Mocked Error')
+        lm_session = lm_sim.as_mocked_session()
+        env_sessions = EnvironmentSessions(lm_session)
+        result = pkg.push(env_sessions, push_options).test(env_sessions, test_options)
+        self.assertEqual(len(result.suite_report.entries), 3)
+        entries_by_name = {entry.test_name: entry for entry in result.suite_report.entries}
+        self.assertEqual(entries_by_name['test'].result, TEST_STATUS_PASSED)
+        self.assertEqual(entries_by_name['test2'].result, TEST_STATUS_FAILED)
+        self.assertEqual(entries_by_name['test2'].detail, 'test2 failed: Mocked Error')
+        self.assertEqual(entries_by_name['test3'].result, TEST_STATUS_PASSED)
+        for entry in result.suite_report.entries:
+            self.assertIsNotNone(entry.duration)
+        # All tests are started before any are polled
+        driver_calls = [c[0] for c in lm_session.behaviour_driver.method_calls if c[0] in ['execute_scenario', 'get_execution']]
+        self.assertEqual(driver_calls[:4], ['execute_scenario', 'execute_scenario', 'execute_scenario', 'get_execution'])
+
 
 class TestTestAssemblyPkgsSubcontent(ProjectSimTestCase):
 
     def setUp(self):
+        super().setUp()
         assembly_content.set_polling_period(0.1)
 
     def tearDown(self):
@@ -1,4 +1,5 @@
 import os
+from unittest.mock import ANY
 import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR) 
 from lmctl.project.package.core import Pkg, PkgContent, PushOptions
@@ -19,7 +20,7 @@ class TestPushBrentProjects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, 'basic.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::basic::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::basic::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, progress_callback=ANY)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
         
@@ -38,7 +39,7 @@ class TestPushBrentSubprojects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC, 'sub_basic-contains_basic.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::sub_basic-contains_basic::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::sub_basic-contains_basic::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, progress_callback=ANY)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
         
\ No newline at end of file
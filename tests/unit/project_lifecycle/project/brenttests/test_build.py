@@ -8,8 +8,10 @@ from tests.common.project_testing import (ProjectSimTestCase,
                                           BRENT_LIFECYCLE_ANSIBLE_CONFIG_DIR)
 from lmctl.project.source.core import Project, BuildResult, Options, BuildOptions
 from lmctl.project.validation import ValidationResult
+from lmctl.journal import JournalKeeper
 import tests.common.simulations.project_lab as project_lab
 import lmctl.project.package.core as pkgs
+from lmctl.project.package.compression import CompressionOptions
 
 BASIC_DESCRIPTOR_YAML = """\
 name: resource::basic::1.0
@@ -201,3 +203,79 @@ class TestBuildBrentSubprojects(ProjectSimTestCase):
                 zip_tester.assert_has_directory(ansible_config_dir)
                 zip_tester.assert_has_file(os.path.join(ansible_config_dir, 'inventory'), BASIC_INVENTORY)
                 zip_tester.assert_has_file(os.path.join(ansible_config_dir, 'host_vars', 'example-host.yml'), BASIC_EXAMPLE_HOST_YAML)
+
+    def _build_incremental(self, project_path, compression=None):
+        keeper = JournalKeeper()
+        build_options = BuildOptions()
+        build_options.incremental = True
+        if compression is not None:
+            build_options.compression = compression
+        build_options.journal_consumer = keeper
+        result = Project(project_path).build(build_options)
+        messages = []
+        for chapter in keeper.chapters:
+            messages.extend([entry.to_readable() for entry in chapter.entries])
+        return result, messages
+
+    def test_build_reproducible_package(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        build_options = BuildOptions()
+        build_options.compression = CompressionOptions(reproducible=True)
+        pkg_contents = []
+        for _ in range(2):
+            pkg = Project(project_sim.path).build(build_options).pkg
+            with open(pkg.path, 'rb') as f:
+                pkg_contents.append(f.read())
+        self.assertEqual(pkg_contents[0], pkg_contents[1])
+        self.assertIsNotNone(pkgs.Pkg(pkg.path).read_meta().content_hash)
+
+    def test_build_incremental_reuses_unchanged_subprojects(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        res_pkg_event = 'Creating Resource package for sub_basic: sub_basic-contains_basic.zip'
+        result, messages = self._build_incremental(project_sim.path)
+        self.assertIn(res_pkg_event, messages)
+        first_pkg_path = result.pkg.path
+        # Nothing changed, so the package from the last build is reused
+        result, messages = self._build_incremental(project_sim.path)
+        self.assertNotIn(res_pkg_event, messages)
+        self.assertIn('No changes since the last build, using existing package at: {0}'.format(first_pkg_path), messages)
+        self.assertEqual(result.pkg.path, first_pkg_path)
+        sub_brent_basic_path = os.path.join(PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC)
+        with self.assert_package(result.pkg) as pkg_tester:
+            pkg_tester.assert_has_file_path(os.path.join(sub_brent_basic_path, 'sub_basic-contains_basic.zip'))
+            pkg_tester.assert_has_file(os.path.join(sub_brent_basic_path, BRENT_DESCRIPTOR_YML_FILE), SUB_BASIC_DESCRIPTOR_YAML)
+        # A change in the Resource sources means it is built again
+        with open(os.path.join(project_sim.path, sub_brent_basic_path, BRENT_LIFECYCLE_DIR, 'extra.txt'), 'w') as f:
+            f.write('changed')
+        result, messages = self._build_incremental(project_sim.path)
+        self.assertIn(res_pkg_event, messages)
+        self.assertIn('No changes to sources of contains_basic since the last build, reusing compiled content', messages)
+
+    def _res_pkg_members(self, pkg):
+        sub_brent_basic_path = os.path.join(PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC)
+        with self.assert_package(pkg) as pkg_tester:
+            with zipfile.ZipFile(pkg_tester.get_file_path(os.path.join(sub_brent_basic_path, 'sub_basic-contains_basic.zip'))) as res_pkg:
+                return res_pkg.infolist()
+
+    def test_build_incremental_after_plain_build_rebuilds(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        extra_file_path = os.path.join(project_sim.path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC, BRENT_LIFECYCLE_DIR, 'extra.txt')
+        self._build_incremental(project_sim.path)
+        # A plain build of different sources replaces the staged/compiled output
+        with open(extra_file_path, 'w') as f:
+            f.write('changed')
+        Project(project_sim.path).build(BuildOptions())
+        # Back to the sources of the first build, which must not reuse the output of the plain build
+        os.remove(extra_file_path)
+        result, messages = self._build_incremental(project_sim.path)
+        self.assertIn('Creating Resource package for sub_basic: sub_basic-contains_basic.zip', messages)
+        member_names = [member.filename for member in self._res_pkg_members(result.pkg)]
+        self.assertNotIn('{0}/extra.txt'.format(BRENT_LIFECYCLE_DIR), member_names)
+
+    def test_build_incremental_with_new_compression_options_rebuilds(self):
+        project_sim = self.simlab.simulate_assembly_contains_brent_basic()
+        self._build_incremental(project_sim.path, compression=CompressionOptions(level=9))
+        result, messages = self._build_incremental(project_sim.path, compression=CompressionOptions(level=0))
+        self.assertIn('Creating Resource package for sub_basic: sub_basic-contains_basic.zip', messages)
+        for member in self._res_pkg_members(result.pkg):
+            self.assertEqual(member.compress_type, zipfile.ZIP_STORED)
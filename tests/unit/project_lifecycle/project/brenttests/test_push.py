@@ -1,4 +1,7 @@
 import os
+import tempfile
+import zipfile
+from unittest.mock import ANY
 import tests.common.simulations.project_lab as project_lab
 from tests.common.project_testing import (ProjectSimTestCase, PROJECT_CONTAINS_DIR) 
 from lmctl.project.package.core import Pkg, PkgContent, PushOptions
@@ -19,10 +22,57 @@ class TestPushBrentProjects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, 'basic.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::basic::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::basic::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, progress_callback=ANY)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
     
+    def test_delta_push_skips_unchanged_res_pkg(self):
+        pkg_sim = self.simlab.simulate_pkg_brent_basic()
+        push_options = PushOptions()
+        push_options.delta = True
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': 'brent', 'url': 'http://brent:8443'})
+        first_session = lm_sim.as_mocked_session()
+        first_env_sessions = EnvironmentSessions(first_session)
+        Pkg(pkg_sim.path).push(first_env_sessions, push_options)
+        first_session.resource_pkg_driver.onboard_package.assert_called_once()
+        self.assertEqual(first_env_sessions.push_tracker.counts['created'], 1)
+        # The environment creates the descriptor when the package is onboarded
+        lm_sim.add_descriptor('name: resource::basic::1.0\n')
+        second_session = lm_sim.as_mocked_session()
+        second_env_sessions = EnvironmentSessions(second_session)
+        Pkg(pkg_sim.path).push(second_env_sessions, push_options)
+        second_session.descriptor_driver.delete_descriptor.assert_not_called()
+        second_session.resource_pkg_driver.delete_package.assert_not_called()
+        second_session.resource_pkg_driver.onboard_package.assert_not_called()
+        second_session.onboard_rm_driver.update_rm.assert_not_called()
+        self.assertEqual(second_env_sessions.push_tracker.counts['skipped'], 1)
+
+    def test_delta_push_after_push_without_delta_does_not_skip_replaced_res_pkg(self):
+        pkg_sim = self.simlab.simulate_pkg_brent_basic()
+        lm_sim = self.simlab.simulate_lm()
+        lm_sim.add_rm({'name': 'brent', 'url': 'http://brent:8443'})
+        delta_options = PushOptions()
+        delta_options.delta = True
+        original_content = Pkg(pkg_sim.path).open(tempfile.mkdtemp())
+        original_content.push(EnvironmentSessions(lm_sim.as_mocked_session()), delta_options)
+        lm_sim.add_descriptor('name: resource::basic::1.0\n')
+        # A push without delta replaces the Resource package with different content
+        changed_content = Pkg(pkg_sim.path).open(tempfile.mkdtemp())
+        with zipfile.ZipFile(os.path.join(changed_content.tree.root_path, 'basic.zip'), 'a') as res_pkg:
+            res_pkg.writestr('Lifecycle/changed.txt', 'changed')
+        changed_session = lm_sim.as_mocked_session()
+        changed_env_sessions = EnvironmentSessions(changed_session)
+        changed_content.push(changed_env_sessions, PushOptions())
+        changed_session.resource_pkg_driver.onboard_package.assert_called_once()
+        self.assertEqual(changed_env_sessions.push_tracker.counts['updated'], 1)
+        # The original content is no longer in the environment so must be pushed again
+        reverted_session = lm_sim.as_mocked_session()
+        reverted_env_sessions = EnvironmentSessions(reverted_session)
+        Pkg(pkg_sim.path).open(tempfile.mkdtemp()).push(reverted_env_sessions, delta_options)
+        reverted_session.resource_pkg_driver.onboard_package.assert_called_once()
+        self.assertEqual(reverted_env_sessions.push_tracker.counts['skipped'], 0)
+
     def test_push_csar(self):
         pkg_sim = self.simlab.simulate_pkg_brent_tosca()
         pkg = Pkg(pkg_sim.path)
@@ -36,7 +86,7 @@ class TestPushBrentProjects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, 'with_tosca.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::with_tosca::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::with_tosca::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, progress_callback=ANY)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
     
@@ -55,7 +105,7 @@ class TestPushBrentSubprojects(ProjectSimTestCase):
         res_pkg_path = os.path.join(result.tree.root_path, PROJECT_CONTAINS_DIR, project_lab.SUBPROJECT_NAME_BRENT_BASIC, 'sub_basic-contains_basic.zip')
         lm_session.descriptor_driver.delete_descriptor.assert_called_once_with('resource::sub_basic-contains_basic::1.0')
         lm_session.resource_pkg_driver.delete_package.assert_called_once_with('resource::sub_basic-contains_basic::1.0')
-        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path)
+        lm_session.resource_pkg_driver.onboard_package.assert_called_once_with(res_pkg_path, progress_callback=ANY)
         lm_session.onboard_rm_driver.get_rm_by_name.assert_called_once_with('brent')
         lm_session.onboard_rm_driver.update_rm.assert_called_once_with({'name': 'brent', 'url': 'http://brent:8443'})
         
\ No newline at end of file
@@ -0,0 +1,91 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+import lmctl.utils.descriptors as descriptor_utils
+from lmctl.utils.descriptors import DescriptorParser, DescriptorCache, DescriptorParsingError, DescriptorReaderException, descriptor_cache
+
+DESCRIPTOR = '''\
+name: assembly::test::1.0
+description: Test descriptor
+properties:
+  propA:
+    type: string
+'''
+
+class TestDescriptorParserCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.descriptor_path = os.path.join(self.tmp_dir, 'assembly.yml')
+        with open(self.descriptor_path, 'w') as f:
+            f.write(DESCRIPTOR)
+        descriptor_cache.clear()
+
+    def tearDown(self):
+        descriptor_cache.clear()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_read_from_file_parses_once(self):
+        with patch('lmctl.utils.descriptors._round_trip_load', wraps=descriptor_utils._round_trip_load) as mock_load:
+            first = DescriptorParser().read_from_file(self.descriptor_path)
+            second = DescriptorParser().read_from_file(self.descriptor_path)
+            self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(first.get_name(), 'assembly::test::1.0')
+        # Each caller gets its own copy to modify
+        first.description = 'Changed'
+        self.assertEqual(second.description, 'Test descriptor')
+        self.assertEqual(DescriptorParser().read_from_file(self.descriptor_path).description, 'Test descriptor')
+
+    def test_copies_of_descriptor_share_parsed_content(self):
+        copy_path = os.path.join(self.tmp_dir, 'copy.yml')
+        shutil.copyfile(self.descriptor_path, copy_path)
+        with patch('lmctl.utils.descriptors._round_trip_load', wraps=descriptor_utils._round_trip_load) as mock_load:
+            DescriptorParser().read_from_file(self.descriptor_path)
+            DescriptorParser().read_from_file(copy_path)
+            self.assertEqual(mock_load.call_count, 1)
+
+    def test_read_from_file_after_file_modified(self):
+        DescriptorParser().read_from_file(self.descriptor_path)
+        with open(self.descriptor_path, 'w') as f:
+            f.write(DESCRIPTOR.replace('1.0', '2.0') + '\n')
+        self.assertEqual(DescriptorParser().read_from_file(self.descriptor_path).get_name(), 'assembly::test::2.0')
+
+    def test_read_after_write_to_file(self):
+        parser = DescriptorParser()
+        descriptor = parser.read_from_file(self.descriptor_path)
+        descriptor.set_name('assembly', 'test', '2.0')
+        parser.write_to_file(descriptor, self.descriptor_path)
+        self.assertEqual(parser.read_from_file(self.descriptor_path).get_name(), 'assembly::test::2.0')
+
+    def test_readonly_uses_fast_loader(self):
+        with patch('lmctl.utils.descriptors._round_trip_load') as mock_round_trip_load:
+            descriptor, raw = DescriptorParser().read_from_file_with_raw(self.descriptor_path, readonly=True)
+            mock_round_trip_load.assert_not_called()
+        self.assertIsInstance(descriptor.raw, dict)
+        self.assertEqual(descriptor.get_name(), 'assembly::test::1.0')
+        self.assertEqual(descriptor.properties, {'propA': {'type': 'string'}})
+        self.assertEqual(raw, DESCRIPTOR)
+
+    def test_read_empty_descriptor(self):
+        self.assertEqual(DescriptorParser().read_from_str('').raw, {'description': None})
+        self.assertEqual(DescriptorParser().read_from_str('', readonly=True).raw, {'description': None})
+
+    def test_read_invalid_descriptor(self):
+        for readonly in (False, True):
+            with self.assertRaises(DescriptorParsingError):
+                DescriptorParser().read_from_str('name: [unclosed', readonly=readonly)
+
+    def test_read_missing_file(self):
+        with self.assertRaises(DescriptorReaderException):
+            DescriptorParser().read_from_file(os.path.join(self.tmp_dir, 'missing.yml'))
+
+    def test_cache_drops_least_recently_used_content(self):
+        cache = DescriptorCache(max_entries=2)
+        first = cache.read_str('name: a')
+        cache.read_str('name: b')
+        self.assertIs(cache.read_str('name: a'), first)
+        cache.read_str('name: c')
+        self.assertIs(cache.read_str('name: a'), first)
+        self.assertEqual(len(cache._contents), 2)
@@ -0,0 +1,121 @@
+import unittest
+import os
+import json
+import shutil
+import tempfile
+from unittest.mock import patch
+from lmctl.utils.profiling import Profiler, profiler, profiled, is_profile_requested, requested_trace_path, NOOP_SPAN, PROFILE_ENV_VAR
+from lmctl.utils.trace_ctx import trace_ctx
+from lmctl.project.journal import ProjectJournal
+
+class TestProfiler(unittest.TestCase):
+
+    def test_span_not_recorded_when_disabled(self):
+        test_profiler = Profiler()
+        with test_profiler.span('op', 'test') as span:
+            span.set(status=200)
+        self.assertIs(span, NOOP_SPAN)
+        self.assertEqual(test_profiler.spans, [])
+
+    def test_span_records_attributes_and_transaction_id(self):
+        test_profiler = Profiler()
+        test_profiler.enable()
+        with trace_ctx.scope(transaction_id='123'):
+            with test_profiler.span('GET api/test', 'http', method='GET') as span:
+                span.set(status=200)
+        self.assertEqual(len(test_profiler.spans), 1)
+        recorded = test_profiler.spans[0]
+        self.assertEqual(recorded.attributes, {'method': 'GET', 'status': 200, 'transaction_id': '123'})
+        self.assertIsNotNone(recorded.end)
+
+    def test_span_records_error(self):
+        test_profiler = Profiler()
+        test_profiler.enable()
+        with self.assertRaises(ValueError):
+            with test_profiler.span('op', 'test'):
+                raise ValueError('Mock error')
+        self.assertEqual(test_profiler.spans[0].attributes, {'error': 'ValueError'})
+
+    def test_summary_groups_by_category_and_name(self):
+        test_profiler = Profiler()
+        test_profiler.enable()
+        for _ in range(3):
+            with test_profiler.span('GET api/test', 'http'):
+                pass
+        with test_profiler.span('config file', 'yaml'):
+            pass
+        summary = {(row['category'], row['name']): row for row in test_profiler.summary()}
+        self.assertEqual(summary[('http', 'GET api/test')]['count'], 3)
+        self.assertEqual(summary[('yaml', 'config file')]['count'], 1)
+        table = test_profiler.summary_table()
+        self.assertIn('GET api/test', table)
+        self.assertIn('Total time:', table)
+
+    def test_write_chrome_trace(self):
+        test_profiler = Profiler()
+        test_profiler.enable()
+        with test_profiler.span('GET api/test', 'http', status=200):
+            pass
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = test_profiler.write_trace(os.path.join(tmp_dir, 'profiles', 'trace.json'))
+            with open(path, 'r') as f:
+                trace = json.load(f)
+        finally:
+            shutil.rmtree(tmp_dir)
+        events = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['name'], 'GET api/test')
+        self.assertEqual(events[0]['cat'], 'http')
+        self.assertEqual(events[0]['args'], {'status': 200})
+        self.assertIn('ts', events[0])
+        self.assertIn('dur', events[0])
+
+    def test_profile_env_var(self):
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: 'true'}):
+            self.assertTrue(is_profile_requested())
+            self.assertIsNone(requested_trace_path())
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: '/tmp/trace.json'}):
+            self.assertTrue(is_profile_requested())
+            self.assertEqual(requested_trace_path(), '/tmp/trace.json')
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: '0'}):
+            self.assertFalse(is_profile_requested())
+
+class TestProfilingHooks(unittest.TestCase):
+
+    def setUp(self):
+        profiler.enable()
+
+    def tearDown(self):
+        profiler.disable()
+
+    def test_profiled_decorator(self):
+        @profiled('do_work', 'test')
+        def do_work():
+            return 'done'
+        self.assertEqual(do_work(), 'done')
+        self.assertEqual([(s.category, s.name) for s in profiler.spans], [('test', 'do_work')])
+
+    def test_journal_sections_and_stages(self):
+        journal = ProjectJournal()
+        journal.section('Validate')
+        journal.subproject('sub')
+        journal.section('Validate')
+        journal.subproject_end('sub')
+        journal.section('Compile')
+        journal.stage('Resource package')
+        journal.section('Package')
+        spans = profiler.spans
+        self.assertEqual([(s.category, s.name, s.attributes['subproject']) for s in spans], [
+            ('project', 'Validate', ''),
+            ('project', 'Validate', 'sub'),
+            ('project', 'Compile', ''),
+            ('project-stage', 'Resource package', ''),
+            ('project', 'Package', '')
+        ])
+        # Each finishes when the next starts at the same level, except the last which is still in progress
+        self.assertLessEqual(spans[1].end, spans[2].start)
+        self.assertLessEqual(spans[0].end, spans[2].start)
+        self.assertLessEqual(spans[2].end, spans[4].start)
+        self.assertLessEqual(spans[3].end, spans[4].start)
+        self.assertIsNone(spans[4].end)
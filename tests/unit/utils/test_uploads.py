@@ -0,0 +1,90 @@
+import unittest
+import io
+import os
+import shutil
+import tempfile
+from urllib3.fields import RequestField
+from urllib3.filepost import encode_multipart_formdata
+from lmctl.utils.uploads import MultipartEncoder, ProgressReader, UploadProgressReporter
+
+class TestMultipartEncoder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def _write_file(self, name, content):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def _read_in_chunks(self, reader, chunk_size):
+        chunks = []
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def test_body_matches_urllib3_encoding(self):
+        content = os.urandom(100000)
+        path = self._write_file('package.csar', content)
+        file_field = RequestField(name='upfile', data=content, filename='package.csar')
+        file_field.make_multipart(content_type='application/octet-stream')
+        expected_body, expected_content_type = encode_multipart_formdata([('resource_name', 'A'), file_field], boundary='testboundary')
+        with open(path, 'rb') as f:
+            encoder = MultipartEncoder({'resource_name': 'A', 'upfile': f}, boundary='testboundary')
+            self.assertEqual(len(encoder), len(expected_body))
+            self.assertEqual(encoder.content_type, expected_content_type)
+            self.assertEqual(self._read_in_chunks(encoder, 8192), expected_body)
+
+    def test_progress_reported_as_read(self):
+        path = self._write_file('package.zip', b'a' * 1000)
+        progress = []
+        with open(path, 'rb') as f:
+            encoder = MultipartEncoder({'file': f}, progress_callback=lambda sent, total: progress.append((sent, total)))
+            self._read_in_chunks(encoder, 100)
+        self.assertGreater(len(progress), 10)
+        self.assertEqual(progress[-1], (len(encoder), len(encoder)))
+        sent_values = [sent for sent, total in progress]
+        self.assertEqual(sent_values, sorted(sent_values))
+
+    def test_seek_rewinds_body_for_resend(self):
+        path = self._write_file('package.zip', b'0123456789' * 100)
+        with open(path, 'rb') as f:
+            encoder = MultipartEncoder({'file': f})
+            first_read = encoder.read()
+            self.assertEqual(encoder.tell(), len(encoder))
+            encoder.seek(0)
+            self.assertEqual(encoder.read(), first_read)
+            encoder.seek(50)
+            self.assertEqual(encoder.read(), first_read[50:])
+
+class TestProgressReader(unittest.TestCase):
+
+    def test_reads_file_and_reports_progress(self):
+        progress = []
+        reader = ProgressReader(io.BytesIO(b'x' * 300), progress_callback=lambda sent, total: progress.append((sent, total)))
+        self.assertEqual(len(reader), 300)
+        self.assertEqual(reader.read(200), b'x' * 200)
+        self.assertEqual(reader.read(200), b'x' * 100)
+        self.assertEqual(progress, [(200, 300), (300, 300)])
+
+class TestUploadProgressReporter(unittest.TestCase):
+
+    def test_reports_each_step_once(self):
+        messages = []
+        reporter = UploadProgressReporter(messages.append, 'package A', step=25)
+        for sent in range(0, 2049, 64):
+            reporter(sent, 2048)
+        self.assertEqual(messages, [
+            'Uploaded 25% of package A (512 B of 2.0 KB)',
+            'Uploaded 50% of package A (1.0 KB of 2.0 KB)',
+            'Uploaded 75% of package A (1.5 KB of 2.0 KB)',
+            'Uploaded 100% of package A (2.0 KB of 2.0 KB)'
+        ])